@@ -0,0 +1,49 @@
+"""
+Micro-benchmark of the available JSON decoders on payloads shaped like each endpoint's response.
+
+Usage::
+
+    python -m benchmarks.bench_json [--repeat 200]
+"""
+import argparse
+import json
+import timeit
+
+from benchmarks import payloads
+from gemini_public_api.json_decoder import available_decoders
+
+PAYLOADS = {
+    'ticker':         payloads.ticker('btcusd'),
+    'ticker_v2':      payloads.ticker_v2('btcusd'),
+    'symbol_details': payloads.symbol_details('btcusd'),
+    'candles':        payloads.candles(),
+    'order_book':     payloads.order_book(),
+    'trade_history':  payloads.trades(),
+    'price_feed':     payloads.price_feed()
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=200, help='decodes per measurement')
+    args = parser.parse_args()
+
+    decoders = available_decoders()
+    names = list(decoders)
+
+    print(f'{"payload":<16}{"bytes":>10}' + ''.join(f'{name + " us":>14}' for name in names) + f'{"speedup":>10}')
+
+    for label, payload in PAYLOADS.items():
+        data = json.dumps(payload).encode()
+        timings = {
+            name: min(timeit.repeat(lambda: decoder.decode(data), number=args.repeat, repeat=5)) / args.repeat * 1e6
+            for name, decoder in decoders.items()
+        }
+        speedup = timings['json'] / min(timings.values())
+
+        columns = ''.join(f'{timings[name]:>14.1f}' for name in names)
+        print(f'{label:<16}{len(data):>10}{columns}{speedup:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""
+Compares the memory held by decoded trade pages as plain dictionaries and as `Trade` models.
+
+Usage::
+
+    python -m benchmarks.bench_models [--trades 100000]
+"""
+import argparse
+import json
+import tracemalloc
+
+from benchmarks import payloads
+from gemini_public_api.json_decoder import get_default_decoder
+from gemini_public_api.models import parse_trades
+
+
+def _measure(build):
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--trades', type=int, default=100_000, help='number of trades to hold')
+    args = parser.parse_args()
+
+    decoder = get_default_decoder()
+    pages = [json.dumps(payloads.trades(start_tid=tid)).encode() for tid in range(1, args.trades + 1, 500)]
+
+    dicts, dict_size = _measure(lambda: [trade for page in pages for trade in decoder.decode(page)])
+    del dicts
+    trades, model_size = _measure(lambda: [trade for page in pages for trade in parse_trades(decoder.decode(page))])
+
+    print(f'{"dict":<8}{dict_size / len(trades):>10.0f} bytes/trade')
+    print(f'{"Trade":<8}{model_size / len(trades):>10.0f} bytes/trade  ({dict_size / model_size:.1f}x smaller)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Throughput of reading a recording and of replaying it through the sync and async replay backends.
+
+A synthetic recording of polled tickers, order books and trade pages is written to a temporary file first.
+
+Usage::
+
+    python -m benchmarks.bench_replay [--responses 200000]
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+from benchmarks import payloads
+from gemini_public_api import endpoints
+from gemini_public_api.aiohttp.recording import ReplaySession
+from gemini_public_api.recording import Exchange, RecordWriter, ReplayTransport, read_records
+
+HEADERS = [('Content-Type', 'application/json')]
+
+
+def _requests(count: int):
+    requests = [
+        endpoints.ticker('btcusd'),
+        endpoints.ticker_v2('ethusd'),
+        endpoints.current_order_book('btcusd', bid_limit=50, ask_limit=50),
+        endpoints.trade_history('btcusd', limit_trades=50)
+    ]
+
+    return [requests[i % len(requests)] for i in range(count)]
+
+
+def _write(path: str, count: int) -> None:
+    bodies = [
+        json.dumps(payloads.ticker('btcusd')).encode(),
+        json.dumps(payloads.ticker_v2('ethusd')).encode(),
+        json.dumps(payloads.order_book(levels=50)).encode(),
+        json.dumps(payloads.trades(count=50)).encode()
+    ]
+
+    with RecordWriter(path) as writer:
+        for i, request in enumerate(_requests(count)):
+            params = {name: str(value) for name, value in request.get('params', {}).items()}
+            writer.write(Exchange(request['url'], params, 200, HEADERS, bodies[i % len(bodies)], i * 0.001, i * 0.001))
+
+
+def _report(label: str, count: int, elapsed: float) -> None:
+    print(f'{label:<20}{count / elapsed * 60 / 1e6:>10.2f} M responses/min')
+
+
+async def _replay_async(path: str, requests) -> None:
+    async with ReplaySession(path) as session:
+        for request in requests:
+            async with session.get(**request) as response:
+                await response.read()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--responses', type=int, default=200_000, help='number of recorded responses')
+    args = parser.parse_args()
+
+    requests = _requests(args.responses)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'session.rec.gz')
+
+        started = time.perf_counter()
+        _write(path, args.responses)
+        _report('write', args.responses, time.perf_counter() - started)
+        print(f'{"file size":<20}{os.path.getsize(path) / args.responses:>10.0f} bytes/response')
+
+        started = time.perf_counter()
+        count = sum(1 for _ in read_records(path))
+        _report('read_records', count, time.perf_counter() - started)
+
+        transport = ReplayTransport(path)
+        started = time.perf_counter()
+        for request in requests:
+            transport.get(**request)
+        _report('ReplayTransport', args.responses, time.perf_counter() - started)
+
+        started = time.perf_counter()
+        asyncio.run(_replay_async(path, requests))
+        _report('ReplaySession', args.responses, time.perf_counter() - started)
+
+
+if __name__ == '__main__':
+    main()
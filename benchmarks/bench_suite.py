@@ -0,0 +1,266 @@
+"""
+Throughput and latency of the library against the local stand-in server, for regression tracking.
+
+Each scenario cycles through all ten public endpoints and reports requests per second, p50 and p99 request
+latency (until the body is received, before decoding), client CPU time per request and peak Python memory.
+The stand-in runs in a separate process, so CPU time and memory are those of the client only.
+
+Scenarios
+---------
+sync
+    `GeminiClient` calls one at a time.
+sync-batch
+    `GeminiClient.fetch_many` on its thread pool.
+async
+    `gemini_public_api.aiohttp.api` calls awaited one at a time.
+async-batch
+    The async calls run concurrently, as in the `fetch_many_*` functions.
+
+Usage::
+
+    python -m benchmarks.bench_suite [--requests 2000] [--concurrency 20] [--latency 0.002] [--jitter 0.001]
+                                     [--error-rate 0] [--throttle-rate 0] [--retries 0] [--json results.json]
+"""
+import argparse
+import asyncio
+import json
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from aiohttp import ClientSession, TCPConnector
+
+from benchmarks.server import LocalSession, LocalTransport, ServerProcess
+from gemini_public_api.aiohttp import api
+from gemini_public_api.aiohttp.throttle import ThrottledSession
+from gemini_public_api.client import GeminiClient
+from gemini_public_api.rate_limit import RetryPolicy
+from gemini_public_api.transport import RequestsTransport, Transport
+
+CALLS: Tuple[Tuple[str, Dict[str, Any]], ...] = (
+    ('get_symbols', {}),
+    ('get_symbol_details', {'symbol': 'btcusd'}),
+    ('get_network', {'token': 'eth'}),
+    ('get_ticker', {'symbol': 'btcusd'}),
+    ('get_ticker_v2', {'symbol': 'ethusd'}),
+    ('get_candles', {'symbol': 'btcusd', 'time_frame': '1m'}),
+    ('get_free_promos', {}),
+    ('get_current_order_book', {'symbol': 'btcusd', 'bid_limit': 50, 'ask_limit': 50}),
+    ('get_trade_history', {'symbol': 'btcusd', 'limit_trades': 50}),
+    ('get_price_feed', {})
+)
+
+
+class TimedTransport(Transport):
+    """
+    Records the latency of every request sent through a wrapped transport.
+    """
+
+    def __init__(self, transport: Transport, latencies: List[float]):
+        self.transport = transport
+        self.latencies = latencies
+        self._lock = threading.Lock()
+
+    def get(self, url: str, params: Optional[Mapping[str, Any]] = None, **kwargs) -> Any:
+        started = time.perf_counter()
+        response = self.transport.get(url, params=params, **kwargs)
+        elapsed = time.perf_counter() - started
+
+        with self._lock:
+            self.latencies.append(elapsed)
+
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class _TimedRequest:
+    def __init__(self, request, latencies: List[float]):
+        self._request = request
+        self._latencies = latencies
+        self._response = None
+
+    def __await__(self):
+        return self._send().__await__()
+
+    async def __aenter__(self):
+        self._response = await self._send()
+        return self._response
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._response.release()
+
+    async def _send(self):
+        started = time.perf_counter()
+        response = await self._request
+        await response.read()
+        self._latencies.append(time.perf_counter() - started)
+
+        return response
+
+
+class TimedSession:
+    """
+    Records the latency of every request sent through a wrapped aiohttp-like session, until its body is read.
+    """
+
+    def __init__(self, session: Any, latencies: List[float]):
+        self.session = session
+        self.latencies = latencies
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.session, name)
+
+    def get(self, url: Any, params: Optional[Mapping[str, Any]] = None, **kwargs) -> _TimedRequest:
+        return _TimedRequest(self.session.get(url, params=params, **kwargs), self.latencies)
+
+
+def _calls(count: int) -> List[Tuple[str, Dict[str, Any]]]:
+    return [CALLS[i % len(CALLS)] for i in range(count)]
+
+
+def _run_sync(args, url: str, latencies: List[float], batch: bool) -> int:
+    transport = TimedTransport(LocalTransport(RequestsTransport(pool_maxsize=args.concurrency), url), latencies)
+    retry_policy = RetryPolicy(max_retries=args.retries) if args.retries else None
+
+    with GeminiClient(transport=transport, max_workers=args.concurrency, retry_policy=retry_policy) as client:
+        calls = _calls(args.requests)
+
+        if batch:
+            results = client.fetch_many(calls)
+        else:
+            results = [client._fetch(endpoint, kwargs) for endpoint, kwargs in calls]
+
+    return sum(isinstance(result, Exception) for result in results)
+
+
+async def _run_async(args, url: str, latencies: List[float], batch: bool) -> int:
+    retry_policy = RetryPolicy(max_retries=args.retries) if args.retries else None
+
+    async with ClientSession(connector=TCPConnector(limit=args.concurrency)) as client:
+        session = TimedSession(LocalSession(client, url), latencies)
+
+        if retry_policy is not None:
+            session = ThrottledSession(session, retry_policy=retry_policy)
+
+        calls = _calls(args.requests)
+
+        def request(i: int):
+            endpoint, kwargs = calls[i]
+            return getattr(api, endpoint)(session, **kwargs)
+
+        if batch:
+            results = list((await api._fetch_many(range(len(calls)), request, args.concurrency)).values())
+        else:
+            results = []
+
+            for i in range(len(calls)):
+                try:
+                    results.append(await api.read_json(request(i)))
+                except Exception as e:
+                    results.append(e)
+
+    return sum(isinstance(result, Exception) for result in results)
+
+
+SCENARIOS: Dict[str, Callable[[Any, str, List[float]], int]] = {
+    'sync': lambda args, url, latencies: _run_sync(args, url, latencies, batch=False),
+    'sync-batch': lambda args, url, latencies: _run_sync(args, url, latencies, batch=True),
+    'async': lambda args, url, latencies: asyncio.run(_run_async(args, url, latencies, batch=False)),
+    'async-batch': lambda args, url, latencies: asyncio.run(_run_async(args, url, latencies, batch=True))
+}
+
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    :param values: sorted values.
+    :param q: percentile between 0 and 100.
+    :return: Nearest-rank percentile of `values`, nan if empty.
+    """
+    if not values:
+        return float('nan')
+
+    return values[min(len(values) - 1, max(0, round(q / 100 * len(values)) - 1))]
+
+
+def run_scenario(name: str, args, url: str, memory: bool = True) -> Dict[str, Any]:
+    """
+    Runs a scenario once for timing and, if `memory`, once more under tracemalloc for its peak memory.
+
+    :param name: scenario name, see `SCENARIOS`.
+    :param args: parsed command line arguments.
+    :param url: base URL of the stand-in server.
+    :param memory: flag to measure the peak memory.
+    :return: Dictionary of the measurements.
+    """
+    latencies: List[float] = []
+
+    cpu, started = time.process_time(), time.perf_counter()
+    errors = SCENARIOS[name](args, url, latencies)
+    elapsed, cpu = time.perf_counter() - started, time.process_time() - cpu
+
+    latencies.sort()
+    result = {
+        'scenario':        name,
+        'requests':        args.requests,
+        'errors':          errors,
+        'requests_per_s':  args.requests / elapsed,
+        'p50_ms':          percentile(latencies, 50) * 1e3,
+        'p99_ms':          percentile(latencies, 99) * 1e3,
+        'cpu_us_per_req':  cpu / args.requests * 1e6,
+        'peak_memory_kib': None
+    }
+
+    if memory:
+        tracemalloc.start()
+        SCENARIOS[name](args, url, [])
+        result['peak_memory_kib'] = tracemalloc.get_traced_memory()[1] / 1024
+        tracemalloc.stop()
+
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=2000, help='requests per scenario')
+    parser.add_argument('--concurrency', type=int, default=20, help='threads or concurrent requests of batch modes')
+    parser.add_argument('--latency', type=float, default=0.002, help='server latency in seconds')
+    parser.add_argument('--jitter', type=float, default=0.001, help='server latency jitter in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of 500 responses')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='fraction of 429 responses')
+    parser.add_argument('--retries', type=int, default=0, help='retries of 429 and 5xx responses')
+    parser.add_argument('--scenarios', nargs='+', choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument('--no-memory', action='store_true', help='skip the peak memory runs')
+    parser.add_argument('--json', help='file to write the results to')
+    args = parser.parse_args()
+
+    options = {
+        'latency':       args.latency,
+        'jitter':        args.jitter,
+        'error_rate':    args.error_rate,
+        'throttle_rate': args.throttle_rate,
+        'seed':          0
+    }
+
+    with ServerProcess(**options) as server:
+        results = [run_scenario(name, args, server.url, memory=not args.no_memory) for name in args.scenarios]
+
+    print(f'{"scenario":<14}{"req/s":>9}{"p50 ms":>9}{"p99 ms":>9}{"cpu us/req":>12}{"peak KiB":>10}{"errors":>8}')
+
+    for result in results:
+        memory = result['peak_memory_kib']
+        print(
+            f'{result["scenario"]:<14}{result["requests_per_s"]:>9.0f}{result["p50_ms"]:>9.2f}{result["p99_ms"]:>9.2f}'
+            f'{result["cpu_us_per_req"]:>12.0f}{memory if memory is not None else float("nan"):>10.0f}'
+            f'{result["errors"]:>8}'
+        )
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump({'options': {**options, **vars(args)}, 'results': results}, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
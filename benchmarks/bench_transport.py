@@ -0,0 +1,112 @@
+"""
+Throughput of the HTTP/1.1 and HTTP/2 backends against local stand-in servers.
+
+Every backend fetches the same number of distinct symbols with the same concurrency. The HTTP/1.1 backends
+(requests, aiohttp) need one connection per concurrent request, while the HTTP/2 backends (httpx) multiplex
+them over a single connection.
+
+Usage::
+
+    python -m benchmarks.bench_transport [--requests 2000] [--concurrency 50] [--latency 0.005] [--endpoint ticker]
+"""
+import argparse
+import asyncio
+import time
+from typing import Callable, List, Tuple
+
+from aiohttp import ClientSession, TCPConnector
+
+from benchmarks.server import H2Server, LocalSession, LocalTransport, ServerThread, make_app
+from gemini_public_api.aiohttp import api
+from gemini_public_api.aiohttp.http2 import HTTP2Session
+from gemini_public_api.client import GeminiClient
+from gemini_public_api.transport import HttpxTransport, RequestsTransport
+
+ENDPOINTS = {
+    'ticker':     ('get_ticker', api.fetch_many_tickers),
+    'order_book': ('get_current_order_book', api.fetch_many_order_books)
+}
+
+
+def _sync(make_transport: Callable, server, endpoint: str, symbols: List[str], concurrency: int) -> float:
+    with ServerThread(server) as thread:
+        with GeminiClient(transport=LocalTransport(make_transport(), thread.url), max_workers=concurrency) as client:
+            started = time.perf_counter()
+            results = client.fetch_many((endpoint, (symbol,)) for symbol in symbols)
+            elapsed = time.perf_counter() - started
+
+    assert not any(isinstance(result, Exception) for result in results), results
+    return elapsed
+
+
+async def _async(make_session: Callable, base_url: str, fetch_many, symbols: List[str], concurrency: int) -> float:
+    async with make_session() as session:
+        started = time.perf_counter()
+        results = await fetch_many(LocalSession(session, base_url), symbols, concurrency=concurrency)
+        elapsed = time.perf_counter() - started
+
+    assert not any(isinstance(result, Exception) for result in results.values()), results
+    return elapsed
+
+
+async def _run_async(args, symbols: List[str]) -> List[Tuple[str, float, int]]:
+    _, fetch_many = ENDPOINTS[args.endpoint]
+    rows = []
+
+    connections = set()
+
+    with ServerThread(make_app(latency=args.latency, connections=connections)) as thread:
+        elapsed = await _async(
+            lambda: ClientSession(connector=TCPConnector(limit=args.concurrency)),
+            thread.url, fetch_many, symbols, args.concurrency
+        )
+    rows.append(('aiohttp (HTTP/1.1)', elapsed, len(connections)))
+
+    server = H2Server(latency=args.latency)
+
+    with ServerThread(server) as thread:
+        elapsed = await _async(
+            lambda: HTTP2Session(http1=False, max_connections=1),
+            thread.url, fetch_many, symbols, args.concurrency
+        )
+    rows.append(('httpx async (HTTP/2)', elapsed, server.connections))
+
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=2000, help='requests per backend')
+    parser.add_argument('--concurrency', type=int, default=50, help='concurrent requests')
+    parser.add_argument('--latency', type=float, default=0.005, help='simulated server latency in seconds')
+    parser.add_argument('--endpoint', choices=sorted(ENDPOINTS), default='ticker')
+    args = parser.parse_args()
+
+    endpoint, _ = ENDPOINTS[args.endpoint]
+    symbols = [f'sym{i}' for i in range(args.requests)]
+    rows = []
+
+    connections = set()
+    elapsed = _sync(
+        lambda: RequestsTransport(pool_maxsize=args.concurrency),
+        make_app(latency=args.latency, connections=connections), endpoint, symbols, args.concurrency
+    )
+    rows.append(('requests (HTTP/1.1)', elapsed, len(connections)))
+
+    server = H2Server(latency=args.latency)
+    elapsed = _sync(
+        lambda: HttpxTransport(http1=False, max_connections=1),
+        server, endpoint, symbols, args.concurrency
+    )
+    rows.append(('httpx (HTTP/2)', elapsed, server.connections))
+
+    rows.extend(asyncio.run(_run_async(args, symbols)))
+
+    print(f'{"backend":<24}{"req/s":>10}{"connections":>14}')
+
+    for name, elapsed, count in rows:
+        print(f'{name:<24}{args.requests / elapsed:>10.0f}{count:>14}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""
+Synthetic payloads shaped like the responses of the public Gemini endpoints.
+"""
+import random
+import time
+from typing import Any, Dict, List
+
+SYMBOLS: List[str] = [
+    base + quote
+    for base in ('btc', 'eth', 'sol', 'ltc', 'bch', 'link', 'matic', 'doge', 'avax', 'dot', 'uni', 'aave', 'xtz',
+                 'fil', 'atom', 'shib', 'crv', 'comp', 'mkr', 'snx', 'yfi', 'zec', 'bat', 'grt', 'ens')
+    for quote in ('usd', 'usdt', 'gusd', 'eur', 'gbp', 'sgd')
+]
+
+
+def _price(rng: random.Random, base: float = 30_000.0) -> str:
+    return f'{base * (1 + rng.uniform(-0.05, 0.05)):.2f}'
+
+
+def _amount(rng: random.Random) -> str:
+    return f'{rng.uniform(0.0001, 5):.8f}'
+
+
+def symbols() -> List[str]:
+    return list(SYMBOLS)
+
+
+def symbol_details(symbol: str) -> Dict[str, Any]:
+    return {
+        'symbol':           symbol.upper(),
+        'base_currency':    symbol[:3].upper(),
+        'quote_currency':   symbol[3:].upper(),
+        'tick_size':        1e-8,
+        'quote_increment':  0.01,
+        'min_order_size':   '0.00001',
+        'status':           'open',
+        'wrap_enabled':     False,
+        'product_type':     'spot',
+        'contract_type':    'vanilla',
+        'contract_price_currency': symbol[3:].upper()
+    }
+
+
+def network(token: str) -> Dict[str, Any]:
+    return {'token': token.upper(), 'network': ['ethereum']}
+
+
+def ticker(symbol: str, seed: int = 0) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    now = int(time.time() * 1000)
+    return {
+        'bid':    _price(rng),
+        'ask':    _price(rng),
+        'volume': {symbol[:3].upper(): _amount(rng), symbol[3:].upper(): _price(rng), 'timestamp': now},
+        'last':   _price(rng)
+    }
+
+
+def ticker_v2(symbol: str, seed: int = 0) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    return {
+        'symbol':  symbol.upper(),
+        'open':    _price(rng),
+        'high':    _price(rng),
+        'low':     _price(rng),
+        'close':   _price(rng),
+        'changes': [_price(rng) for _ in range(24)],
+        'bid':     _price(rng),
+        'ask':     _price(rng)
+    }
+
+
+def candles(count: int = 1440, step_ms: int = 60_000, seed: int = 0) -> List[List[float]]:
+    rng = random.Random(seed)
+    end = int(time.time() * 1000) // step_ms * step_ms
+    rows = []
+    for i in range(count):
+        open_ = 30_000 * (1 + rng.uniform(-0.05, 0.05))
+        close = open_ * (1 + rng.uniform(-0.001, 0.001))
+        rows.append([
+            end - i * step_ms, open_, max(open_, close) * 1.0005, min(open_, close) * 0.9995, close, rng.uniform(0, 50)
+        ])
+    return rows
+
+
+def free_promos() -> Dict[str, Any]:
+    return {'symbols': ['GUSDUSD', 'USDCUSD']}
+
+
+def order_book(levels: int = 500, seed: int = 0) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    now = str(int(time.time()))
+    return {
+        'bids': [
+            {'price': f'{30_000 - i * 0.01:.2f}', 'amount': _amount(rng), 'timestamp': now} for i in range(levels)
+        ],
+        'asks': [
+            {'price': f'{30_000.01 + i * 0.01:.2f}', 'amount': _amount(rng), 'timestamp': now} for i in range(levels)
+        ]
+    }
+
+
+def trades(count: int = 500, start_ms: int = 1_700_000_000_000, start_tid: int = 1, seed: int = 0) -> List[Dict]:
+    rng = random.Random(seed)
+    page, timestamp = [], start_ms
+    for tid in range(start_tid, start_tid + count):
+        timestamp += rng.randint(0, 50)
+        page.append({
+            'timestamp':   timestamp // 1000,
+            'timestampms': timestamp,
+            'tid':         tid,
+            'price':       _price(rng),
+            'amount':      _amount(rng),
+            'exchange':    'gemini',
+            'type':        rng.choice(('buy', 'sell'))
+        })
+    return list(reversed(page))
+
+
+def price_feed(seed: int = 0) -> List[Dict[str, str]]:
+    rng = random.Random(seed)
+    return [
+        {'pair': symbol.upper(), 'price': _price(rng), 'percentChange24h': f'{rng.uniform(-0.1, 0.1):.4f}'}
+        for symbol in SYMBOLS
+    ]
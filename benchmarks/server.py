@@ -0,0 +1,488 @@
+"""
+Local stand-ins for the public Gemini API, serving synthetic payloads over HTTP/1.1 and HTTP/2.
+
+`make_app` builds an aiohttp application for the HTTP/1.1 backends and `H2Server` is a minimal cleartext
+HTTP/2 server (prior knowledge, no TLS) built on ``h2``. Both serve every public endpoint through a `StandIn`,
+which can add latency, jitter, server errors and 429 responses, and both count the connections they accept.
+`LocalTransport` and `LocalSession` point the library's absolute endpoint URLs at a local server.
+
+The HTTP/1.1 stand-in can also run on its own, e.g. in a separate process from the benchmarked client::
+
+    python -m benchmarks.server --port 8080 --latency 0.02 --jitter 0.005 --throttle-rate 0.01
+"""
+import argparse
+import asyncio
+import functools
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import threading
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
+
+from aiohttp import web
+
+from benchmarks import payloads
+from gemini_public_api.transport import Transport
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+    import h2.exceptions
+except ImportError:  # pragma: no cover
+    h2 = None
+
+DEFAULT_BID_LIMIT: int = 50
+DEFAULT_LIMIT_TRADES: int = 50
+
+ROUTES = (
+    (re.compile(r'^/v1/symbols$'), lambda query: payloads.symbols()),
+    (re.compile(r'^/v1/symbols/details/(?P<symbol>[^/]+)$'), lambda query, symbol: payloads.symbol_details(symbol)),
+    (re.compile(r'^/v1/network/(?P<token>[^/]+)$'), lambda query, token: payloads.network(token)),
+    (re.compile(r'^/v1/pubticker/(?P<symbol>[^/]+)$'), lambda query, symbol: payloads.ticker(symbol)),
+    (re.compile(r'^/v2/ticker/(?P<symbol>[^/]+)$'), lambda query, symbol: payloads.ticker_v2(symbol)),
+    (
+        re.compile(r'^/v2/candles/(?P<symbol>[^/]+)/(?P<time_frame>[^/]+)$'),
+        lambda query, symbol, time_frame: payloads.candles()
+    ),
+    (re.compile(r'^/v1/feepromos$'), lambda query: payloads.free_promos()),
+    (
+        re.compile(r'^/v1/book/(?P<symbol>[^/]+)$'),
+        lambda query, symbol: payloads.order_book(levels=int(query.get('bid_limit', DEFAULT_BID_LIMIT)))
+    ),
+    (
+        re.compile(r'^/v1/trades/(?P<symbol>[^/]+)$'),
+        lambda query, symbol: payloads.trades(count=int(query.get('limit_trades', DEFAULT_LIMIT_TRADES)))
+    ),
+    (re.compile(r'^/v1/pricefeed$'), lambda query: payloads.price_feed())
+)
+
+JSON_HEADERS: List[Tuple[str, str]] = [('Content-Type', 'application/json')]
+
+
+def _error(reason: str, message: str) -> bytes:
+    return json.dumps({'result': 'error', 'reason': reason, 'message': message}).encode()
+
+
+@functools.lru_cache(maxsize=4096)
+def respond(path: str, query_string: str = '') -> Tuple[int, bytes]:
+    """
+    :param path: request path.
+    :param query_string: raw query string of the request.
+    :return: Tuple of the HTTP status and the encoded body, cached so serving costs as little as possible.
+    """
+    query = dict(parse_qsl(query_string))
+
+    for pattern, payload in ROUTES:
+        match = pattern.match(path)
+
+        if match:
+            return 200, json.dumps(payload(query, **match.groupdict())).encode()
+
+    return 404, _error('EndpointNotFound', f'API entry point `{path}` not found')
+
+
+class StandIn:
+    """
+    Answers requests for the public endpoints, injecting latency, jitter, errors and rate limiting.
+
+    Attributes
+    ----------
+    requests
+        Number of requests answered.
+    errors
+        Number of injected 500 responses.
+    throttled
+        Number of injected 429 responses.
+    """
+
+    def __init__(
+            self,
+            latency: float = 0.0,
+            jitter: float = 0.0,
+            error_rate: float = 0.0,
+            throttle_rate: float = 0.0,
+            retry_after: float = 0.0,
+            seed: Optional[int] = None
+    ):
+        """
+        :param latency: seconds each response is delayed by, to simulate network round trips.
+        :param jitter: maximum seconds added to or removed from `latency`, uniformly at random.
+        :param error_rate: fraction of requests answered with a 500 error.
+        :param throttle_rate: fraction of requests answered with a 429 error.
+        :param retry_after: seconds sent in the `Retry-After` header of 429 responses.
+        :param seed: seed of the random faults, for reproducible runs.
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+
+        self._random = random.Random(seed)
+
+    async def handle(self, path: str, query_string: str = '') -> Tuple[int, List[Tuple[str, str]], bytes]:
+        """
+        :param path: request path.
+        :param query_string: raw query string of the request.
+        :return: Tuple of the HTTP status, headers and body of the response.
+        """
+        self.requests += 1
+        delay = self.latency + self._random.uniform(-self.jitter, self.jitter) if self.jitter else self.latency
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        draw = self._random.random() if self.error_rate or self.throttle_rate else 1.0
+
+        if draw < self.throttle_rate:
+            self.throttled += 1
+            return 429, JSON_HEADERS + [('Retry-After', str(self.retry_after))], _error(
+                'RateLimited', 'Requests were made too frequently'
+            )
+
+        if draw < self.throttle_rate + self.error_rate:
+            self.errors += 1
+            return 500, JSON_HEADERS, _error('ServerError', 'Injected server error')
+
+        status, body = respond(path, query_string)
+
+        return status, JSON_HEADERS, body
+
+
+STAND_IN_KEY = web.AppKey('stand_in', StandIn)
+
+
+def make_app(
+        latency: float = 0.0,
+        connections: Optional[Set[int]] = None,
+        stand_in: Optional[StandIn] = None
+) -> web.Application:
+    """
+    :param latency: seconds each response is delayed by, ignored if `stand_in` is given.
+    :param connections: set the ids of the connections that sent requests are added to.
+    :param stand_in: StandIn answering the requests, one with `latency` and no faults if omitted.
+    :return: aiohttp application serving every public endpoint, with the StandIn under `STAND_IN_KEY`.
+    """
+    stand_in = stand_in if stand_in is not None else StandIn(latency=latency)
+
+    async def handler(request: web.Request) -> web.Response:
+        if connections is not None:
+            connections.add(id(request.transport))
+
+        status, headers, body = await stand_in.handle(request.path, request.query_string)
+
+        return web.Response(status=status, body=body, headers=headers)
+
+    app = web.Application()
+    app[STAND_IN_KEY] = stand_in
+    app.router.add_get('/{tail:.*}', handler)
+
+    return app
+
+
+class _H2Protocol(asyncio.Protocol):
+    def __init__(self, server: 'H2Server'):
+        self.server = server
+        self.connection = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False, header_encoding='utf-8')
+        )
+        self.transport = None
+        self.window_updated: Dict[int, asyncio.Event] = {}
+
+    def connection_made(self, transport) -> None:
+        self.server.connections += 1
+        self.transport = transport
+        self.connection.initiate_connection()
+        self.transport.write(self.connection.data_to_send())
+
+    def connection_lost(self, exc) -> None:
+        for event in self.window_updated.values():
+            event.set()
+
+    def data_received(self, data: bytes) -> None:
+        for event in self.connection.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                path, _, query_string = dict(event.headers)[':path'].partition('?')
+                self.window_updated[event.stream_id] = asyncio.Event()
+                asyncio.ensure_future(self._respond(event.stream_id, path, query_string))
+            elif isinstance(event, h2.events.WindowUpdated):
+                for stream_id, updated in self.window_updated.items():
+                    if event.stream_id in (0, stream_id):
+                        updated.set()
+            elif isinstance(event, h2.events.StreamReset):
+                updated = self.window_updated.pop(event.stream_id, None)
+
+                if updated is not None:
+                    updated.set()
+
+        self.transport.write(self.connection.data_to_send())
+
+    async def _respond(self, stream_id: int, path: str, query_string: str) -> None:
+        status, headers, body = await self.server.stand_in.handle(path, query_string)
+
+        try:
+            self.connection.send_headers(stream_id, [
+                (':status', str(status)),
+                *((name.lower(), value) for name, value in headers),
+                ('content-length', str(len(body)))
+            ], end_stream=not body)
+            self.transport.write(self.connection.data_to_send())
+
+            while body:
+                window = self.connection.local_flow_control_window(stream_id)
+
+                if window < 1:
+                    updated = self.window_updated[stream_id]
+                    updated.clear()
+                    await updated.wait()
+
+                    if self.transport.is_closing():
+                        return
+
+                    continue
+
+                size = min(window, self.connection.max_outbound_frame_size)
+                chunk, body = body[:size], body[size:]
+                self.connection.send_data(stream_id, chunk, end_stream=not body)
+                self.transport.write(self.connection.data_to_send())
+        except (h2.exceptions.StreamClosedError, h2.exceptions.ProtocolError, KeyError):
+            return
+        finally:
+            self.window_updated.pop(stream_id, None)
+
+
+class H2Server:
+    """
+    A minimal cleartext HTTP/2 server serving every public endpoint, for use by clients with prior knowledge.
+
+    Attributes
+    ----------
+    url
+        Base URL of the server once started.
+    connections
+        Number of connections accepted.
+    """
+
+    def __init__(
+            self,
+            host: str = '127.0.0.1',
+            port: int = 0,
+            latency: float = 0.0,
+            stand_in: Optional[StandIn] = None
+    ):
+        """
+        :param host: interface to listen on.
+        :param port: port to listen on, 0 for any free port.
+        :param latency: seconds each response is delayed by, ignored if `stand_in` is given.
+        :param stand_in: StandIn answering the requests, one with `latency` and no faults if omitted.
+        """
+        if h2 is None:
+            raise ImportError('h2 is not installed, install it with `pip install h2`')
+
+        self.host = host
+        self.port = port
+        self.stand_in = stand_in if stand_in is not None else StandIn(latency=latency)
+        self.connections = 0
+        self.url: Optional[str] = None
+        self._server = None
+
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(lambda: _H2Protocol(self), self.host, self.port)
+        self.url = f'http://{self.host}:{self._server.sockets[0].getsockname()[1]}'
+
+    async def close(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def __aenter__(self) -> 'H2Server':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+class ServerThread:
+    """
+    Runs a server on an event loop in a background thread, for benchmarking synchronous clients.
+
+    `server` is either an `H2Server` or an aiohttp application.
+    """
+
+    def __init__(self, server: Any):
+        self.server = server
+        self.url: Optional[str] = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._runner = None
+
+    def _run(self, coroutine) -> Any:
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    async def _start(self) -> str:
+        if isinstance(self.server, H2Server):
+            await self.server.start()
+            return self.server.url
+
+        self._runner = web.AppRunner(self.server)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+
+        return f'http://127.0.0.1:{self._runner.addresses[0][1]}'
+
+    async def _stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+        else:
+            await self.server.close()
+
+    def __enter__(self) -> 'ServerThread':
+        self._thread.start()
+        self.url = self._run(self._start())
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._run(self._stop())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+def rebase(url: Any, base_url: str) -> str:
+    """
+    :param url: absolute URL, e.g. one of the public endpoints.
+    :param base_url: scheme and host to send the request to instead.
+    :return: `url` with its scheme and host replaced by those of `base_url`.
+    """
+    base, parts = urlsplit(base_url), urlsplit(str(url))
+
+    return urlunsplit((base.scheme, base.netloc, parts.path, parts.query, parts.fragment))
+
+
+class LocalTransport(Transport):
+    """
+    Sends the requests of a wrapped `Transport` to a local server instead.
+    """
+
+    def __init__(self, transport: Transport, base_url: str):
+        self.transport = transport
+        self.base_url = base_url
+
+    def get(self, url: str, params: Optional[Mapping[str, Any]] = None, **kwargs) -> Any:
+        return self.transport.get(rebase(url, self.base_url), params=params, **kwargs)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class LocalSession:
+    """
+    Sends the requests of a wrapped aiohttp-like session to a local server instead.
+    """
+
+    def __init__(self, session: Any, base_url: str):
+        self.session = session
+        self.base_url = base_url
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.session, name)
+
+    def get(self, url: Any, params: Optional[Mapping[str, Any]] = None, **kwargs) -> Any:
+        return self.session.get(rebase(url, self.base_url), params=params, **kwargs)
+
+
+class ServerProcess:
+    """
+    Runs the HTTP/1.1 stand-in in a separate Python process, so that it shares neither the CPU time nor the
+    GIL of the benchmarked client.
+
+    Attributes
+    ----------
+    url
+        Base URL of the server once started.
+    """
+
+    def __init__(self, **options: Any):
+        """
+        :param options: `StandIn` arguments, e.g. `latency=0.01, throttle_rate=0.05`.
+        """
+        self.options = options
+        self.url: Optional[str] = None
+        self._process: Optional[subprocess.Popen] = None
+
+    def __enter__(self) -> 'ServerProcess':
+        arguments = [sys.executable, '-m', 'benchmarks.server', '--port', '0']
+
+        for name, value in self.options.items():
+            if value is not None:
+                arguments += [f'--{name.replace("_", "-")}', str(value)]
+
+        self._process = subprocess.Popen(
+            arguments,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            stdout=subprocess.PIPE,
+            text=True
+        )
+        self.url = self._process.stdout.readline().split()[-1]
+
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._process.terminate()
+        self._process.wait()
+        self._process.stdout.close()
+
+
+async def _serve(args) -> None:
+    stand_in = StandIn(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        seed=args.seed
+    )
+    runner = web.AppRunner(make_app(stand_in=stand_in), access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, args.host, args.port).start()
+
+    host, port = runner.addresses[0][:2]
+    print(f'serving on http://{host}:{port}', flush=True)
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Serves the public Gemini endpoints locally with synthetic payloads.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080, help='port to listen on, 0 for any free port')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds each response is delayed by')
+    parser.add_argument('--jitter', type=float, default=0.0, help='maximum seconds added to or removed from latency')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with 500')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='fraction of requests answered with 429')
+    parser.add_argument('--retry-after', type=float, default=0.0, help='Retry-After seconds of 429 responses')
+    parser.add_argument('--seed', type=int, default=None, help='seed of the random faults')
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
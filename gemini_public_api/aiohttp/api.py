@@ -1,9 +1,28 @@
-from typing import Optional
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Tuple, Union
 
 from aiohttp import ClientSession
 
-import gemini_public_api.public_endpoints as production
-import gemini_public_api.public_sandbox_endpoints as sandbox
+import gemini_public_api.endpoints as endpoints
+from gemini_public_api.aiohttp.response import BufferedResponse
+from gemini_public_api.candles import decode_candles, decode_candles_structured
+from gemini_public_api.json_decoder import get_default_decoder
+from gemini_public_api.models import PARSERS, parse
+from gemini_public_api.pagination import TradeCursor
+from gemini_public_api.streaming import DEFAULT_CHUNK_SIZE, Record, aiter_records
+
+ENDPOINTS: Tuple[str, ...] = (
+    'get_symbols',
+    'get_symbol_details',
+    'get_network',
+    'get_ticker',
+    'get_ticker_v2',
+    'get_candles',
+    'get_free_promos',
+    'get_current_order_book',
+    'get_trade_history',
+    'get_price_feed'
+)
 
 
 async def get_symbols(session: ClientSession, use_sandbox: bool = False):
@@ -14,7 +33,7 @@ async def get_symbols(session: ClientSession, use_sandbox: bool = False):
     :param use_sandbox: flag to use sandbox endpoints.
     :return: Coroutine that needs to be awaited on, returns aiohttp client response.
     """
-    return session.get(url=sandbox.SYMBOLS if use_sandbox else production.SYMBOLS)
+    return session.get(**endpoints.symbols(use_sandbox=use_sandbox))
 
 
 async def get_symbol_details(session: ClientSession, symbol: str, use_sandbox: bool = False):
@@ -26,10 +45,7 @@ async def get_symbol_details(session: ClientSession, symbol: str, use_sandbox: b
     :param use_sandbox: flag to use sandbox endpoints.
     :return: Coroutine that needs to be awaited on, returns aiohttp client response.
     """
-    return session.get(
-        url=sandbox.SYMBOL_DETAILS.format(symbol=symbol) if use_sandbox else production.SYMBOL_DETAILS.format(
-            symbol=symbol)
-    )
+    return session.get(**endpoints.symbol_details(symbol=symbol, use_sandbox=use_sandbox))
 
 
 async def get_network(session: ClientSession, token: str, use_sandbox: bool = False):
@@ -41,9 +57,7 @@ async def get_network(session: ClientSession, token: str, use_sandbox: bool = Fa
     :param use_sandbox: flag to use sandbox endpoints.
     :return: Coroutine that needs to be awaited on, returns aiohttp client response.
     """
-    return session.get(
-        url=sandbox.NETWORK.format(token=token) if use_sandbox else production.NETWORK.format(token=token)
-    )
+    return session.get(**endpoints.network(token=token, use_sandbox=use_sandbox))
 
 
 async def get_ticker(session: ClientSession, symbol: str, use_sandbox: bool = False):
@@ -55,10 +69,7 @@ async def get_ticker(session: ClientSession, symbol: str, use_sandbox: bool = Fa
     :param use_sandbox: flag to use sandbox endpoints.
     :return: Coroutine that needs to be awaited on, returns aiohttp client response.
     """
-    return session.get(
-        url=sandbox.PUBLIC_TICKER.format(
-            symbol=symbol) if use_sandbox else production.PUBLIC_TICKER.format(symbol=symbol)
-    )
+    return session.get(**endpoints.ticker(symbol=symbol, use_sandbox=use_sandbox))
 
 
 async def get_ticker_v2(session: ClientSession, symbol: str, use_sandbox: bool = False):
@@ -70,10 +81,7 @@ async def get_ticker_v2(session: ClientSession, symbol: str, use_sandbox: bool =
     :param use_sandbox: flag to use sandbox endpoints.
     :return: Coroutine that needs to be awaited on, returns aiohttp client response.
     """
-    return session.get(
-        url=sandbox.PUBLIC_TICKER_V2.format(
-            symbol=symbol) if use_sandbox else production.PUBLIC_TICKER_V2.format(symbol=symbol)
-    )
+    return session.get(**endpoints.ticker_v2(symbol=symbol, use_sandbox=use_sandbox))
 
 
 async def get_candles(session: ClientSession, symbol: str, time_frame: str, use_sandbox: bool = False):
@@ -86,11 +94,29 @@ async def get_candles(session: ClientSession, symbol: str, time_frame: str, use_
     :param use_sandbox: flag to use sandbox endpoints.
     :return: Coroutine that needs to be awaited on, returns aiohttp client response.
     """
-    return session.get(
-        url=sandbox.CANDLES.format(
-            symbol=symbol, time_frame=time_frame
-        ) if use_sandbox else production.CANDLES.format(symbol=symbol, time_frame=time_frame)
-    )
+    return session.get(**endpoints.candles(symbol=symbol, time_frame=time_frame, use_sandbox=use_sandbox))
+
+
+async def get_candle_columns(
+        session: ClientSession,
+        symbol: str,
+        time_frame: str,
+        structured: bool = False,
+        use_sandbox: bool = False
+) -> Any:
+    """
+    Asynchronously retrieves the candles data for a specific symbol and time frame decoded into columns.
+
+    :param session: aiohttp client session.
+    :param symbol: symbol for which candles data is required.
+    :param time_frame: time frame for the candles data.
+    :param structured: flag to return a numpy structured array instead of a dictionary of columns.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Columns sorted by ascending timestamp, see `gemini_public_api.candles`.
+    """
+    payload = await read_json(get_candles(session, symbol=symbol, time_frame=time_frame, use_sandbox=use_sandbox))
+
+    return decode_candles_structured(payload) if structured else decode_candles(payload)
 
 
 async def get_free_promos(session: ClientSession, use_sandbox: bool = False):
@@ -101,7 +127,7 @@ async def get_free_promos(session: ClientSession, use_sandbox: bool = False):
     :param use_sandbox: flag to use sandbox endpoints.
     :return: Coroutine that needs to be awaited on, returns aiohttp client response.
     """
-    return session.get(url=sandbox.FREE_PROMOS if use_sandbox else production.FREE_PROMOS)
+    return session.get(**endpoints.free_promos(use_sandbox=use_sandbox))
 
 
 async def get_current_order_book(
@@ -121,11 +147,12 @@ async def get_current_order_book(
     :param use_sandbox: flag to use sandbox endpoints.
     :return: Coroutine that needs to be awaited on, returns aiohttp client response.
     """
-    return session.get(
-        url=sandbox.CURRENT_ORDER_BOOK.format(symbol=symbol) if use_sandbox else production.CURRENT_ORDER_BOOK.format(
-            symbol=symbol),
-        params={'bid_limit': bid_limit, 'ask_limit': ask_limit}
-    )
+    return session.get(**endpoints.current_order_book(
+        symbol=symbol,
+        bid_limit=bid_limit,
+        ask_limit=ask_limit,
+        use_sandbox=use_sandbox
+    ))
 
 
 async def get_trade_history(
@@ -147,18 +174,13 @@ async def get_trade_history(
     :param use_sandbox: flag to use sandbox endpoints.
     :return: Coroutine that needs to be awaited on, returns aiohttp client response.
     """
-    return session.get(
-        url=sandbox.TRADE_HISTORY.format(symbol=symbol) if use_sandbox else production.TRADE_HISTORY.format(
-            symbol=symbol),
-        params={
-            'timestamp':      timestamp,
-            'limit_trades':   limit_trades,
-            'include_breaks': str(include_breaks).lower()
-        } if timestamp is not None else {
-            'limit_trades':   limit_trades,
-            'include_breaks': str(include_breaks).lower()
-        }
-    )
+    return session.get(**endpoints.trade_history(
+        symbol=symbol,
+        timestamp=timestamp,
+        limit_trades=limit_trades,
+        include_breaks=include_breaks,
+        use_sandbox=use_sandbox
+    ))
 
 
 async def get_price_feed(session: ClientSession, use_sandbox: bool = False):
@@ -169,4 +191,375 @@ async def get_price_feed(session: ClientSession, use_sandbox: bool = False):
     :param use_sandbox: flag to use sandbox endpoints.
     :return: Coroutine that needs to be awaited on, returns aiohttp client response.
     """
-    return session.get(url=sandbox.PRICE_FEED if use_sandbox else production.PRICE_FEED)
+    return session.get(**endpoints.price_feed(use_sandbox=use_sandbox))
+
+
+DEFAULT_CONCURRENCY: int = 10
+
+
+async def read_json(request: Awaitable) -> Any:
+    """
+    Sends a request, e.g. ``api.read_json(api.get_ticker(session, 'btcusd'))``, and decodes its body with the
+    default `JSONDecoder`. The connection is released before returning, also on errors and cancellation.
+
+    Responses of the session wrappers, e.g. `InstrumentedSession`, are decoded by their `json()`, which caches the
+    result and records the decode time of instrumented responses.
+
+    :param request: awaitable returned by one of the `get_*` functions, or by the `get` of a session.
+    :return: Decoded response, raises ClientResponseError for error statuses.
+    """
+    async with await request as response:
+        response.raise_for_status()
+
+        if isinstance(response, BufferedResponse):
+            return await response.json()
+
+        return get_default_decoder().decode(await response.read())
+
+
+async def get_model(session: ClientSession, endpoint: str, *args, **kwargs) -> Any:
+    """
+    Asynchronously calls an endpoint and decodes the response into its typed model, see `gemini_public_api.models`,
+    e.g. `await api.get_model(session, 'get_trade_history', 'btcusd')` returns a list of Trade.
+
+    :param session: aiohttp client session.
+    :param endpoint: name of one of the `get_*` functions that has a model.
+    :param args: positional arguments of the endpoint function.
+    :param kwargs: keyword arguments of the endpoint function.
+    :return: Model, or list or dictionary of models, of the endpoint.
+    """
+    if endpoint not in PARSERS:
+        raise ValueError(f'no model for endpoint: {endpoint!r}, expected one of {list(PARSERS)}')
+
+    return parse(endpoint, await read_json(globals()[endpoint](session, *args, **kwargs)))
+
+
+async def _fetch_many(
+        keys: Iterable[Hashable],
+        request_factory: Callable[[Hashable], Awaitable],
+        concurrency: int
+) -> Dict[Hashable, Union[Any, Exception]]:
+    if concurrency < 1:
+        raise ValueError(f'concurrency must be at least 1, got {concurrency}')
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(key):
+        async with semaphore:
+            try:
+                return key, await read_json(request_factory(key))
+            except Exception as e:
+                return key, e
+
+    return dict(await asyncio.gather(*(fetch(key) for key in dict.fromkeys(keys))))
+
+
+async def fetch_many_symbol_details(
+        session: ClientSession,
+        symbols: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        use_sandbox: bool = False
+) -> Dict[str, Union[Any, Exception]]:
+    """
+    Asynchronously retrieves details for many symbols with at most `concurrency` requests in flight.
+
+    :param session: aiohttp client session.
+    :param symbols: symbols for which details are required.
+    :param concurrency: maximum number of concurrent requests.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Dictionary mapping each symbol to its decoded response, or to the exception raised while fetching it.
+    """
+    return await _fetch_many(
+        symbols,
+        lambda symbol: get_symbol_details(session, symbol=symbol, use_sandbox=use_sandbox),
+        concurrency
+    )
+
+
+async def fetch_many_networks(
+        session: ClientSession,
+        tokens: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        use_sandbox: bool = False
+) -> Dict[str, Union[Any, Exception]]:
+    """
+    Asynchronously retrieves the network status of many tokens with at most `concurrency` requests in flight.
+
+    :param session: aiohttp client session.
+    :param tokens: tokens for which network status is required.
+    :param concurrency: maximum number of concurrent requests.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Dictionary mapping each token to its decoded response, or to the exception raised while fetching it.
+    """
+    return await _fetch_many(
+        tokens,
+        lambda token: get_network(session, token=token, use_sandbox=use_sandbox),
+        concurrency
+    )
+
+
+async def fetch_many_tickers(
+        session: ClientSession,
+        symbols: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        use_sandbox: bool = False
+) -> Dict[str, Union[Any, Exception]]:
+    """
+    Asynchronously retrieves tickers for many symbols with at most `concurrency` requests in flight.
+
+    :param session: aiohttp client session.
+    :param symbols: symbols for which tickers are required.
+    :param concurrency: maximum number of concurrent requests.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Dictionary mapping each symbol to its decoded response, or to the exception raised while fetching it.
+    """
+    return await _fetch_many(
+        symbols,
+        lambda symbol: get_ticker(session, symbol=symbol, use_sandbox=use_sandbox),
+        concurrency
+    )
+
+
+async def fetch_many_tickers_v2(
+        session: ClientSession,
+        symbols: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        use_sandbox: bool = False
+) -> Dict[str, Union[Any, Exception]]:
+    """
+    Asynchronously retrieves tickers (version 2) for many symbols with at most `concurrency` requests in flight.
+
+    :param session: aiohttp client session.
+    :param symbols: symbols for which tickers (version 2) are required.
+    :param concurrency: maximum number of concurrent requests.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Dictionary mapping each symbol to its decoded response, or to the exception raised while fetching it.
+    """
+    return await _fetch_many(
+        symbols,
+        lambda symbol: get_ticker_v2(session, symbol=symbol, use_sandbox=use_sandbox),
+        concurrency
+    )
+
+
+async def fetch_many_candles(
+        session: ClientSession,
+        symbols: Iterable[str],
+        time_frame: str,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        use_sandbox: bool = False
+) -> Dict[str, Union[Any, Exception]]:
+    """
+    Asynchronously retrieves candles for many symbols with at most `concurrency` requests in flight.
+
+    :param session: aiohttp client session.
+    :param symbols: symbols for which candles data is required.
+    :param time_frame: time frame for the candles data.
+    :param concurrency: maximum number of concurrent requests.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Dictionary mapping each symbol to its decoded response, or to the exception raised while fetching it.
+    """
+    return await _fetch_many(
+        symbols,
+        lambda symbol: get_candles(session, symbol=symbol, time_frame=time_frame, use_sandbox=use_sandbox),
+        concurrency
+    )
+
+
+async def fetch_many_order_books(
+        session: ClientSession,
+        symbols: Iterable[str],
+        bid_limit: int = 500,
+        ask_limit: int = 500,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        use_sandbox: bool = False
+) -> Dict[str, Union[Any, Exception]]:
+    """
+    Asynchronously retrieves order books for many symbols with at most `concurrency` requests in flight.
+
+    :param session: aiohttp client session.
+    :param symbols: symbols for which order books are required.
+    :param bid_limit: limit for bid orders.
+    :param ask_limit: limit for ask orders.
+    :param concurrency: maximum number of concurrent requests.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Dictionary mapping each symbol to its decoded response, or to the exception raised while fetching it.
+    """
+    return await _fetch_many(
+        symbols,
+        lambda symbol: get_current_order_book(
+            session, symbol=symbol, bid_limit=bid_limit, ask_limit=ask_limit, use_sandbox=use_sandbox
+        ),
+        concurrency
+    )
+
+
+async def fetch_many_trade_histories(
+        session: ClientSession,
+        symbols: Iterable[str],
+        timestamp: Optional[int] = None,
+        limit_trades: int = 500,
+        include_breaks: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        use_sandbox: bool = False
+) -> Dict[str, Union[Any, Exception]]:
+    """
+    Asynchronously retrieves trade histories for many symbols with at most `concurrency` requests in flight.
+
+    :param session: aiohttp client session.
+    :param symbols: symbols for which trade histories are required.
+    :param timestamp: starting timestamp for the trade history.
+    :param limit_trades: limit for number of trades in each history.
+    :param include_breaks: flag to include breaks in the trade history.
+    :param concurrency: maximum number of concurrent requests.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Dictionary mapping each symbol to its decoded response, or to the exception raised while fetching it.
+    """
+    return await _fetch_many(
+        symbols,
+        lambda symbol: get_trade_history(
+            session,
+            symbol=symbol,
+            timestamp=timestamp,
+            limit_trades=limit_trades,
+            include_breaks=include_breaks,
+            use_sandbox=use_sandbox
+        ),
+        concurrency
+    )
+
+
+async def iter_trades(
+        session: ClientSession,
+        symbol: str,
+        since: int,
+        until: Optional[int] = None,
+        limit_trades: int = 500,
+        include_breaks: bool = False,
+        use_sandbox: bool = False
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Asynchronously iterates over all trades for a specific symbol in [since, until), oldest first.
+
+    Pages are requested lazily as the iterator is consumed and duplicates at page boundaries are dropped.
+
+    :param session: aiohttp client session.
+    :param symbol: symbol for which trades are required.
+    :param since: inclusive start, in milliseconds.
+    :param until: exclusive end, in milliseconds, or None to iterate up to the latest trade.
+    :param limit_trades: number of trades requested per page.
+    :param include_breaks: flag to include breaks in the trade history.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Async iterator over decoded trades.
+    """
+    cursor = TradeCursor(since=since, until=until, limit_trades=limit_trades)
+
+    while not cursor.done:
+        page = await read_json(
+            get_trade_history(
+                session,
+                symbol=symbol,
+                timestamp=cursor.timestamp,
+                limit_trades=limit_trades,
+                include_breaks=include_breaks,
+                use_sandbox=use_sandbox
+            )
+        )
+
+        for trade in cursor.advance(page):
+            yield trade
+
+
+async def _stream(request: Awaitable, chunk_size: int) -> AsyncIterator[Record]:
+    async with await request as response:
+        response.raise_for_status()
+
+        async for record in aiter_records(response.content.iter_chunked(chunk_size)):
+            yield record
+
+
+async def stream_current_order_book(
+        session: ClientSession,
+        symbol: str,
+        bid_limit: int = 500,
+        ask_limit: int = 500,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        use_sandbox: bool = False
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Asynchronously retrieves the current order book for a specific symbol, decoding its levels one at a time as the
+    body arrives, see `gemini_public_api.streaming`.
+
+    The connection is released once the iterator is exhausted or closed, e.g. with ``contextlib.aclosing``.
+
+    :param session: aiohttp client session.
+    :param symbol: symbol for which order book is required.
+    :param bid_limit: limit for bid orders.
+    :param ask_limit: limit for ask orders.
+    :param chunk_size: maximum number of bytes to read at a time.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Async iterator over (side, level) pairs, where side is 'bids' or 'asks'.
+    """
+    request = get_current_order_book(
+        session,
+        symbol=symbol,
+        bid_limit=bid_limit,
+        ask_limit=ask_limit,
+        use_sandbox=use_sandbox
+    )
+
+    async for side, level in _stream(request, chunk_size):
+        yield side, level
+
+
+async def stream_trade_history(
+        session: ClientSession,
+        symbol: str,
+        timestamp: Optional[int] = None,
+        limit_trades: int = 500,
+        include_breaks: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        use_sandbox: bool = False
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Asynchronously retrieves the trade history for a specific symbol, decoding its trades one at a time as the body
+    arrives. The connection is released once the iterator is exhausted or closed.
+
+    :param session: aiohttp client session.
+    :param symbol: symbol for which trade history is required.
+    :param timestamp: starting timestamp for the trade history.
+    :param limit_trades: limit for number of trades in the history.
+    :param include_breaks: flag to include breaks in the trade history.
+    :param chunk_size: maximum number of bytes to read at a time.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Async iterator over decoded trades.
+    """
+    request = get_trade_history(
+        session,
+        symbol=symbol,
+        timestamp=timestamp,
+        limit_trades=limit_trades,
+        include_breaks=include_breaks,
+        use_sandbox=use_sandbox
+    )
+
+    async for _, trade in _stream(request, chunk_size):
+        yield trade
+
+
+async def stream_price_feed(
+        session: ClientSession,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        use_sandbox: bool = False
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Asynchronously retrieves the price feed, decoding its entries one at a time as the body arrives. The connection
+    is released once the iterator is exhausted or closed.
+
+    :param session: aiohttp client session.
+    :param chunk_size: maximum number of bytes to read at a time.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Async iterator over decoded price feed entries.
+    """
+    async for _, entry in _stream(get_price_feed(session, use_sandbox=use_sandbox), chunk_size):
+        yield entry
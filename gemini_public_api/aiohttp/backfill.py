@@ -0,0 +1,154 @@
+import asyncio
+import heapq
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List
+
+from aiohttp import ClientSession
+
+from gemini_public_api.aiohttp.api import get_trade_history, read_json
+from gemini_public_api.pagination import trade_key
+
+DEFAULT_PARALLELISM: int = 8
+DEFAULT_WINDOW_MS: int = 60 * 60 * 1000
+
+
+class _WindowFetcher:
+    def __init__(
+            self,
+            session: ClientSession,
+            symbol: str,
+            semaphore: asyncio.Semaphore,
+            limit_trades: int,
+            include_breaks: bool,
+            use_sandbox: bool
+    ):
+        self.session = session
+        self.symbol = symbol
+        self.semaphore = semaphore
+        self.limit_trades = limit_trades
+        self.include_breaks = include_breaks
+        self.use_sandbox = use_sandbox
+
+    async def fetch(self, start: int, end: int) -> List[List[Dict[str, Any]]]:
+        """
+        Fetches all trades in [start, end) as a list of sorted runs, subdividing the window when a page overflows.
+        """
+        async with self.semaphore:
+            page = await read_json(
+                get_trade_history(
+                    self.session,
+                    symbol=self.symbol,
+                    timestamp=start,
+                    limit_trades=self.limit_trades,
+                    include_breaks=self.include_breaks,
+                    use_sandbox=self.use_sandbox
+                )
+            )
+
+        page.sort(key=trade_key)
+        runs = [[trade for trade in page if start <= trade['timestampms'] < end]]
+
+        if len(page) < self.limit_trades or page[-1]['timestampms'] >= end:
+            return runs
+
+        last = page[-1]['timestampms']
+
+        if last == start:
+            # A full page within a single millisecond cannot be paged through, skip past it.
+            if start + 1 < end:
+                runs.extend(await self.fetch(start + 1, end))
+
+            return runs
+
+        # The page overflowed, split the rest of the window and fetch both halves concurrently.
+        # The rest starts at `last` again since the page may have been cut within that millisecond.
+        middle = (last + end) // 2
+
+        if middle <= last:
+            return runs + await self.fetch(last, end)
+
+        for child in await asyncio.gather(self.fetch(last, middle), self.fetch(middle, end)):
+            runs.extend(child)
+
+        return runs
+
+
+async def backfill_trades(
+        session: ClientSession,
+        symbol: str,
+        since: int,
+        until: int,
+        parallelism: int = DEFAULT_PARALLELISM,
+        window: int = DEFAULT_WINDOW_MS,
+        limit_trades: int = 500,
+        include_breaks: bool = False,
+        use_sandbox: bool = False
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Asynchronously backfills all trades for a specific symbol in [since, until), oldest first.
+
+    The range is split into windows of `window` milliseconds which are fetched concurrently with at most
+    `parallelism` requests in flight. Windows holding more than `limit_trades` trades are subdivided until
+    every page fits. The pages of each window are k-way merged into one ordered stream without duplicates,
+    and windows are yielded in order while the following ones are still being fetched.
+
+    :param session: aiohttp client session.
+    :param symbol: symbol for which trades are required.
+    :param since: inclusive start, in milliseconds.
+    :param until: exclusive end, in milliseconds.
+    :param parallelism: maximum number of concurrent requests.
+    :param window: initial window size, in milliseconds.
+    :param limit_trades: number of trades requested per page.
+    :param include_breaks: flag to include breaks in the trade history.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Async iterator over decoded trades.
+    """
+    if parallelism < 1:
+        raise ValueError(f'parallelism must be at least 1, got {parallelism}')
+
+    if window < 1:
+        raise ValueError(f'window must be at least 1, got {window}')
+
+    fetcher = _WindowFetcher(
+        session=session,
+        symbol=symbol,
+        semaphore=asyncio.Semaphore(parallelism),
+        limit_trades=limit_trades,
+        include_breaks=include_breaks,
+        use_sandbox=use_sandbox
+    )
+
+    starts = iter(range(since, until, window))
+    pending: Deque[asyncio.Task] = deque()
+
+    def schedule() -> None:
+        # Keep twice as many windows scheduled as can be in flight, so the next windows are ready when
+        # the current one is yielded without buffering the whole range in memory.
+        while len(pending) < 2 * parallelism:
+            start = next(starts, None)
+
+            if start is None:
+                return
+
+            pending.append(asyncio.ensure_future(fetcher.fetch(start, min(start + window, until))))
+
+    last_key = None
+
+    try:
+        schedule()
+
+        while pending:
+            runs = await pending.popleft()
+            schedule()
+
+            for trade in heapq.merge(*runs, key=trade_key):
+                key = trade_key(trade)
+
+                if key == last_key:
+                    continue
+
+                last_key = key
+                yield trade
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,211 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from aiohttp import ClientSession
+
+import gemini_public_api.aiohttp.api as api
+from gemini_public_api.cache import (
+    DEFAULT_MAX_SIZE,
+    DEFAULT_MAX_STALE,
+    DEFAULT_TTLS,
+    FRESH,
+    STALE,
+    TTLCache,
+    cache_key,
+    key_predicate
+)
+
+
+class CachedAPI:
+    """
+    An asynchronous caching layer over the reference-data endpoints of `gemini_public_api.aiohttp.api`.
+
+    `get_symbols`, `get_symbol_details`, `get_network` and `get_free_promos` return decoded payloads that are
+    cached for a per-endpoint TTL in a bounded LRU cache. Concurrent misses on the same key await a single
+    fetch, and once an entry expires it is still served for up to `max_stale` seconds while a background
+    task refreshes it.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        async with SessionContextManager() as session:
+            cached = CachedAPI(session)
+
+            symbols = await cached.get_symbols()
+            details = await asyncio.gather(*(cached.get_symbol_details(symbol) for symbol in symbols))
+
+            await cached.close()
+
+    Attributes
+    ----------
+    session
+        aiohttp client session used to fetch.
+    cache
+        The TTLCache holding the decoded payloads.
+    """
+
+    def __init__(
+            self,
+            session: ClientSession,
+            ttls: Optional[Dict[str, float]] = None,
+            max_size: int = DEFAULT_MAX_SIZE,
+            max_stale: float = DEFAULT_MAX_STALE,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        :param session: aiohttp client session.
+        :param ttls: per-endpoint TTLs in seconds, merged over `DEFAULT_TTLS`.
+        :param max_size: maximum number of cached payloads.
+        :param max_stale: seconds an expired payload is served while it is refreshed, 0 to always await a fetch.
+        :param clock: monotonic clock returning seconds.
+        """
+        self.session = session
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.cache = TTLCache(max_size=max_size, max_stale=max_stale, clock=clock)
+
+        self.refreshes = 0
+        self.refresh_errors = 0
+        self.coalesced = 0
+
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+
+    async def close(self) -> None:
+        """
+        Cancels fetches and background refreshes that are still running. The session is not closed.
+        """
+        tasks = list(self._in_flight.values())
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _fetch(self, key: Tuple[Hashable, ...], fetch: Callable[[], Awaitable], background: bool) -> asyncio.Task:
+        task = self._in_flight.get(key)
+
+        if task is not None:
+            return task
+
+        generation = self.cache.generation
+
+        async def run():
+            value = await fetch()
+            # Dropped if the key was invalidated while the fetch ran.
+            self.cache.put(key, value, self.ttls[key[0]], generation)
+            return value
+
+        def done(finished: asyncio.Task) -> None:
+            if self._in_flight.get(key) is finished:
+                del self._in_flight[key]
+
+            if finished.cancelled():
+                return
+
+            if finished.exception() is not None:
+                if background:
+                    self.refresh_errors += 1
+            elif background:
+                self.refreshes += 1
+
+        task = asyncio.ensure_future(run())
+        task.add_done_callback(done)
+        self._in_flight[key] = task
+
+        return task
+
+    async def _get(self, key: Tuple[Hashable, ...], fetch: Callable[[], Awaitable]) -> Any:
+        state, value = self.cache.lookup(key)
+
+        if state == FRESH:
+            return value
+
+        if state == STALE:
+            self._fetch(key, fetch, background=True)
+            return value
+
+        if key in self._in_flight:
+            self.coalesced += 1
+
+        # Shielded so that a cancelled caller does not cancel the fetch other callers are waiting on.
+        return await asyncio.shield(self._fetch(key, fetch, background=False))
+
+    async def get_symbols(self, use_sandbox: bool = False) -> Any:
+        """
+        Asynchronously retrieves all available trading symbols, cached.
+
+        :param use_sandbox: flag to use sandbox endpoints.
+        :return: Decoded response.
+        """
+        return await self._get(
+            cache_key('get_symbols', use_sandbox),
+            lambda: api.read_json(api.get_symbols(self.session, use_sandbox=use_sandbox))
+        )
+
+    async def get_symbol_details(self, symbol: str, use_sandbox: bool = False) -> Any:
+        """
+        Asynchronously retrieves detailed information for a specific symbol, cached.
+
+        :param symbol: symbol for which details are required.
+        :param use_sandbox: flag to use sandbox endpoints.
+        :return: Decoded response.
+        """
+        return await self._get(
+            cache_key('get_symbol_details', use_sandbox, symbol),
+            lambda: api.read_json(api.get_symbol_details(self.session, symbol=symbol, use_sandbox=use_sandbox))
+        )
+
+    async def get_network(self, token: str, use_sandbox: bool = False) -> Any:
+        """
+        Asynchronously retrieves the network status of a token, cached.
+
+        :param token: token for which network status is required.
+        :param use_sandbox: flag to use sandbox endpoints.
+        :return: Decoded response.
+        """
+        return await self._get(
+            cache_key('get_network', use_sandbox, token),
+            lambda: api.read_json(api.get_network(self.session, token=token, use_sandbox=use_sandbox))
+        )
+
+    async def get_free_promos(self, use_sandbox: bool = False) -> Any:
+        """
+        Asynchronously retrieves all available free promotions, cached.
+
+        :param use_sandbox: flag to use sandbox endpoints.
+        :return: Decoded response.
+        """
+        return await self._get(
+            cache_key('get_free_promos', use_sandbox),
+            lambda: api.read_json(api.get_free_promos(self.session, use_sandbox=use_sandbox))
+        )
+
+    def invalidate(self, endpoint: Optional[str] = None, *args: Hashable, use_sandbox: Optional[bool] = None) -> None:
+        """
+        Drops cached payloads, e.g. `invalidate()`, `invalidate('get_symbols')` or
+        `invalidate('get_symbol_details', 'btcusd')`.
+
+        :param endpoint: endpoint to invalidate, all endpoints if None.
+        :param args: endpoint arguments to invalidate, all arguments if empty.
+        :param use_sandbox: only invalidate sandbox (True) or production (False) payloads, both if None.
+        """
+        predicate = key_predicate(endpoint, args, use_sandbox)
+
+        self.cache.invalidate_where(predicate)
+
+        # Fetches already running may return the old payload, later calls start their own.
+        for key in [key for key in self._in_flight if predicate(key)]:
+            del self._in_flight[key]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        :return: Dictionary of the cache counters, background refreshes, failed refreshes and coalesced misses.
+        """
+        return {
+            **self.cache.stats(),
+            'refreshes':      self.refreshes,
+            'refresh_errors': self.refresh_errors,
+            'coalesced':      self.coalesced
+        }
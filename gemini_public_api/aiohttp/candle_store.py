@@ -0,0 +1,34 @@
+from aiohttp import ClientSession
+
+from gemini_public_api.aiohttp.api import get_candle_columns
+from gemini_public_api.candle_store import CandleStore, SyncResult
+
+
+async def sync(session: ClientSession, store: CandleStore, symbol: str, time_frame: str) -> SyncResult:
+    """
+    Asynchronously fetches the latest candles and stores the new complete ones, see `CandleStore.sync`.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        async with SessionContextManager() as session:
+            with CandleStore('candles') as store:
+                await asyncio.gather(*(sync(session, store, symbol, '1m') for symbol in symbols))
+
+    :param session: aiohttp client session.
+    :param store: store to append to.
+    :param symbol: symbol, e.g. 'btcusd'.
+    :param time_frame: time frame, e.g. '1m'.
+    :return: SyncResult with the appended candles and any gaps before them.
+    """
+    candles = await get_candle_columns(
+        session,
+        symbol=symbol,
+        time_frame=time_frame,
+        structured=True,
+        use_sandbox=store.use_sandbox
+    )
+
+    return store.extend(symbol, time_frame, candles)
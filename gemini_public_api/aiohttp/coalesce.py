@@ -0,0 +1,118 @@
+import asyncio
+from functools import partial
+from typing import Any, Dict, Mapping, Optional
+
+from aiohttp import ClientSession
+from yarl import URL
+
+from gemini_public_api.aiohttp.response import BufferedResponse, RequestContextManager
+
+
+class _Flight:
+    __slots__ = ('task', 'waiters')
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class CoalescingSession:
+    """
+    Wraps an aiohttp ``ClientSession`` so that concurrent identical GET requests share one HTTP round trip.
+
+    Requests are keyed by their fully resolved URL including query parameters. While a request is in flight,
+    further requests with the same key wait for it instead of opening their own. Each of them receives its own
+    view of the same `BufferedResponse`: the body and its decoded JSON are shared, but every caller reads
+    `content` from its own position, so concurrent streaming consumers each see the whole body. Nothing is cached
+    once the request completes.
+    A cancelled waiter does not affect the others; the request itself is only cancelled once nobody waits on it.
+
+    The wrapper can be passed wherever the functions in `gemini_public_api.aiohttp.api` expect a session, so
+    existing call sites do not change. Other attributes are forwarded to the wrapped session.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        async with SessionContextManager() as session:
+            session = CoalescingSession(session)
+
+            async with await api.get_ticker_v2(session, 'btcusd') as resp:
+                print(await resp.json())
+
+    Attributes
+    ----------
+    session
+        The wrapped aiohttp client session.
+    requests
+        Number of requests sent to the wrapped session.
+    coalesced
+        Number of requests that joined one already in flight.
+    """
+
+    def __init__(self, session: ClientSession):
+        """
+        :param session: aiohttp client session to send requests with.
+        """
+        self.session = session
+        self.requests = 0
+        self.coalesced = 0
+
+        self._in_flight: Dict[str, _Flight] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.session, name)
+
+    def get(self, url: Any, params: Optional[Mapping[str, Any]] = None, **kwargs):
+        """
+        Sends a GET request, joining an identical one already in flight.
+
+        Requests with extra keyword arguments, e.g. headers, are sent as they are without coalescing.
+
+        :param url: request URL.
+        :param params: query parameters.
+        :return: Awaitable async context manager resolving to a BufferedResponse.
+        """
+        if kwargs:
+            return self.session.get(url, params=params, **kwargs)
+
+        resolved = URL(url)
+
+        if params:
+            resolved = resolved.update_query(params)
+
+        return RequestContextManager(partial(self._join, str(resolved), url, params))
+
+    async def _fetch(self, url: Any, params: Optional[Mapping[str, Any]]) -> BufferedResponse:
+        self.requests += 1
+
+        async with self.session.get(url, params=params) as response:
+            return await BufferedResponse.from_response(response)
+
+    async def _join(self, key: str, url: Any, params: Optional[Mapping[str, Any]]) -> BufferedResponse:
+        flight = self._in_flight.get(key)
+
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(self._fetch(url, params)))
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+            self._in_flight[key] = flight
+        else:
+            self.coalesced += 1
+
+        flight.waiters += 1
+
+        try:
+            return (await asyncio.shield(flight.task)).view()
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                # The last waiter gave up, free the connection and let the next request start afresh.
+                self._forget(key, flight)
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _forget(self, key: str, flight: _Flight) -> None:
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
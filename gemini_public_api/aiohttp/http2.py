@@ -0,0 +1,102 @@
+from functools import partial
+from typing import Any, Mapping, Optional
+
+from gemini_public_api.aiohttp.response import BufferedResponse, RequestContextManager
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+DEFAULT_MAX_CONNECTIONS: int = 2
+
+
+class HTTP2Session:
+    """
+    An HTTP/2 stand-in for an aiohttp ``ClientSession``, backed by an ``httpx.AsyncClient``.
+
+    aiohttp speaks HTTP/1.1 only, so every concurrent request needs its own connection. This session
+    multiplexes all concurrent requests to a host as streams over a few HTTP/2 connections instead.
+    Its `get` returns `BufferedResponse` objects, so it can be passed wherever the functions in
+    `gemini_public_api.aiohttp.api` expect a session, and wrapped by `CoalescingSession` or `ThrottledSession`.
+
+    Requires ``httpx`` with HTTP/2 support, install it with `pip install gemini-public-api[http2]`.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        async with HTTP2Session() as session:
+            tickers = await api.fetch_many_tickers(session, symbols, concurrency=100)
+
+    Attributes
+    ----------
+    client
+        The underlying ``httpx.AsyncClient``.
+    """
+
+    def __init__(
+            self,
+            http2: bool = True,
+            max_connections: int = DEFAULT_MAX_CONNECTIONS,
+            timeout: Optional[float] = None,
+            client: Optional['httpx.AsyncClient'] = None,
+            **kwargs
+    ):
+        """
+        :param http2: negotiate HTTP/2, falls back to HTTP/1.1 if the server does not support it.
+        :param max_connections: maximum number of connections, each carrying many concurrent streams.
+        :param timeout: timeout of each request in seconds, None to wait indefinitely.
+        :param client: existing client to use, the other arguments are ignored if given.
+        :param kwargs: further keyword arguments of ``httpx.AsyncClient``.
+        """
+        if client is None:
+            if httpx is None:
+                raise ImportError('httpx is not installed, install it with `pip install gemini-public-api[http2]`')
+
+            client = httpx.AsyncClient(
+                http2=http2,
+                limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+                timeout=timeout,
+                **kwargs
+            )
+
+        self.client = client
+
+    async def __aenter__(self) -> 'HTTP2Session':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    @property
+    def closed(self) -> bool:
+        return self.client.is_closed
+
+    async def close(self) -> None:
+        """
+        Closes all connections of the underlying client.
+        """
+        await self.client.aclose()
+
+    def get(self, url: Any, params: Optional[Mapping[str, Any]] = None, **kwargs) -> RequestContextManager:
+        """
+        Sends a GET request.
+
+        :param url: request URL.
+        :param params: query parameters.
+        :return: Awaitable async context manager resolving to a BufferedResponse.
+        """
+        return RequestContextManager(partial(self._send, url, params, kwargs))
+
+    async def _send(self, url: Any, params: Optional[Mapping[str, Any]], kwargs) -> BufferedResponse:
+        response = await self.client.get(str(url), params=params, **kwargs)
+
+        return BufferedResponse(
+            url=str(response.url),
+            status=response.status_code,
+            headers=response.headers.multi_items(),
+            body=response.content,
+            reason=response.reason_phrase
+        )
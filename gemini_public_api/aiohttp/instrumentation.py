@@ -0,0 +1,182 @@
+import time
+from functools import partial
+from typing import Any, Dict, Mapping, Optional
+
+from aiohttp import ClientSession, TraceConfig
+
+from gemini_public_api.aiohttp.response import BufferedResponse, RequestContextManager
+from gemini_public_api.instrumentation import Instrumentation, Timing, endpoint_name
+from gemini_public_api.json_decoder import get_default_decoder
+
+
+class _Trace:
+    """
+    Per-request `trace_request_ctx` filled in by the callbacks of `trace_config`.
+    """
+
+    __slots__ = (
+        'started', 'queue_started', 'queue_ended', 'dns_started', 'dns_ended', 'connect_started', 'connect_ended',
+        'sent', 'received'
+    )
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, None)
+
+    def phases(self) -> Dict[str, float]:
+        phases = {}
+
+        if self.queue_ended is not None:
+            phases['queue'] = self.queue_ended - self.queue_started
+
+        dns = self.dns_ended - self.dns_started if self.dns_ended is not None else 0.0
+
+        if self.dns_ended is not None:
+            phases['dns'] = dns
+
+        if self.connect_ended is not None:
+            # aiohttp resolves the host and performs the TLS handshake while creating the connection.
+            phases['connect'] = max(0.0, self.connect_ended - self.connect_started - dns)
+
+        if self.received is not None:
+            phases['ttfb'] = self.received - (self.sent if self.sent is not None else self.started)
+
+        return phases
+
+
+def _mark(attribute: str):
+    async def callback(session, context, params) -> None:
+        trace = context.trace_request_ctx
+
+        if isinstance(trace, _Trace):
+            setattr(trace, attribute, time.perf_counter())
+
+    return callback
+
+
+def trace_config() -> TraceConfig:
+    """
+    Creates an aiohttp ``TraceConfig`` that reports the connection pool wait, DNS lookup, connection setup and
+    time to first byte of requests sent through an `InstrumentedSession`. Requests sent otherwise are ignored.
+
+    :return: TraceConfig to pass to ``ClientSession(trace_configs=[...])``.
+    """
+    config = TraceConfig()
+    signals = {
+        'started':         config.on_request_start,
+        'queue_started':   config.on_connection_queued_start,
+        'queue_ended':     config.on_connection_queued_end,
+        'dns_started':     config.on_dns_resolvehost_start,
+        'dns_ended':       config.on_dns_resolvehost_end,
+        'connect_started': config.on_connection_create_start,
+        'connect_ended':   config.on_connection_create_end,
+        'sent':            config.on_request_headers_sent,
+        'received':        config.on_request_end
+    }
+
+    for attribute, signal in signals.items():
+        signal.append(_mark(attribute))
+
+    return config
+
+
+class InstrumentedResponse(BufferedResponse):
+    """
+    A `BufferedResponse` that records how long decoding its JSON body takes.
+
+    Attributes
+    ----------
+    instrumentation
+        The Instrumentation decode timings are recorded with.
+    """
+
+    instrumentation: Instrumentation
+
+    async def json(self, *, loads=None, **kwargs) -> Any:
+        if loads is None and 'json' not in self._decoded and self.body.strip():
+            self._decoded['json'] = self.instrumentation.decode(
+                get_default_decoder().decode, self.body, self.url, self.status
+            )
+
+        return await super().json(loads=loads, **kwargs)
+
+
+class InstrumentedSession:
+    """
+    Wraps an aiohttp ``ClientSession`` to record a `Timing` of every request, see `gemini_public_api.instrumentation`.
+
+    Every request reports `ttfb`, `transfer` and `total`, and `decode` once its body is decoded by `json()` or by
+    `api.read_json`, which the `fetch_many_*` functions and the other helpers use.
+    If the session was created with `trace_config`, requests also report `queue`, `dns` and `connect`, which
+    includes the TLS handshake, and `ttfb` then excludes connection setup. Responses are read into an
+    `InstrumentedResponse`.
+
+    The wrapper can be passed wherever the functions in `gemini_public_api.aiohttp.api` expect a session.
+    Other attributes are forwarded to the wrapped session.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        histograms = HistogramSink()
+
+        async with ClientSession(trace_configs=[trace_config()]) as client:
+            session = InstrumentedSession(client, Instrumentation(histograms))
+            tickers = await api.fetch_many_tickers(session, symbols)
+
+    Attributes
+    ----------
+    session
+        The wrapped aiohttp client session.
+    instrumentation
+        The Instrumentation timings are recorded with.
+    """
+
+    def __init__(self, session: ClientSession, instrumentation: Instrumentation, trace: Optional[bool] = None):
+        """
+        :param session: aiohttp client session to send requests with.
+        :param instrumentation: instrumentation to record timings with.
+        :param trace: pass a `trace_request_ctx` to the session for `trace_config`, by default only if it is a
+            ``ClientSession``.
+        """
+        self.session = session
+        self.instrumentation = instrumentation
+        self.trace = isinstance(session, ClientSession) if trace is None else trace
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.session, name)
+
+    def get(self, url: Any, params: Optional[Mapping[str, Any]] = None, **kwargs) -> RequestContextManager:
+        """
+        Sends a GET request.
+
+        :param url: request URL.
+        :param params: query parameters.
+        :return: Awaitable async context manager resolving to an InstrumentedResponse.
+        """
+        return RequestContextManager(partial(self._send, url, params, kwargs))
+
+    async def _send(self, url: Any, params: Optional[Mapping[str, Any]], kwargs) -> InstrumentedResponse:
+        trace = _Trace()
+
+        if self.trace:
+            kwargs = {**kwargs, 'trace_request_ctx': trace}
+
+        started = time.perf_counter()
+
+        async with self.session.get(url, params=params, **kwargs) as response:
+            received = time.perf_counter()
+            result = await InstrumentedResponse.from_response(response)
+
+        ended = time.perf_counter()
+        result.instrumentation = self.instrumentation
+
+        phases = trace.phases()
+        phases.setdefault('ttfb', received - started)
+        phases['transfer'] = ended - (trace.received if trace.received is not None else received)
+        phases['total'] = ended - started
+
+        self.instrumentation.record(Timing(endpoint_name(url), str(url), result.status, len(result.body), phases))
+
+        return result
@@ -0,0 +1,162 @@
+from typing import Any, Optional
+
+from aiohttp import ClientSession
+
+import gemini_public_api.aiohttp.api as api
+
+# The functions below mirror those of `gemini_public_api.aiohttp.api`, but own the whole life of their request
+# through `api.read_json`: it is sent, its body read and decoded, and its connection released before the result
+# is returned. Errors, including cancellation and timeouts, leave through the response context manager, which
+# releases the connection too, closing it if its body was not read in full. Callers therefore cannot hold on to
+# pooled connections.
+
+
+async def get_symbols(session: ClientSession, use_sandbox: bool = False) -> Any:
+    """
+    Asynchronously retrieves all available trading symbols.
+
+    :param session: aiohttp client session.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Decoded response, raises ClientResponseError for error statuses.
+    """
+    return await api.read_json(api.get_symbols(session, use_sandbox=use_sandbox))
+
+
+async def get_symbol_details(session: ClientSession, symbol: str, use_sandbox: bool = False) -> Any:
+    """
+    Asynchronously retrieves detailed information for a specific symbol.
+
+    :param session: aiohttp client session.
+    :param symbol: symbol for which details are required.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Decoded response, raises ClientResponseError for error statuses.
+    """
+    return await api.read_json(api.get_symbol_details(session, symbol=symbol, use_sandbox=use_sandbox))
+
+
+async def get_network(session: ClientSession, token: str, use_sandbox: bool = False) -> Any:
+    """
+    Asynchronously retrieves the network status of a token.
+
+    :param session: aiohttp client session.
+    :param token: token for which network status is required.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Decoded response, raises ClientResponseError for error statuses.
+    """
+    return await api.read_json(api.get_network(session, token=token, use_sandbox=use_sandbox))
+
+
+async def get_ticker(session: ClientSession, symbol: str, use_sandbox: bool = False) -> Any:
+    """
+    Asynchronously retrieves the ticker for a specific symbol.
+
+    :param session: aiohttp client session.
+    :param symbol: symbol for which ticker is required.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Decoded response, raises ClientResponseError for error statuses.
+    """
+    return await api.read_json(api.get_ticker(session, symbol=symbol, use_sandbox=use_sandbox))
+
+
+async def get_ticker_v2(session: ClientSession, symbol: str, use_sandbox: bool = False) -> Any:
+    """
+    Asynchronously retrieves the ticker (version 2) for a specific symbol.
+
+    :param session: aiohttp client session.
+    :param symbol: symbol for which ticker (version 2) is required.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Decoded response, raises ClientResponseError for error statuses.
+    """
+    return await api.read_json(api.get_ticker_v2(session, symbol=symbol, use_sandbox=use_sandbox))
+
+
+async def get_candles(session: ClientSession, symbol: str, time_frame: str, use_sandbox: bool = False) -> Any:
+    """
+    Asynchronously retrieves the candles data for a specific symbol and time frame.
+
+    :param session: aiohttp client session.
+    :param symbol: symbol for which candles data is required.
+    :param time_frame: time frame for the candles data.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Decoded response, raises ClientResponseError for error statuses.
+    """
+    return await api.read_json(
+        api.get_candles(session, symbol=symbol, time_frame=time_frame, use_sandbox=use_sandbox)
+    )
+
+
+async def get_free_promos(session: ClientSession, use_sandbox: bool = False) -> Any:
+    """
+    Asynchronously retrieves all available free promotions.
+
+    :param session: aiohttp client session.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Decoded response, raises ClientResponseError for error statuses.
+    """
+    return await api.read_json(api.get_free_promos(session, use_sandbox=use_sandbox))
+
+
+async def get_current_order_book(
+        session: ClientSession,
+        symbol: str,
+        bid_limit: int = 500,
+        ask_limit: int = 500,
+        use_sandbox: bool = False
+) -> Any:
+    """
+    Asynchronously retrieves the current order book for a specific symbol.
+
+    :param session: aiohttp client session.
+    :param symbol: symbol for which order book is required.
+    :param bid_limit: limit for bid orders.
+    :param ask_limit: limit for ask orders.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Decoded response, raises ClientResponseError for error statuses.
+    """
+    return await api.read_json(api.get_current_order_book(
+        session,
+        symbol=symbol,
+        bid_limit=bid_limit,
+        ask_limit=ask_limit,
+        use_sandbox=use_sandbox
+    ))
+
+
+async def get_trade_history(
+        session: ClientSession,
+        symbol: str,
+        timestamp: Optional[int] = None,
+        limit_trades: int = 500,
+        include_breaks: bool = False,
+        use_sandbox: bool = False
+) -> Any:
+    """
+    Asynchronously retrieves the trade history for a specific symbol.
+
+    :param session: aiohttp client session.
+    :param symbol: symbol for which trade history is required.
+    :param timestamp: starting timestamp for the trade history.
+    :param limit_trades: limit for number of trades in the history.
+    :param include_breaks: flag to include breaks in the trade history.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Decoded response, raises ClientResponseError for error statuses.
+    """
+    return await api.read_json(api.get_trade_history(
+        session,
+        symbol=symbol,
+        timestamp=timestamp,
+        limit_trades=limit_trades,
+        include_breaks=include_breaks,
+        use_sandbox=use_sandbox
+    ))
+
+
+async def get_price_feed(session: ClientSession, use_sandbox: bool = False) -> Any:
+    """
+    Asynchronously retrieves the price feed.
+
+    :param session: aiohttp client session.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Decoded response, raises ClientResponseError for error statuses.
+    """
+    return await api.read_json(api.get_price_feed(session, use_sandbox=use_sandbox))
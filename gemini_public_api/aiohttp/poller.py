@@ -0,0 +1,384 @@
+import asyncio
+import heapq
+import inspect
+import itertools
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from aiohttp import ClientSession
+
+import gemini_public_api.aiohttp.api as api
+
+DEFAULT_CONCURRENCY: int = 10
+DEFAULT_MIN_INTERVAL: float = 1.0
+DEFAULT_MAX_INTERVAL: float = 60.0
+DEFAULT_SPEEDUP: float = 0.5
+DEFAULT_SLOWDOWN: float = 1.25
+
+_MISSING = object()
+
+
+class PollJob:
+    """
+    One endpoint call polled by a `Poller`, with its own adaptive interval.
+
+    Attributes
+    ----------
+    endpoint
+        Name of the `gemini_public_api.aiohttp.api` function polled.
+    args, kwargs
+        Arguments of the endpoint function.
+    interval
+        Current polling interval in seconds, between `min_interval` and `max_interval`.
+    due
+        Clock time of the next poll.
+    payload
+        Last decoded response, None before the first successful poll.
+    polls, changes, errors
+        Number of completed polls, polls whose payload changed and failed polls.
+    skipped
+        Number of scheduled polls skipped because the previous one was still running.
+    """
+
+    __slots__ = (
+        'endpoint', 'args', 'kwargs', 'callback', 'fingerprint', 'interval', 'min_interval', 'max_interval',
+        'due', 'payload', 'polls', 'changes', 'errors', 'skipped', 'active', '_last'
+    )
+
+    def __init__(
+            self,
+            endpoint: str,
+            args: Tuple[Any, ...],
+            kwargs: Dict[str, Any],
+            callback: Optional[Callable[['PollJob', Any], Any]],
+            fingerprint: Optional[Callable[[Any], Any]],
+            interval: float,
+            min_interval: float,
+            max_interval: float,
+            due: float
+    ):
+        if not 0 < min_interval <= max_interval:
+            raise ValueError(f'expected 0 < min_interval <= max_interval, got {min_interval} and {max_interval}')
+
+        self.endpoint = endpoint
+        self.args = args
+        self.kwargs = kwargs
+        self.callback = callback
+        self.fingerprint = fingerprint
+        self.interval = min(max(interval, min_interval), max_interval)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.due = due
+        self.payload = None
+        self.polls = 0
+        self.changes = 0
+        self.errors = 0
+        self.skipped = 0
+        self.active = True
+
+        self._last = _MISSING
+
+    def __repr__(self) -> str:
+        args = ', '.join([repr(arg) for arg in self.args] + [f'{k}={v!r}' for k, v in self.kwargs.items()])
+        return f'PollJob({self.endpoint}({args}), interval={self.interval:.3f})'
+
+    def update(self, payload: Any) -> bool:
+        """
+        Stores a new payload.
+
+        :param payload: decoded response.
+        :return: True if it differs from the previous payload, by `fingerprint` if given.
+        """
+        last = self.fingerprint(payload) if self.fingerprint is not None else payload
+        changed = last != self._last
+
+        self.payload = payload
+        self._last = last
+        self.polls += 1
+        self.changes += changed
+
+        return changed
+
+    def adapt(self, changed: bool, speedup: float, slowdown: float) -> None:
+        """
+        Shortens the interval after a change and lengthens it after a poll without one, within the bounds.
+
+        :param changed: whether the last poll returned new data.
+        :param speedup: factor applied to the interval after a change.
+        :param slowdown: factor applied to the interval after a poll without a change.
+        """
+        interval = self.interval * (speedup if changed else slowdown)
+        self.interval = min(max(interval, self.min_interval), self.max_interval)
+
+    def reschedule(self, now: float) -> None:
+        """
+        Moves `due` one interval ahead of the previous due time, not of the time the poll finished, so that the
+        schedule does not drift. Slots that already passed while the poll ran are skipped instead of piling up.
+
+        :param now: current clock time.
+        """
+        self.due += self.interval
+
+        if self.due <= now:
+            missed = math.floor((now - self.due) / self.interval) + 1
+
+            while self.due + missed * self.interval <= now:
+                # Rounding can land the slot exactly on `now`.
+                missed += 1
+
+            self.due += missed * self.interval
+            self.skipped += missed
+
+
+class Poller:
+    """
+    Polls many endpoint calls of `gemini_public_api.aiohttp.api` on one drift-free, adaptive schedule.
+
+    Each job is polled on a monotonic clock at its own interval, measured between scheduled times rather than
+    from the end of the previous poll, so slow responses do not shift the schedule. A job's next request is
+    only sent once its previous one finished; slots missed meanwhile are skipped. After every poll the
+    interval shrinks by `speedup` if the payload changed and grows by `slowdown` otherwise, within the
+    job's bounds, so busy symbols are polled close to their rate of change and quiet ones back off.
+
+    Callbacks receive the job and the decoded payload whenever it changed, and may be coroutine functions.
+    Errors are counted on the job and passed to `on_error` if given; the job keeps its schedule, also when
+    `on_error` raises, which is reported to the event loop's exception handler.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        async with SessionContextManager() as session:
+            async with Poller(session, min_interval=0.5, max_interval=30) as poller:
+                for symbol in symbols:
+                    poller.add('get_ticker', symbol, callback=on_ticker, fingerprint=lambda t: t['last'])
+
+                poller.add('get_price_feed', callback=on_prices, interval=5)
+                await asyncio.sleep(3600)
+
+    Attributes
+    ----------
+    session
+        aiohttp client session, or any session accepted by `gemini_public_api.aiohttp.api`.
+    jobs
+        List of the active PollJob.
+    """
+
+    def __init__(
+            self,
+            session: ClientSession,
+            concurrency: int = DEFAULT_CONCURRENCY,
+            min_interval: float = DEFAULT_MIN_INTERVAL,
+            max_interval: float = DEFAULT_MAX_INTERVAL,
+            speedup: float = DEFAULT_SPEEDUP,
+            slowdown: float = DEFAULT_SLOWDOWN,
+            on_error: Optional[Callable[[PollJob, Exception], Any]] = None,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        :param session: aiohttp client session.
+        :param concurrency: maximum number of requests in flight across all jobs.
+        :param min_interval: default lower bound of job intervals in seconds.
+        :param max_interval: default upper bound of job intervals in seconds.
+        :param speedup: factor between 0 and 1 applied to an interval after its payload changed.
+        :param slowdown: factor of at least 1 applied to an interval after its payload did not change.
+        :param on_error: function called with the job and the exception of a failed poll.
+        :param clock: monotonic clock returning seconds.
+        """
+        if concurrency < 1:
+            raise ValueError(f'concurrency must be at least 1, got {concurrency}')
+
+        if not 0 < speedup <= 1 <= slowdown:
+            raise ValueError(f'expected 0 < speedup <= 1 <= slowdown, got {speedup} and {slowdown}')
+
+        self.session = session
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.speedup = speedup
+        self.slowdown = slowdown
+        self.on_error = on_error
+        self.clock = clock
+        self.concurrency = concurrency
+        self.jobs: List[PollJob] = []
+
+        self._queue: List[Tuple[float, int, PollJob]] = []
+        self._counter = itertools.count()
+        # Created by `run`, on the event loop that polls.
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._runner: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> 'Poller':
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    def add(
+            self,
+            endpoint: str,
+            *args: Any,
+            callback: Optional[Callable[[PollJob, Any], Any]] = None,
+            fingerprint: Optional[Callable[[Any], Any]] = None,
+            interval: Optional[float] = None,
+            min_interval: Optional[float] = None,
+            max_interval: Optional[float] = None,
+            **kwargs: Any
+    ) -> PollJob:
+        """
+        Schedules an endpoint call, first polled right away.
+
+        :param endpoint: name of a `get_*` function of `gemini_public_api.aiohttp.api`, e.g. 'get_ticker'.
+        :param args: positional arguments of the endpoint function after the session.
+        :param callback: function called with the job and the payload whenever the payload changed.
+        :param fingerprint: function extracting the part of the payload compared between polls, e.g. the last
+            price, the whole payload if omitted.
+        :param interval: initial interval in seconds, `min_interval` if omitted.
+        :param min_interval: lower bound of the interval, the poller's if omitted.
+        :param max_interval: upper bound of the interval, the poller's if omitted.
+        :param kwargs: keyword arguments of the endpoint function.
+        :return: The scheduled PollJob.
+        """
+        if endpoint not in api.ENDPOINTS:
+            raise ValueError(f'unknown endpoint: {endpoint!r}')
+
+        min_interval = self.min_interval if min_interval is None else min_interval
+        max_interval = self.max_interval if max_interval is None else max_interval
+
+        job = PollJob(
+            endpoint=endpoint,
+            args=args,
+            kwargs=kwargs,
+            callback=callback,
+            fingerprint=fingerprint,
+            interval=min_interval if interval is None else interval,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            due=self.clock()
+        )
+
+        self.jobs.append(job)
+        self._push(job)
+
+        return job
+
+    def remove(self, job: PollJob) -> None:
+        """
+        Stops polling a job. A poll already in flight completes without calling back.
+
+        :param job: job returned by `add`.
+        """
+        job.active = False
+        self.jobs.remove(job)
+
+    def _push(self, job: PollJob) -> None:
+        heapq.heappush(self._queue, (job.due, next(self._counter), job))
+
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def start(self) -> asyncio.Task:
+        """
+        Starts polling in a background task.
+
+        :return: The task running the schedule.
+        """
+        if self._runner is None or self._runner.done():
+            self._runner = asyncio.ensure_future(self.run())
+
+        return self._runner
+
+    async def stop(self) -> None:
+        """
+        Stops polling and cancels the polls in flight. The session is not closed.
+        """
+        tasks = list(self._tasks)
+
+        if self._runner is not None:
+            tasks.append(self._runner)
+            self._runner = None
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run(self) -> None:
+        """
+        Polls the scheduled jobs until cancelled.
+        """
+        queue = self._queue
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._wakeup = asyncio.Event()
+
+        while True:
+            now = self.clock()
+
+            while queue and queue[0][0] <= now:
+                _, _, job = heapq.heappop(queue)
+
+                if job.active:
+                    task = asyncio.ensure_future(self._poll(job))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+
+            self._wakeup.clear()
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), queue[0][0] - now if queue else None)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _poll(self, job: PollJob) -> None:
+        try:
+            async with self._semaphore:
+                payload = await api.read_json(getattr(api, job.endpoint)(self.session, *job.args, **job.kwargs))
+
+            changed = job.update(payload)
+
+            if changed and job.callback is not None and job.active:
+                result = job.callback(job, payload)
+
+                if inspect.isawaitable(result):
+                    await result
+
+            job.adapt(changed, self.speedup, self.slowdown)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            job.errors += 1
+
+            if self.on_error is not None:
+                self._report(job, e)
+        finally:
+            job.reschedule(self.clock())
+
+            # Also after errors and cancellation, so that a restarted poller still polls the job.
+            if job.active:
+                self._push(job)
+
+    def _report(self, job: PollJob, error: Exception) -> None:
+        try:
+            self.on_error(job, error)
+        except Exception as e:
+            # A failing error callback must not take the job off the schedule, hand it to the loop's handler.
+            asyncio.get_running_loop().call_exception_handler({
+                'message':   f'on_error of Poller failed for {job.endpoint}',
+                'exception': e
+            })
+
+    def stats(self) -> Dict[str, int]:
+        """
+        :return: Dictionary of the number of jobs and the summed polls, changes, errors and skipped polls.
+        """
+        return {
+            'jobs':    len(self.jobs),
+            'polls':   sum(job.polls for job in self.jobs),
+            'changes': sum(job.changes for job in self.jobs),
+            'errors':  sum(job.errors for job in self.jobs),
+            'skipped': sum(job.skipped for job in self.jobs)
+        }
@@ -0,0 +1,100 @@
+import asyncio
+import time
+from typing import Callable, Dict, Iterable, Optional, Set
+
+from aiohttp import ClientSession
+
+import gemini_public_api.aiohttp.api as api
+from gemini_public_api.price_feed import DEFAULT_TTL, BasePriceFeedIndex, PriceFeed
+
+
+class AsyncPriceFeedIndex(BasePriceFeedIndex):
+    """
+    The asynchronous counterpart of `gemini_public_api.price_feed.PriceFeedIndex`.
+
+    Answers per-symbol price lookups from a single `get_price_feed` call, refreshed on the first lookup after
+    `ttl` seconds. Concurrent lookups that find the feed missing or expired await the same fetch.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        async with SessionContextManager() as session:
+            index = AsyncPriceFeedIndex(session, ttl=2)
+            prices = await index.prices(['btcusd', 'ethusd'])
+
+    Attributes
+    ----------
+    session
+        aiohttp client session used to fetch.
+    feed
+        The current PriceFeed, None before the first fetch.
+    refreshes
+        Number of times the feed was fetched.
+    """
+
+    def __init__(
+            self,
+            session: ClientSession,
+            ttl: float = DEFAULT_TTL,
+            use_sandbox: bool = False,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        :param session: aiohttp client session.
+        :param ttl: seconds a fetched feed is served before it is refreshed.
+        :param use_sandbox: flag to use sandbox endpoints.
+        :param clock: monotonic clock returning seconds.
+        """
+        super().__init__(ttl=ttl, use_sandbox=use_sandbox, clock=clock)
+
+        self.session = session
+
+        self._in_flight: Optional[asyncio.Task] = None
+
+    async def _fetch(self) -> Set[str]:
+        return self._update(await api.read_json(api.get_price_feed(self.session, use_sandbox=self.use_sandbox)))
+
+    async def refresh(self) -> Set[str]:
+        """
+        Fetches the feed now, regardless of its age, or joins a fetch already in flight.
+
+        :return: Set of the pairs whose price changed.
+        """
+        if self._in_flight is None:
+            self._in_flight = asyncio.ensure_future(self._fetch())
+            self._in_flight.add_done_callback(lambda _: setattr(self, '_in_flight', None))
+
+        # Shielded so that a cancelled caller does not cancel the fetch other callers are waiting on.
+        return await asyncio.shield(self._in_flight)
+
+    async def current(self) -> PriceFeed:
+        """
+        :return: The current PriceFeed, fetched first if missing or older than `ttl`.
+        """
+        if self._expired():
+            await self.refresh()
+
+        return self.feed
+
+    async def price(self, symbol: str) -> float:
+        """
+        :param symbol: symbol or pair, e.g. 'btcusd'.
+        :return: Latest price, raises KeyError for pairs not in the feed.
+        """
+        return (await self.current()).price(symbol)
+
+    async def prices(self, symbols: Optional[Iterable[str]] = None) -> Dict[str, float]:
+        """
+        :param symbols: symbols or pairs, all pairs if None.
+        :return: Dictionary mapping each of `symbols` to its price, see `PriceFeed.prices`.
+        """
+        return (await self.current()).prices(symbols)
+
+    async def change_24h(self, symbol: str) -> Optional[float]:
+        """
+        :param symbol: symbol or pair, e.g. 'btcusd'.
+        :return: Relative change over the last 24 hours or None, raises KeyError for pairs not in the feed.
+        """
+        return (await self.current()).change_24h(symbol)
@@ -0,0 +1,144 @@
+import asyncio
+import time
+from functools import partial
+from typing import Any, Iterable, Mapping, Optional, Union
+
+from aiohttp import ClientSession
+
+from gemini_public_api.aiohttp.response import BufferedResponse, RequestContextManager
+from gemini_public_api.recording import Exchange, RecordWriter, Replayer, query_params
+from gemini_public_api.utils import PathLike
+
+
+class RecordingSession:
+    """
+    Wraps an aiohttp ``ClientSession`` and records every request and its response with a `RecordWriter`.
+
+    Responses are read in full and returned as `BufferedResponse` objects. The wrapper can be passed wherever
+    the functions in `gemini_public_api.aiohttp.api` expect a session. Other attributes are forwarded to the
+    wrapped session.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        with RecordWriter('session.rec.gz') as writer:
+            async with SessionContextManager() as session:
+                session = RecordingSession(session, writer)
+                await api.fetch_many_tickers(session, symbols)
+
+    Attributes
+    ----------
+    session
+        The wrapped aiohttp client session.
+    writer
+        The RecordWriter requests and responses are recorded with.
+    """
+
+    def __init__(self, session: ClientSession, writer: RecordWriter):
+        """
+        :param session: aiohttp client session to send requests with.
+        :param writer: writer to record requests and responses with, not closed by the session.
+        """
+        self.session = session
+        self.writer = writer
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.session, name)
+
+    def get(self, url: Any, params: Optional[Mapping[str, Any]] = None, **kwargs) -> RequestContextManager:
+        """
+        Sends and records a GET request.
+
+        :param url: request URL.
+        :param params: query parameters.
+        :return: Awaitable async context manager resolving to a BufferedResponse.
+        """
+        return RequestContextManager(partial(self._send, url, params, kwargs))
+
+    async def _send(self, url: Any, params: Optional[Mapping[str, Any]], kwargs) -> BufferedResponse:
+        sent_at = time.time()
+
+        async with self.session.get(url, params=params, **kwargs) as response:
+            response = await BufferedResponse.from_response(response)
+
+        self.writer.write(Exchange(
+            url=str(url),
+            params=query_params(params),
+            status=response.status,
+            headers=list(response.headers.items()),
+            body=response.body,
+            sent_at=sent_at,
+            received_at=time.time()
+        ))
+
+        return response
+
+
+class ReplaySession:
+    """
+    Serves recorded responses as `BufferedResponse` objects instead of sending requests, see `Replayer`.
+
+    It can be passed wherever the functions in `gemini_public_api.aiohttp.api` expect a session, so async
+    code replays a recording without touching the network.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        async with ReplaySession('session.rec.gz', speed=10.0) as session:
+            tickers = await api.fetch_many_tickers(session, symbols)
+
+    Attributes
+    ----------
+    replayer
+        The Replayer matching requests to records.
+    """
+
+    def __init__(
+            self,
+            records: Union[PathLike, Iterable[Exchange]],
+            speed: Optional[float] = None,
+            clock=time.monotonic
+    ):
+        """
+        :param records: recorded file or iterable of Exchange.
+        :param speed: pacing relative to the recording, None to serve responses at full speed.
+        :param clock: monotonic clock returning seconds.
+        """
+        self.replayer = Replayer(records, speed=speed, clock=clock)
+        self.closed = False
+
+    async def __aenter__(self) -> 'ReplaySession':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self) -> None:
+        self.closed = True
+
+    def get(self, url: Any, params: Optional[Mapping[str, Any]] = None, **kwargs) -> RequestContextManager:
+        """
+        Serves the next recorded response to a GET request.
+
+        :param url: request URL.
+        :param params: query parameters.
+        :return: Awaitable async context manager resolving to a BufferedResponse.
+        """
+        return RequestContextManager(partial(self._send, url, params))
+
+    async def _send(self, url: Any, params: Optional[Mapping[str, Any]]) -> BufferedResponse:
+        record, delay = self.replayer.next(url, params)
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        return BufferedResponse(
+            url=record.url,
+            status=record.status,
+            headers=record.headers,
+            body=record.body
+        )
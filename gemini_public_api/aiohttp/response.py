@@ -0,0 +1,196 @@
+import copy
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Mapping, Optional
+
+from aiohttp import ClientResponseError, RequestInfo
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from gemini_public_api.json_decoder import get_default_decoder
+
+
+class BufferedContent:
+    """
+    The part of aiohttp's ``StreamReader`` interface, ``response.content``, that reads a body already in memory.
+    """
+
+    def __init__(self, body: bytes):
+        self._body = body
+        self._position = 0
+
+    def at_eof(self) -> bool:
+        return self._position >= len(self._body)
+
+    async def read(self, n: int = -1) -> bytes:
+        end = len(self._body) if n < 0 else self._position + n
+        chunk = self._body[self._position:end]
+        self._position += len(chunk)
+
+        return chunk
+
+    async def iter_chunked(self, n: int) -> AsyncIterator[bytes]:
+        while not self.at_eof():
+            yield await self.read(n)
+
+    async def iter_any(self) -> AsyncIterator[bytes]:
+        if not self.at_eof():
+            yield await self.read()
+
+
+class BufferedResponse:
+    """
+    A fully read HTTP response that behaves like an aiohttp ``ClientResponse``.
+
+    Session wrappers return it in place of a live response, so code written against aiohttp, e.g.
+    ``async with await api.get_ticker(session, 'btcusd') as resp: await resp.json()``, keeps working.
+    The body is already in memory and the connection already released, so `release` and `close` do nothing, and
+    `content` reads the body from memory.
+    The JSON body is decoded with the default `JSONDecoder` and cached. Callers sharing a response each get a `view`,
+    which reads `content` from its own position but decodes the body only once for all of them.
+
+    Attributes
+    ----------
+    url
+        URL of the request.
+    method
+        HTTP method of the request.
+    status
+        HTTP status code.
+    reason
+        HTTP reason phrase.
+    headers
+        Response headers.
+    body
+        Raw response body.
+    content
+        BufferedContent reading the body in chunks, like ``ClientResponse.content``.
+    """
+
+    def __init__(
+            self,
+            url: Any,
+            status: int,
+            headers: Optional[Mapping[str, str]] = None,
+            body: bytes = b'',
+            reason: Optional[str] = None,
+            method: str = 'GET',
+            request_info: Optional[RequestInfo] = None
+    ):
+        self.url = URL(url)
+        self.method = method
+        self.status = status
+        self.reason = reason
+        self.headers = CIMultiDictProxy(CIMultiDict(headers or {}))
+        self.body = body
+        self.content = BufferedContent(body)
+        self.request_info = request_info if request_info is not None else RequestInfo(
+            url=self.url, method=method, headers=CIMultiDictProxy(CIMultiDict()), real_url=self.url
+        )
+
+        # Shared with the views of this response, so the body is decoded once for all of them.
+        self._decoded: Dict[str, Any] = {}
+
+    def __repr__(self) -> str:
+        return f'<BufferedResponse({self.url}) [{self.status} {self.reason}]>'
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+    @property
+    def ok(self) -> bool:
+        return self.status < 400
+
+    @property
+    def content_type(self) -> str:
+        return self.headers.get('Content-Type', 'application/octet-stream').split(';', 1)[0].strip()
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise ClientResponseError(
+                request_info=self.request_info,
+                history=(),
+                status=self.status,
+                message=self.reason or '',
+                headers=self.headers
+            )
+
+    async def read(self) -> bytes:
+        return self.body
+
+    async def text(self, encoding: Optional[str] = None, errors: str = 'strict') -> str:
+        return self.body.decode(encoding or 'utf-8', errors)
+
+    async def json(self, *, loads: Optional[Callable[[bytes], Any]] = None, **kwargs) -> Any:
+        if 'json' not in self._decoded:
+            if loads is None:
+                loads = get_default_decoder().decode
+
+            self._decoded['json'] = loads(self.body) if self.body.strip() else None
+
+        return self._decoded['json']
+
+    def view(self) -> 'BufferedResponse':
+        """
+        :return: A BufferedResponse over the same body and decoded JSON, whose `content` reads from the start.
+        """
+        view = copy.copy(self)
+        view.content = BufferedContent(self.body)
+
+        return view
+
+    def release(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    @classmethod
+    async def from_response(cls, response) -> 'BufferedResponse':
+        """
+        Reads the body of a live aiohttp response into a BufferedResponse.
+
+        :param response: aiohttp client response.
+        :return: Returns a BufferedResponse.
+        """
+        body = await response.read()
+
+        return cls(
+            url=response.url,
+            status=response.status,
+            headers=response.headers,
+            body=body,
+            reason=response.reason,
+            method=response.method,
+            request_info=response.request_info
+        )
+
+
+class RequestContextManager:
+    """
+    Awaitable and async context manager resolving to the response of a request, like the one returned by
+    aiohttp's ``ClientSession.get``, for the `get` of session wrappers.
+
+    The request is sent by calling `send` once the object is awaited or entered. The response is released on
+    exit, which returns the connection of a live response to the pool and does nothing for a `BufferedResponse`.
+    """
+
+    __slots__ = ('_send', '_response')
+
+    def __init__(self, send: Callable[[], Awaitable[Any]]):
+        """
+        :param send: function sending the request and returning an awaitable of its response.
+        """
+        self._send = send
+        self._response = None
+
+    def __await__(self):
+        return self._send().__await__()
+
+    async def __aenter__(self) -> Any:
+        self._response = await self._send()
+        return self._response
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._response.release()
@@ -1,5 +1,56 @@
+import asyncio
+from typing import Any, Optional
+
 import aiohttp
 
+import gemini_public_api.public_endpoints as public_endpoints
+import gemini_public_api.public_sandbox_endpoints as public_sandbox_endpoints
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover
+    uvloop = None
+
+DEFAULT_LIMIT: int = 100
+DEFAULT_LIMIT_PER_HOST: int = 0
+DEFAULT_KEEPALIVE_TIMEOUT: float = 15.0
+DEFAULT_TTL_DNS_CACHE: int = 10
+
+
+def install_uvloop() -> bool:
+    """
+    Makes event loops created from now on, e.g. by ``asyncio.run``, uvloop loops, if uvloop is installed
+    (`pip install gemini-public-api[uvloop]`). Call it before the loop is started.
+
+    :return: True if uvloop was installed as the event loop policy, False if it is not available.
+    """
+    if uvloop is None:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+async def warm_up(session: aiohttp.ClientSession, url: str, connections: int) -> int:
+    """
+    Opens keep-alive connections ahead of the first real requests by sending concurrent HEAD requests to `url`.
+
+    Each request in flight needs its own connection, and each is returned to the session's pool once its response
+    is read, so later requests to the same host skip the DNS lookup, TCP connect and TLS handshake.
+
+    :param session: aiohttp client session.
+    :param url: URL on the host to connect to.
+    :param connections: number of connections to open.
+    :return: Number of connections that were opened successfully.
+    """
+    async def touch():
+        async with session.head(url, allow_redirects=False) as response:
+            await response.read()
+
+    results = await asyncio.gather(*(touch() for _ in range(connections)), return_exceptions=True)
+
+    return sum(not isinstance(result, BaseException) for result in results)
+
 
 class SessionContextManager:
     """
@@ -10,6 +61,12 @@ class SessionContextManager:
 
     This class can be used with an `async with` statement.
 
+    The session's connector can be tuned: the total and per-host connection limits, how long idle keep-alive
+    connections are kept and how long DNS lookups are cached. The defaults are those of aiohttp, which also sets
+    TCP_NODELAY on every connection, so small requests are sent without delay. With `warm_up` set, entering opens
+    that many keep-alive connections to the API host first, so that the first requests after startup do not pay
+    for DNS and TLS setup.
+
     Example
     -------
 
@@ -20,19 +77,84 @@ class SessionContextManager:
                 print(resp.status)
                 print(await resp.text())
 
+        timeout = aiohttp.ClientTimeout(total=10, sock_connect=2)
+
+        async with SessionContextManager(limit_per_host=16, ttl_dns_cache=300, timeout=timeout, warm_up=8) as session:
+            tickers = await api.fetch_many_tickers_v2(session, symbols, concurrency=8)
+
     Attributes
     ----------
     session
         An instance of aiohttp's ClientSession.
+    warmed
+        Number of connections opened by the warm-up.
     """
 
+    def __init__(
+            self,
+            limit: int = DEFAULT_LIMIT,
+            limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+            keepalive_timeout: Optional[float] = DEFAULT_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache: Optional[int] = DEFAULT_TTL_DNS_CACHE,
+            timeout: Optional[aiohttp.ClientTimeout] = None,
+            warm_up: int = 0,
+            warm_up_url: Optional[str] = None,
+            use_sandbox: bool = False,
+            **session_kwargs: Any
+    ):
+        """
+        :param limit: maximum number of connections, 0 for no limit.
+        :param limit_per_host: maximum number of connections to one host, 0 for no limit.
+        :param keepalive_timeout: seconds an idle connection is kept open for reuse.
+        :param ttl_dns_cache: seconds DNS lookups are cached, None to cache them forever.
+        :param timeout: request timeouts, aiohttp's default if None.
+        :param warm_up: number of keep-alive connections to open on entering.
+        :param warm_up_url: URL to open them to, the symbols endpoint if None.
+        :param use_sandbox: flag to warm up connections to the sandbox instead.
+        :param session_kwargs: further ClientSession arguments, e.g. `trace_configs`.
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.timeout = timeout
+        self.warm_up = warm_up
+        self.warm_up_url = warm_up_url
+        self.use_sandbox = use_sandbox
+        self.session_kwargs = session_kwargs
+        self.warmed = 0
+
     async def __aenter__(self):
         """
         Enter the runtime context related to this object.
 
-        A new ClientSession object is created and returned.
+        A new ClientSession object is created, warmed up if requested, and returned.
         """
-        self.session = aiohttp.ClientSession()
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache
+        )
+        kwargs = dict(self.session_kwargs)
+
+        if self.timeout is not None:
+            kwargs['timeout'] = self.timeout
+
+        self.session = aiohttp.ClientSession(connector=connector, **kwargs)
+
+        if self.warm_up:
+            url = self.warm_up_url
+
+            if url is None:
+                url = public_sandbox_endpoints.SYMBOLS if self.use_sandbox else public_endpoints.SYMBOLS
+
+            try:
+                self.warmed = await warm_up(self.session, url, self.warm_up)
+            except BaseException:
+                await self.session.close()
+                raise
+
         return self.session
 
     async def __aexit__(self, exc_type, exc, tb):
@@ -0,0 +1,95 @@
+import asyncio
+from functools import partial
+from typing import Any, Mapping, Optional
+
+from aiohttp import ClientSession
+
+from gemini_public_api.aiohttp.response import RequestContextManager
+from gemini_public_api.rate_limit import RetryPolicy, TokenBucket
+
+
+class ThrottledSession:
+    """
+    Wraps an aiohttp ``ClientSession`` with a shared token-bucket rate limit and a retry policy.
+
+    Every request first acquires a token from `rate_limiter`. Responses with a retryable status are released
+    and retried according to `retry_policy`; a `Retry-After` header or the backoff delay is applied to the
+    whole bucket, so all tasks sharing it hold off together instead of retrying at once.
+
+    The wrapper can be passed wherever the functions in `gemini_public_api.aiohttp.api` expect a session, so
+    existing call sites do not change. Other attributes are forwarded to the wrapped session.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        async with SessionContextManager() as session:
+            session = ThrottledSession(session, TokenBucket(rate=2, burst=5), RetryPolicy(max_retries=3))
+            tickers = await api.fetch_many_tickers(session, symbols)
+
+            print(session.rate_limiter.throttled, session.retried)
+
+    Attributes
+    ----------
+    session
+        The wrapped aiohttp client session.
+    rate_limiter
+        The TokenBucket shared by all requests, or None.
+    retry_policy
+        The RetryPolicy applied to all requests, or None.
+    retried
+        Number of requests that were retried.
+    """
+
+    def __init__(
+            self,
+            session: ClientSession,
+            rate_limiter: Optional[TokenBucket] = None,
+            retry_policy: Optional[RetryPolicy] = None
+    ):
+        """
+        :param session: aiohttp client session to send requests with.
+        :param rate_limiter: token bucket to acquire a token from before every request.
+        :param retry_policy: policy for retrying responses with retryable statuses such as 429.
+        """
+        self.session = session
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.retried = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.session, name)
+
+    def get(self, url: Any, params: Optional[Mapping[str, Any]] = None, **kwargs) -> RequestContextManager:
+        """
+        Sends a GET request once a token is available, retrying retryable responses.
+
+        :param url: request URL.
+        :param params: query parameters.
+        :return: Awaitable async context manager resolving to the response.
+        """
+        return RequestContextManager(partial(self._send, url, params, kwargs))
+
+    async def _send(self, url: Any, params: Optional[Mapping[str, Any]], kwargs):
+        attempt = 0
+
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+
+            response = await self.session.get(url, params=params, **kwargs)
+
+            if self.retry_policy is None or not self.retry_policy.should_retry(response.status, attempt):
+                return response
+
+            delay = self.retry_policy.delay(attempt, response.headers.get('Retry-After'))
+            response.release()
+
+            self.retried += 1
+            attempt += 1
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.defer(delay)
+            else:
+                await asyncio.sleep(delay)
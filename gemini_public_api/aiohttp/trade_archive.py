@@ -0,0 +1,52 @@
+from typing import Optional
+
+from aiohttp import ClientSession
+
+from gemini_public_api.aiohttp.api import get_trade_history, read_json
+from gemini_public_api.trade_archive import TradeArchive
+
+
+async def sync(
+        session: ClientSession,
+        archive: TradeArchive,
+        symbol: str,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        limit_trades: int = 500
+) -> int:
+    """
+    Asynchronously fetches and archives the trades newer than the newest archived trade, see `TradeArchive.sync`.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        async with SessionContextManager() as session:
+            with TradeArchive('trades') as archive:
+                await asyncio.gather(*(sync(session, archive, symbol, since=launch) for symbol in symbols))
+
+    :param session: aiohttp client session.
+    :param archive: archive to append to.
+    :param symbol: symbol, e.g. 'btcusd'.
+    :param since: millisecond timestamp to start from if the archive of `symbol` is empty.
+    :param until: exclusive end of the walk, in milliseconds, or None to walk up to the latest trade.
+    :param limit_trades: number of trades requested per page.
+    :return: Number of trades appended.
+    """
+    cursor = archive.cursor(symbol, since=since, until=until, limit_trades=limit_trades)
+    appended = 0
+
+    while not cursor.done:
+        page = await read_json(
+            get_trade_history(
+                session,
+                symbol=symbol,
+                timestamp=cursor.timestamp,
+                limit_trades=limit_trades,
+                use_sandbox=archive.use_sandbox
+            )
+        )
+        appended += archive.extend(symbol, cursor.advance(page))
+
+    return appended
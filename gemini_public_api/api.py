@@ -1,9 +1,9 @@
-from typing import Optional
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
 
 import requests
 
-import gemini_public_api.public_endpoints as production
-import gemini_public_api.public_sandbox_endpoints as sandbox
+from gemini_public_api.client import get_default_client
+from gemini_public_api.streaming import DEFAULT_CHUNK_SIZE
 
 
 def get_symbols(use_sandbox: bool = False) -> requests.Response:
@@ -13,7 +13,7 @@ def get_symbols(use_sandbox: bool = False) -> requests.Response:
     :param use_sandbox: flag to use sandbox endpoints.
     :return: Returns a Response object.
     """
-    return requests.get(url=sandbox.SYMBOLS if use_sandbox else production.SYMBOLS)
+    return get_default_client().get_symbols(use_sandbox=use_sandbox)
 
 
 def get_symbol_details(symbol: str, use_sandbox: bool = False) -> requests.Response:
@@ -24,10 +24,7 @@ def get_symbol_details(symbol: str, use_sandbox: bool = False) -> requests.Respo
     :param use_sandbox: flag to use sandbox endpoints.
     :return: Returns a Response object.
     """
-    return requests.get(
-        url=sandbox.SYMBOL_DETAILS.format(symbol=symbol) if use_sandbox else production.SYMBOL_DETAILS.format(
-            symbol=symbol)
-    )
+    return get_default_client().get_symbol_details(symbol=symbol, use_sandbox=use_sandbox)
 
 
 def get_network(token: str, use_sandbox: bool = False) -> requests.Response:
@@ -38,9 +35,7 @@ def get_network(token: str, use_sandbox: bool = False) -> requests.Response:
     :param use_sandbox: flag to use sandbox endpoints.
     :return: Returns a Response object.
     """
-    return requests.get(
-        url=sandbox.NETWORK.format(token=token) if use_sandbox else production.NETWORK.format(token=token)
-    )
+    return get_default_client().get_network(token=token, use_sandbox=use_sandbox)
 
 
 def get_ticker(symbol: str, use_sandbox: bool = False) -> requests.Response:
@@ -51,10 +46,7 @@ def get_ticker(symbol: str, use_sandbox: bool = False) -> requests.Response:
     :param use_sandbox: flag to use sandbox endpoints.
     :return: Returns a Response object.
     """
-    return requests.get(
-        url=sandbox.PUBLIC_TICKER.format(
-            symbol=symbol) if use_sandbox else production.PUBLIC_TICKER.format(symbol=symbol)
-    )
+    return get_default_client().get_ticker(symbol=symbol, use_sandbox=use_sandbox)
 
 
 def get_ticker_v2(symbol: str, use_sandbox: bool = False) -> requests.Response:
@@ -65,10 +57,7 @@ def get_ticker_v2(symbol: str, use_sandbox: bool = False) -> requests.Response:
     :param use_sandbox: flag to use sandbox endpoints.
     :return: Returns a Response object.
     """
-    return requests.get(
-        url=sandbox.PUBLIC_TICKER_V2.format(
-            symbol=symbol) if use_sandbox else production.PUBLIC_TICKER_V2.format(symbol=symbol)
-    )
+    return get_default_client().get_ticker_v2(symbol=symbol, use_sandbox=use_sandbox)
 
 
 def get_candles(symbol: str, time_frame: str, use_sandbox: bool = False) -> requests.Response:
@@ -80,13 +69,39 @@ def get_candles(symbol: str, time_frame: str, use_sandbox: bool = False) -> requ
     :param use_sandbox: flag to use sandbox endpoints.
     :return: Returns a Response object.
     """
-    return requests.get(
-        url=sandbox.CANDLES.format(
-            symbol=symbol, time_frame=time_frame
-        ) if use_sandbox else production.CANDLES.format(symbol=symbol, time_frame=time_frame)
+    return get_default_client().get_candles(symbol=symbol, time_frame=time_frame, use_sandbox=use_sandbox)
+
+
+def get_candle_columns(symbol: str, time_frame: str, structured: bool = False, use_sandbox: bool = False) -> Any:
+    """
+    Retrieves the candles data for a specific symbol and time frame decoded into columns.
+
+    :param symbol: symbol for which candles data is required.
+    :param time_frame: time frame for the candles data.
+    :param structured: flag to return a numpy structured array instead of a dictionary of columns.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Columns sorted by ascending timestamp, see `gemini_public_api.candles`.
+    """
+    return get_default_client().get_candle_columns(
+        symbol=symbol,
+        time_frame=time_frame,
+        structured=structured,
+        use_sandbox=use_sandbox
     )
 
 
+def get_model(endpoint: str, *args, **kwargs) -> Any:
+    """
+    Calls an endpoint and decodes the response into its typed model, see `gemini_public_api.models`.
+
+    :param endpoint: name of one of the `get_*` functions that has a model, e.g. 'get_trade_history'.
+    :param args: positional arguments of the endpoint function.
+    :param kwargs: keyword arguments of the endpoint function.
+    :return: Model, or list or dictionary of models, of the endpoint.
+    """
+    return get_default_client().get_model(endpoint, *args, **kwargs)
+
+
 def get_free_promos(use_sandbox: bool = False) -> requests.Response:
     """
     Retrieves all available free promotions.
@@ -94,7 +109,7 @@ def get_free_promos(use_sandbox: bool = False) -> requests.Response:
     :param use_sandbox: flag to use sandbox endpoints.
     :return: Returns a Response object.
     """
-    return requests.get(url=sandbox.FREE_PROMOS if use_sandbox else production.FREE_PROMOS)
+    return get_default_client().get_free_promos(use_sandbox=use_sandbox)
 
 
 def get_current_order_book(
@@ -112,10 +127,11 @@ def get_current_order_book(
     :param use_sandbox: flag to use sandbox endpoints.
     :return: Returns a Response object.
     """
-    return requests.get(
-        url=sandbox.CURRENT_ORDER_BOOK.format(symbol=symbol) if use_sandbox else production.CURRENT_ORDER_BOOK.format(
-            symbol=symbol),
-        params={'bid_limit': bid_limit, 'ask_limit': ask_limit}
+    return get_default_client().get_current_order_book(
+        symbol=symbol,
+        bid_limit=bid_limit,
+        ask_limit=ask_limit,
+        use_sandbox=use_sandbox
     )
 
 
@@ -136,17 +152,12 @@ def get_trade_history(
     :param use_sandbox: flag to use sandbox endpoints.
     :return: Returns a Response object.
     """
-    return requests.get(
-        url=sandbox.TRADE_HISTORY.format(symbol=symbol) if use_sandbox else production.TRADE_HISTORY.format(
-            symbol=symbol),
-        params={
-            'timestamp':      timestamp,
-            'limit_trades':   limit_trades,
-            'include_breaks': str(include_breaks).lower()
-        } if timestamp is not None else {
-            'limit_trades':   limit_trades,
-            'include_breaks': str(include_breaks).lower()
-        }
+    return get_default_client().get_trade_history(
+        symbol=symbol,
+        timestamp=timestamp,
+        limit_trades=limit_trades,
+        include_breaks=include_breaks,
+        use_sandbox=use_sandbox
     )
 
 
@@ -157,4 +168,109 @@ def get_price_feed(use_sandbox: bool = False) -> requests.Response:
     :param use_sandbox: flag to use sandbox endpoints.
     :return: Returns a Response object.
     """
-    return requests.get(url=sandbox.PRICE_FEED if use_sandbox else production.PRICE_FEED)
+    return get_default_client().get_price_feed(use_sandbox=use_sandbox)
+
+
+def iter_trades(
+        symbol: str,
+        since: int,
+        until: Optional[int] = None,
+        limit_trades: int = 500,
+        include_breaks: bool = False,
+        use_sandbox: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterates over all trades for a specific symbol in [since, until), oldest first.
+
+    :param symbol: symbol for which trades are required.
+    :param since: inclusive start, in milliseconds.
+    :param until: exclusive end, in milliseconds, or None to iterate up to the latest trade.
+    :param limit_trades: number of trades requested per page.
+    :param include_breaks: flag to include breaks in the trade history.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Iterator over decoded trades.
+    """
+    return get_default_client().iter_trades(
+        symbol=symbol,
+        since=since,
+        until=until,
+        limit_trades=limit_trades,
+        include_breaks=include_breaks,
+        use_sandbox=use_sandbox
+    )
+
+
+def stream_current_order_book(
+        symbol: str,
+        bid_limit: int = 500,
+        ask_limit: int = 500,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        use_sandbox: bool = False
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Retrieves the current order book for a specific symbol, decoding its levels one at a time as the body arrives.
+
+    :param symbol: symbol for which order book is required.
+    :param bid_limit: limit for bid orders.
+    :param ask_limit: limit for ask orders.
+    :param chunk_size: number of bytes to read at a time.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Iterator over (side, level) pairs, where side is 'bids' or 'asks'.
+    """
+    return get_default_client().stream_current_order_book(
+        symbol=symbol,
+        bid_limit=bid_limit,
+        ask_limit=ask_limit,
+        chunk_size=chunk_size,
+        use_sandbox=use_sandbox
+    )
+
+
+def stream_trade_history(
+        symbol: str,
+        timestamp: Optional[int] = None,
+        limit_trades: int = 500,
+        include_breaks: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        use_sandbox: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """
+    Retrieves the trade history for a specific symbol, decoding its trades one at a time as the body arrives.
+
+    :param symbol: symbol for which trade history is required.
+    :param timestamp: starting timestamp for the trade history.
+    :param limit_trades: limit for number of trades in the history.
+    :param include_breaks: flag to include breaks in the trade history.
+    :param chunk_size: number of bytes to read at a time.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Iterator over decoded trades.
+    """
+    return get_default_client().stream_trade_history(
+        symbol=symbol,
+        timestamp=timestamp,
+        limit_trades=limit_trades,
+        include_breaks=include_breaks,
+        chunk_size=chunk_size,
+        use_sandbox=use_sandbox
+    )
+
+
+def stream_price_feed(chunk_size: int = DEFAULT_CHUNK_SIZE, use_sandbox: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Retrieves the price feed, decoding its entries one at a time as the body arrives.
+
+    :param chunk_size: number of bytes to read at a time.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :return: Iterator over decoded price feed entries.
+    """
+    return get_default_client().stream_price_feed(chunk_size=chunk_size, use_sandbox=use_sandbox)
+
+
+def fetch_many(calls: Iterable[Tuple[str, Union[Sequence, Mapping[str, Any]]]]) -> List[Union[Any, Exception]]:
+    """
+    Fetches many endpoints concurrently on the default client's thread pool.
+
+    :param calls: `(endpoint, args)` pairs, e.g. `('get_ticker', ('btcusd',))`.
+    :return: List of decoded responses in the order of `calls`, with the exception raised in place of failed calls.
+    """
+    return get_default_client().fetch_many(calls)
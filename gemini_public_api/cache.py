@@ -0,0 +1,378 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+from gemini_public_api.client import GeminiClient, get_default_client
+
+DEFAULT_MAX_SIZE: int = 1024
+DEFAULT_MAX_STALE: float = 60 * 60
+
+DEFAULT_TTLS: Dict[str, float] = {
+    'get_symbols':        60 * 60,
+    'get_symbol_details': 60 * 60,
+    'get_network':        60 * 60,
+    'get_free_promos':    5 * 60
+}
+
+FRESH: str = 'fresh'
+STALE: str = 'stale'
+MISS: str = 'miss'
+
+
+class TTLCache:
+    """
+    A bounded LRU cache whose entries expire after a per-entry TTL.
+
+    Expired entries are kept for up to `max_stale` seconds more so callers can serve them while a refresh runs.
+    The cache is thread-safe and keeps hit, stale hit, miss and eviction counters.
+
+    Attributes
+    ----------
+    hits
+        Lookups answered with a fresh entry.
+    stale_hits
+        Lookups answered with an expired entry that may still be served.
+    misses
+        Lookups that found nothing servable.
+    evictions
+        Entries dropped to stay within `max_size`.
+    generation
+        Number of invalidations so far, see `put`.
+    """
+
+    def __init__(
+            self,
+            max_size: int = DEFAULT_MAX_SIZE,
+            max_stale: float = DEFAULT_MAX_STALE,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        :param max_size: maximum number of entries, least recently used entries are evicted first.
+        :param max_stale: seconds an expired entry may still be served.
+        :param clock: monotonic clock returning seconds.
+        """
+        if max_size < 1:
+            raise ValueError(f'max_size must be at least 1, got {max_size}')
+
+        self.max_size = max_size
+        self.max_stale = max_stale
+        self.clock = clock
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.generation = 0
+
+        self._entries: 'OrderedDict[Hashable, Tuple[Any, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: Hashable) -> Tuple[str, Any]:
+        """
+        Looks up `key` and marks it as recently used.
+
+        :param key: cache key.
+        :return: Tuple of the entry state (`FRESH`, `STALE` or `MISS`) and the cached value, None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return MISS, None
+
+            value, expires_at = entry
+            now = self.clock()
+
+            if now < expires_at:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return FRESH, value
+
+            if now < expires_at + self.max_stale:
+                self._entries.move_to_end(key)
+                self.stale_hits += 1
+                return STALE, value
+
+            del self._entries[key]
+            self.misses += 1
+            return MISS, None
+
+    def put(self, key: Hashable, value: Any, ttl: float, generation: Optional[int] = None) -> bool:
+        """
+        Stores `value` under `key` for `ttl` seconds, evicting the least recently used entries if full.
+
+        Fetches that may finish after an invalidation read `generation` before they start and pass it here, so
+        that a value fetched before the invalidation is dropped instead of being put back.
+
+        :param key: cache key.
+        :param value: value to store.
+        :param ttl: seconds the value stays fresh.
+        :param generation: `generation` read before the value was fetched, None to always store it.
+        :return: True if the value was stored, False if it was dropped.
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return False
+
+            self._entries[key] = (value, self.clock() + ttl)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+            return True
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Removes `key` from the cache if present.
+
+        :param key: cache key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self.generation += 1
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """
+        Removes all entries whose key satisfies `predicate`.
+
+        :param predicate: function called with each key.
+        """
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+            self.generation += 1
+
+    def clear(self) -> None:
+        """
+        Removes all entries.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        :return: Dictionary of the cache counters and its current size.
+        """
+        with self._lock:
+            return {
+                'hits':       self.hits,
+                'stale_hits': self.stale_hits,
+                'misses':     self.misses,
+                'evictions':  self.evictions,
+                'size':       len(self._entries)
+            }
+
+
+def cache_key(endpoint: str, use_sandbox: bool, *args: Hashable) -> Tuple[Hashable, ...]:
+    """
+    :param endpoint: name of the endpoint method, e.g. 'get_symbol_details'.
+    :param use_sandbox: flag to use sandbox endpoints.
+    :param args: arguments of the endpoint method.
+    :return: Key of the payload in the TTLCache of a `CachedClient` or `CachedAPI`.
+    """
+    return (endpoint, use_sandbox) + args
+
+
+def key_predicate(
+        endpoint: Optional[str],
+        args: Tuple[Hashable, ...],
+        use_sandbox: Optional[bool]
+) -> Callable[[Tuple[Hashable, ...]], bool]:
+    """
+    :param endpoint: endpoint to match, all endpoints if None.
+    :param args: endpoint arguments to match, all arguments if empty.
+    :param use_sandbox: only match sandbox (True) or production (False) keys, both if None.
+    :return: Function telling whether a `cache_key` matches, e.g. for `TTLCache.invalidate_where`.
+    """
+    def predicate(key: Tuple[Hashable, ...]) -> bool:
+        return (endpoint is None or key[0] == endpoint) \
+            and (use_sandbox is None or key[1] == use_sandbox) \
+            and (not args or key[2:] == args)
+
+    return predicate
+
+
+class CachedClient:
+    """
+    A caching layer over the reference-data endpoints of a `GeminiClient`.
+
+    `get_symbols`, `get_symbol_details`, `get_network` and `get_free_promos` return decoded payloads that are
+    cached for a per-endpoint TTL in a bounded LRU cache. Once an entry expires it is still served for up to
+    `max_stale` seconds while a single background thread refreshes it.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        cached = CachedClient(ttls={'get_symbols': 600})
+
+        if 'btcusd' in cached.get_symbols():
+            print(cached.get_symbol_details('btcusd'))
+
+        print(cached.stats())
+
+    Attributes
+    ----------
+    client
+        The wrapped GeminiClient.
+    cache
+        The TTLCache holding the decoded payloads.
+    """
+
+    def __init__(
+            self,
+            client: Optional[GeminiClient] = None,
+            ttls: Optional[Dict[str, float]] = None,
+            max_size: int = DEFAULT_MAX_SIZE,
+            max_stale: float = DEFAULT_MAX_STALE,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        :param client: client to fetch with, the default client if omitted.
+        :param ttls: per-endpoint TTLs in seconds, merged over `DEFAULT_TTLS`.
+        :param max_size: maximum number of cached payloads.
+        :param max_stale: seconds an expired payload is served while it is refreshed, 0 to always fetch synchronously.
+        :param clock: monotonic clock returning seconds.
+        """
+        self.client = client if client is not None else get_default_client()
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.cache = TTLCache(max_size=max_size, max_stale=max_stale, clock=clock)
+
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+        self._refreshing: Set[Hashable] = set()
+        self._refresh_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def close(self) -> None:
+        """
+        Waits for background refreshes to finish and stops the refresh thread. The wrapped client is not closed.
+        """
+        with self._refresh_lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _refresh(self, key: Hashable, ttl: float, fetch: Callable[[], Any], generation: int) -> None:
+        failed = True
+
+        try:
+            self.cache.put(key, fetch(), ttl, generation)
+            failed = False
+        except Exception:
+            pass
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(key)
+
+                if failed:
+                    self.refresh_errors += 1
+                else:
+                    self.refreshes += 1
+
+    def _get(self, key: Tuple[Hashable, ...], fetch: Callable[[], Any]) -> Any:
+        state, value = self.cache.lookup(key)
+        ttl = self.ttls[key[0]]
+
+        if state == FRESH:
+            return value
+
+        if state == STALE:
+            with self._refresh_lock:
+                if key not in self._refreshing:
+                    if self._executor is None:
+                        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='gemini-public-api-cache')
+
+                    self._refreshing.add(key)
+                    self._executor.submit(self._refresh, key, ttl, fetch, self.cache.generation)
+
+            return value
+
+        generation = self.cache.generation
+        value = fetch()
+        self.cache.put(key, value, ttl, generation)
+
+        return value
+
+    def get_symbols(self, use_sandbox: bool = False) -> Any:
+        """
+        Retrieves all available trading symbols, cached.
+
+        :param use_sandbox: flag to use sandbox endpoints.
+        :return: Decoded response.
+        """
+        return self._get(
+            cache_key('get_symbols', use_sandbox),
+            lambda: self.client.decode(self.client.get_symbols(use_sandbox=use_sandbox))
+        )
+
+    def get_symbol_details(self, symbol: str, use_sandbox: bool = False) -> Any:
+        """
+        Retrieves detailed information for a specific symbol, cached.
+
+        :param symbol: symbol for which details are required.
+        :param use_sandbox: flag to use sandbox endpoints.
+        :return: Decoded response.
+        """
+        return self._get(
+            cache_key('get_symbol_details', use_sandbox, symbol),
+            lambda: self.client.decode(self.client.get_symbol_details(symbol=symbol, use_sandbox=use_sandbox))
+        )
+
+    def get_network(self, token: str, use_sandbox: bool = False) -> Any:
+        """
+        Retrieves the network status of a token, cached.
+
+        :param token: token for which network status is required.
+        :param use_sandbox: flag to use sandbox endpoints.
+        :return: Decoded response.
+        """
+        return self._get(
+            cache_key('get_network', use_sandbox, token),
+            lambda: self.client.decode(self.client.get_network(token=token, use_sandbox=use_sandbox))
+        )
+
+    def get_free_promos(self, use_sandbox: bool = False) -> Any:
+        """
+        Retrieves all available free promotions, cached.
+
+        :param use_sandbox: flag to use sandbox endpoints.
+        :return: Decoded response.
+        """
+        return self._get(
+            cache_key('get_free_promos', use_sandbox),
+            lambda: self.client.decode(self.client.get_free_promos(use_sandbox=use_sandbox))
+        )
+
+    def invalidate(self, endpoint: Optional[str] = None, *args: Hashable, use_sandbox: Optional[bool] = None) -> None:
+        """
+        Drops cached payloads, e.g. `invalidate()`, `invalidate('get_symbols')` or
+        `invalidate('get_symbol_details', 'btcusd')`.
+
+        :param endpoint: endpoint to invalidate, all endpoints if None.
+        :param args: endpoint arguments to invalidate, all arguments if empty.
+        :param use_sandbox: only invalidate sandbox (True) or production (False) payloads, both if None.
+        """
+        self.cache.invalidate_where(key_predicate(endpoint, args, use_sandbox))
+
+    def stats(self) -> Dict[str, int]:
+        """
+        :return: Dictionary of the cache counters, background refreshes and failed refreshes.
+        """
+        with self._refresh_lock:
+            refreshes, refresh_errors = self.refreshes, self.refresh_errors
+
+        return {**self.cache.stats(), 'refreshes': refreshes, 'refresh_errors': refresh_errors}
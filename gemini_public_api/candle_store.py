@@ -0,0 +1,388 @@
+import os
+import struct
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from gemini_public_api.candles import CANDLE_DTYPE, CANDLE_FIELDS, _require_numpy, np
+from gemini_public_api.client import GeminiClient, get_default_client
+from gemini_public_api.resample import parse_bar
+from gemini_public_api.utils import PathLike
+
+# Format tag and number of stored records, so that records start 8 byte aligned.
+_MAGIC: bytes = b'GPCANDL1'
+_HEADER = struct.Struct('<8sQ')
+HEADER_SIZE: int = _HEADER.size
+
+# Number of records the file grows by at least, so that appends rarely remap it.
+MIN_CAPACITY: int = 1024
+
+SUFFIX: str = '.candles'
+
+Gap = Tuple[int, int]
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def find_gaps(timestamps: Any, interval: int) -> List[Gap]:
+    """
+    :param timestamps: ascending candle timestamps in milliseconds.
+    :param interval: candle interval in milliseconds.
+    :return: List of (before, after) pairs of consecutive timestamps more than `interval` apart, i.e. with
+        missing candles in between.
+    """
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    holes = np.flatnonzero(np.diff(timestamps) > interval)
+
+    return [(int(timestamps[i]), int(timestamps[i + 1])) for i in holes]
+
+
+class SyncResult:
+    """
+    Outcome of a `CandleStore.sync`.
+
+    Attributes
+    ----------
+    candles
+        Read-only structured array view of the candles appended.
+    gaps
+        Gaps between the previously newest stored candle and the appended ones, see `find_gaps`. A gap right after
+        the previously newest candle means the response no longer reached back to it.
+    """
+
+    __slots__ = ('candles', 'gaps')
+
+    def __init__(self, candles: Any, gaps: List[Gap]):
+        self.candles = candles
+        self.gaps = gaps
+
+    def __repr__(self) -> str:
+        return f'SyncResult(appended={len(self.candles)}, gaps={self.gaps!r})'
+
+
+class CandleFile:
+    """
+    An append-only file of the candles of one symbol and time frame, read through a memory map.
+
+    Candles are stored as fixed-width records of `CANDLE_DTYPE`, an int64 timestamp followed by float64 open,
+    high, low, close and volume, after a 16 byte header holding the number of records. The file grows by doubling
+    its capacity, so the memory map is only recreated when it does, and reads are zero-copy views of the page
+    cache that survive a restart. Records are written before the header counts them, so a crash mid-append
+    leaves the file as it was before the append.
+
+    Views returned by `read` and `columns` stay valid after later appends, they just do not include them.
+
+    Attributes
+    ----------
+    path
+        Path of the file.
+    interval
+        Candle interval in milliseconds.
+    """
+
+    def __init__(self, path: PathLike, interval: int):
+        """
+        :param path: path of the file, created if missing.
+        :param interval: candle interval in milliseconds.
+        """
+        _require_numpy()
+
+        self.path = os.fspath(path)
+        self.interval = interval
+
+        self._lock = threading.Lock()
+        self._file = os.fdopen(os.open(self.path, os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0)), 'r+b')
+        header = self._file.read(HEADER_SIZE)
+
+        if not header:
+            self._file.write(_HEADER.pack(_MAGIC, 0))
+            self._file.flush()
+            header = _HEADER.pack(_MAGIC, 0)
+        elif len(header) < HEADER_SIZE or header[:len(_MAGIC)] != _MAGIC:
+            self._file.close()
+            raise ValueError(f'{self.path} is not a candle file')
+
+        capacity = (os.fstat(self._file.fileno()).st_size - HEADER_SIZE) // CANDLE_DTYPE.itemsize
+        # Records past the count were torn by a crash mid-append, or are spare capacity.
+        self._size = min(_HEADER.unpack(header)[1], capacity)
+        self._map(capacity)
+
+    def __enter__(self) -> 'CandleFile':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _map(self, capacity: int) -> None:
+        if capacity:
+            self._candles = np.memmap(self._file, dtype=CANDLE_DTYPE, mode='r', offset=HEADER_SIZE, shape=(capacity,))
+        else:
+            self._candles = np.empty(0, dtype=CANDLE_DTYPE)
+
+    def _reserve(self, size: int) -> None:
+        if size > len(self._candles):
+            capacity = max(size, 2 * len(self._candles), MIN_CAPACITY)
+            self._file.truncate(HEADER_SIZE + capacity * CANDLE_DTYPE.itemsize)
+            self._map(capacity)
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        """
+        :return: Timestamp of the newest stored candle, None if the file is empty.
+        """
+        size = self._size
+        return int(self._candles['timestamp'][size - 1]) if size else None
+
+    def read(self, start: Optional[int] = None, end: Optional[int] = None):
+        """
+        :param start: timestamp in milliseconds of the first candle to include, from the oldest if None.
+        :param end: timestamp in milliseconds before which to stop, up to the newest if None.
+        :return: Read-only structured array view of the candles in the range, sorted by ascending timestamp.
+        """
+        candles = self._candles[:self._size]
+        timestamps = candles['timestamp']
+
+        first = 0 if start is None else int(np.searchsorted(timestamps, start, side='left'))
+        last = len(candles) if end is None else int(np.searchsorted(timestamps, end, side='left'))
+
+        return candles[first:last]
+
+    def columns(self, start: Optional[int] = None, end: Optional[int] = None) -> Dict[str, Any]:
+        """
+        :param start: see `read`.
+        :param end: see `read`.
+        :return: Dictionary mapping each of `CANDLE_FIELDS` to a read-only, strided view of its column.
+        """
+        candles = self.read(start, end)
+        return {field: candles[field] for field in CANDLE_FIELDS}
+
+    def gaps(self) -> List[Gap]:
+        """
+        :return: Gaps in the stored candles, see `find_gaps`.
+        """
+        return find_gaps(self.read()['timestamp'], self.interval)
+
+    def _write(self, candles: Any) -> None:
+        # Callers hold the lock and have checked that the candles are newer than the stored ones.
+        self._reserve(self._size + len(candles))
+
+        self._file.seek(HEADER_SIZE + self._size * CANDLE_DTYPE.itemsize)
+        self._file.write(candles.tobytes())
+        self._file.flush()
+
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(_MAGIC, self._size + len(candles)))
+        self._file.flush()
+
+        self._size += len(candles)
+
+    def append(self, candles: Any) -> int:
+        """
+        :param candles: structured array of `CANDLE_DTYPE` sorted by strictly ascending timestamp, all newer than
+            `last_timestamp`.
+        :return: Number of candles appended.
+        """
+        candles = np.asarray(candles, dtype=CANDLE_DTYPE)
+
+        if not len(candles):
+            return 0
+
+        timestamps = candles['timestamp']
+
+        if len(timestamps) > 1 and not (timestamps[1:] > timestamps[:-1]).all():
+            raise ValueError('candles must be sorted by strictly ascending timestamp')
+
+        with self._lock:
+            last = self.last_timestamp
+
+            if last is not None and timestamps[0] <= last:
+                raise ValueError(f'candle at {int(timestamps[0])} is not newer than the last stored one at {last}')
+
+            self._write(candles)
+
+        return len(candles)
+
+    def extend(self, candles: Any, complete_before: Optional[int] = None) -> SyncResult:
+        """
+        Appends the candles newer than the newest stored candle, e.g. from a `get_candle_columns` response, and
+        ignores the rest.
+
+        :param candles: structured array of `CANDLE_DTYPE` sorted by strictly ascending timestamp.
+        :param complete_before: UNIX time in milliseconds, to append only the candles that closed by then.
+        :return: SyncResult with the appended candles and any gaps before them.
+        """
+        candles = np.asarray(candles, dtype=CANDLE_DTYPE)
+        timestamps = candles['timestamp']
+
+        with self._lock:
+            last = self.last_timestamp
+            keep = np.ones(len(candles), dtype=bool)
+
+            if complete_before is not None:
+                keep &= timestamps + self.interval <= complete_before
+
+            if last is not None:
+                keep &= timestamps > last
+
+            candles = candles[keep]
+            timestamps = candles['timestamp']
+
+            if len(timestamps) > 1 and not (timestamps[1:] > timestamps[:-1]).all():
+                raise ValueError('candles must be sorted by strictly ascending timestamp')
+
+            if last is not None and len(candles):
+                timestamps = np.concatenate(([last], timestamps))
+
+            gaps = find_gaps(timestamps, self.interval)
+            first = self._size
+
+            if len(candles):
+                self._write(candles)
+
+            return SyncResult(self._candles[first:self._size], gaps)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class CandleStore:
+    """
+    A persistent candle store with one `CandleFile` per symbol and time frame in a directory.
+
+    `sync` fetches the latest candles and appends only the complete ones newer than the newest stored candle, so
+    history is downloaded once and a restart reads it back from disk instead of the network. The candle still
+    forming is never stored, since stored candles cannot be changed.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        with CandleStore('candles') as store:
+            result = store.sync('btcusd', '1m')
+
+            if result.gaps:
+                print('missing candles between', result.gaps)
+
+            closes = store.columns('btcusd', '1m', start=since)['close']
+
+    Attributes
+    ----------
+    root
+        Directory of the candle files.
+    client
+        The GeminiClient used to fetch, the default client if None.
+    """
+
+    def __init__(
+            self,
+            root: PathLike,
+            client: Optional[GeminiClient] = None,
+            use_sandbox: bool = False,
+            clock: Callable[[], int] = _now_ms
+    ):
+        """
+        :param root: directory of the candle files, created if missing.
+        :param client: client to fetch with, the default client if omitted.
+        :param use_sandbox: flag to use sandbox endpoints.
+        :param clock: function returning the current UNIX time in milliseconds, to tell complete candles apart.
+        """
+        _require_numpy()
+
+        self.root = os.fspath(root)
+        self.client = client
+        self.use_sandbox = use_sandbox
+        self.clock = clock
+
+        self._files: Dict[Tuple[str, str], CandleFile] = {}
+        self._lock = threading.Lock()
+
+        os.makedirs(self.root, exist_ok=True)
+
+    def __enter__(self) -> 'CandleStore':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def path(self, symbol: str, time_frame: str) -> str:
+        """
+        :param symbol: symbol, e.g. 'btcusd'.
+        :param time_frame: time frame, e.g. '1m'.
+        :return: Path of the candle file.
+        """
+        return os.path.join(self.root, f'{symbol.lower()}_{time_frame}{SUFFIX}')
+
+    def open(self, symbol: str, time_frame: str) -> CandleFile:
+        """
+        :param symbol: symbol, e.g. 'btcusd'.
+        :param time_frame: time frame, e.g. '1m'.
+        :return: The CandleFile, opened once and kept open until `close`.
+        """
+        key = (symbol.lower(), time_frame)
+
+        with self._lock:
+            file = self._files.get(key)
+
+            if file is None:
+                file = self._files[key] = CandleFile(self.path(symbol, time_frame), parse_bar(time_frame))
+
+        return file
+
+    def read(self, symbol: str, time_frame: str, start: Optional[int] = None, end: Optional[int] = None):
+        """
+        :return: Stored candles, see `CandleFile.read`.
+        """
+        return self.open(symbol, time_frame).read(start, end)
+
+    def columns(
+            self,
+            symbol: str,
+            time_frame: str,
+            start: Optional[int] = None,
+            end: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        :return: Stored candle columns, see `CandleFile.columns`.
+        """
+        return self.open(symbol, time_frame).columns(start, end)
+
+    def extend(self, symbol: str, time_frame: str, candles: Any) -> SyncResult:
+        """
+        Appends the complete candles newer than the newest stored candle, e.g. from a `get_candle_columns`
+        response, and ignores the rest.
+
+        :param symbol: symbol, e.g. 'btcusd'.
+        :param time_frame: time frame, e.g. '1m'.
+        :param candles: structured array of `CANDLE_DTYPE` sorted by ascending timestamp.
+        :return: SyncResult with the appended candles and any gaps before them.
+        """
+        return self.open(symbol, time_frame).extend(candles, complete_before=self.clock())
+
+    def sync(self, symbol: str, time_frame: str) -> SyncResult:
+        """
+        Fetches the latest candles and stores the new complete ones, see `extend`.
+
+        :param symbol: symbol, e.g. 'btcusd'.
+        :param time_frame: time frame, e.g. '1m'.
+        :return: SyncResult with the appended candles and any gaps before them.
+        """
+        client = self.client if self.client is not None else get_default_client()
+        candles = client.get_candle_columns(symbol, time_frame, structured=True, use_sandbox=self.use_sandbox)
+
+        return self.extend(symbol, time_frame, candles)
+
+    def close(self) -> None:
+        """
+        Closes all open candle files. Views read from them stay valid.
+        """
+        with self._lock:
+            for file in self._files.values():
+                file.close()
+
+            self._files.clear()
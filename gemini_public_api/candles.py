@@ -0,0 +1,83 @@
+from array import array
+from operator import itemgetter
+from typing import Any, Dict, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+CANDLE_FIELDS: Tuple[str, ...] = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+
+CANDLE_DTYPE = np.dtype([
+    ('timestamp', np.int64),
+    ('open',      np.float64),
+    ('high',      np.float64),
+    ('low',       np.float64),
+    ('close',     np.float64),
+    ('volume',    np.float64)
+]) if np is not None else None
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError('numpy is required for this feature, install it with `pip install gemini-public-api[numpy]`')
+
+
+def _to_rows(payload: Sequence[Sequence[float]]):
+    rows = np.asarray(payload, dtype=np.float64).reshape(-1, len(CANDLE_FIELDS))
+    timestamps = rows[:, 0].astype(np.int64)
+
+    if timestamps.size > 1 and timestamps[0] > timestamps[-1] and (timestamps[:-1] >= timestamps[1:]).all():
+        # Candles are served newest first, flipping is cheaper than sorting.
+        return rows[::-1], timestamps[::-1]
+
+    order = np.argsort(timestamps, kind='stable')
+    return rows[order], timestamps[order]
+
+
+def decode_candles(payload: Sequence[Sequence[float]]) -> Dict[str, Any]:
+    """
+    Decodes a candles payload into contiguous columns sorted by ascending timestamp.
+
+    With numpy installed, the columns are numpy arrays. Otherwise they are ``array.array`` objects,
+    ``'q'`` (int64) for timestamps and ``'d'`` (float64) for prices and volume.
+
+    :param payload: decoded candles response, a list of [timestamp, open, high, low, close, volume] rows.
+    :return: Dictionary mapping each of `CANDLE_FIELDS` to a column.
+    """
+    if np is None:
+        rows = sorted(payload, key=itemgetter(0))
+        columns = list(zip(*rows)) if rows else [()] * len(CANDLE_FIELDS)
+
+        return {
+            field: array('q' if field == 'timestamp' else 'd', map(int, column) if field == 'timestamp' else column)
+            for field, column in zip(CANDLE_FIELDS, columns)
+        }
+
+    rows, timestamps = _to_rows(payload)
+    columns = {'timestamp': np.ascontiguousarray(timestamps)}
+
+    for i, field in enumerate(CANDLE_FIELDS[1:], start=1):
+        columns[field] = np.ascontiguousarray(rows[:, i])
+
+    return columns
+
+
+def decode_candles_structured(payload: Sequence[Sequence[float]]):
+    """
+    Decodes a candles payload into a numpy structured array of `CANDLE_DTYPE` sorted by ascending timestamp.
+
+    :param payload: decoded candles response, a list of [timestamp, open, high, low, close, volume] rows.
+    :return: Structured numpy array.
+    """
+    _require_numpy()
+
+    rows, timestamps = _to_rows(payload)
+    candles = np.empty(len(timestamps), dtype=CANDLE_DTYPE)
+    candles['timestamp'] = timestamps
+
+    for i, field in enumerate(CANDLE_FIELDS[1:], start=1):
+        candles[field] = rows[:, i]
+
+    return candles
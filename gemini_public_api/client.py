@@ -0,0 +1,563 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import requests
+from urllib3.util.retry import Retry
+
+import gemini_public_api.endpoints as endpoints
+from gemini_public_api.candles import decode_candles, decode_candles_structured
+from gemini_public_api.instrumentation import Instrumentation, InstrumentedTransport
+from gemini_public_api.json_decoder import JSONDecoder, get_default_decoder
+from gemini_public_api.models import PARSERS, parse
+from gemini_public_api.pagination import TradeCursor
+from gemini_public_api.rate_limit import RetryPolicy, TokenBucket
+from gemini_public_api.streaming import DEFAULT_CHUNK_SIZE, Record, iter_records
+from gemini_public_api.transport import RequestsTransport, Transport
+
+DEFAULT_POOL_CONNECTIONS: int = 10
+DEFAULT_MAX_WORKERS: int = 10
+DEFAULT_MAX_RETRIES: int = 0
+
+ENDPOINTS: Tuple[str, ...] = (
+    'get_symbols',
+    'get_symbol_details',
+    'get_network',
+    'get_ticker',
+    'get_ticker_v2',
+    'get_candles',
+    'get_free_promos',
+    'get_current_order_book',
+    'get_trade_history',
+    'get_price_feed'
+)
+
+
+class GeminiClient:
+    """
+    A synchronous client for the public Gemini REST API.
+
+    The client owns a ``requests.Session`` with a pooled ``HTTPAdapter`` mounted for both
+    ``http://`` and ``https://``, so consecutive calls reuse open keep-alive connections
+    instead of paying a fresh TCP connect and TLS handshake each time.
+
+    This class can be used with a `with` statement, in which case the session is closed on exit.
+
+    Requests go through a pluggable `Transport`; passing an `HttpxTransport` multiplexes concurrent
+    requests over a few HTTP/2 connections instead.
+
+    Many requests can be fanned out over a thread pool that shares the session with `fetch_many`.
+
+    Decoded results, e.g. from `fetch_many`, are parsed from the raw body with a pluggable `JSONDecoder`,
+    orjson or msgspec when installed.
+
+    An optional `TokenBucket` limits the request rate of all calls made through the client, and an optional
+    `RetryPolicy` retries throttled and failed requests, honoring `Retry-After`.
+
+    An optional `Instrumentation` records the phase timings and payload sizes of every request and decode,
+    see `gemini_public_api.instrumentation`.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        with GeminiClient(pool_maxsize=32) as client:
+            print(client.get_ticker('btcusd').json())
+            print(client.fetch_many([('get_ticker', ('btcusd',)), ('get_ticker', ('ethusd',))]))
+
+    Attributes
+    ----------
+    transport
+        The Transport requests are sent through.
+    session
+        The ``requests.Session`` of the default transport, None for other transports.
+    rate_limiter
+        The TokenBucket shared by all calls, or None.
+    retry_policy
+        The RetryPolicy applied to all calls, or None.
+    decoder
+        The JSONDecoder used to decode response bodies.
+    instrumentation
+        The Instrumentation recording request timings, or None.
+    retried
+        Number of requests that were retried.
+    """
+
+    def __init__(
+            self,
+            pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize: Optional[int] = None,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            max_retries: Union[int, Retry] = DEFAULT_MAX_RETRIES,
+            pool_block: bool = False,
+            keep_alive: bool = True,
+            session: Optional[requests.Session] = None,
+            rate_limiter: Optional[TokenBucket] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            decoder: Optional[JSONDecoder] = None,
+            transport: Optional[Transport] = None,
+            instrumentation: Optional[Instrumentation] = None
+    ):
+        """
+        :param pool_connections: number of per-host connection pools to cache.
+        :param pool_maxsize: maximum number of connections kept open per host, defaults to `max_workers`.
+        :param max_workers: number of threads used by `fetch_many`.
+        :param max_retries: retries for failed connections, either a count or a urllib3 ``Retry``.
+        :param pool_block: block when the pool is exhausted instead of opening throwaway connections.
+        :param keep_alive: keep connections open between requests.
+        :param session: existing session to configure, a new one is created if omitted.
+        :param rate_limiter: token bucket to acquire a token from before every request.
+        :param retry_policy: policy for retrying responses with retryable statuses such as 429.
+        :param decoder: JSON decoder for response bodies, the default decoder if omitted.
+        :param transport: backend to send requests through, e.g. an `HttpxTransport` for HTTP/2. A
+            `RequestsTransport` configured with the pool arguments above is created if omitted.
+        :param instrumentation: instrumentation to record request timings with, off if omitted.
+        """
+        if max_workers < 1:
+            raise ValueError(f'max_workers must be at least 1, got {max_workers}')
+
+        if transport is None:
+            transport = RequestsTransport(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize if pool_maxsize is not None else max_workers,
+                max_retries=max_retries,
+                pool_block=pool_block,
+                keep_alive=keep_alive,
+                session=session
+            )
+
+        self.session = getattr(transport, 'session', None)
+        self.transport = InstrumentedTransport(transport, instrumentation) if instrumentation is not None else transport
+        self.instrumentation = instrumentation
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.decoder = decoder if decoder is not None else get_default_decoder()
+        self.retried = 0
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the underlying session, all pooled connections and the `fetch_many` thread pool.
+        """
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+        self.transport.close()
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        attempt = 0
+
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+
+            response = self.transport.get(url=url, **kwargs)
+
+            if self.retry_policy is None or not self.retry_policy.should_retry(response.status_code, attempt):
+                return response
+
+            delay = self.retry_policy.delay(attempt, response.headers.get('Retry-After'))
+            response.close()
+
+            self.retried += 1
+            attempt += 1
+
+            if self.rate_limiter is not None:
+                # Hold off every caller sharing the bucket, not just this one.
+                self.rate_limiter.defer(delay)
+            else:
+                time.sleep(delay)
+
+    def decode(self, response: requests.Response) -> Any:
+        """
+        Raises for error statuses and decodes the raw response body with the client's decoder.
+
+        :param response: response returned by one of the `get_*` methods.
+        :return: Decoded response body.
+        """
+        response.raise_for_status()
+
+        if self.instrumentation is None:
+            return self.decoder.decode(response.content)
+
+        return self.instrumentation.decode(self.decoder.decode, response.content, response.url, response.status_code)
+
+    def get_model(self, endpoint: str, *args, **kwargs) -> Any:
+        """
+        Calls an endpoint and decodes the response into its typed model, see `gemini_public_api.models`,
+        e.g. `client.get_model('get_trade_history', 'btcusd')` returns a list of Trade.
+
+        :param endpoint: name of one of the client's `get_*` methods that has a model.
+        :param args: positional arguments of the endpoint method.
+        :param kwargs: keyword arguments of the endpoint method.
+        :return: Model, or list or dictionary of models, of the endpoint.
+        """
+        if endpoint not in PARSERS:
+            raise ValueError(f'no model for endpoint: {endpoint!r}, expected one of {list(PARSERS)}')
+
+        return parse(endpoint, self.decode(getattr(self, endpoint)(*args, **kwargs)))
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='gemini-public-api'
+                )
+
+            return self._executor
+
+    def _fetch(self, endpoint: str, args: Union[Sequence, Mapping[str, Any]]) -> Union[Any, Exception]:
+        try:
+            method = getattr(self, endpoint)
+            return self.decode(method(**args) if isinstance(args, Mapping) else method(*args))
+        except Exception as e:
+            return e
+
+    def fetch_many(
+            self,
+            calls: Iterable[Tuple[str, Union[Sequence, Mapping[str, Any]]]]
+    ) -> List[Union[Any, Exception]]:
+        """
+        Fetches many endpoints concurrently on the client's thread pool.
+
+        Each call is an `(endpoint, args)` pair, where `endpoint` is the name of one of the client's
+        `get_*` methods and `args` is either a sequence of positional arguments or a mapping of keyword
+        arguments, e.g. `('get_ticker', ('btcusd',))` or `('get_candles', {'symbol': 'btcusd', 'time_frame': '1m'})`.
+
+        :param calls: endpoint calls to make.
+        :return: List of decoded responses in the order of `calls`, with the exception raised in place of failed calls.
+        """
+        calls = list(calls)
+
+        for endpoint, _ in calls:
+            if endpoint not in ENDPOINTS:
+                raise ValueError(f'unknown endpoint: {endpoint!r}')
+
+        executor = self._get_executor()
+        futures = [executor.submit(self._fetch, endpoint, args) for endpoint, args in calls]
+
+        return [future.result() for future in futures]
+
+    def get_symbols(self, use_sandbox: bool = False) -> requests.Response:
+        """
+        Retrieves all available trading symbols.
+
+        :param use_sandbox: flag to use sandbox endpoints.
+        :return: Returns a Response object.
+        """
+        return self._get(**endpoints.symbols(use_sandbox=use_sandbox))
+
+    def get_symbol_details(self, symbol: str, use_sandbox: bool = False) -> requests.Response:
+        """
+        Retrieves detailed information for a specific symbol.
+
+        :param symbol: symbol for which details are required.
+        :param use_sandbox: flag to use sandbox endpoints.
+        :return: Returns a Response object.
+        """
+        return self._get(**endpoints.symbol_details(symbol=symbol, use_sandbox=use_sandbox))
+
+    def get_network(self, token: str, use_sandbox: bool = False) -> requests.Response:
+        """
+        Retrieves the network status of a token.
+
+        :param token: token for which network status is required.
+        :param use_sandbox: flag to use sandbox endpoints.
+        :return: Returns a Response object.
+        """
+        return self._get(**endpoints.network(token=token, use_sandbox=use_sandbox))
+
+    def get_ticker(self, symbol: str, use_sandbox: bool = False) -> requests.Response:
+        """
+        Retrieves the ticker for a specific symbol.
+
+        :param symbol: symbol for which ticker is required.
+        :param use_sandbox: flag to use sandbox endpoints.
+        :return: Returns a Response object.
+        """
+        return self._get(**endpoints.ticker(symbol=symbol, use_sandbox=use_sandbox))
+
+    def get_ticker_v2(self, symbol: str, use_sandbox: bool = False) -> requests.Response:
+        """
+        Retrieves the ticker (version 2) for a specific symbol.
+
+        :param symbol: symbol for which ticker (version 2) is required.
+        :param use_sandbox: flag to use sandbox endpoints.
+        :return: Returns a Response object.
+        """
+        return self._get(**endpoints.ticker_v2(symbol=symbol, use_sandbox=use_sandbox))
+
+    def get_candles(self, symbol: str, time_frame: str, use_sandbox: bool = False) -> requests.Response:
+        """
+        Retrieves the candles data for a specific symbol and time frame.
+
+        :param symbol: symbol for which candles data is required.
+        :param time_frame: time frame for the candles data.
+        :param use_sandbox: flag to use sandbox endpoints.
+        :return: Returns a Response object.
+        """
+        return self._get(**endpoints.candles(symbol=symbol, time_frame=time_frame, use_sandbox=use_sandbox))
+
+    def get_candle_columns(
+            self,
+            symbol: str,
+            time_frame: str,
+            structured: bool = False,
+            use_sandbox: bool = False
+    ) -> Any:
+        """
+        Retrieves the candles data for a specific symbol and time frame decoded into columns.
+
+        :param symbol: symbol for which candles data is required.
+        :param time_frame: time frame for the candles data.
+        :param structured: flag to return a numpy structured array instead of a dictionary of columns.
+        :param use_sandbox: flag to use sandbox endpoints.
+        :return: Columns sorted by ascending timestamp, see `gemini_public_api.candles`.
+        """
+        payload = self.decode(self.get_candles(symbol=symbol, time_frame=time_frame, use_sandbox=use_sandbox))
+
+        return decode_candles_structured(payload) if structured else decode_candles(payload)
+
+    def get_free_promos(self, use_sandbox: bool = False) -> requests.Response:
+        """
+        Retrieves all available free promotions.
+
+        :param use_sandbox: flag to use sandbox endpoints.
+        :return: Returns a Response object.
+        """
+        return self._get(**endpoints.free_promos(use_sandbox=use_sandbox))
+
+    def get_current_order_book(
+            self,
+            symbol: str,
+            bid_limit: int = 500,
+            ask_limit: int = 500,
+            use_sandbox: bool = False
+    ) -> requests.Response:
+        """
+        Retrieves the current order book for a specific symbol.
+
+        :param symbol: symbol for which order book is required.
+        :param bid_limit: limit for bid orders.
+        :param ask_limit: limit for ask orders.
+        :param use_sandbox: flag to use sandbox endpoints.
+        :return: Returns a Response object.
+        """
+        return self._get(**endpoints.current_order_book(
+            symbol=symbol,
+            bid_limit=bid_limit,
+            ask_limit=ask_limit,
+            use_sandbox=use_sandbox
+        ))
+
+    def get_trade_history(
+            self,
+            symbol: str,
+            timestamp: Optional[int] = None,
+            limit_trades: int = 500,
+            include_breaks: bool = False,
+            use_sandbox: bool = False
+    ) -> requests.Response:
+        """
+        Retrieves the trade history for a specific symbol.
+
+        :param symbol: symbol for which trade history is required.
+        :param timestamp: starting timestamp for the trade history.
+        :param limit_trades: limit for number of trades in the history.
+        :param include_breaks: flag to include breaks in the trade history.
+        :param use_sandbox: flag to use sandbox endpoints.
+        :return: Returns a Response object.
+        """
+        return self._get(**endpoints.trade_history(
+            symbol=symbol,
+            timestamp=timestamp,
+            limit_trades=limit_trades,
+            include_breaks=include_breaks,
+            use_sandbox=use_sandbox
+        ))
+
+    def get_price_feed(self, use_sandbox: bool = False) -> requests.Response:
+        """
+        Retrieves the price feed.
+
+        :param use_sandbox: flag to use sandbox endpoints.
+        :return: Returns a Response object.
+        """
+        return self._get(**endpoints.price_feed(use_sandbox=use_sandbox))
+
+    def iter_trades(
+            self,
+            symbol: str,
+            since: int,
+            until: Optional[int] = None,
+            limit_trades: int = 500,
+            include_breaks: bool = False,
+            use_sandbox: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterates over all trades for a specific symbol in [since, until), oldest first.
+
+        Pages are requested lazily as the iterator is consumed and duplicates at page boundaries are dropped.
+
+        :param symbol: symbol for which trades are required.
+        :param since: inclusive start, in milliseconds.
+        :param until: exclusive end, in milliseconds, or None to iterate up to the latest trade.
+        :param limit_trades: number of trades requested per page.
+        :param include_breaks: flag to include breaks in the trade history.
+        :param use_sandbox: flag to use sandbox endpoints.
+        :return: Iterator over decoded trades.
+        """
+        cursor = TradeCursor(since=since, until=until, limit_trades=limit_trades)
+
+        while not cursor.done:
+            page = self.decode(
+                self.get_trade_history(
+                    symbol=symbol,
+                    timestamp=cursor.timestamp,
+                    limit_trades=limit_trades,
+                    include_breaks=include_breaks,
+                    use_sandbox=use_sandbox
+                )
+            )
+
+            yield from cursor.advance(page)
+
+    def _stream(self, chunk_size: int, **kwargs) -> Iterator[Record]:
+        response = self._get(stream=True, **kwargs)
+
+        try:
+            response.raise_for_status()
+
+            # requests responses stream with iter_content, httpx responses with iter_bytes.
+            if hasattr(response, 'iter_content'):
+                chunks = response.iter_content(chunk_size)
+            else:
+                chunks = response.iter_bytes(chunk_size)
+
+            yield from iter_records(chunks, self.decoder)
+        finally:
+            response.close()
+
+    def stream_current_order_book(
+            self,
+            symbol: str,
+            bid_limit: int = 500,
+            ask_limit: int = 500,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            use_sandbox: bool = False
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Retrieves the current order book for a specific symbol, decoding its levels one at a time as the body
+        arrives, see `gemini_public_api.streaming`.
+
+        The body is read in chunks by a `RequestsTransport`, also when wrapped by an `InstrumentedTransport`.
+        `HttpxTransport` reads it in full before the first level is decoded, and `RecordingTransport` keeps it in
+        memory until it is recorded. The same holds for the other `stream_*` methods.
+
+        :param symbol: symbol for which order book is required.
+        :param bid_limit: limit for bid orders.
+        :param ask_limit: limit for ask orders.
+        :param chunk_size: number of bytes to read at a time.
+        :param use_sandbox: flag to use sandbox endpoints.
+        :return: Iterator over (side, level) pairs, where side is 'bids' or 'asks', in the order of the response.
+        """
+        return self._stream(chunk_size, **endpoints.current_order_book(
+            symbol=symbol,
+            bid_limit=bid_limit,
+            ask_limit=ask_limit,
+            use_sandbox=use_sandbox
+        ))
+
+    def stream_trade_history(
+            self,
+            symbol: str,
+            timestamp: Optional[int] = None,
+            limit_trades: int = 500,
+            include_breaks: bool = False,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            use_sandbox: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Retrieves the trade history for a specific symbol, decoding its trades one at a time as the body arrives.
+
+        :param symbol: symbol for which trade history is required.
+        :param timestamp: starting timestamp for the trade history.
+        :param limit_trades: limit for number of trades in the history.
+        :param include_breaks: flag to include breaks in the trade history.
+        :param chunk_size: number of bytes to read at a time.
+        :param use_sandbox: flag to use sandbox endpoints.
+        :return: Iterator over decoded trades, in the order of the response.
+        """
+        records = self._stream(chunk_size, **endpoints.trade_history(
+            symbol=symbol,
+            timestamp=timestamp,
+            limit_trades=limit_trades,
+            include_breaks=include_breaks,
+            use_sandbox=use_sandbox
+        ))
+
+        return (trade for _, trade in records)
+
+    def stream_price_feed(
+            self,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            use_sandbox: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Retrieves the price feed, decoding its entries one at a time as the body arrives.
+
+        :param chunk_size: number of bytes to read at a time.
+        :param use_sandbox: flag to use sandbox endpoints.
+        :return: Iterator over decoded price feed entries, in the order of the response.
+        """
+        return (entry for _, entry in self._stream(chunk_size, **endpoints.price_feed(use_sandbox=use_sandbox)))
+
+
+_default_client: Optional[GeminiClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> GeminiClient:
+    """
+    Returns the process-wide client used by the functions in ``gemini_public_api.api``.
+
+    The client is created lazily on first use with default pool settings.
+
+    :return: Returns the default GeminiClient.
+    """
+    global _default_client
+
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = GeminiClient()
+
+    return _default_client
+
+
+def set_default_client(client: Optional[GeminiClient]) -> None:
+    """
+    Replaces the process-wide client used by the functions in ``gemini_public_api.api``.
+
+    The previous client is not closed. Passing None makes the next call create a fresh default client.
+
+    :param client: client to use, or None to reset.
+    """
+    global _default_client
+
+    with _default_client_lock:
+        _default_client = client
@@ -0,0 +1,73 @@
+"""
+Request definitions of the public endpoints, shared by the synchronous and asynchronous APIs.
+
+Each function returns the keyword arguments of the GET request to send, a `url` and, for endpoints that take
+query parameters, `params`, so every transport sends exactly the same request.
+"""
+from typing import Any, Dict, Optional
+
+import gemini_public_api.public_endpoints as production
+import gemini_public_api.public_sandbox_endpoints as sandbox
+
+
+def _urls(use_sandbox: bool):
+    return sandbox if use_sandbox else production
+
+
+def symbols(use_sandbox: bool = False) -> Dict[str, Any]:
+    return {'url': _urls(use_sandbox).SYMBOLS}
+
+
+def symbol_details(symbol: str, use_sandbox: bool = False) -> Dict[str, Any]:
+    return {'url': _urls(use_sandbox).SYMBOL_DETAILS.format(symbol=symbol)}
+
+
+def network(token: str, use_sandbox: bool = False) -> Dict[str, Any]:
+    return {'url': _urls(use_sandbox).NETWORK.format(token=token)}
+
+
+def ticker(symbol: str, use_sandbox: bool = False) -> Dict[str, Any]:
+    return {'url': _urls(use_sandbox).PUBLIC_TICKER.format(symbol=symbol)}
+
+
+def ticker_v2(symbol: str, use_sandbox: bool = False) -> Dict[str, Any]:
+    return {'url': _urls(use_sandbox).PUBLIC_TICKER_V2.format(symbol=symbol)}
+
+
+def candles(symbol: str, time_frame: str, use_sandbox: bool = False) -> Dict[str, Any]:
+    return {'url': _urls(use_sandbox).CANDLES.format(symbol=symbol, time_frame=time_frame)}
+
+
+def free_promos(use_sandbox: bool = False) -> Dict[str, Any]:
+    return {'url': _urls(use_sandbox).FREE_PROMOS}
+
+
+def current_order_book(
+        symbol: str,
+        bid_limit: int = 500,
+        ask_limit: int = 500,
+        use_sandbox: bool = False
+) -> Dict[str, Any]:
+    return {
+        'url':    _urls(use_sandbox).CURRENT_ORDER_BOOK.format(symbol=symbol),
+        'params': {'bid_limit': bid_limit, 'ask_limit': ask_limit}
+    }
+
+
+def trade_history(
+        symbol: str,
+        timestamp: Optional[int] = None,
+        limit_trades: int = 500,
+        include_breaks: bool = False,
+        use_sandbox: bool = False
+) -> Dict[str, Any]:
+    params = {'limit_trades': limit_trades, 'include_breaks': str(include_breaks).lower()}
+
+    if timestamp is not None:
+        params = {'timestamp': timestamp, **params}
+
+    return {'url': _urls(use_sandbox).TRADE_HISTORY.format(symbol=symbol), 'params': params}
+
+
+def price_feed(use_sandbox: bool = False) -> Dict[str, Any]:
+    return {'url': _urls(use_sandbox).PRICE_FEED}
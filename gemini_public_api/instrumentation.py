@@ -0,0 +1,690 @@
+import math
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from gemini_public_api import public_endpoints
+from gemini_public_api.transport import RequestsTransport, Transport
+
+PHASES: Tuple[str, ...] = ('queue', 'dns', 'connect', 'tls', 'ttfb', 'transfer', 'decode', 'total')
+
+DEFAULT_SIGNIFICANT_FIGURES: int = 2
+
+# Upper bounds of the exported histogram buckets, in seconds and bytes.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+DEFAULT_SIZE_BUCKETS: Tuple[int, ...] = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+_ENDPOINT_URLS: Dict[str, str] = {
+    'get_symbols':            public_endpoints.SYMBOLS,
+    'get_symbol_details':     public_endpoints.SYMBOL_DETAILS,
+    'get_network':            public_endpoints.NETWORK,
+    'get_ticker':             public_endpoints.PUBLIC_TICKER,
+    'get_ticker_v2':          public_endpoints.PUBLIC_TICKER_V2,
+    'get_candles':            public_endpoints.CANDLES,
+    'get_free_promos':        public_endpoints.FREE_PROMOS,
+    'get_current_order_book': public_endpoints.CURRENT_ORDER_BOOK,
+    'get_trade_history':      public_endpoints.TRADE_HISTORY,
+    'get_price_feed':         public_endpoints.PRICE_FEED
+}
+
+_ENDPOINT_PATTERNS: Tuple[Tuple[str, 're.Pattern[str]'], ...] = tuple(
+    (name, re.compile('^' + re.sub(r'\\{\w+\\}', '[^/]+', re.escape(urlsplit(url).path)) + '$'))
+    for name, url in _ENDPOINT_URLS.items()
+)
+
+
+@lru_cache(maxsize=4096)
+def _endpoint_of_path(path: str) -> str:
+    for name, pattern in _ENDPOINT_PATTERNS:
+        if pattern.match(path):
+            return name
+
+    return 'other'
+
+
+def endpoint_name(url: Any) -> str:
+    """
+    :param url: request URL, of the production, sandbox or any other host.
+    :return: Name of the endpoint function the URL path belongs to, e.g. 'get_ticker', or 'other'.
+    """
+    return _endpoint_of_path(urlsplit(str(url)).path)
+
+
+class Timing:
+    """
+    Phase timings of one request, or of decoding one response body.
+
+    Phases, all in seconds, are those of `PHASES` that the backend could observe:
+
+    queue
+        Waiting for a free connection of the pool.
+    dns
+        Resolving the host name.
+    connect
+        Opening the TCP connection, including the DNS lookup where it is not reported separately.
+    tls
+        TLS handshake, included in `connect` where it is not reported separately.
+    ttfb
+        From sending the request until the response headers arrived, the time spent by the server.
+    transfer
+        Reading the response body.
+    decode
+        Decoding the JSON body. Reported in its own Timing, because a response may be decoded later or not at all.
+    total
+        The whole request, until its body was read.
+
+    Connection phases are only present for requests that opened a new connection.
+
+    Attributes
+    ----------
+    endpoint
+        Name of the endpoint, see `endpoint_name`.
+    url
+        Request URL.
+    status
+        HTTP status of the response.
+    size
+        Size of the response body in bytes.
+    phases
+        Dictionary mapping phase names to seconds.
+    """
+
+    __slots__ = ('endpoint', 'url', 'status', 'size', 'phases')
+
+    def __init__(self, endpoint: str, url: str, status: int, size: int, phases: Dict[str, float]):
+        self.endpoint = endpoint
+        self.url = url
+        self.status = status
+        self.size = size
+        self.phases = phases
+
+    def __repr__(self) -> str:
+        phases = ', '.join(f'{name}={seconds * 1e3:.3f}ms' for name, seconds in self.phases.items())
+        return f'Timing({self.endpoint}, status={self.status}, size={self.size}, {phases})'
+
+
+class Sink(ABC):
+    """
+    Interface of the destinations timings are recorded into.
+
+    `record` is called on the thread or event loop that sent the request, so it should be quick and thread-safe.
+    """
+
+    @abstractmethod
+    def record(self, timing: Timing) -> None:
+        """
+        :param timing: timing to record.
+        """
+
+
+class CallbackSink(Sink):
+    """
+    Passes every timing to a callback, e.g. to log slow requests or feed another metrics library.
+    """
+
+    def __init__(self, callback: Callable[[Timing], Any]):
+        """
+        :param callback: function called with each Timing.
+        """
+        self.callback = callback
+
+    def record(self, timing: Timing) -> None:
+        self.callback(timing)
+
+
+class HdrHistogram:
+    """
+    A high dynamic range histogram of non-negative integers with bounded relative error.
+
+    Values are counted in log-linear buckets: exactly up to ``2 * 10 ** significant_figures`` and with a
+    relative error below ``10 ** -significant_figures`` above, so a histogram of microseconds resolves both
+    a 50 microsecond decode and a 30 second timeout at a memory cost of a few kilobytes. Like HdrHistogram,
+    percentiles report the highest value equivalent to the bucket they fall in. Not thread-safe.
+
+    Attributes
+    ----------
+    count
+        Number of recorded values.
+    total
+        Exact sum of the recorded values.
+    min, max
+        Exact smallest and largest recorded value, None while empty.
+    """
+
+    def __init__(self, significant_figures: int = DEFAULT_SIGNIFICANT_FIGURES):
+        """
+        :param significant_figures: number of significant decimal digits preserved, from 1 to 5.
+        """
+        if not 1 <= significant_figures <= 5:
+            raise ValueError(f'significant_figures must be between 1 and 5, got {significant_figures}')
+
+        self.significant_figures = significant_figures
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+        self._bits = math.ceil(math.log2(2 * 10 ** significant_figures))
+        self._sub_buckets = 1 << self._bits
+        self._half = self._sub_buckets >> 1
+        self._counts: List[int] = []
+
+    def _index(self, value: int) -> int:
+        if value < self._sub_buckets:
+            return value
+
+        shift = value.bit_length() - self._bits
+
+        return self._sub_buckets + (shift - 1) * self._half + (value >> shift) - self._half
+
+    def _highest_equivalent(self, index: int) -> int:
+        if index < self._sub_buckets:
+            return index
+
+        shift, offset = divmod(index - self._sub_buckets, self._half)
+
+        return ((offset + self._half + 1) << (shift + 1)) - 1
+
+    def record(self, value: int, count: int = 1) -> None:
+        """
+        :param value: non-negative integer to record.
+        :param count: number of times to record it.
+        """
+        value = int(value)
+
+        if value < 0:
+            raise ValueError(f'value must not be negative, got {value}')
+
+        index = self._index(value)
+        counts = self._counts
+
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+
+        counts[index] += count
+        self.count += count
+        self.total += value * count
+
+        if self.min is None or value < self.min:
+            self.min = value
+
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else float('nan')
+
+    def percentile(self, q: float) -> int:
+        """
+        :param q: percentile between 0 and 100.
+        :return: Value below or at which `q` percent of the recorded values fall, 0 if empty.
+        """
+        if not self.count:
+            return 0
+
+        rank = max(1, math.ceil(q / 100 * self.count))
+        seen = 0
+
+        for index, count in enumerate(self._counts):
+            seen += count
+
+            if seen >= rank:
+                return min(self._highest_equivalent(index), self.max)
+
+        return self.max
+
+    def cumulative_counts(self, bounds: Sequence[int]) -> List[int]:
+        """
+        :param bounds: ascending upper bounds.
+        :return: Number of values in buckets up to each bound, as needed for cumulative histogram buckets.
+        """
+        result = []
+        index, seen, counts = 0, 0, self._counts
+
+        for bound in bounds:
+            last = min(self._index(int(bound)), len(counts) - 1)
+
+            while index <= last:
+                seen += counts[index]
+                index += 1
+
+            result.append(seen)
+
+        return result
+
+    def copy(self) -> 'HdrHistogram':
+        """
+        :return: An independent copy of the histogram.
+        """
+        histogram = HdrHistogram(self.significant_figures)
+        histogram.count = self.count
+        histogram.total = self.total
+        histogram.min = self.min
+        histogram.max = self.max
+        histogram._counts = list(self._counts)
+
+        return histogram
+
+    def reset(self) -> None:
+        """
+        Clears all recorded values.
+        """
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self._counts = []
+
+
+class HistogramSink(Sink):
+    """
+    Aggregates timings into in-memory `HdrHistogram` objects, per endpoint and phase, and payload sizes per endpoint.
+
+    Durations are kept in microseconds, sizes in bytes. Recording is thread-safe.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        histograms = HistogramSink()
+
+        with GeminiClient(instrumentation=Instrumentation(histograms)) as client:
+            ...
+
+        print(histograms.summary()['get_ticker']['ttfb'])
+
+    Attributes
+    ----------
+    timings
+        Dictionary mapping (endpoint, phase) to the HdrHistogram of its durations in microseconds.
+    sizes
+        Dictionary mapping endpoints to the HdrHistogram of their response sizes in bytes.
+    """
+
+    def __init__(self, significant_figures: int = DEFAULT_SIGNIFICANT_FIGURES):
+        """
+        :param significant_figures: precision of the histograms, see `HdrHistogram`.
+        """
+        self.significant_figures = significant_figures
+        self.timings: Dict[Tuple[str, str], HdrHistogram] = {}
+        self.sizes: Dict[str, HdrHistogram] = {}
+
+        self._lock = threading.Lock()
+
+    def _histogram(self, histograms: Dict[Any, HdrHistogram], key: Any) -> HdrHistogram:
+        histogram = histograms.get(key)
+
+        if histogram is None:
+            histogram = histograms[key] = HdrHistogram(self.significant_figures)
+
+        return histogram
+
+    def record(self, timing: Timing) -> None:
+        with self._lock:
+            for phase, seconds in timing.phases.items():
+                self._histogram(self.timings, (timing.endpoint, phase)).record(round(seconds * 1e6))
+
+            if 'total' in timing.phases:
+                self._histogram(self.sizes, timing.endpoint).record(timing.size)
+
+    def percentile(self, endpoint: str, phase: str, q: float) -> float:
+        """
+        :param endpoint: endpoint name.
+        :param phase: phase name, see `PHASES`.
+        :param q: percentile between 0 and 100.
+        :return: Percentile of the phase in seconds, nan if it was never recorded.
+        """
+        with self._lock:
+            histogram = self.timings.get((endpoint, phase))
+
+            return histogram.percentile(q) / 1e6 if histogram is not None else float('nan')
+
+    def summary(self, percentiles: Iterable[float] = (50, 90, 99)) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        :param percentiles: percentiles to report.
+        :return: Dictionary mapping endpoints to phases to their count, mean, max and percentiles in seconds,
+            e.g. `{'get_ticker': {'ttfb': {'count': 10, 'mean': 0.012, 'max': 0.03, 'p50': 0.011, ...}}}`.
+        """
+        percentiles = tuple(percentiles)
+        result: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+        with self._lock:
+            for (endpoint, phase), histogram in sorted(self.timings.items()):
+                stats = {'count': histogram.count, 'mean': histogram.mean / 1e6, 'max': histogram.max / 1e6}
+
+                for q in percentiles:
+                    stats[f'p{q:g}'] = histogram.percentile(q) / 1e6
+
+                result.setdefault(endpoint, {})[phase] = stats
+
+        return result
+
+    def snapshot(self) -> Tuple[Dict[Tuple[str, str], HdrHistogram], Dict[str, HdrHistogram]]:
+        """
+        :return: Copies of `timings` and `sizes` taken at one point in time, safe to read while recording goes on.
+        """
+        with self._lock:
+            timings = {key: histogram.copy() for key, histogram in self.timings.items()}
+            sizes = {key: histogram.copy() for key, histogram in self.sizes.items()}
+
+        return timings, sizes
+
+    def reset(self) -> None:
+        """
+        Clears all histograms.
+        """
+        with self._lock:
+            self.timings.clear()
+            self.sizes.clear()
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _labels(labels: Mapping[str, str]) -> str:
+    return ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+class PrometheusExporter:
+    """
+    Exposes the histograms of a `HistogramSink` in the Prometheus text exposition format.
+
+    Two histogram metrics are exported, `<namespace>_request_phase_seconds` labelled by endpoint and phase,
+    and `<namespace>_response_size_bytes` labelled by endpoint. Bucket counts are derived from the HDR
+    histograms when scraped, so the buckets can be changed without losing recorded data.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        histograms = HistogramSink()
+        server = PrometheusExporter(histograms).serve(port=9108)
+        ...
+        server.shutdown()
+    """
+
+    def __init__(
+            self,
+            sink: HistogramSink,
+            buckets: Sequence[float] = DEFAULT_BUCKETS,
+            size_buckets: Sequence[int] = DEFAULT_SIZE_BUCKETS,
+            namespace: str = 'gemini_public_api'
+    ):
+        """
+        :param sink: histograms to export.
+        :param buckets: ascending upper bounds of the duration buckets in seconds.
+        :param size_buckets: ascending upper bounds of the size buckets in bytes.
+        :param namespace: prefix of the metric names.
+        """
+        self.sink = sink
+        self.buckets = tuple(sorted(buckets))
+        self.size_buckets = tuple(sorted(size_buckets))
+        self.namespace = namespace
+
+    @staticmethod
+    def _histogram(
+            lines: List[str],
+            name: str,
+            labels: Mapping[str, str],
+            histogram: HdrHistogram,
+            bounds: Sequence[float],
+            scale: float
+    ) -> None:
+        for bound, count in zip(bounds, histogram.cumulative_counts([bound * scale for bound in bounds])):
+            lines.append(f'{name}_bucket{{{_labels({**labels, "le": f"{bound:g}"})}}} {count}')
+
+        lines.append(f'{name}_bucket{{{_labels({**labels, "le": "+Inf"})}}} {histogram.count}')
+        lines.append(f'{name}_sum{{{_labels(labels)}}} {histogram.total / scale:g}')
+        lines.append(f'{name}_count{{{_labels(labels)}}} {histogram.count}')
+
+    def render(self) -> str:
+        """
+        :return: All metrics in the Prometheus text exposition format.
+        """
+        seconds = f'{self.namespace}_request_phase_seconds'
+        size = f'{self.namespace}_response_size_bytes'
+
+        lines = [
+            f'# HELP {seconds} Duration of each phase of requests to the Gemini public API.',
+            f'# TYPE {seconds} histogram'
+        ]
+
+        timings, sizes = self.sink.snapshot()
+
+        for (endpoint, phase), histogram in sorted(timings.items()):
+            self._histogram(lines, seconds, {'endpoint': endpoint, 'phase': phase}, histogram, self.buckets, 1e6)
+
+        lines.append(f'# HELP {size} Size of response bodies of the Gemini public API.')
+        lines.append(f'# TYPE {size} histogram')
+
+        for endpoint, histogram in sorted(sizes.items()):
+            self._histogram(lines, size, {'endpoint': endpoint}, histogram, self.size_buckets, 1)
+
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, port: int = 0, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+        """
+        Serves the metrics to Prometheus scrapers from a daemon thread.
+
+        :param port: port to listen on, 0 for any free port, see `server.server_address`.
+        :param host: address to listen on.
+        :return: The running server, stop it with `shutdown()`.
+        """
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = exporter.render().encode()
+
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name='gemini-public-api-metrics', daemon=True).start()
+
+        return server
+
+
+class Instrumentation:
+    """
+    Fans timings out to sinks. Pass it to a `GeminiClient`, or to an `InstrumentedSession` for aiohttp.
+
+    Instrumentation is off unless an Instrumentation is passed, in which case nothing is timed or allocated.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        instrumentation = Instrumentation(HistogramSink(), CallbackSink(print))
+
+    Attributes
+    ----------
+    sinks
+        List of Sink to record timings into.
+    """
+
+    def __init__(self, *sinks: Sink):
+        """
+        :param sinks: sinks to record timings into.
+        """
+        self.sinks: List[Sink] = list(sinks)
+
+    def record(self, timing: Timing) -> None:
+        """
+        :param timing: timing to pass to every sink.
+        """
+        for sink in self.sinks:
+            sink.record(timing)
+
+    def decode(self, decode: Callable[[bytes], Any], body: bytes, url: Any, status: int) -> Any:
+        """
+        Decodes a response body and records how long it took.
+
+        :param decode: function decoding the body.
+        :param body: raw response body.
+        :param url: request URL.
+        :param status: HTTP status of the response.
+        :return: Decoded body.
+        """
+        started = time.perf_counter()
+        result = decode(body)
+        elapsed = time.perf_counter() - started
+
+        self.record(Timing(endpoint_name(url), str(url), status, len(body), {'decode': elapsed}))
+
+        return result
+
+
+# Connection setup of the calling thread's last request, see `InstrumentedTransport`.
+_connections = threading.local()
+
+
+class _TimedConnectionMixin:
+    def _new_conn(self):
+        started = time.perf_counter()
+
+        try:
+            return super()._new_conn()
+        finally:
+            _connections.tcp = time.perf_counter() - started
+
+    def connect(self):
+        _connections.tcp = 0.0
+        started = time.perf_counter()
+        super().connect()
+        elapsed = time.perf_counter() - started
+
+        _connections.phases = {'connect': _connections.tcp}
+
+        if isinstance(self, HTTPSConnection):
+            _connections.phases['tls'] = elapsed - _connections.tcp
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """
+    An ``HTTPAdapter`` whose connection pools time the setup of new connections, see `InstrumentedTransport`.
+
+    Telling the TCP connect apart from the TLS handshake relies on ``HTTPConnection._new_conn`` of urllib3 2.x,
+    the version pinned in pyproject.toml. Without it the adapter behaves like a plain ``HTTPAdapter``.
+    """
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+
+        if hasattr(HTTPConnection, '_new_conn'):
+            self.poolmanager.pool_classes_by_scheme = {
+                'http':  _TimedHTTPConnectionPool,
+                'https': _TimedHTTPSConnectionPool
+            }
+
+
+def _body_size(response: Any, kwargs: Mapping[str, Any]) -> int:
+    # The body of a streamed response is still unread, reading it here would buffer it after all.
+    if kwargs.get('stream'):
+        try:
+            return int(response.headers.get('Content-Length', 0))
+        except ValueError:
+            return 0
+
+    return len(response.content)
+
+
+class InstrumentedTransport(Transport):
+    """
+    Records a `Timing` of every request sent through a wrapped `Transport`, the synchronous counterpart of
+    `gemini_public_api.aiohttp.instrumentation.InstrumentedSession`.
+
+    Every transport reports `total`. Transports returning ``requests.Response`` objects also report `ttfb`
+    and `transfer`. A `RequestsTransport` that created its own session additionally reports `connect`, which
+    includes the DNS lookup, and `tls` for requests that opened a new connection: the wrapper mounts a
+    `TimedHTTPAdapter` on that session. A session passed to the `RequestsTransport` by the caller is left as it
+    is and reports no connection phases. `GeminiClient` creates this wrapper when given an
+    `Instrumentation`, and then also reports `decode`.
+
+    Streamed requests, sent with ``stream=True``, are timed until their headers arrived and their body is left
+    unread: they report no `transfer`, and the Content-Length header as their size.
+
+    Attributes
+    ----------
+    transport
+        The wrapped Transport.
+    instrumentation
+        The Instrumentation timings are recorded with.
+    """
+
+    def __init__(self, transport: Transport, instrumentation: Instrumentation):
+        """
+        :param transport: transport to send requests through.
+        :param instrumentation: instrumentation to record timings with.
+        """
+        self.transport = transport
+        self.instrumentation = instrumentation
+
+        if isinstance(transport, RequestsTransport) and transport.owns_session:
+            transport.mount(TimedHTTPAdapter)
+
+    def get(self, url: str, params: Optional[Mapping[str, Any]] = None, **kwargs) -> Any:
+        _connections.phases = None
+        started = time.perf_counter()
+        response = self.transport.get(url, params=params, **kwargs)
+        total = time.perf_counter() - started
+
+        phases = _connections.phases or {}
+
+        if isinstance(response, requests.Response):
+            elapsed = response.elapsed.total_seconds()
+            phases['ttfb'] = max(0.0, elapsed - phases.get('connect', 0.0) - phases.get('tls', 0.0))
+
+            if not kwargs.get('stream'):
+                phases['transfer'] = max(0.0, total - elapsed)
+
+        phases['total'] = total
+
+        self.instrumentation.record(
+            Timing(endpoint_name(url), str(url), response.status_code, _body_size(response, kwargs), phases)
+        )
+
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
@@ -0,0 +1,130 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+
+class JSONDecoder(ABC):
+    """
+    Interface of the decoders used to turn raw response bodies into Python objects.
+
+    Decoders take the body as bytes, so fast decoders can parse it without building an intermediate ``str``.
+    """
+
+    name: str = 'abstract'
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """
+        :param data: raw JSON document.
+        :return: Decoded document.
+        """
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}()'
+
+
+class StdlibDecoder(JSONDecoder):
+    """
+    Decoder backed by the standard library ``json`` module, always available.
+    """
+
+    name = 'json'
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonDecoder(JSONDecoder):
+    """
+    Decoder backed by ``orjson``, which parses bytes directly.
+    """
+
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError('orjson is not installed, install it with `pip install gemini-public-api[orjson]`')
+
+    def decode(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecDecoder(JSONDecoder):
+    """
+    Decoder backed by ``msgspec``, which parses bytes directly.
+    """
+
+    name = 'msgspec'
+
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError('msgspec is not installed, install it with `pip install gemini-public-api[msgspec]`')
+
+        self._decoder = msgspec.json.Decoder()
+
+    def decode(self, data: bytes) -> Any:
+        return self._decoder.decode(data)
+
+
+_DECODERS = (OrjsonDecoder, MsgspecDecoder, StdlibDecoder)
+
+
+def available_decoders() -> Dict[str, JSONDecoder]:
+    """
+    :return: Dictionary of the decoders that can be used in this environment by name, fastest first.
+    """
+    decoders = {}
+
+    for decoder in _DECODERS:
+        try:
+            decoders[decoder.name] = decoder()
+        except ImportError:
+            continue
+
+    return decoders
+
+
+_default_decoder: Optional[JSONDecoder] = None
+
+
+def get_default_decoder() -> JSONDecoder:
+    """
+    Returns the decoder used when none is given: orjson if installed, then msgspec, then the standard library.
+
+    :return: Returns a JSONDecoder.
+    """
+    global _default_decoder
+
+    if _default_decoder is None:
+        _default_decoder = next(iter(available_decoders().values()))
+
+    return _default_decoder
+
+
+def set_default_decoder(decoder: Union[JSONDecoder, str, None]) -> None:
+    """
+    Replaces the decoder used when none is given.
+
+    :param decoder: decoder instance, name of an available decoder, or None to pick the fastest available again.
+    """
+    global _default_decoder
+
+    if isinstance(decoder, str):
+        decoders = available_decoders()
+
+        if decoder not in decoders:
+            raise ValueError(f'unknown or unavailable decoder: {decoder!r}, available: {list(decoders)}')
+
+        decoder = decoders[decoder]
+
+    _default_decoder = decoder
@@ -0,0 +1,499 @@
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class Model:
+    """
+    Base of the typed response models.
+
+    Models declare their fields in `__slots__`, so instances carry no per-object ``__dict__``. Numeric fields
+    are parsed from their string representation once, when the model is built, and low-cardinality strings
+    such as currencies and trade sides are interned so that every record shares a single copy.
+
+    Models are built from the payload returned by `gemini_public_api.json_decoder`, whichever decoder is in use,
+    rather than decoded into ``msgspec`` Structs, so that they do not depend on that optional extra.
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return self.astuple() == other.astuple()
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'{type(self).__name__}({fields})'
+
+    def astuple(self) -> Tuple[Any, ...]:
+        """
+        :return: Tuple of the field values in declaration order.
+        """
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def asdict(self) -> Dict[str, Any]:
+        """
+        :return: Dictionary of the field values by name.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+
+def _float(value: Any) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+class Ticker(Model):
+    """
+    Public ticker of a symbol.
+
+    Attributes
+    ----------
+    bid, ask, last
+        Best bid, best ask and last trade price.
+    base_currency, quote_currency
+        Currencies of the 24 hour volumes.
+    base_volume, quote_volume
+        Volume traded over the last 24 hours in each currency.
+    timestamp
+        Time of the volume figures in milliseconds.
+    """
+
+    __slots__ = ('bid', 'ask', 'last', 'base_currency', 'quote_currency', 'base_volume', 'quote_volume', 'timestamp')
+
+    def __init__(
+            self,
+            bid: Optional[float],
+            ask: Optional[float],
+            last: Optional[float],
+            base_currency: Optional[str] = None,
+            quote_currency: Optional[str] = None,
+            base_volume: Optional[float] = None,
+            quote_volume: Optional[float] = None,
+            timestamp: Optional[int] = None
+    ):
+        self.bid = bid
+        self.ask = ask
+        self.last = last
+        self.base_currency = base_currency
+        self.quote_currency = quote_currency
+        self.base_volume = base_volume
+        self.quote_volume = quote_volume
+        self.timestamp = timestamp
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> 'Ticker':
+        """
+        :param payload: decoded ticker response.
+        :return: Returns a Ticker.
+        """
+        volume = dict(payload.get('volume') or {})
+        timestamp = volume.pop('timestamp', None)
+        (base_currency, base_volume), (quote_currency, quote_volume) = (list(volume.items()) + [(None, None)] * 2)[:2]
+
+        return cls(
+            bid=_float(payload.get('bid')),
+            ask=_float(payload.get('ask')),
+            last=_float(payload.get('last')),
+            base_currency=_intern(base_currency),
+            quote_currency=_intern(quote_currency),
+            base_volume=_float(base_volume),
+            quote_volume=_float(quote_volume),
+            timestamp=timestamp
+        )
+
+
+class TickerV2(Model):
+    """
+    Version 2 ticker of a symbol.
+
+    Attributes
+    ----------
+    symbol
+        Trading symbol.
+    open, high, low, close
+        Prices over the last 24 hours.
+    changes
+        Hourly prices over the last 24 hours, most recent first.
+    bid, ask
+        Best bid and best ask.
+    """
+
+    __slots__ = ('symbol', 'open', 'high', 'low', 'close', 'changes', 'bid', 'ask')
+
+    def __init__(
+            self,
+            symbol: str,
+            open: Optional[float],
+            high: Optional[float],
+            low: Optional[float],
+            close: Optional[float],
+            changes: Tuple[float, ...] = (),
+            bid: Optional[float] = None,
+            ask: Optional[float] = None
+    ):
+        self.symbol = symbol
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.changes = changes
+        self.bid = bid
+        self.ask = ask
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> 'TickerV2':
+        """
+        :param payload: decoded ticker v2 response.
+        :return: Returns a TickerV2.
+        """
+        return cls(
+            symbol=_intern(payload.get('symbol')),
+            open=_float(payload.get('open')),
+            high=_float(payload.get('high')),
+            low=_float(payload.get('low')),
+            close=_float(payload.get('close')),
+            changes=tuple(map(float, payload.get('changes') or ())),
+            bid=_float(payload.get('bid')),
+            ask=_float(payload.get('ask'))
+        )
+
+
+class SymbolDetails(Model):
+    """
+    Trading rules of a symbol.
+
+    Attributes
+    ----------
+    symbol
+        Trading symbol.
+    base_currency, quote_currency
+        Currencies of the symbol.
+    tick_size
+        Smallest order amount increment.
+    quote_increment
+        Smallest price increment.
+    min_order_size
+        Smallest order amount.
+    status
+        Trading status, e.g. 'open'.
+    wrap_enabled
+        Whether the symbol can be wrapped.
+    product_type, contract_type, contract_price_currency
+        Product details.
+    """
+
+    __slots__ = (
+        'symbol', 'base_currency', 'quote_currency', 'tick_size', 'quote_increment', 'min_order_size', 'status',
+        'wrap_enabled', 'product_type', 'contract_type', 'contract_price_currency'
+    )
+
+    def __init__(
+            self,
+            symbol: str,
+            base_currency: Optional[str],
+            quote_currency: Optional[str],
+            tick_size: Optional[float],
+            quote_increment: Optional[float],
+            min_order_size: Optional[float],
+            status: Optional[str] = None,
+            wrap_enabled: bool = False,
+            product_type: Optional[str] = None,
+            contract_type: Optional[str] = None,
+            contract_price_currency: Optional[str] = None
+    ):
+        self.symbol = symbol
+        self.base_currency = base_currency
+        self.quote_currency = quote_currency
+        self.tick_size = tick_size
+        self.quote_increment = quote_increment
+        self.min_order_size = min_order_size
+        self.status = status
+        self.wrap_enabled = wrap_enabled
+        self.product_type = product_type
+        self.contract_type = contract_type
+        self.contract_price_currency = contract_price_currency
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> 'SymbolDetails':
+        """
+        :param payload: decoded symbol details response.
+        :return: Returns a SymbolDetails.
+        """
+        return cls(
+            symbol=_intern(payload.get('symbol')),
+            base_currency=_intern(payload.get('base_currency')),
+            quote_currency=_intern(payload.get('quote_currency')),
+            tick_size=_float(payload.get('tick_size')),
+            quote_increment=_float(payload.get('quote_increment')),
+            min_order_size=_float(payload.get('min_order_size')),
+            status=_intern(payload.get('status')),
+            wrap_enabled=bool(payload.get('wrap_enabled', False)),
+            product_type=_intern(payload.get('product_type')),
+            contract_type=_intern(payload.get('contract_type')),
+            contract_price_currency=_intern(payload.get('contract_price_currency'))
+        )
+
+
+class Network(Model):
+    """
+    Networks a token can be transferred on.
+
+    Attributes
+    ----------
+    token
+        Token symbol.
+    networks
+        Names of the supported networks.
+    """
+
+    __slots__ = ('token', 'networks')
+
+    def __init__(self, token: str, networks: Tuple[str, ...] = ()):
+        self.token = token
+        self.networks = networks
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> 'Network':
+        """
+        :param payload: decoded network response.
+        :return: Returns a Network.
+        """
+        return cls(
+            token=_intern(payload.get('token')),
+            networks=tuple(_intern(network) for network in payload.get('network') or ())
+        )
+
+
+class Candle(Model):
+    """
+    One OHLCV candle.
+
+    Attributes
+    ----------
+    timestamp
+        Start of the candle in milliseconds.
+    open, high, low, close
+        Prices over the candle.
+    volume
+        Amount traded over the candle.
+    """
+
+    __slots__ = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+
+    def __init__(self, timestamp: int, open: float, high: float, low: float, close: float, volume: float):
+        self.timestamp = timestamp
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+
+    @classmethod
+    def from_row(cls, row: List[Any]) -> 'Candle':
+        """
+        :param row: [timestamp, open, high, low, close, volume] row of a candles response.
+        :return: Returns a Candle.
+        """
+        timestamp, open_, high, low, close, volume = row
+
+        return cls(int(timestamp), float(open_), float(high), float(low), float(close), float(volume))
+
+
+class Trade(Model):
+    """
+    One public trade.
+
+    Attributes
+    ----------
+    timestampms
+        Time of the trade in milliseconds.
+    tid
+        Trade id, increasing over time.
+    price, amount
+        Price and amount of the trade.
+    exchange
+        Exchange the trade happened on.
+    type
+        Taker side, 'buy', 'sell', 'auction' or 'block'.
+    broken
+        Whether the trade was broken, None unless breaks were requested.
+    """
+
+    __slots__ = ('timestampms', 'tid', 'price', 'amount', 'exchange', 'type', 'broken')
+
+    def __init__(
+            self,
+            timestampms: int,
+            tid: int,
+            price: float,
+            amount: float,
+            exchange: Optional[str] = None,
+            type: Optional[str] = None,
+            broken: Optional[bool] = None
+    ):
+        self.timestampms = timestampms
+        self.tid = tid
+        self.price = price
+        self.amount = amount
+        self.exchange = exchange
+        self.type = type
+        self.broken = broken
+
+    @property
+    def timestamp(self) -> int:
+        """
+        Time of the trade in seconds.
+        """
+        return self.timestampms // 1000
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> 'Trade':
+        """
+        :param payload: decoded trade from a trade history response.
+        :return: Returns a Trade.
+        """
+        return cls(
+            timestampms=payload['timestampms'],
+            tid=payload['tid'],
+            price=float(payload['price']),
+            amount=float(payload['amount']),
+            exchange=_intern(payload.get('exchange')),
+            type=_intern(payload.get('type')),
+            broken=payload.get('broken')
+        )
+
+
+class OrderBookLevel(Model):
+    """
+    One price level of an order book.
+
+    Attributes
+    ----------
+    price, amount
+        Price of the level and the amount at it.
+    timestamp
+        Time of the level in seconds.
+    """
+
+    __slots__ = ('price', 'amount', 'timestamp')
+
+    def __init__(self, price: float, amount: float, timestamp: Optional[int] = None):
+        self.price = price
+        self.amount = amount
+        self.timestamp = timestamp
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> 'OrderBookLevel':
+        """
+        :param payload: decoded level from a current order book response.
+        :return: Returns an OrderBookLevel.
+        """
+        timestamp = payload.get('timestamp')
+
+        return cls(
+            price=float(payload['price']),
+            amount=float(payload['amount']),
+            timestamp=int(timestamp) if timestamp is not None else None
+        )
+
+
+class PriceFeedEntry(Model):
+    """
+    Latest price of one trading pair.
+
+    Attributes
+    ----------
+    pair
+        Trading pair.
+    price
+        Latest price.
+    percent_change_24h
+        Relative change over the last 24 hours.
+    """
+
+    __slots__ = ('pair', 'price', 'percent_change_24h')
+
+    def __init__(self, pair: str, price: float, percent_change_24h: Optional[float] = None):
+        self.pair = pair
+        self.price = price
+        self.percent_change_24h = percent_change_24h
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> 'PriceFeedEntry':
+        """
+        :param payload: decoded entry from a price feed response.
+        :return: Returns a PriceFeedEntry.
+        """
+        return cls(
+            pair=_intern(payload['pair']),
+            price=float(payload['price']),
+            percent_change_24h=_float(payload.get('percentChange24h'))
+        )
+
+
+def parse_candles(payload: Iterable[List[Any]]) -> List[Candle]:
+    """
+    :param payload: decoded candles response.
+    :return: List of Candle in the order of the response.
+    """
+    return [Candle.from_row(row) for row in payload]
+
+
+def parse_trades(payload: Iterable[Dict[str, Any]]) -> List[Trade]:
+    """
+    :param payload: decoded trade history response.
+    :return: List of Trade in the order of the response.
+    """
+    return [Trade.from_payload(trade) for trade in payload]
+
+
+def parse_order_book(payload: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[OrderBookLevel]]:
+    """
+    :param payload: decoded current order book response.
+    :return: Dictionary with `bids` and `asks` lists of OrderBookLevel, in the order of the response.
+    """
+    return {
+        'bids': [OrderBookLevel.from_payload(level) for level in payload.get('bids', ())],
+        'asks': [OrderBookLevel.from_payload(level) for level in payload.get('asks', ())]
+    }
+
+
+def parse_price_feed(payload: Iterable[Dict[str, Any]]) -> List[PriceFeedEntry]:
+    """
+    :param payload: decoded price feed response.
+    :return: List of PriceFeedEntry in the order of the response.
+    """
+    return [PriceFeedEntry.from_payload(entry) for entry in payload]
+
+
+PARSERS: Dict[str, Callable[[Any], Any]] = {
+    'get_symbol_details':     SymbolDetails.from_payload,
+    'get_network':            Network.from_payload,
+    'get_ticker':             Ticker.from_payload,
+    'get_ticker_v2':          TickerV2.from_payload,
+    'get_candles':            parse_candles,
+    'get_current_order_book': parse_order_book,
+    'get_trade_history':      parse_trades,
+    'get_price_feed':         parse_price_feed
+}
+
+
+def parse(endpoint: str, payload: Any) -> Any:
+    """
+    Builds the typed model of a decoded response.
+
+    :param endpoint: name of the endpoint method that returned the response, e.g. 'get_trade_history'.
+    :param payload: decoded response.
+    :return: Model, or list or dictionary of models, of the endpoint.
+    """
+    try:
+        parser = PARSERS[endpoint]
+    except KeyError:
+        raise ValueError(f'no model for endpoint: {endpoint!r}, expected one of {list(PARSERS)}') from None
+
+    return parser(payload)
@@ -0,0 +1,517 @@
+import math
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+BUY: str = 'buy'
+SELL: str = 'sell'
+
+
+class _Side:
+    """
+    One side of an order book held as parallel price and amount arrays.
+
+    Prices are stored best first: descending for bids and ascending for asks. Lookups search `keys`, the prices
+    negated for bids, so both sides can be searched as ascending arrays.
+    """
+
+    def __init__(self, prices: Sequence[float], amounts: Sequence[float], descending: bool):
+        self.descending = descending
+
+        if np is not None:
+            prices = np.asarray(prices, dtype=np.float64)
+            amounts = np.asarray(amounts, dtype=np.float64)
+            keys = -prices if descending else prices
+
+            if keys.size > 1 and (keys[1:] < keys[:-1]).any():
+                order = np.argsort(keys, kind='stable')
+                prices, amounts, keys = prices[order], amounts[order], keys[order]
+        else:
+            prices, amounts = [float(price) for price in prices], [float(amount) for amount in amounts]
+            keys = [-price for price in prices] if descending else prices
+
+            if any(b < a for a, b in zip(keys, keys[1:])):
+                order = sorted(range(len(keys)), key=keys.__getitem__)
+                prices, amounts = [prices[i] for i in order], [amounts[i] for i in order]
+                keys = [keys[i] for i in order]
+
+        self.prices = prices
+        self.amounts = amounts
+        self.keys = keys
+
+        self._cumulative_amounts = None
+        self._cumulative_notionals = None
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    @property
+    def cumulative_amounts(self):
+        if self._cumulative_amounts is None:
+            self._cumulative_amounts = np.cumsum(self.amounts) if np is not None else list(accumulate(self.amounts))
+
+        return self._cumulative_amounts
+
+    @property
+    def cumulative_notionals(self):
+        if self._cumulative_notionals is None:
+            self._cumulative_notionals = np.cumsum(self.prices * self.amounts) if np is not None else list(
+                accumulate(price * amount for price, amount in zip(self.prices, self.amounts))
+            )
+
+        return self._cumulative_notionals
+
+    def key(self, price: float) -> float:
+        return -price if self.descending else price
+
+    def amount_at(self, price: float) -> float:
+        key = self.key(price)
+        i = int(np.searchsorted(self.keys, key)) if np is not None else bisect_left(self.keys, key)
+
+        return float(self.amounts[i]) if i < len(self.keys) and self.keys[i] == key else 0.0
+
+    def depth(self, price: float) -> float:
+        key = self.key(price)
+        i = int(np.searchsorted(self.keys, key, side='right')) if np is not None else bisect_right(self.keys, key)
+
+        return float(self.cumulative_amounts[i - 1]) if i else 0.0
+
+    def vwap(self, amount):
+        cumulative_amounts, cumulative_notionals = self.cumulative_amounts, self.cumulative_notionals
+
+        if np is not None:
+            amount = np.asarray(amount, dtype=np.float64)
+
+            if not len(cumulative_amounts):
+                result = np.full(amount.shape, np.nan)
+            else:
+                i = np.searchsorted(cumulative_amounts, amount)
+                filled = i < len(cumulative_amounts)
+                i = np.minimum(i, len(cumulative_amounts) - 1)
+                notional = cumulative_notionals[i] - (cumulative_amounts[i] - amount) * self.prices[i]
+
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    result = np.where(filled & (amount > 0), notional / amount, np.nan)
+
+            return float(result) if result.ndim == 0 else result
+
+        i = bisect_left(cumulative_amounts, amount)
+
+        if i == len(cumulative_amounts) or amount <= 0:
+            return math.nan
+
+        return (cumulative_notionals[i] - (cumulative_amounts[i] - amount) * self.prices[i]) / amount
+
+
+class SideDiff:
+    """
+    Changes to one side of an order book between two snapshots, each list sorted best price first.
+
+    Attributes
+    ----------
+    added
+        (price, amount) pairs of new levels.
+    removed
+        Prices of levels that disappeared.
+    resized
+        (price, amount) pairs of levels whose amount changed, with the new amount.
+    """
+
+    __slots__ = ('added', 'removed', 'resized')
+
+    def __init__(self, added: List[Tuple[float, float]], removed: List[float], resized: List[Tuple[float, float]]):
+        self.added = added
+        self.removed = removed
+        self.resized = resized
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.removed) + len(self.resized)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, SideDiff):
+            return NotImplemented
+
+        return (self.added, self.removed, self.resized) == (other.added, other.removed, other.resized)
+
+    def __repr__(self) -> str:
+        return f'SideDiff(added={self.added!r}, removed={self.removed!r}, resized={self.resized!r})'
+
+
+class OrderBookDiff:
+    """
+    Changes between two order book snapshots. A diff without changes is falsy.
+
+    Attributes
+    ----------
+    bids
+        Changes to the bids.
+    asks
+        Changes to the asks.
+    """
+
+    __slots__ = ('bids', 'asks')
+
+    def __init__(self, bids: SideDiff, asks: SideDiff):
+        self.bids = bids
+        self.asks = asks
+
+    def __len__(self) -> int:
+        return len(self.bids) + len(self.asks)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, OrderBookDiff):
+            return NotImplemented
+
+        return (self.bids, self.asks) == (other.bids, other.asks)
+
+    def __repr__(self) -> str:
+        return f'OrderBookDiff(bids={self.bids!r}, asks={self.asks!r})'
+
+
+def _diff_sides(old: _Side, new: _Side) -> SideDiff:
+    old_keys, old_prices, old_amounts = _as_lists(old)
+    new_keys, new_prices, new_amounts = _as_lists(new)
+
+    added, removed, resized = [], [], []
+    i, j, n, m = 0, 0, len(old_keys), len(new_keys)
+
+    while i < n and j < m:
+        if old_keys[i] == new_keys[j]:
+            if old_amounts[i] != new_amounts[j]:
+                resized.append((new_prices[j], new_amounts[j]))
+            i += 1
+            j += 1
+        elif old_keys[i] < new_keys[j]:
+            removed.append(old_prices[i])
+            i += 1
+        else:
+            added.append((new_prices[j], new_amounts[j]))
+            j += 1
+
+    removed.extend(old_prices[i:])
+    added.extend(zip(new_prices[j:], new_amounts[j:]))
+
+    return SideDiff(added=added, removed=removed, resized=resized)
+
+
+def _apply_side(side: _Side, diff: SideDiff) -> Tuple[List[float], List[float]]:
+    keys, prices, amounts = _as_lists(side)
+
+    changes = [(side.key(price), price, amount) for price, amount in diff.added]
+    changes.extend((side.key(price), price, amount) for price, amount in diff.resized)
+    changes.extend((side.key(price), price, None) for price in diff.removed)
+    changes.sort(key=lambda change: change[0])
+
+    result_prices, result_amounts = [], []
+    i, n = 0, len(keys)
+
+    for key, price, amount in changes:
+        while i < n and keys[i] < key:
+            result_prices.append(prices[i])
+            result_amounts.append(amounts[i])
+            i += 1
+
+        if i < n and keys[i] == key:
+            i += 1
+
+        if amount is not None:
+            result_prices.append(price)
+            result_amounts.append(amount)
+
+    result_prices.extend(prices[i:])
+    result_amounts.extend(amounts[i:])
+
+    return result_prices, result_amounts
+
+
+def _as_lists(side: _Side) -> Tuple[List[float], List[float], List[float]]:
+    if np is not None:
+        return side.keys.tolist(), side.prices.tolist(), side.amounts.tolist()
+
+    return side.keys, side.prices, side.amounts
+
+
+class OrderBook:
+    """
+    An order book snapshot held as sorted parallel arrays of prices and amounts.
+
+    Bids are sorted by descending price and asks by ascending price, so the best level of each side is
+    its first element. Prices and amounts are parsed once into float64 values; with numpy installed the
+    arrays are numpy arrays and depth and VWAP queries are vectorized, otherwise plain lists are used.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        book = OrderBook.from_payload(api.get_current_order_book('btcusd').json())
+
+        print(book.best_bid, book.best_ask, book.spread)
+        print(book.vwap('buy', 2.5), book.slippage('buy', 2.5))
+
+    Attributes
+    ----------
+    bid_prices, bid_amounts
+        Bid levels, best (highest price) first.
+    ask_prices, ask_amounts
+        Ask levels, best (lowest price) first.
+    """
+
+    def __init__(
+            self,
+            bid_prices: Sequence[float],
+            bid_amounts: Sequence[float],
+            ask_prices: Sequence[float],
+            ask_amounts: Sequence[float]
+    ):
+        """
+        :param bid_prices: bid prices, in any order.
+        :param bid_amounts: bid amounts, parallel to `bid_prices`.
+        :param ask_prices: ask prices, in any order.
+        :param ask_amounts: ask amounts, parallel to `ask_prices`.
+        """
+        if len(bid_prices) != len(bid_amounts) or len(ask_prices) != len(ask_amounts):
+            raise ValueError('prices and amounts must have the same length')
+
+        self._bids = _Side(bid_prices, bid_amounts, descending=True)
+        self._asks = _Side(ask_prices, ask_amounts, descending=False)
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, List[Dict[str, Any]]]) -> 'OrderBook':
+        """
+        Builds an order book from a decoded current order book response.
+
+        :param payload: dictionary with `bids` and `asks` lists of levels with string `price` and `amount`.
+        :return: Returns an OrderBook.
+        """
+        bids, asks = payload.get('bids', ()), payload.get('asks', ())
+
+        if np is not None:
+            return cls(
+                np.fromiter((float(level['price']) for level in bids), dtype=np.float64, count=len(bids)),
+                np.fromiter((float(level['amount']) for level in bids), dtype=np.float64, count=len(bids)),
+                np.fromiter((float(level['price']) for level in asks), dtype=np.float64, count=len(asks)),
+                np.fromiter((float(level['amount']) for level in asks), dtype=np.float64, count=len(asks))
+            )
+
+        return cls(
+            [level['price'] for level in bids],
+            [level['amount'] for level in bids],
+            [level['price'] for level in asks],
+            [level['amount'] for level in asks]
+        )
+
+    def __repr__(self) -> str:
+        return f'OrderBook(bids={len(self._bids)}, asks={len(self._asks)}, best_bid={self.best_bid}, ' \
+               f'best_ask={self.best_ask})'
+
+    @property
+    def bid_prices(self):
+        return self._bids.prices
+
+    @property
+    def bid_amounts(self):
+        return self._bids.amounts
+
+    @property
+    def ask_prices(self):
+        return self._asks.prices
+
+    @property
+    def ask_amounts(self):
+        return self._asks.amounts
+
+    @property
+    def best_bid(self) -> Optional[float]:
+        """
+        Highest bid price, or None if there are no bids.
+        """
+        return float(self._bids.prices[0]) if len(self._bids) else None
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        """
+        Lowest ask price, or None if there are no asks.
+        """
+        return float(self._asks.prices[0]) if len(self._asks) else None
+
+    @property
+    def spread(self) -> Optional[float]:
+        """
+        Difference between the best ask and the best bid, or None if either side is empty.
+        """
+        if not len(self._bids) or not len(self._asks):
+            return None
+
+        return float(self._asks.prices[0] - self._bids.prices[0])
+
+    @property
+    def mid(self) -> Optional[float]:
+        """
+        Midpoint between the best bid and the best ask, or None if either side is empty.
+        """
+        if not len(self._bids) or not len(self._asks):
+            return None
+
+        return float(self._asks.prices[0] + self._bids.prices[0]) / 2
+
+    def bid_amount(self, price: float) -> float:
+        """
+        Returns the amount bid at exactly `price`, or 0.0 if there is no such level.
+
+        :param price: price level to look up.
+        :return: Amount at the price level.
+        """
+        return self._bids.amount_at(price)
+
+    def ask_amount(self, price: float) -> float:
+        """
+        Returns the amount offered at exactly `price`, or 0.0 if there is no such level.
+
+        :param price: price level to look up.
+        :return: Amount at the price level.
+        """
+        return self._asks.amount_at(price)
+
+    def bid_depth(self, price: Optional[float] = None):
+        """
+        Returns the cumulative amount bid at `price` or better.
+
+        :param price: worst price to include, or None for the cumulative amounts of all levels.
+        :return: Cumulative amount, or an array of cumulative amounts parallel to `bid_prices` if `price` is None.
+        """
+        return self._bids.cumulative_amounts if price is None else self._bids.depth(price)
+
+    def ask_depth(self, price: Optional[float] = None):
+        """
+        Returns the cumulative amount offered at `price` or better.
+
+        :param price: worst price to include, or None for the cumulative amounts of all levels.
+        :return: Cumulative amount, or an array of cumulative amounts parallel to `ask_prices` if `price` is None.
+        """
+        return self._asks.cumulative_amounts if price is None else self._asks.depth(price)
+
+    def diff(self, new: 'OrderBook') -> OrderBookDiff:
+        """
+        Returns the levels that were added, removed or resized between this snapshot and `new`.
+
+        Both sides are compared with a single linear merge over their sorted prices.
+
+        :param new: newer snapshot of the same order book.
+        :return: Returns an OrderBookDiff.
+        """
+        return OrderBookDiff(bids=_diff_sides(self._bids, new._bids), asks=_diff_sides(self._asks, new._asks))
+
+    def apply(self, diff: OrderBookDiff) -> 'OrderBook':
+        """
+        Returns a new order book with `diff` applied to this one.
+
+        :param diff: changes to apply, as returned by `diff`.
+        :return: Returns an OrderBook.
+        """
+        bid_prices, bid_amounts = _apply_side(self._bids, diff.bids)
+        ask_prices, ask_amounts = _apply_side(self._asks, diff.asks)
+
+        return OrderBook(bid_prices, bid_amounts, ask_prices, ask_amounts)
+
+    def _taken_side(self, side: str) -> _Side:
+        if side == BUY:
+            return self._asks
+
+        if side == SELL:
+            return self._bids
+
+        raise ValueError(f'side must be {BUY!r} or {SELL!r}, got {side!r}')
+
+    def vwap(self, side: str, amount):
+        """
+        Returns the volume-weighted average price of filling `amount` with a market order.
+
+        A buy walks the asks and a sell walks the bids. With numpy installed, `amount` may be an array.
+
+        :param side: 'buy' or 'sell'.
+        :param amount: amount to fill.
+        :return: Average fill price, or nan if the book is too thin to fill `amount`.
+        """
+        return self._taken_side(side).vwap(amount)
+
+    def slippage(self, side: str, amount):
+        """
+        Returns the relative cost of filling `amount` with a market order compared to the best price.
+
+        :param side: 'buy' or 'sell'.
+        :param amount: amount to fill.
+        :return: Slippage as a non-negative fraction of the best price, or nan if the book is too thin to fill `amount`.
+        """
+        taken = self._taken_side(side)
+
+        if not len(taken):
+            return self.vwap(side, amount)
+
+        best = taken.prices[0]
+        vwap = taken.vwap(amount)
+
+        return (vwap - best) / best if side == BUY else (best - vwap) / best
+
+
+class OrderBookDiffer:
+    """
+    Keeps the last order book snapshot of each symbol and diffs every new snapshot against it.
+
+    The first snapshot of a symbol is diffed against an empty book, so all of its levels are reported as added.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        differ = OrderBookDiffer()
+
+        while True:
+            book = OrderBook.from_payload(api.get_current_order_book('btcusd').json())
+            diff = differ.update('btcusd', book)
+
+            if diff:
+                forward(diff)
+    """
+
+    def __init__(self):
+        self._books: Dict[str, OrderBook] = {}
+
+    def update(self, symbol: str, book: OrderBook) -> OrderBookDiff:
+        """
+        Stores `book` as the latest snapshot of `symbol` and returns its changes since the previous one.
+
+        :param symbol: symbol the snapshot belongs to.
+        :param book: latest snapshot.
+        :return: Returns an OrderBookDiff.
+        """
+        previous = self._books.get(symbol)
+        self._books[symbol] = book
+
+        return (previous if previous is not None else OrderBook([], [], [], [])).diff(book)
+
+    def get(self, symbol: str) -> Optional[OrderBook]:
+        """
+        Returns the latest snapshot of `symbol`, or None if none was stored.
+
+        :param symbol: symbol to look up.
+        :return: Returns an OrderBook or None.
+        """
+        return self._books.get(symbol)
+
+    def reset(self, symbol: Optional[str] = None) -> None:
+        """
+        Forgets the stored snapshot of `symbol`, or of all symbols if `symbol` is None.
+
+        :param symbol: symbol to forget.
+        """
+        if symbol is None:
+            self._books.clear()
+        else:
+            self._books.pop(symbol, None)
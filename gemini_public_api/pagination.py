@@ -0,0 +1,94 @@
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+def trade_key(trade: Dict[str, Any]) -> Tuple[int, int]:
+    """
+    Returns the key trades are ordered by: millisecond timestamp, then trade id.
+
+    :param trade: trade as returned by the trade history endpoint.
+    :return: Tuple of (timestampms, tid).
+    """
+    return trade['timestampms'], trade['tid']
+
+
+class TradeCursor:
+    """
+    Tracks the position of a forward walk over trade history pages.
+
+    The trade history endpoint returns at most `limit_trades` trades at or after `timestamp`,
+    newest first. The cursor turns each page into trades in ascending order, drops trades
+    outside of [since, until) and moves `timestamp` to the newest trade of the page. Trades that
+    share the newest millisecond come back on the next page, so only their ids are remembered
+    to drop them again; memory does not grow with the number of pages walked.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        cursor = TradeCursor(since=1700000000000, until=1700086400000)
+
+        while not cursor.done:
+            page = api.get_trade_history('btcusd', timestamp=cursor.timestamp).json()
+            for trade in cursor.advance(page):
+                print(trade)
+
+    Attributes
+    ----------
+    timestamp
+        Millisecond timestamp to request the next page from.
+    done
+        True once the walk reached `until` or the end of the history.
+    """
+
+    def __init__(self, since: int, until: Optional[int] = None, limit_trades: int = 500):
+        """
+        :param since: inclusive start of the walk, in milliseconds.
+        :param until: exclusive end of the walk, in milliseconds, or None to walk up to the latest trade.
+        :param limit_trades: number of trades requested per page.
+        """
+        if limit_trades < 1:
+            raise ValueError(f'limit_trades must be at least 1, got {limit_trades}')
+
+        self.timestamp = since
+        self.until = until
+        self.limit_trades = limit_trades
+        self.done = until is not None and since >= until
+
+        self._boundary_tids: Set[int] = set()
+
+    def advance(self, page: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Consumes a page fetched at `timestamp` and moves the cursor past it.
+
+        :param page: trades as returned by the trade history endpoint.
+        :return: New trades of the page within [since, until), oldest first.
+        """
+        page = sorted(page, key=trade_key)
+
+        start, until, seen = self.timestamp, self.until, self._boundary_tids
+        trades = [
+            trade for trade in page
+            if trade['tid'] not in seen
+            and trade['timestampms'] >= start
+            and (until is None or trade['timestampms'] < until)
+        ]
+
+        if len(page) < self.limit_trades:
+            self.done = True
+            return trades
+
+        last = page[-1]['timestampms']
+
+        if last > start:
+            self.timestamp = last
+            self._boundary_tids = {trade['tid'] for trade in page if trade['timestampms'] == last}
+        else:
+            # A full page within a single millisecond cannot be paged through, skip past it.
+            self.timestamp = last + 1
+            self._boundary_tids = set()
+
+        if until is not None and self.timestamp >= until:
+            self.done = True
+
+        return trades
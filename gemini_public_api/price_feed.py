@@ -0,0 +1,278 @@
+import math
+import threading
+import time
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from gemini_public_api.client import GeminiClient, get_default_client
+
+DEFAULT_TTL: float = 5.0
+
+Subscriber = Callable[[Set[str], 'PriceFeed'], Any]
+
+
+def _pair(symbol: str) -> str:
+    return symbol.upper()
+
+
+class PriceFeed:
+    """
+    An immutable snapshot of the price feed, indexed by pair.
+
+    Prices and 24 hour changes are held in ``array.array('d')`` columns and a dictionary maps each pair to its
+    position, so a lookup is one dictionary access. Pairs are matched case-insensitively, so both the feed's
+    'BTCUSD' and the symbol 'btcusd' work.
+
+    Attributes
+    ----------
+    pairs
+        List of the pairs, in the order of the response.
+    price_column
+        Prices, in the order of `pairs`.
+    change_column
+        Relative changes over the last 24 hours, nan where the feed has none.
+    fetched_at
+        Clock time at which the feed was fetched.
+    """
+
+    __slots__ = ('pairs', 'price_column', 'change_column', 'fetched_at', '_positions')
+
+    def __init__(self, pairs: List[str], price_column: array, change_column: array, fetched_at: float = 0.0):
+        self.pairs = pairs
+        self.price_column = price_column
+        self.change_column = change_column
+        self.fetched_at = fetched_at
+
+        self._positions: Dict[str, int] = {pair: i for i, pair in enumerate(pairs)}
+
+    @classmethod
+    def from_payload(cls, payload: Iterable[Dict[str, Any]], fetched_at: float = 0.0) -> 'PriceFeed':
+        """
+        :param payload: decoded price feed response.
+        :param fetched_at: clock time at which it was fetched.
+        :return: Returns a PriceFeed.
+        """
+        pairs, prices, changes = [], array('d'), array('d')
+
+        for entry in payload:
+            change = entry.get('percentChange24h')
+
+            pairs.append(_pair(entry['pair']))
+            prices.append(float(entry['price']))
+            changes.append(float(change) if change is not None else math.nan)
+
+        return cls(pairs, prices, changes, fetched_at)
+
+    def __len__(self) -> int:
+        return len(self.pairs)
+
+    def __contains__(self, symbol: str) -> bool:
+        return _pair(symbol) in self._positions
+
+    def price(self, symbol: str) -> float:
+        """
+        :param symbol: symbol or pair, e.g. 'btcusd'.
+        :return: Latest price, raises KeyError for pairs not in the feed.
+        """
+        return self.price_column[self._positions[_pair(symbol)]]
+
+    def change_24h(self, symbol: str) -> Optional[float]:
+        """
+        :param symbol: symbol or pair, e.g. 'btcusd'.
+        :return: Relative change over the last 24 hours or None, raises KeyError for pairs not in the feed.
+        """
+        change = self.change_column[self._positions[_pair(symbol)]]
+        return None if math.isnan(change) else change
+
+    def prices(self, symbols: Optional[Iterable[str]] = None) -> Dict[str, float]:
+        """
+        :param symbols: symbols or pairs, all pairs if None.
+        :return: Dictionary mapping each of `symbols`, as given, to its price. Raises KeyError for pairs not in the
+            feed.
+        """
+        if symbols is None:
+            return dict(zip(self.pairs, self.price_column))
+
+        positions, column = self._positions, self.price_column
+
+        return {symbol: column[positions[_pair(symbol)]] for symbol in symbols}
+
+    def changed(self, previous: Optional['PriceFeed']) -> Set[str]:
+        """
+        :param previous: earlier snapshot, or None.
+        :return: Set of the pairs whose price differs from `previous`, including pairs added or removed since.
+        """
+        if previous is None:
+            return set(self.pairs)
+
+        if previous.pairs == self.pairs:
+            # The feed usually lists the same pairs in the same order, compare the columns in lockstep.
+            return {
+                pair for pair, old, new in zip(self.pairs, previous.price_column, self.price_column) if old != new
+            }
+
+        old = previous.prices()
+        new = self.prices()
+
+        return {pair for pair in old.keys() | new.keys() if old.get(pair) != new.get(pair)}
+
+
+class BasePriceFeedIndex:
+    """
+    The part of `PriceFeedIndex` and `gemini_public_api.aiohttp.price_feed.AsyncPriceFeedIndex` that does not do
+    I/O: it holds the current feed, decides when it expired, and diffs each new feed against it for the subscribers.
+
+    Attributes
+    ----------
+    feed
+        The current PriceFeed, None before the first fetch.
+    refreshes
+        Number of times the feed was fetched.
+    """
+
+    def __init__(
+            self,
+            ttl: float = DEFAULT_TTL,
+            use_sandbox: bool = False,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        :param ttl: seconds a fetched feed is served before it is refreshed.
+        :param use_sandbox: flag to use sandbox endpoints.
+        :param clock: monotonic clock returning seconds.
+        """
+        self.ttl = ttl
+        self.use_sandbox = use_sandbox
+        self.clock = clock
+        self.feed: Optional[PriceFeed] = None
+        self.refreshes = 0
+
+        self._subscribers: List[Subscriber] = []
+
+    def subscribe(self, callback: Subscriber) -> Subscriber:
+        """
+        :param callback: function called with the set of changed pairs and the new PriceFeed after each refresh that
+            changed any price.
+        :return: The callback, e.g. to unsubscribe it later.
+        """
+        self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback: Subscriber) -> None:
+        """
+        :param callback: previously subscribed callback.
+        """
+        self._subscribers.remove(callback)
+
+    def _expired(self) -> bool:
+        return self.feed is None or self.clock() - self.feed.fetched_at >= self.ttl
+
+    def _update(self, payload: Iterable[Dict[str, Any]]) -> Set[str]:
+        feed = PriceFeed.from_payload(payload, fetched_at=self.clock())
+        changed = feed.changed(self.feed)
+
+        self.feed = feed
+        self.refreshes += 1
+
+        if changed:
+            for callback in list(self._subscribers):
+                callback(changed, feed)
+
+        return changed
+
+
+class PriceFeedIndex(BasePriceFeedIndex):
+    """
+    Answers per-symbol price lookups from a single `get_price_feed` call instead of one `get_ticker` call per symbol.
+
+    The feed is fetched on first use and again on the first lookup after `ttl` seconds, by one thread while
+    concurrent callers wait for it. Subscribers are called after every refresh that changed any price, with the
+    set of changed pairs and the new `PriceFeed`.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        index = PriceFeedIndex(ttl=2)
+        index.subscribe(lambda changed, feed: print({pair: feed.price(pair) for pair in changed}))
+
+        print(index.price('btcusd'), index.prices(['ethusd', 'solusd']))
+
+    Attributes
+    ----------
+    client
+        The GeminiClient used to fetch the feed.
+    feed
+        The current PriceFeed, None before the first fetch.
+    refreshes
+        Number of times the feed was fetched.
+    """
+
+    def __init__(
+            self,
+            client: Optional[GeminiClient] = None,
+            ttl: float = DEFAULT_TTL,
+            use_sandbox: bool = False,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        :param client: client to fetch with, the default client if omitted.
+        :param ttl: seconds a fetched feed is served before it is refreshed.
+        :param use_sandbox: flag to use sandbox endpoints.
+        :param clock: monotonic clock returning seconds.
+        """
+        super().__init__(ttl=ttl, use_sandbox=use_sandbox, clock=clock)
+
+        self.client = client if client is not None else get_default_client()
+
+        self._lock = threading.Lock()
+
+    def refresh(self) -> Set[str]:
+        """
+        Fetches the feed now, regardless of its age.
+
+        :return: Set of the pairs whose price changed.
+        """
+        with self._lock:
+            return self._refresh()
+
+    def _refresh(self) -> Set[str]:
+        return self._update(self.client.decode(self.client.get_price_feed(use_sandbox=self.use_sandbox)))
+
+    def current(self) -> PriceFeed:
+        """
+        :return: The current PriceFeed, fetched first if missing or older than `ttl`.
+        """
+        feed = self.feed
+
+        if self._expired():
+            with self._lock:
+                # Another thread may have refreshed it while this one waited for the lock.
+                if self._expired():
+                    self._refresh()
+
+                feed = self.feed
+
+        return feed
+
+    def price(self, symbol: str) -> float:
+        """
+        :param symbol: symbol or pair, e.g. 'btcusd'.
+        :return: Latest price, raises KeyError for pairs not in the feed.
+        """
+        return self.current().price(symbol)
+
+    def prices(self, symbols: Optional[Iterable[str]] = None) -> Dict[str, float]:
+        """
+        :param symbols: symbols or pairs, all pairs if None.
+        :return: Dictionary mapping each of `symbols` to its price, see `PriceFeed.prices`.
+        """
+        return self.current().prices(symbols)
+
+    def change_24h(self, symbol: str) -> Optional[float]:
+        """
+        :param symbol: symbol or pair, e.g. 'btcusd'.
+        :return: Relative change over the last 24 hours or None, raises KeyError for pairs not in the feed.
+        """
+        return self.current().change_24h(symbol)
@@ -0,0 +1,204 @@
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Iterable, Optional
+
+DEFAULT_RATE: float = 2.0
+DEFAULT_BURST: int = 5
+
+DEFAULT_MAX_RETRIES: int = 3
+DEFAULT_BACKOFF: float = 0.5
+DEFAULT_MAX_BACKOFF: float = 30.0
+DEFAULT_RETRY_STATUSES: frozenset = frozenset({429, 500, 502, 503, 504})
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket limiting requests to `rate` per second with bursts of up to `burst`.
+
+    Each request reserves a token; when the bucket is empty the reservation is queued behind earlier
+    ones, so waiting callers are released one by one at `rate` instead of all at once. One bucket can
+    be shared by a `GeminiClient`, any number of threads and all tasks on an event loop.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        bucket = TokenBucket(rate=2, burst=5)
+
+        bucket.acquire()              # in a thread
+        await bucket.acquire_async()  # in a coroutine
+
+    Attributes
+    ----------
+    throttled
+        Number of acquisitions that had to wait for a token.
+    throttled_seconds
+        Total time acquisitions were told to wait.
+    """
+
+    def __init__(
+            self,
+            rate: float = DEFAULT_RATE,
+            burst: int = DEFAULT_BURST,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        :param rate: tokens added per second.
+        :param burst: maximum number of tokens, the bucket starts full.
+        :param clock: monotonic clock returning seconds.
+        """
+        if rate <= 0:
+            raise ValueError(f'rate must be positive, got {rate}')
+
+        if burst < 1:
+            raise ValueError(f'burst must be at least 1, got {burst}')
+
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+
+        self.throttled = 0
+        self.throttled_seconds = 0.0
+
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """
+        Takes a token, possibly from the future.
+
+        :return: Seconds to wait before the request may be sent, 0.0 if a token was available.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+
+            if self._tokens >= 0:
+                return 0.0
+
+            delay = -self._tokens / self.rate
+            self.throttled += 1
+            self.throttled_seconds += delay
+
+            return delay
+
+    def defer(self, seconds: float) -> None:
+        """
+        Empties the bucket so that no token is available for at least `seconds`, e.g. after a 429 response.
+
+        :param seconds: seconds to hold off all callers.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+    def acquire(self) -> None:
+        """
+        Blocks the calling thread until a token is available.
+        """
+        delay = self.reserve()
+
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """
+        Waits without blocking the event loop until a token is available.
+        """
+        delay = self.reserve()
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Parses a `Retry-After` header given either as delay seconds or as an HTTP date.
+
+    :param value: header value.
+    :param now: current UNIX time, defaults to `time.time()`.
+    :return: Seconds to wait, or None if the header is missing or malformed.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if date is None:
+        return None
+
+    return max(0.0, date.timestamp() - (time.time() if now is None else now))
+
+
+class RetryPolicy:
+    """
+    Decides whether and when to retry a request that failed with a retryable HTTP status.
+
+    Delays honor the `Retry-After` header when the server sends one, and otherwise use exponential
+    backoff with full jitter: a random delay between 0 and `backoff * 2 ** attempt`, capped at `max_backoff`.
+    """
+
+    def __init__(
+            self,
+            max_retries: int = DEFAULT_MAX_RETRIES,
+            backoff: float = DEFAULT_BACKOFF,
+            max_backoff: float = DEFAULT_MAX_BACKOFF,
+            statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+            jitter: Callable[[], float] = random.random
+    ):
+        """
+        :param max_retries: maximum number of retries per request.
+        :param backoff: base delay in seconds.
+        :param max_backoff: maximum delay in seconds, also caps `Retry-After`.
+        :param statuses: HTTP statuses to retry.
+        :param jitter: function returning a random number in [0, 1).
+        """
+        if max_retries < 0:
+            raise ValueError(f'max_retries must not be negative, got {max_retries}')
+
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = frozenset(statuses)
+        self.jitter = jitter
+
+    def should_retry(self, status: int, attempt: int) -> bool:
+        """
+        :param status: HTTP status of the response.
+        :param attempt: number of retries already made.
+        :return: True if the request should be retried.
+        """
+        return status in self.statuses and attempt < self.max_retries
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        :param attempt: number of retries already made.
+        :param retry_after: value of the `Retry-After` header, if any.
+        :return: Seconds to wait before the next attempt.
+        """
+        seconds = parse_retry_after(retry_after)
+
+        if seconds is None:
+            seconds = self.jitter() * self.backoff * 2 ** attempt
+
+        return min(seconds, self.max_backoff)
@@ -0,0 +1,410 @@
+import gzip
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+from http import HTTPStatus
+from typing import Any, Deque, Dict, Hashable, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from gemini_public_api.json_decoder import get_default_decoder
+from gemini_public_api.transport import Transport
+from gemini_public_api.utils import PathLike
+
+DEFAULT_COMPRESS_LEVEL: int = 6
+
+# sent_at, received_at, status, length of the metadata, length of the body
+_FRAME = struct.Struct('<ddHII')
+
+
+def query_params(params: Optional[Mapping[str, Any]]) -> Dict[str, str]:
+    """
+    :param params: query parameters.
+    :return: The parameters as strings, the way they are recorded in an `Exchange`.
+    """
+    return {str(name): str(value) for name, value in params.items()} if params else {}
+
+
+def request_key(url: Any, params: Optional[Mapping[str, Any]] = None) -> Tuple[Hashable, ...]:
+    """
+    :param url: request URL.
+    :param params: query parameters.
+    :return: Key identifying the request, equal for requests with the same URL and parameters in any order.
+    """
+    return (str(url),) + tuple(sorted(query_params(params).items()))
+
+
+class Exchange:
+    """
+    One recorded request and its response.
+
+    Attributes
+    ----------
+    url
+        Request URL, without the query parameters.
+    params
+        Query parameters, with values as strings.
+    status
+        HTTP status of the response.
+    headers
+        Response headers as (name, value) pairs.
+    body
+        Raw response body.
+    sent_at, received_at
+        UNIX times at which the request was sent and its response fully received.
+    """
+
+    __slots__ = ('url', 'params', 'status', 'headers', 'body', 'sent_at', 'received_at')
+
+    def __init__(
+            self,
+            url: str,
+            params: Dict[str, str],
+            status: int,
+            headers: List[Tuple[str, str]],
+            body: bytes,
+            sent_at: float,
+            received_at: float
+    ):
+        self.url = url
+        self.params = params
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.sent_at = sent_at
+        self.received_at = received_at
+
+    def __repr__(self) -> str:
+        return f'Exchange(url={self.url!r}, params={self.params!r}, status={self.status}, body={len(self.body)} bytes)'
+
+    @property
+    def key(self) -> Tuple[Hashable, ...]:
+        return request_key(self.url, self.params)
+
+
+class RecordWriter:
+    """
+    Appends records to a gzip compressed file, one frame per record.
+
+    Every writer appends a new gzip member, so a file can be recorded into many times and is read back as one
+    stream. Writes are thread-safe. Data is compressed in memory and reaches the file as the compressor fills
+    its buffer, on `flush` and on `close`; if the process dies first, readers stop at the last complete record.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        with RecordWriter('session.rec.gz') as writer:
+            client = GeminiClient(transport=RecordingTransport(RequestsTransport(), writer))
+            ...
+
+    Attributes
+    ----------
+    records
+        Number of records written.
+    """
+
+    def __init__(self, path: PathLike, compress_level: int = DEFAULT_COMPRESS_LEVEL):
+        """
+        :param path: file to append to, created if missing.
+        :param compress_level: gzip compression level from 1 (fastest) to 9 (smallest).
+        """
+        self.path = path
+        self.records = 0
+
+        self._file = gzip.open(path, 'ab', compresslevel=compress_level)
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'RecordWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write(self, record: Exchange) -> None:
+        """
+        Appends `record` to the file.
+
+        :param record: record to append.
+        """
+        meta = json.dumps({'url': record.url, 'params': record.params, 'headers': record.headers}).encode()
+        header = _FRAME.pack(record.sent_at, record.received_at, record.status, len(meta), len(record.body))
+
+        with self._lock:
+            self._file.write(header + meta + record.body)
+            self.records += 1
+
+    def flush(self) -> None:
+        """
+        Writes all records so far to the file, so that they can be read while recording continues.
+        """
+        with self._lock:
+            self._file.flush(zlib.Z_SYNC_FLUSH)
+
+    def close(self) -> None:
+        """
+        Writes the remaining records and closes the file.
+        """
+        with self._lock:
+            self._file.close()
+
+
+def read_records(path: PathLike) -> Iterator[Exchange]:
+    """
+    Reads the records of a file written by `RecordWriter`, in the order they were written.
+
+    A truncated last record, e.g. from a recording process that was killed, ends the iteration.
+
+    :param path: recorded file.
+    :return: Iterator of Exchange.
+    """
+    decode = get_default_decoder().decode
+    size = _FRAME.size
+
+    with gzip.open(path, 'rb') as file:
+        read = file.read
+
+        while True:
+            try:
+                header = read(size)
+
+                if len(header) < size:
+                    return
+
+                sent_at, received_at, status, meta_length, body_length = _FRAME.unpack(header)
+                meta = read(meta_length)
+                body = read(body_length)
+            except EOFError:
+                return
+
+            if len(meta) < meta_length or len(body) < body_length:
+                return
+
+            meta = decode(meta)
+
+            yield Exchange(
+                url=meta['url'],
+                params=meta['params'],
+                status=status,
+                headers=[tuple(pair) for pair in meta['headers']],
+                body=body,
+                sent_at=sent_at,
+                received_at=received_at
+            )
+
+
+class Replayer:
+    """
+    Matches requests to recorded responses, shared by the synchronous and asynchronous replay backends.
+
+    Each request is answered with the next unused record of the same URL and parameters, so a URL polled
+    repeatedly replays its responses in recorded order. Records are streamed from the file as needed; those
+    skipped over while looking for a request are held until requested.
+
+    With a `speed`, each response is due at its recorded time relative to the first record, divided by `speed`,
+    counted from the first request. Without one, responses are served as fast as they are requested.
+
+    Attributes
+    ----------
+    served
+        Number of responses served.
+    """
+
+    def __init__(
+            self,
+            records: Union[PathLike, Iterable[Exchange]],
+            speed: Optional[float] = None,
+            clock=time.monotonic
+    ):
+        """
+        :param records: recorded file or iterable of Exchange.
+        :param speed: pacing relative to the recording, e.g. 1.0 for recorded pacing or 10.0 for ten times faster,
+            None to serve responses at full speed.
+        :param clock: monotonic clock returning seconds.
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError(f'speed must be positive, got {speed}')
+
+        self.speed = speed
+        self.clock = clock
+        self.served = 0
+
+        self._records = iter(read_records(records) if isinstance(records, (str, os.PathLike)) else records)
+        self._pending: Dict[Tuple[Hashable, ...], Deque[Exchange]] = {}
+        self._origin: Optional[float] = None
+        self._started: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def next(self, url: Any, params: Optional[Mapping[str, Any]] = None) -> Tuple[Exchange, float]:
+        """
+        Takes the next recorded response to a request.
+
+        :param url: request URL.
+        :param params: query parameters.
+        :return: Tuple of the Exchange and the seconds to wait before serving it.
+        """
+        key = request_key(url, params)
+
+        with self._lock:
+            queue = self._pending.get(key)
+
+            if queue:
+                record = queue.popleft()
+            else:
+                for record in self._records:
+                    if self._origin is None:
+                        self._origin = record.sent_at
+
+                    if record.key == key:
+                        break
+
+                    self._pending.setdefault(record.key, deque()).append(record)
+                else:
+                    raise LookupError(f'no recorded response left for {url} with params {query_params(params)}')
+
+            self.served += 1
+
+            if self.speed is None:
+                return record, 0.0
+
+            now = self.clock()
+
+            if self._started is None:
+                self._started = now
+
+            return record, max(0.0, self._started + (record.received_at - self._origin) / self.speed - now)
+
+
+class RecordingTransport(Transport):
+    """
+    Records every request sent through a wrapped `Transport` and its response with a `RecordWriter`.
+
+    Responses to requests sent with ``stream=True`` are recorded once their body was read to the end with
+    ``iter_content``, and not at all if it was not.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        with RecordWriter('session.rec.gz') as writer:
+            with GeminiClient(transport=RecordingTransport(RequestsTransport(), writer)) as client:
+                client.get_ticker('btcusd')
+    """
+
+    def __init__(self, transport: Transport, writer: RecordWriter):
+        """
+        :param transport: transport to send requests through.
+        :param writer: writer to record requests and responses with, not closed by the transport.
+        """
+        self.transport = transport
+        self.writer = writer
+
+    def get(self, url: str, params: Optional[Mapping[str, Any]] = None, **kwargs) -> Any:
+        sent_at = time.time()
+        response = self.transport.get(url, params=params, **kwargs)
+
+        def write(body: bytes) -> None:
+            self.writer.write(Exchange(
+                url=str(url),
+                params=query_params(params),
+                status=response.status_code,
+                headers=list(response.headers.items()),
+                body=body,
+                sent_at=sent_at,
+                received_at=time.time()
+            ))
+
+        if kwargs.get('stream') and isinstance(response, requests.Response):
+            # Reading the content here would buffer the body the caller asked to stream.
+            response.iter_content = _recording_iter_content(response.iter_content, write)
+        else:
+            write(response.content)
+
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+def _recording_iter_content(iter_content, write):
+    # Passes the chunks of a streamed body through and records the body once it was read to the end.
+    def recording_iter_content(chunk_size: int = 1, decode_unicode: bool = False) -> Iterator[bytes]:
+        chunks = []
+
+        for chunk in iter_content(chunk_size, decode_unicode):
+            chunks.append(chunk)
+            yield chunk
+
+        write(b''.join(chunks))
+
+    return recording_iter_content
+
+
+class ReplayTransport(Transport):
+    """
+    Serves recorded responses instead of sending requests, see `Replayer`.
+
+    Responses are ``requests.Response`` objects, so a `GeminiClient` using this transport behaves as it did
+    while recording, without touching the network.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        with GeminiClient(transport=ReplayTransport('session.rec.gz')) as client:
+            client.get_ticker('btcusd')
+
+    Attributes
+    ----------
+    replayer
+        The Replayer matching requests to records.
+    """
+
+    def __init__(
+            self,
+            records: Union[PathLike, Iterable[Exchange]],
+            speed: Optional[float] = None,
+            clock=time.monotonic
+    ):
+        """
+        :param records: recorded file or iterable of Exchange.
+        :param speed: pacing relative to the recording, None to serve responses at full speed.
+        :param clock: monotonic clock returning seconds.
+        """
+        self.replayer = Replayer(records, speed=speed, clock=clock)
+
+    def get(self, url: str, params: Optional[Mapping[str, Any]] = None, **kwargs) -> requests.Response:
+        record, delay = self.replayer.next(url, params)
+
+        if delay > 0:
+            time.sleep(delay)
+
+        return _to_requests_response(record)
+
+    def close(self) -> None:
+        pass
+
+
+def _to_requests_response(record: Exchange) -> requests.Response:
+    response = requests.Response()
+    response.status_code = record.status
+    response.headers = CaseInsensitiveDict(record.headers)
+    response._content = record.body
+    response._content_consumed = True
+    response.url = record.url
+    response.encoding = 'utf-8'
+
+    try:
+        response.reason = HTTPStatus(record.status).phrase
+    except ValueError:
+        response.reason = ''
+
+    return response
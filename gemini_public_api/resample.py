@@ -0,0 +1,231 @@
+import re
+from typing import Any, Dict, Optional, Union
+
+from gemini_public_api.candles import CANDLE_DTYPE, CANDLE_FIELDS, _require_numpy, np
+
+DEFAULT_CAPACITY: int = 1024
+
+_UNITS: Dict[str, int] = {
+    'm':   60 * 1000,
+    'h':   60 * 60 * 1000,
+    'hr':  60 * 60 * 1000,
+    'd':   24 * 60 * 60 * 1000,
+    'day': 24 * 60 * 60 * 1000
+}
+
+_DURATION = re.compile(r'^(\d+)(m|hr|h|day|d)$')
+
+
+def parse_bar(bar: Union[str, int]) -> int:
+    """
+    :param bar: bar size, either a number of milliseconds or a duration such as '3m', '2h', '12hr' or '1day'.
+    :return: Bar size in milliseconds.
+    """
+    if isinstance(bar, str):
+        match = _DURATION.match(bar.strip().lower())
+
+        if match is None:
+            raise ValueError(f'invalid bar size: {bar!r}, expected e.g. 3m, 2h, 12hr or 1day')
+
+        bar = int(match.group(1)) * _UNITS[match.group(2)]
+
+    if bar <= 0:
+        raise ValueError(f'bar size must be positive, got {bar}')
+
+    return int(bar)
+
+
+def _structured(candles: Any):
+    if isinstance(candles, np.ndarray) and candles.dtype.names is not None:
+        return candles
+
+    result = np.empty(len(candles['timestamp']), dtype=CANDLE_DTYPE)
+
+    for field in CANDLE_FIELDS:
+        result[field] = candles[field]
+
+    return result
+
+
+def _aggregate(candles, bar: int, origin: int):
+    if not len(candles):
+        return np.empty(0, dtype=CANDLE_DTYPE)
+
+    timestamps = candles['timestamp']
+    buckets = (timestamps - origin) // bar
+    starts = np.flatnonzero(np.concatenate(([True], buckets[1:] != buckets[:-1])))
+    ends = np.concatenate((starts[1:], [len(candles)])) - 1
+
+    bars = np.empty(len(starts), dtype=CANDLE_DTYPE)
+    bars['timestamp'] = buckets[starts] * bar + origin
+    bars['open'] = candles['open'][starts]
+    bars['high'] = np.maximum.reduceat(candles['high'], starts)
+    bars['low'] = np.minimum.reduceat(candles['low'], starts)
+    bars['close'] = candles['close'][ends]
+    bars['volume'] = np.add.reduceat(candles['volume'], starts)
+
+    return bars
+
+
+def _check_interval(bar: int, interval: Optional[Union[str, int]]) -> None:
+    if interval is not None and bar % parse_bar(interval):
+        raise ValueError(f'bar size of {bar} ms is not a multiple of the candle interval {interval!r}')
+
+
+def _check_sorted(timestamps) -> None:
+    if len(timestamps) > 1 and not (timestamps[1:] > timestamps[:-1]).all():
+        raise ValueError('candles must be sorted by strictly ascending timestamp')
+
+
+def _columns(bars) -> Dict[str, Any]:
+    return {field: np.ascontiguousarray(bars[field]) for field in CANDLE_FIELDS}
+
+
+def resample(
+        candles: Any,
+        bar: Union[str, int],
+        origin: int = 0,
+        interval: Optional[Union[str, int]] = None
+) -> Any:
+    """
+    Aggregates candles into bars of any size that is a multiple of their interval, e.g. 1m candles into 3m,
+    10m, 2h or 12h bars, which are not native `time_frame` values.
+
+    Bars start at multiples of the bar size after `origin`, UTC midnight aligned by default, and aggregate the
+    first open, highest high, lowest low, last close and summed volume of their candles. The first and last bar
+    may cover fewer candles than a full bar. Requires numpy.
+
+    :param candles: candles sorted by ascending timestamp, either columns from `decode_candles` or a structured
+        array from `decode_candles_structured`.
+    :param bar: bar size, see `parse_bar`.
+    :param origin: timestamp in milliseconds that bars are aligned to.
+    :param interval: time frame of the candles, e.g. '1m', to check that `bar` is a multiple of it.
+    :return: Bars in the same form as `candles`, a dictionary of columns or a structured array of `CANDLE_DTYPE`.
+    """
+    _require_numpy()
+
+    bar = parse_bar(bar)
+    _check_interval(bar, interval)
+    structured = _structured(candles)
+    _check_sorted(structured['timestamp'])
+    bars = _aggregate(structured, bar, origin)
+
+    return bars if structured is candles else _columns(bars)
+
+
+class Resampler:
+    """
+    Resamples a growing series of candles into bars incrementally.
+
+    Each `update` takes the latest candles, e.g. a fresh `get_candles` response or just the newest candles, and
+    recomputes only the last bar, which may still be forming, and the bars after it. Candles older than the
+    last bar are ignored, so re-sent history costs one vectorized filter. Bars are kept in a growable structured
+    array. Requires numpy.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        resamplers = {bar: Resampler(bar) for bar in ('3m', '10m', '2h', '12h')}
+
+        while True:
+            candles = client.get_candle_columns('btcusd', '1m', structured=True)
+
+            for resampler in resamplers.values():
+                resampler.update(candles)
+
+            time.sleep(60)
+
+    Attributes
+    ----------
+    bar
+        Bar size in milliseconds.
+    origin
+        Timestamp in milliseconds that bars are aligned to.
+    """
+
+    def __init__(
+            self,
+            bar: Union[str, int],
+            origin: int = 0,
+            interval: Optional[Union[str, int]] = None,
+            capacity: int = DEFAULT_CAPACITY
+    ):
+        """
+        :param bar: bar size, see `parse_bar`.
+        :param origin: timestamp in milliseconds that bars are aligned to.
+        :param interval: time frame of the candles, e.g. '1m', to check that `bar` is a multiple of it.
+        :param capacity: number of bars to allocate room for up front.
+        """
+        _require_numpy()
+
+        self.bar = parse_bar(bar)
+        self.origin = origin
+        _check_interval(self.bar, interval)
+
+        self._bars = np.empty(max(1, capacity), dtype=CANDLE_DTYPE)
+        self._size = 0
+        # Candles of the last bar, to recompute it when more of them arrive.
+        self._pending = np.empty(0, dtype=CANDLE_DTYPE)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def bars(self):
+        """
+        :return: Structured array view of all bars, valid until the next `update`.
+        """
+        return self._bars[:self._size]
+
+    def columns(self) -> Dict[str, Any]:
+        """
+        :return: Dictionary of contiguous copies of the bar columns, like `decode_candles`.
+        """
+        return _columns(self.bars)
+
+    def _reserve(self, size: int) -> None:
+        if size > len(self._bars):
+            bars = np.empty(max(size, 2 * len(self._bars)), dtype=CANDLE_DTYPE)
+            bars[:self._size] = self._bars[:self._size]
+            self._bars = bars
+
+    def update(self, candles: Any):
+        """
+        Adds candles, replacing those with timestamps already seen, e.g. a candle that was still forming.
+
+        :param candles: candles sorted by ascending timestamp, columns or a structured array as for `resample`.
+        :return: Structured array of the recomputed last bar and the bars that were added.
+        """
+        candles = _structured(candles)
+        _check_sorted(candles['timestamp'])
+
+        first = self._size
+
+        if self._size:
+            first -= 1
+            candles = candles[candles['timestamp'] >= self._bars['timestamp'][first]]
+
+            if not len(candles):
+                return np.empty(0, dtype=CANDLE_DTYPE)
+
+            pending = self._pending[~np.isin(self._pending['timestamp'], candles['timestamp'])]
+
+            if len(pending):
+                candles = np.concatenate((pending, candles))
+                candles = candles[np.argsort(candles['timestamp'], kind='stable')]
+
+        if not len(candles):
+            return np.empty(0, dtype=CANDLE_DTYPE)
+
+        bars = _aggregate(candles, self.bar, self.origin)
+
+        self._reserve(first + len(bars))
+        self._bars[first:first + len(bars)] = bars
+        self._size = first + len(bars)
+
+        last = bars['timestamp'][-1]
+        self._pending = candles[candles['timestamp'] >= last].copy()
+
+        return bars
@@ -0,0 +1,173 @@
+import re
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, List, Optional, Tuple
+
+from gemini_public_api.json_decoder import JSONDecoder, get_default_decoder
+
+DEFAULT_CHUNK_SIZE: int = 16 * 1024
+
+Record = Tuple[Optional[str], Any]
+
+_OPEN_OBJECT, _CLOSE_OBJECT = ord('{'), ord('}')
+_OPEN_ARRAY, _CLOSE_ARRAY = ord('['), ord(']')
+_QUOTE = ord('"')
+
+_STRUCTURAL = re.compile(rb'[{}\[\]"]')
+# Rest of a string after its opening quote, up to and including the closing quote.
+_STRING_TAIL = re.compile(rb'(?:[^"\\]|\\.)*"', re.DOTALL)
+
+
+class RecordParser:
+    """
+    Parses the records of a JSON document incrementally, as chunks of it arrive.
+
+    Records are the objects in the arrays of the document: the elements of a top level array, e.g. the trades of
+    a trade history or the entries of the price feed, and the elements of arrays that are values of a top level
+    object, e.g. the bids and asks of an order book. Each record is decoded with the `JSONDecoder` as soon as its
+    closing brace arrives, and only the bytes of the record being scanned are buffered, so the parser never holds
+    the whole body in memory nor decodes it at once. Whether the body is read in chunks in the first place is up
+    to the transport or session it comes from.
+
+    The parser checks that brackets balance and strings are closed, but leaves validating the records themselves
+    to the decoder.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        parser = RecordParser()
+
+        for chunk in response.iter_content(16384):
+            for side, level in parser.feed(chunk):
+                print(side, level['price'])
+
+        parser.close()
+    """
+
+    def __init__(self, decoder: Optional[JSONDecoder] = None):
+        """
+        :param decoder: decoder of the records, the default decoder if omitted.
+        """
+        self.decoder = decoder if decoder is not None else get_default_decoder()
+
+        self._buffer = bytearray()
+        self._position = 0
+        self._stack: List[int] = []
+        # Offsets of the opening quote of the string and the opening brace of the record being scanned.
+        self._string: Optional[int] = None
+        self._record: Optional[int] = None
+        self._record_depth = 0
+        # Last string at the top level of a root object, i.e. the key of the array that follows it.
+        self._key: Optional[str] = None
+        self._array_key: Optional[str] = None
+
+    def feed(self, chunk: bytes) -> List[Record]:
+        """
+        :param chunk: next bytes of the document.
+        :return: List of the records completed by `chunk`, as (key, record) pairs, where key is the key of the
+            record's array in the root object, or None if the root is the array.
+        """
+        buffer, stack = self._buffer, self._stack
+        buffer += chunk
+        position = self._position
+        records = []
+
+        while True:
+            if self._string is not None:
+                match = _STRING_TAIL.match(buffer, self._string + 1)
+
+                if match is None:
+                    break
+
+                position = match.end()
+
+                if len(stack) == 1 and stack[0] == _OPEN_OBJECT:
+                    self._key = self.decoder.decode(bytes(buffer[self._string:position]))
+
+                self._string = None
+                continue
+
+            match = _STRUCTURAL.search(buffer, position)
+
+            if match is None:
+                position = len(buffer)
+                break
+
+            start, position = match.start(), match.end()
+            char = buffer[start]
+
+            if char == _QUOTE:
+                self._string = start
+            elif char == _OPEN_OBJECT or char == _OPEN_ARRAY:
+                depth = len(stack)
+
+                if char == _OPEN_OBJECT and self._record is None and stack[-1:] == [_OPEN_ARRAY] and depth <= 2:
+                    if depth == 1 or stack[0] == _OPEN_OBJECT:
+                        self._record = start
+                        self._record_depth = depth
+                elif char == _OPEN_ARRAY and depth == 1 and stack[0] == _OPEN_OBJECT:
+                    self._array_key = self._key
+
+                stack.append(char)
+            else:
+                expected = _OPEN_OBJECT if char == _CLOSE_OBJECT else _OPEN_ARRAY
+
+                if not stack or stack.pop() != expected:
+                    raise ValueError(f'unbalanced {chr(char)!r} in JSON document')
+
+                if self._record is not None and len(stack) == self._record_depth:
+                    records.append((self._array_key, self.decoder.decode(bytes(buffer[self._record:position]))))
+                    self._record = None
+
+        # Drop the bytes scanned past, keeping any string or record still being scanned.
+        keep = min(offset for offset in (position, self._string, self._record) if offset is not None)
+
+        if keep:
+            del buffer[:keep]
+            position -= keep
+
+            if self._string is not None:
+                self._string -= keep
+
+            if self._record is not None:
+                self._record -= keep
+
+        self._position = position
+
+        return records
+
+    def close(self) -> None:
+        """
+        Checks that the document is complete, raises ValueError otherwise.
+        """
+        if self._stack or self._string is not None:
+            raise ValueError('incomplete JSON document')
+
+
+def iter_records(chunks: Iterable[bytes], decoder: Optional[JSONDecoder] = None) -> Iterator[Record]:
+    """
+    :param chunks: chunks of a JSON document, e.g. from ``requests.Response.iter_content``.
+    :param decoder: decoder of the records, the default decoder if omitted.
+    :return: Iterator over the (key, record) pairs of the document, see `RecordParser`.
+    """
+    parser = RecordParser(decoder)
+
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+
+    parser.close()
+
+
+async def aiter_records(chunks: AsyncIterable[bytes], decoder: Optional[JSONDecoder] = None) -> AsyncIterator[Record]:
+    """
+    :param chunks: chunks of a JSON document, e.g. from ``aiohttp.StreamReader.iter_chunked``.
+    :param decoder: decoder of the records, the default decoder if omitted.
+    :return: Asynchronous iterator over the (key, record) pairs of the document, see `RecordParser`.
+    """
+    parser = RecordParser(decoder)
+
+    async for chunk in chunks:
+        for record in parser.feed(chunk):
+            yield record
+
+    parser.close()
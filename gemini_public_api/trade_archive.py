@@ -0,0 +1,510 @@
+import os
+import struct
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from gemini_public_api.candles import _require_numpy, np
+from gemini_public_api.client import GeminiClient, get_default_client
+from gemini_public_api.pagination import TradeCursor
+from gemini_public_api.utils import PathLike
+
+DEFAULT_SEGMENT_SIZE: int = 1 << 20
+DEFAULT_INDEX_STRIDE: int = 1 << 10
+
+SIDES: Tuple[str, ...] = ('buy', 'sell', 'auction', 'block')
+
+TRADE_DTYPE = np.dtype([
+    ('tid',       np.int64),
+    ('timestamp', np.int64),
+    ('price',     np.float64),
+    ('amount',    np.float64),
+    ('side',      np.uint8)
+]) if np is not None else None
+
+# Format tag and the segment size or index stride the file was created with.
+_HEADER = struct.Struct('<8sQ')
+_SEGMENT_MAGIC: bytes = b'GPTRADE1'
+_INDEX_MAGIC: bytes = b'GPTRIDX1'
+
+_SIDE_CODES: Dict[str, int] = {side: code for code, side in enumerate(SIDES)}
+
+SEGMENT_SUFFIX: str = '.trades'
+INDEX_NAME: str = 'index'
+
+
+def encode_trades(trades: Iterable[Dict[str, Any]]):
+    """
+    :param trades: trades as returned by the trade history endpoint.
+    :return: Structured array of `TRADE_DTYPE`, with the side as its position in `SIDES`. Raises KeyError for
+        other sides.
+    """
+    _require_numpy()
+
+    rows = [
+        (trade['tid'], trade['timestampms'], float(trade['price']), float(trade['amount']), _SIDE_CODES[trade['type']])
+        for trade in trades
+    ]
+
+    return np.array(rows, dtype=TRADE_DTYPE)
+
+
+def _open(path: str, magic: bytes, value: int):
+    """
+    Opens a file for appending, writing its header if it is new.
+
+    :return: Tuple of the file and the value stored in its header.
+    """
+    file = open(path, 'a+b')
+    file.seek(0)
+    header = file.read(_HEADER.size)
+
+    if not header:
+        file.write(_HEADER.pack(magic, value))
+        file.flush()
+        return file, value
+
+    if len(header) < _HEADER.size or header[:len(magic)] != magic:
+        file.close()
+        raise ValueError(f'{path} is not a trade archive file')
+
+    return file, _HEADER.unpack(header)[1]
+
+
+def _truncate(file, itemsize: int) -> int:
+    """
+    Truncates a record torn by a crash mid-append.
+
+    :return: Number of complete records in the file.
+    """
+    size = os.fstat(file.fileno()).st_size
+    torn = (size - _HEADER.size) % itemsize
+
+    if torn:
+        file.truncate(size - torn)
+
+    return (size - _HEADER.size) // itemsize
+
+
+class TradeLog:
+    """
+    The archived trades of one symbol: append-only segment files of packed, fixed-width records and a sparse
+    timestamp index, all in one directory.
+
+    Trades are stored as 33 byte records of `TRADE_DTYPE` in ascending timestamp order. Each segment holds
+    `segment_size` records and is read through a memory map, so a read maps only the pages it touches. The index
+    holds the timestamp of every `index_stride`-th record; a time-range read binary-searches it, then a single
+    stride of records, instead of scanning the segments.
+
+    Segments are written before the index, and a record torn by a crash mid-append is truncated away when the log
+    is next opened, so the log always resumes from its last complete record. Index entries lost in a crash are
+    rebuilt from the segments.
+
+    Attributes
+    ----------
+    path
+        Directory of the log.
+    segment_size
+        Number of records per segment, as the log was created with.
+    index_stride
+        Number of records per index entry, as the log was created with.
+    """
+
+    def __init__(
+            self,
+            path: PathLike,
+            segment_size: int = DEFAULT_SEGMENT_SIZE,
+            index_stride: int = DEFAULT_INDEX_STRIDE
+    ):
+        """
+        :param path: directory of the log, created if missing.
+        :param segment_size: number of records per segment of a new log, a multiple of `index_stride`.
+        :param index_stride: number of records per index entry of a new log.
+        """
+        _require_numpy()
+
+        if index_stride < 1 or segment_size % index_stride:
+            raise ValueError(f'segment_size {segment_size} must be a multiple of index_stride {index_stride}')
+
+        self.path = os.fspath(path)
+        os.makedirs(self.path, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._segments: List[Any] = []
+        self._size = 0
+
+        names = sorted(name for name in os.listdir(self.path) if name.endswith(SEGMENT_SUFFIX))
+        self.segment_size = segment_size
+
+        for number, name in enumerate(names):
+            if name != self._segment_name(number):
+                raise ValueError(f'unexpected segment {name} in {self.path}')
+
+            self._file, self.segment_size = _open(os.path.join(self.path, name), _SEGMENT_MAGIC, segment_size)
+            count = _truncate(self._file, TRADE_DTYPE.itemsize)
+
+            if number < len(names) - 1:
+                if count != self.segment_size:
+                    raise ValueError(f'segment {name} in {self.path} is incomplete')
+
+                self._file.close()
+
+            self._segments.append(self._map(number, count))
+            self._size += count
+
+        if not names:
+            self._file = None
+
+        self._index_file, self.index_stride = _open(os.path.join(self.path, INDEX_NAME), _INDEX_MAGIC, index_stride)
+
+        if self.segment_size % self.index_stride:
+            raise ValueError(f'index stride {self.index_stride} does not divide segment size {self.segment_size}')
+
+        self._load_index()
+
+    def __enter__(self) -> 'TradeLog':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _segment_name(self, number: int) -> str:
+        return f'{number:08d}{SEGMENT_SUFFIX}'
+
+    def _map(self, number: int, count: int):
+        if not count:
+            return np.empty(0, dtype=TRADE_DTYPE)
+
+        path = os.path.join(self.path, self._segment_name(number))
+        return np.memmap(path, dtype=TRADE_DTYPE, mode='r', offset=_HEADER.size, shape=(count,))
+
+    def _load_index(self) -> None:
+        count = _truncate(self._index_file, 8)
+        expected = -(-self._size // self.index_stride)
+
+        if count > expected:
+            self._index_file.truncate(_HEADER.size + 8 * expected)
+            count = expected
+
+        self._index_file.seek(_HEADER.size)
+        self._index = np.frombuffer(self._index_file.read(8 * count), dtype=np.int64).copy()
+
+        if count < expected:
+            self._extend_index()
+
+    def _extend_index(self) -> None:
+        # Adds the entries of the records appended since the last entry.
+        positions = range(len(self._index) * self.index_stride, self._size, self.index_stride)
+        entries = np.array([self._timestamp(position) for position in positions], dtype=np.int64)
+
+        if len(entries):
+            self._index_file.write(entries.tobytes())
+            self._index_file.flush()
+            self._index = np.concatenate((self._index, entries))
+
+    def _timestamp(self, position: int) -> int:
+        return int(self._segments[position // self.segment_size]['timestamp'][position % self.segment_size])
+
+    def _lower_bound(self, timestamp: int) -> int:
+        # Position of the first record at or after `timestamp`.
+        entry = int(np.searchsorted(self._index, timestamp, side='left'))
+
+        if entry == 0:
+            return 0
+
+        low = (entry - 1) * self.index_stride + 1
+        high = min(entry * self.index_stride, self._size)
+
+        if low >= high:
+            # Past the last indexed record, which is the last record when the stride is 1.
+            return high
+
+        segment = self._segments[low // self.segment_size]['timestamp']
+        offset = low // self.segment_size * self.segment_size
+
+        return low + int(np.searchsorted(segment[low - offset:high - offset], timestamp, side='left'))
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        """
+        :return: Timestamp of the newest archived trade, None if the log is empty.
+        """
+        return self._timestamp(self._size - 1) if self._size else None
+
+    def last_tids(self) -> Set[int]:
+        """
+        :return: Ids of the archived trades that share the newest timestamp.
+        """
+        last = self.last_timestamp
+
+        if last is None:
+            return set()
+
+        return {int(tid) for view in self.slices(start=last) for tid in view['tid']}
+
+    def slices(self, start: Optional[int] = None, end: Optional[int] = None) -> List[Any]:
+        """
+        :param start: timestamp in milliseconds of the first trade to include, from the oldest if None.
+        :param end: timestamp in milliseconds before which to stop, up to the newest if None.
+        :return: List of read-only structured array views of the trades in the range, one per segment it spans.
+        """
+        first = 0 if start is None else self._lower_bound(start)
+        last = self._size if end is None else self._lower_bound(end)
+        views = []
+
+        while first < last:
+            number, offset = divmod(first, self.segment_size)
+            count = min(last - first, self.segment_size - offset)
+
+            views.append(self._segments[number][offset:offset + count])
+            first += count
+
+        return views
+
+    def read(self, start: Optional[int] = None, end: Optional[int] = None):
+        """
+        :param start: see `slices`.
+        :param end: see `slices`.
+        :return: Structured array of the trades in the range, a zero-copy view unless the range spans segments.
+        """
+        views = self.slices(start, end)
+
+        if not views:
+            return np.empty(0, dtype=TRADE_DTYPE)
+
+        return views[0] if len(views) == 1 else np.concatenate(views)
+
+    def append(self, trades: Any) -> int:
+        """
+        :param trades: structured array of `TRADE_DTYPE` sorted by ascending timestamp, none older than
+            `last_timestamp`.
+        :return: Number of trades appended.
+        """
+        trades = np.asarray(trades, dtype=TRADE_DTYPE)
+
+        if not len(trades):
+            return 0
+
+        timestamps = trades['timestamp']
+
+        if len(timestamps) > 1 and (timestamps[1:] < timestamps[:-1]).any():
+            raise ValueError('trades must be sorted by ascending timestamp')
+
+        with self._lock:
+            last = self.last_timestamp
+
+            if last is not None and timestamps[0] < last:
+                raise ValueError(f'trade at {int(timestamps[0])} is older than the last archived one at {last}')
+
+            written = 0
+
+            while written < len(trades):
+                number, offset = divmod(self._size, self.segment_size)
+
+                if offset == 0 and number == len(self._segments):
+                    if self._file is not None:
+                        self._file.close()
+
+                    self._file, _ = _open(
+                        os.path.join(self.path, self._segment_name(number)),
+                        _SEGMENT_MAGIC,
+                        self.segment_size
+                    )
+                    self._segments.append(self._map(number, 0))
+
+                count = min(len(trades) - written, self.segment_size - offset)
+
+                self._file.write(trades[written:written + count].tobytes())
+                self._file.flush()
+                self._segments[number] = self._map(number, offset + count)
+                self._size += count
+                written += count
+
+            self._extend_index()
+
+        return len(trades)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+        self._index_file.close()
+
+
+class TradeArchive:
+    """
+    A persistent trade archive with one `TradeLog` per symbol in a directory.
+
+    `sync` walks the trade history from the newest archived trade onwards and appends each page as it arrives, so
+    an interrupted sync resumes where the archive stops. Trades already archived are dropped by timestamp and id.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        with TradeArchive('trades') as archive:
+            for symbol in symbols:
+                archive.sync(symbol, since=launch)
+
+            trades = archive.read('btcusd', start=day_start, end=day_start + 86400000)
+            print(trades['price'].mean(), trades['amount'].sum())
+
+    Attributes
+    ----------
+    root
+        Directory of the archive.
+    client
+        The GeminiClient used to fetch, the default client if None.
+    """
+
+    def __init__(
+            self,
+            root: PathLike,
+            client: Optional[GeminiClient] = None,
+            use_sandbox: bool = False,
+            segment_size: int = DEFAULT_SEGMENT_SIZE,
+            index_stride: int = DEFAULT_INDEX_STRIDE
+    ):
+        """
+        :param root: directory of the archive, created if missing.
+        :param client: client to fetch with, the default client if omitted.
+        :param use_sandbox: flag to use sandbox endpoints.
+        :param segment_size: number of records per segment of new logs.
+        :param index_stride: number of records per index entry of new logs.
+        """
+        _require_numpy()
+
+        self.root = os.fspath(root)
+        self.client = client
+        self.use_sandbox = use_sandbox
+        self.segment_size = segment_size
+        self.index_stride = index_stride
+
+        self._logs: Dict[str, TradeLog] = {}
+        self._lock = threading.Lock()
+
+        os.makedirs(self.root, exist_ok=True)
+
+    def __enter__(self) -> 'TradeArchive':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def open(self, symbol: str) -> TradeLog:
+        """
+        :param symbol: symbol, e.g. 'btcusd'.
+        :return: The TradeLog, opened once and kept open until `close`.
+        """
+        symbol = symbol.lower()
+
+        with self._lock:
+            log = self._logs.get(symbol)
+
+            if log is None:
+                log = self._logs[symbol] = TradeLog(
+                    os.path.join(self.root, symbol),
+                    segment_size=self.segment_size,
+                    index_stride=self.index_stride
+                )
+
+        return log
+
+    def read(self, symbol: str, start: Optional[int] = None, end: Optional[int] = None):
+        """
+        :return: Archived trades, see `TradeLog.read`.
+        """
+        return self.open(symbol).read(start, end)
+
+    def slices(self, symbol: str, start: Optional[int] = None, end: Optional[int] = None) -> List[Any]:
+        """
+        :return: Archived trades, see `TradeLog.slices`.
+        """
+        return self.open(symbol).slices(start, end)
+
+    def cursor(
+            self,
+            symbol: str,
+            since: Optional[int] = None,
+            until: Optional[int] = None,
+            limit_trades: int = 500
+    ) -> TradeCursor:
+        """
+        :param symbol: symbol, e.g. 'btcusd'.
+        :param since: millisecond timestamp to start from if the archive of `symbol` is empty.
+        :param until: exclusive end of the walk, in milliseconds, or None to walk up to the latest trade.
+        :param limit_trades: number of trades requested per page.
+        :return: TradeCursor resuming from the newest archived trade.
+        """
+        last = self.open(symbol).last_timestamp
+
+        if last is None and since is None:
+            raise ValueError(f'the archive of {symbol} is empty, pass `since` to start it')
+
+        return TradeCursor(since=since if last is None else last, until=until, limit_trades=limit_trades)
+
+    def extend(self, symbol: str, trades: List[Dict[str, Any]]) -> int:
+        """
+        Appends the trades that are not archived yet, e.g. from `TradeCursor.advance`.
+
+        :param symbol: symbol, e.g. 'btcusd'.
+        :param trades: trades as returned by the trade history endpoint, oldest first.
+        :return: Number of trades appended.
+        """
+        log = self.open(symbol)
+        last = log.last_timestamp
+
+        if last is not None:
+            seen = log.last_tids()
+            trades = [
+                trade for trade in trades
+                if trade['timestampms'] > last or (trade['timestampms'] == last and trade['tid'] not in seen)
+            ]
+
+        return log.append(encode_trades(trades))
+
+    def sync(
+            self,
+            symbol: str,
+            since: Optional[int] = None,
+            until: Optional[int] = None,
+            limit_trades: int = 500
+    ) -> int:
+        """
+        Fetches and archives the trades newer than the newest archived trade, page by page.
+
+        :param symbol: symbol, e.g. 'btcusd'.
+        :param since: see `cursor`.
+        :param until: see `cursor`.
+        :param limit_trades: number of trades requested per page.
+        :return: Number of trades appended.
+        """
+        client = self.client if self.client is not None else get_default_client()
+        cursor = self.cursor(symbol, since=since, until=until, limit_trades=limit_trades)
+        appended = 0
+
+        while not cursor.done:
+            page = client.decode(
+                client.get_trade_history(
+                    symbol=symbol,
+                    timestamp=cursor.timestamp,
+                    limit_trades=limit_trades,
+                    use_sandbox=self.use_sandbox
+                )
+            )
+            appended += self.extend(symbol, cursor.advance(page))
+
+        return appended
+
+    def close(self) -> None:
+        """
+        Closes all open logs. Views read from them stay valid.
+        """
+        with self._lock:
+            for log in self._logs.values():
+                log.close()
+
+            self._logs.clear()
@@ -0,0 +1,201 @@
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Mapping, Optional, Type, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+DEFAULT_POOL_CONNECTIONS: int = 10
+DEFAULT_POOL_MAXSIZE: int = 10
+DEFAULT_MAX_CONNECTIONS: int = 2
+
+
+class Transport(ABC):
+    """
+    Interface of the backends a `GeminiClient` sends its requests through.
+
+    A transport sends GET requests and returns responses that provide `status_code`, `headers`, `content`,
+    `json()`, `raise_for_status()` and `close()`, like ``requests.Response``. Transports must be safe to use
+    from the threads of `GeminiClient.fetch_many`.
+    """
+
+    @abstractmethod
+    def get(self, url: str, params: Optional[Mapping[str, Any]] = None, **kwargs) -> Any:
+        """
+        :param url: request URL.
+        :param params: query parameters.
+        :return: Response.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Closes all connections of the transport.
+        """
+
+
+class RequestsTransport(Transport):
+    """
+    HTTP/1.1 transport backed by a ``requests.Session`` with a pooled ``HTTPAdapter``.
+
+    Each concurrent request holds its own connection, so `pool_maxsize` should be at least the number of threads
+    sending requests.
+
+    Attributes
+    ----------
+    session
+        The underlying ``requests.Session``.
+    owns_session
+        True if the transport created `session`, False if it was passed in.
+    """
+
+    def __init__(
+            self,
+            pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+            max_retries: Union[int, Retry] = 0,
+            pool_block: bool = False,
+            keep_alive: bool = True,
+            session: Optional[requests.Session] = None
+    ):
+        """
+        :param pool_connections: number of per-host connection pools to cache.
+        :param pool_maxsize: maximum number of connections kept open per host.
+        :param max_retries: retries for failed connections, either a count or a urllib3 ``Retry``.
+        :param pool_block: block when the pool is exhausted instead of opening throwaway connections.
+        :param keep_alive: keep connections open between requests.
+        :param session: existing session to configure, a new one is created if omitted.
+        """
+        self.owns_session = session is None
+        self.session = session if session is not None else requests.Session()
+
+        self._adapter_options = {
+            'pool_connections': pool_connections,
+            'pool_maxsize':     pool_maxsize,
+            'max_retries':      max_retries,
+            'pool_block':       pool_block
+        }
+        self.mount(HTTPAdapter)
+
+        if not keep_alive:
+            self.session.headers['Connection'] = 'close'
+
+    def mount(self, adapter_class: Type[HTTPAdapter]) -> HTTPAdapter:
+        """
+        Mounts a new adapter for http and https URLs, with the pool options the transport was created with.
+        The adapter mounted before, if any, is closed along with its pooled connections.
+
+        :param adapter_class: ``HTTPAdapter`` or a subclass of it.
+        :return: The mounted adapter.
+        """
+        previous = {self.session.adapters.get(prefix) for prefix in ('https://', 'http://')} - {None}
+        adapter = adapter_class(**self._adapter_options)
+
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        for old in previous:
+            if old not in self.session.adapters.values():
+                old.close()
+
+        return adapter
+
+    def get(self, url: str, params: Optional[Mapping[str, Any]] = None, **kwargs) -> requests.Response:
+        if params is None:
+            return self.session.get(url=url, **kwargs)
+
+        return self.session.get(url=url, params=params, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class HttpxTransport(Transport):
+    """
+    HTTP/2 transport backed by an ``httpx.AsyncClient`` running on its own event loop thread.
+
+    Concurrent requests to the same host are multiplexed as streams over a few connections instead of
+    opening one TCP and TLS connection per request. Requests from all calling threads are handed to the
+    loop thread, because httpcore's synchronous HTTP/2 connection may send the headers of concurrent
+    streams out of stream id order, which servers reject as a protocol error.
+
+    Requires ``httpx`` with HTTP/2 support, install it with `pip install gemini-public-api[http2]`.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        with GeminiClient(transport=HttpxTransport(), max_workers=32) as client:
+            tickers = client.fetch_many(('get_ticker', (symbol,)) for symbol in symbols)
+
+    Attributes
+    ----------
+    client
+        The underlying ``httpx.AsyncClient``.
+    """
+
+    def __init__(
+            self,
+            http2: bool = True,
+            max_connections: int = DEFAULT_MAX_CONNECTIONS,
+            timeout: Optional[float] = None,
+            client: Optional['httpx.AsyncClient'] = None,
+            **kwargs
+    ):
+        """
+        :param http2: negotiate HTTP/2, falls back to HTTP/1.1 if the server does not support it.
+        :param max_connections: maximum number of connections, each carrying many concurrent streams.
+        :param timeout: timeout of each request in seconds, None to wait indefinitely like ``requests``.
+        :param client: existing client to use, the other arguments are ignored if given.
+        :param kwargs: further keyword arguments of ``httpx.AsyncClient``.
+        """
+        if client is None:
+            if httpx is None:
+                raise ImportError('httpx is not installed, install it with `pip install gemini-public-api[http2]`')
+
+            client = httpx.AsyncClient(
+                http2=http2,
+                limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+                timeout=timeout,
+                **kwargs
+            )
+
+        self.client = client
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='gemini-public-api-http2', daemon=True)
+        self._thread.start()
+
+    def _run(self, coroutine) -> Any:
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def get(self, url: str, params: Optional[Mapping[str, Any]] = None, **kwargs) -> 'httpx.Response':
+        # Bodies are read in full on the loop thread, so there is nothing to stream.
+        kwargs.pop('stream', None)
+        response = self._run(self.client.get(url, params=params, **kwargs))
+
+        # Rebuild the fully read response around its body so that its synchronous methods work.
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            content=response.content,
+            request=response.request,
+            extensions={'http_version': response.extensions.get('http_version', b'HTTP/1.1')}
+        )
+
+    def close(self) -> None:
+        if self._loop.is_closed():
+            return
+
+        self._run(self.client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
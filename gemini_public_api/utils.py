@@ -0,0 +1,5 @@
+import os
+from typing import Union
+
+# File system paths accepted by the modules that read and write files.
+PathLike = Union[str, 'os.PathLike[str]']
@@ -0,0 +1,151 @@
+import asyncio
+import contextlib
+import json
+
+from aiohttp import ClientResponseError
+from aiohttp.test_utils import TestServer
+from mock import MagicMock
+
+from gemini_public_api.transport import Transport
+
+
+class Clock:
+    """
+    Clock that only moves when a test sets `now`.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeTransport(Transport):
+    """
+    Answers every request with `{"ok": true}` and records the requested urls and params.
+    """
+
+    def __init__(self):
+        self.requests = []
+        self.closed = False
+
+    def get(self, url, params=None, **kwargs):
+        self.requests.append((url, params))
+
+        response = MagicMock()
+        response.status_code = 200
+        response.content = b'{"ok": true}'
+
+        return response
+
+    def close(self):
+        self.closed = True
+
+
+class FakeClient:
+    """
+    Stands in for a GeminiClient whose responses carry their decoded payload, subclasses add the endpoints.
+    """
+
+    def respond(self, payload):
+        response = MagicMock()
+        response.payload = payload
+
+        return response
+
+    def decode(self, response):
+        return response.payload
+
+
+class FakeResponse:
+    """
+    Stands in for an aiohttp ClientResponse with a JSON body.
+    """
+
+    headers = {'Content-Type': 'application/json'}
+    reason, method, request_info = 'OK', 'GET', None
+
+    def __init__(self, payload, status=200, url=None):
+        self.payload = payload
+        self.status = status
+        self.url = url
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise ClientResponseError(request_info=None, history=(), status=self.status)
+
+    async def read(self):
+        return json.dumps(self.payload).encode()
+
+
+class FakeRequest:
+    """
+    The context manager returned by `FakeSession.get`.
+    """
+
+    def __init__(self, session, url, params):
+        self.session = session
+        self.url = url
+        self.params = params
+
+    async def __aenter__(self):
+        return await self.session.respond(self.url, self.params)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.session.release(self.url)
+
+
+class FakeSession:
+    """
+    Stands in for an aiohttp ClientSession. Records the requested urls and params and answers each request with
+    `response(url, params)` after `delay` seconds, counting the requests in flight. By default the response is
+    `{"symbol": <last path segment>}`, with status 500 for the symbols in `failing`.
+    """
+
+    def __init__(self, delay=0.0, failing=()):
+        self.delay = delay
+        self.failing = set(failing)
+        self.urls = []
+        self.params = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get(self, url, params=None, **kwargs):
+        self.urls.append(url)
+        self.params.append(params)
+
+        return FakeRequest(self, url, params)
+
+    async def respond(self, url, params):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            await asyncio.sleep(self.delay)
+            return self.response(url, params)
+        except BaseException:
+            # The request is not entered, so it is not released either.
+            self.in_flight -= 1
+            raise
+
+    def release(self, url):
+        self.in_flight -= 1
+
+    def response(self, url, params):
+        symbol = url.rsplit('/', 1)[-1]
+        return FakeResponse({'symbol': symbol}, status=500 if symbol in self.failing else 200, url=url)
+
+
+@contextlib.asynccontextmanager
+async def serve(app):
+    """
+    Serves an aiohttp application on a local port for the duration of the block.
+    """
+    test_server = TestServer(app)
+    await test_server.start_server()
+
+    try:
+        yield test_server
+    finally:
+        await test_server.close()
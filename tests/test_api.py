@@ -9,13 +9,13 @@ from gemini_public_api import public_sandbox_endpoints
 MAX_EXAMPLES: int = 100
 
 
-@patch('requests.get')
+@patch('requests.Session.get')
 def test_get_symbols(mock):
     api.get_symbols()
     mock.assert_called_once_with(url=public_endpoints.SYMBOLS)
 
 
-@patch('requests.get')
+@patch('requests.Session.get')
 def test_get_symbols_sandbox(mock):
     api.get_symbols(use_sandbox=True)
     mock.assert_called_once_with(url=public_sandbox_endpoints.SYMBOLS)
@@ -24,7 +24,7 @@ def test_get_symbols_sandbox(mock):
 @settings(max_examples=MAX_EXAMPLES)
 @given(symbol=from_type(str))
 def test_get_symbol_details(symbol):
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def run_test(mock):
         api.get_symbol_details(symbol=symbol)
         mock.assert_called_once_with(url=public_endpoints.SYMBOL_DETAILS.format(symbol=symbol))
@@ -35,7 +35,7 @@ def test_get_symbol_details(symbol):
 @settings(max_examples=MAX_EXAMPLES)
 @given(symbol=from_type(str))
 def test_get_symbol_details_sandbox(symbol):
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def run_test(mock):
         api.get_symbol_details(symbol=symbol, use_sandbox=True)
         mock.assert_called_once_with(url=public_sandbox_endpoints.SYMBOL_DETAILS.format(symbol=symbol))
@@ -46,7 +46,7 @@ def test_get_symbol_details_sandbox(symbol):
 @settings(max_examples=MAX_EXAMPLES)
 @given(token=from_type(str))
 def test_get_network(token):
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def run_test(mock):
         api.get_network(token=token)
         mock.assert_called_once_with(url=public_endpoints.NETWORK.format(token=token))
@@ -57,7 +57,7 @@ def test_get_network(token):
 @settings(max_examples=MAX_EXAMPLES)
 @given(token=from_type(str))
 def test_get_network_sandbox(token):
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def run_test(mock):
         api.get_network(token=token, use_sandbox=True)
         mock.assert_called_once_with(url=public_sandbox_endpoints.NETWORK.format(token=token))
@@ -68,7 +68,7 @@ def test_get_network_sandbox(token):
 @settings(max_examples=MAX_EXAMPLES)
 @given(symbol=from_type(str))
 def test_get_ticker(symbol):
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def run_test(mock):
         api.get_ticker(symbol=symbol)
         mock.assert_called_once_with(url=public_endpoints.PUBLIC_TICKER.format(symbol=symbol))
@@ -79,7 +79,7 @@ def test_get_ticker(symbol):
 @settings(max_examples=MAX_EXAMPLES)
 @given(symbol=from_type(str))
 def test_get_ticker_sandbox(symbol):
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def run_test(mock):
         api.get_ticker(symbol=symbol, use_sandbox=True)
         mock.assert_called_once_with(url=public_sandbox_endpoints.PUBLIC_TICKER.format(symbol=symbol))
@@ -90,7 +90,7 @@ def test_get_ticker_sandbox(symbol):
 @settings(max_examples=MAX_EXAMPLES)
 @given(symbol=from_type(str))
 def test_get_ticker_v2(symbol):
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def run_test(mock):
         api.get_ticker_v2(symbol=symbol)
         mock.assert_called_once_with(url=public_endpoints.PUBLIC_TICKER_V2.format(symbol=symbol))
@@ -101,7 +101,7 @@ def test_get_ticker_v2(symbol):
 @settings(max_examples=MAX_EXAMPLES)
 @given(symbol=from_type(str))
 def test_get_ticker_v2_sandbox(symbol):
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def run_test(mock):
         api.get_ticker_v2(symbol=symbol, use_sandbox=True)
         mock.assert_called_once_with(url=public_sandbox_endpoints.PUBLIC_TICKER_V2.format(symbol=symbol))
@@ -125,7 +125,7 @@ def test_get_ticker_v2_sandbox(symbol):
     )
 )
 def test_get_candles(symbol, time_frame):
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def run_test(mock):
         api.get_candles(symbol=symbol, time_frame=time_frame)
         mock.assert_called_once_with(url=public_endpoints.CANDLES.format(symbol=symbol, time_frame=time_frame))
@@ -149,7 +149,7 @@ def test_get_candles(symbol, time_frame):
     )
 )
 def test_get_candles_sandbox(symbol, time_frame):
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def run_test(mock):
         api.get_candles(symbol=symbol, time_frame=time_frame, use_sandbox=True)
         mock.assert_called_once_with(
@@ -159,13 +159,13 @@ def test_get_candles_sandbox(symbol, time_frame):
     run_test()
 
 
-@patch('requests.get')
+@patch('requests.Session.get')
 def test_get_free_promos(mock):
     api.get_free_promos()
     mock.assert_called_once_with(url=public_endpoints.FREE_PROMOS)
 
 
-@patch('requests.get')
+@patch('requests.Session.get')
 def test_get_free_promos_sandbox(mock):
     api.get_free_promos(use_sandbox=True)
     mock.assert_called_once_with(url=public_sandbox_endpoints.FREE_PROMOS)
@@ -178,7 +178,7 @@ def test_get_free_promos_sandbox(mock):
     ask_limit=from_type(int)
 )
 def test_get_current_order_book(symbol, bid_limit, ask_limit):
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def run_test(mock):
         api.get_current_order_book(symbol=symbol, bid_limit=bid_limit, ask_limit=ask_limit)
         mock.assert_called_once_with(
@@ -196,7 +196,7 @@ def test_get_current_order_book(symbol, bid_limit, ask_limit):
     ask_limit=from_type(int)
 )
 def test_get_current_order_book_sandbox(symbol, bid_limit, ask_limit):
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def run_test(mock):
         api.get_current_order_book(symbol=symbol, bid_limit=bid_limit, ask_limit=ask_limit, use_sandbox=True)
         mock.assert_called_once_with(
@@ -215,7 +215,7 @@ def test_get_current_order_book_sandbox(symbol, bid_limit, ask_limit):
     include_breaks=from_type(bool)
 )
 def test_get_trade_history(symbol, timestamp, limit_trades, include_breaks):
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def run_test(mock):
         api.get_trade_history(
             symbol=symbol,
@@ -243,7 +243,7 @@ def test_get_trade_history(symbol, timestamp, limit_trades, include_breaks):
     include_breaks=from_type(bool)
 )
 def test_get_trade_history_sandbox(symbol, timestamp, limit_trades, include_breaks):
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def run_test(mock):
         api.get_trade_history(
             symbol=symbol,
@@ -264,13 +264,13 @@ def test_get_trade_history_sandbox(symbol, timestamp, limit_trades, include_brea
     run_test()
 
 
-@patch('requests.get')
+@patch('requests.Session.get')
 def test_get_price_feed(mock):
     api.get_price_feed()
     mock.assert_called_once_with(url=public_endpoints.PRICE_FEED)
 
 
-@patch('requests.get')
+@patch('requests.Session.get')
 def test_get_price_feed_sandbox(mock):
     api.get_price_feed(use_sandbox=True)
     mock.assert_called_once_with(url=public_sandbox_endpoints.PRICE_FEED)
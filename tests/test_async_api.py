@@ -1,12 +1,14 @@
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
-from aiohttp import ClientSession
+from aiohttp import ClientResponseError, ClientSession
 from hypothesis import given, strategies as st, settings
 from hypothesis.strategies import from_type, sampled_from
 
 from gemini_public_api import public_sandbox_endpoints, public_endpoints
 from gemini_public_api.aiohttp import api
+from tests.fakes import FakeResponse, FakeSession
 
 MAX_EXAMPLES: int = 100
 
@@ -359,3 +361,94 @@ async def test_get_price_feed_sandbox():
     await api.get_price_feed(session=session, use_sandbox=True)
 
     mock_get.assert_called_once_with(url=public_sandbox_endpoints.PRICE_FEED)
+
+
+@settings(max_examples=10, deadline=None)
+@given(
+    symbols=st.lists(st.text(alphabet='abcdefghijklmnopqrstuvwxyz', min_size=1), min_size=1, max_size=40),
+    concurrency=st.integers(min_value=1, max_value=8)
+)
+@pytest.mark.asyncio
+async def test_fetch_many_tickers_caps_concurrency(symbols, concurrency):
+    session = FakeSession(delay=0.001)
+
+    result = await api.fetch_many_tickers(session, symbols, concurrency=concurrency)
+
+    assert result == {symbol: {'symbol': symbol} for symbol in symbols}
+    assert session.max_in_flight <= concurrency
+    assert len(session.urls) == len(set(symbols))
+
+
+@pytest.mark.asyncio
+async def test_fetch_many_tickers_v2_keeps_errors_per_symbol():
+    session = FakeSession(failing={'ethusd'})
+
+    result = await api.fetch_many_tickers_v2(session, ['btcusd', 'ethusd'], use_sandbox=True)
+
+    assert result['btcusd'] == {'symbol': 'btcusd'}
+    assert isinstance(result['ethusd'], ClientResponseError)
+    assert session.urls == [
+        public_sandbox_endpoints.PUBLIC_TICKER_V2.format(symbol='btcusd'),
+        public_sandbox_endpoints.PUBLIC_TICKER_V2.format(symbol='ethusd')
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fetch_many_endpoints_use_per_symbol_urls():
+    session = FakeSession()
+
+    await api.fetch_many_symbol_details(session, ['btcusd'])
+    await api.fetch_many_networks(session, ['eth'])
+    await api.fetch_many_candles(session, ['btcusd'], time_frame='1m')
+    await api.fetch_many_order_books(session, ['btcusd'])
+    await api.fetch_many_trade_histories(session, ['btcusd'])
+
+    assert session.urls == [
+        public_endpoints.SYMBOL_DETAILS.format(symbol='btcusd'),
+        public_endpoints.NETWORK.format(token='eth'),
+        public_endpoints.CANDLES.format(symbol='btcusd', time_frame='1m'),
+        public_endpoints.CURRENT_ORDER_BOOK.format(symbol='btcusd'),
+        public_endpoints.TRADE_HISTORY.format(symbol='btcusd')
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fetch_many_rejects_invalid_concurrency():
+    with pytest.raises(ValueError):
+        await api.fetch_many_tickers(FakeSession(), ['btcusd'], concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_iter_trades_pages_forward():
+    pages = {
+        100: [{'tid': 3, 'timestampms': 102}, {'tid': 2, 'timestampms': 101}, {'tid': 1, 'timestampms': 100}],
+        102: [{'tid': 4, 'timestampms': 103}, {'tid': 3, 'timestampms': 102}]
+    }
+
+    class PagedSession(FakeSession):
+        def response(self, url, params):
+            return FakeResponse(pages[params['timestamp']])
+
+    session = PagedSession()
+
+    trades = [trade async for trade in api.iter_trades(session, 'btcusd', since=100, until=103, limit_trades=3)]
+
+    assert [trade['tid'] for trade in trades] == [1, 2, 3]
+    assert [params['timestamp'] for params in session.params] == [100, 102]
+
+
+@pytest.mark.asyncio
+async def test_get_candle_columns():
+    class CandleSession(FakeSession):
+        def response(self, url, params):
+            assert url == public_endpoints.CANDLES.format(symbol='btcusd', time_frame='1m')
+            return FakeResponse([[2, 1.0, 2.0, 0.5, 1.5, 10.0], [1, 1.0, 1.0, 1.0, 1.0, 5.0]])
+
+    columns = await api.get_candle_columns(CandleSession(), 'btcusd', '1m')
+
+    assert list(columns['timestamp']) == [1, 2]
+    assert list(columns['close']) == [1.0, 1.5]
+
+
+def test_endpoints_are_api_functions():
+    assert all(asyncio.iscoroutinefunction(getattr(api, endpoint)) for endpoint in api.ENDPOINTS)
@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+from aiohttp import ClientResponseError
+
+from gemini_public_api import public_endpoints
+from gemini_public_api.aiohttp.cache import CachedAPI
+from gemini_public_api.cache import MISS
+from tests.fakes import Clock, FakeResponse, FakeSession
+
+
+class Session(FakeSession):
+    def __init__(self, delay=0.0):
+        super().__init__(delay=delay)
+        self.version = 0
+        self.status = 200
+
+    def response(self, url, params):
+        return FakeResponse({'url': url, 'version': self.version}, self.status)
+
+
+@pytest.mark.asyncio
+async def test_cached_api_coalesces_concurrent_misses():
+    session = Session(delay=0.01)
+    cached = CachedAPI(session)
+
+    results = await asyncio.gather(*(cached.get_symbol_details('btcusd') for _ in range(10)))
+
+    assert session.urls == [public_endpoints.SYMBOL_DETAILS.format(symbol='btcusd')]
+    assert all(result is results[0] for result in results)
+    assert cached.stats()['coalesced'] == 9
+
+    assert await cached.get_symbol_details('btcusd') is results[0]
+    assert cached.stats()['hits'] == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_api_serves_stale_while_refreshing():
+    clock = Clock()
+    session = Session(delay=0.01)
+    cached = CachedAPI(session, ttls={'get_symbols': 10}, clock=clock)
+
+    assert (await cached.get_symbols())['version'] == 0
+
+    session.version = 1
+    clock.now = 11
+
+    assert (await cached.get_symbols())['version'] == 0
+    assert (await cached.get_symbols())['version'] == 0
+
+    await asyncio.sleep(0.05)
+
+    assert (await cached.get_symbols())['version'] == 1
+    assert len(session.urls) == 2
+    assert cached.stats()['refreshes'] == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_api_cancelled_waiter_does_not_cancel_fetch():
+    session = Session(delay=0.02)
+    cached = CachedAPI(session)
+
+    first = asyncio.ensure_future(cached.get_network('eth'))
+    second = asyncio.ensure_future(cached.get_network('eth'))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert (await second)['url'] == public_endpoints.NETWORK.format(token='eth')
+    assert len(session.urls) == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_api_does_not_cache_errors():
+    session = Session()
+    session.status = 500
+    cached = CachedAPI(session)
+
+    for _ in range(2):
+        with pytest.raises(ClientResponseError):
+            await cached.get_free_promos()
+
+    assert len(session.urls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_api_invalidate_fences_in_flight_refresh():
+    clock = Clock()
+    session = Session(delay=0.02)
+    cached = CachedAPI(session, ttls={'get_symbols': 10}, clock=clock)
+
+    await cached.get_symbols()
+
+    clock.now = 11
+    await cached.get_symbols()
+    await asyncio.sleep(0)
+
+    cached.invalidate('get_symbols')
+    await asyncio.sleep(0.05)
+
+    assert len(session.urls) == 2
+    assert cached.cache.lookup(('get_symbols', False))[0] == MISS
+
+
+@pytest.mark.asyncio
+async def test_cached_api_invalidate_and_close():
+    session = Session()
+    cached = CachedAPI(session)
+
+    await cached.get_symbols(use_sandbox=True)
+    await cached.get_symbols()
+
+    cached.invalidate('get_symbols', use_sandbox=True)
+    await cached.get_symbols(use_sandbox=True)
+    await cached.get_symbols()
+
+    assert len(session.urls) == 3
+
+    await cached.close()
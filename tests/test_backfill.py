@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+from hypothesis import assume, given, settings
+from hypothesis import strategies as st
+
+from gemini_public_api import public_endpoints
+from gemini_public_api.aiohttp.backfill import backfill_trades
+from tests.fakes import FakeResponse, FakeSession
+
+
+class Exchange(FakeSession):
+    def __init__(self, trades, delay=0.0):
+        super().__init__(delay=delay)
+        self.trades = trades
+
+    def response(self, url, params):
+        assert url == public_endpoints.TRADE_HISTORY.format(symbol='btcusd')
+        page = [trade for trade in self.trades if trade['timestampms'] >= params['timestamp']]
+        return FakeResponse(list(reversed(page[:params['limit_trades']])))
+
+
+def make_trades(gaps):
+    trades, timestamp = [], 0
+    for tid, gap in enumerate(gaps):
+        timestamp += gap
+        trades.append({'tid': tid, 'timestampms': timestamp})
+    return trades
+
+
+@settings(max_examples=50, deadline=None)
+@given(
+    gaps=st.lists(st.integers(min_value=0, max_value=5), max_size=300),
+    limit_trades=st.integers(min_value=2, max_value=40),
+    window=st.integers(min_value=1, max_value=200),
+    parallelism=st.integers(min_value=1, max_value=6),
+    since=st.integers(min_value=0, max_value=100),
+    span=st.integers(min_value=0, max_value=1_500)
+)
+@pytest.mark.asyncio
+async def test_backfill_yields_every_trade_once_in_order(gaps, limit_trades, window, parallelism, since, span):
+    trades = make_trades(gaps)
+    counts = {}
+    for trade in trades:
+        counts[trade['timestampms']] = counts.get(trade['timestampms'], 0) + 1
+    assume(max(counts.values(), default=0) < limit_trades)
+
+    exchange = Exchange(trades)
+
+    result = [
+        trade async for trade in backfill_trades(
+            exchange, 'btcusd', since=since, until=since + span,
+            parallelism=parallelism, window=window, limit_trades=limit_trades
+        )
+    ]
+
+    assert result == [trade for trade in trades if since <= trade['timestampms'] < since + span]
+    assert exchange.max_in_flight <= parallelism
+
+
+@pytest.mark.asyncio
+async def test_backfill_fetches_windows_concurrently():
+    exchange = Exchange(make_trades([1] * 100), delay=0.01)
+
+    result = [
+        trade async for trade in backfill_trades(exchange, 'btcusd', since=0, until=101, parallelism=4, window=10)
+    ]
+
+    assert len(result) == 100
+    assert exchange.max_in_flight == 4
+
+
+@pytest.mark.asyncio
+async def test_backfill_cancels_pending_windows_when_closed():
+    exchange = Exchange(make_trades([1] * 100), delay=0.01)
+    iterator = backfill_trades(exchange, 'btcusd', since=0, until=101, parallelism=2, window=10)
+
+    await iterator.__anext__()
+    await iterator.aclose()
+    await asyncio.sleep(0.05)
+
+    assert exchange.in_flight == 0
+    assert len(exchange.urls) < 11
+
+
+@pytest.mark.asyncio
+async def test_backfill_rejects_invalid_arguments():
+    with pytest.raises(ValueError):
+        await backfill_trades(Exchange([]), 'btcusd', since=0, until=1, parallelism=0).__anext__()
+
+    with pytest.raises(ValueError):
+        await backfill_trades(Exchange([]), 'btcusd', since=0, until=1, window=0).__anext__()
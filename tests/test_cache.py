@@ -0,0 +1,223 @@
+import json
+import threading
+
+import pytest
+import requests
+from mock import MagicMock
+
+from gemini_public_api.cache import FRESH, MISS, STALE, CachedClient, TTLCache
+from gemini_public_api.client import GeminiClient
+from tests.fakes import Clock
+
+
+def test_ttl_cache_expires_and_serves_stale():
+    clock = Clock()
+    cache = TTLCache(max_size=10, max_stale=5, clock=clock)
+
+    assert cache.lookup('a') == (MISS, None)
+
+    cache.put('a', 1, ttl=10)
+    assert cache.lookup('a') == (FRESH, 1)
+
+    clock.now = 12
+    assert cache.lookup('a') == (STALE, 1)
+
+    clock.now = 15
+    assert cache.lookup('a') == (MISS, None)
+    assert len(cache) == 0
+
+    assert cache.stats() == {'hits': 1, 'stale_hits': 1, 'misses': 2, 'evictions': 0, 'size': 0}
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(max_size=2)
+
+    cache.put('a', 1, ttl=10)
+    cache.put('b', 2, ttl=10)
+    cache.lookup('a')
+    cache.put('c', 3, ttl=10)
+
+    assert cache.lookup('b') == (MISS, None)
+    assert cache.lookup('a') == (FRESH, 1)
+    assert cache.lookup('c') == (FRESH, 3)
+    assert cache.evictions == 1
+
+
+def test_ttl_cache_invalidation():
+    cache = TTLCache()
+
+    cache.put(('x', 1), 1, ttl=10)
+    cache.put(('x', 2), 2, ttl=10)
+    cache.put(('y', 1), 3, ttl=10)
+
+    cache.invalidate(('x', 1))
+    assert cache.lookup(('x', 1))[0] == MISS
+
+    cache.invalidate_where(lambda key: key[0] == 'x')
+    assert len(cache) == 1
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_ttl_cache_drops_values_fetched_before_an_invalidation():
+    cache = TTLCache()
+
+    generation = cache.generation
+    cache.invalidate('a')
+
+    assert not cache.put('a', 1, ttl=10, generation=generation)
+    assert cache.lookup('a') == (MISS, None)
+
+    assert cache.put('a', 2, ttl=10, generation=cache.generation)
+    assert cache.lookup('a') == (FRESH, 2)
+
+
+def test_ttl_cache_rejects_invalid_size():
+    with pytest.raises(ValueError):
+        TTLCache(max_size=0)
+
+
+def make_client(payloads):
+    client = GeminiClient()
+    calls = []
+
+    def respond(name):
+        def method(**kwargs):
+            calls.append((name, kwargs))
+            response = MagicMock()
+            payload = payloads[name]
+            if isinstance(payload, Exception):
+                response.raise_for_status.side_effect = payload
+            else:
+                response.content = json.dumps(payload).encode()
+            return response
+        return method
+
+    for name in payloads:
+        setattr(client, name, respond(name))
+
+    return client, calls
+
+
+def test_cached_client_caches_per_endpoint_and_arguments():
+    clock = Clock()
+    client, calls = make_client({'get_symbols': ['btcusd'], 'get_symbol_details': {'symbol': 'BTCUSD'}})
+    cached = CachedClient(client=client, ttls={'get_symbols': 10}, clock=clock)
+
+    assert cached.get_symbols() == ['btcusd']
+    assert cached.get_symbols() == ['btcusd']
+    assert cached.get_symbols(use_sandbox=True) == ['btcusd']
+    assert cached.get_symbol_details('btcusd') == {'symbol': 'BTCUSD'}
+    assert cached.get_symbol_details('ethusd') == {'symbol': 'BTCUSD'}
+
+    assert [name for name, _ in calls] == [
+        'get_symbols', 'get_symbols', 'get_symbol_details', 'get_symbol_details'
+    ]
+    assert cached.stats()['hits'] == 1
+
+
+def test_cached_client_serves_stale_while_refreshing():
+    clock = Clock()
+    client, calls = make_client({'get_network': {'network': ['ethereum']}})
+    cached = CachedClient(client=client, ttls={'get_network': 10}, max_stale=100, clock=clock)
+
+    cached.get_network('eth')
+    client.get_network = MagicMock(return_value=MagicMock(content=b'{"network": ["base"]}'))
+
+    clock.now = 20
+    assert cached.get_network('eth') == {'network': ['ethereum']}
+
+    cached.close()
+
+    assert cached.get_network('eth') == {'network': ['base']}
+    assert cached.stats()['refreshes'] == 1
+
+
+def test_cached_client_keeps_stale_value_when_refresh_fails():
+    clock = Clock()
+    client, _ = make_client({'get_free_promos': {'symbols': []}})
+    cached = CachedClient(client=client, max_stale=1_000, clock=clock)
+
+    cached.get_free_promos()
+    client.get_free_promos = MagicMock(side_effect=requests.ConnectionError())
+
+    clock.now = 600
+    assert cached.get_free_promos() == {'symbols': []}
+
+    cached.close()
+
+    assert cached.get_free_promos() == {'symbols': []}
+    assert cached.stats()['refresh_errors'] >= 1
+
+
+def test_cached_client_does_not_cache_errors():
+    client, calls = make_client({'get_symbols': requests.HTTPError('500')})
+    cached = CachedClient(client=client)
+
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            cached.get_symbols()
+
+    assert len(calls) == 2
+
+
+def test_cached_client_invalidate():
+    client, calls = make_client({'get_symbol_details': {}, 'get_symbols': []})
+    cached = CachedClient(client=client)
+
+    cached.get_symbols()
+    cached.get_symbol_details('btcusd')
+    cached.get_symbol_details('ethusd')
+
+    cached.invalidate('get_symbol_details', 'btcusd')
+    cached.get_symbol_details('btcusd')
+    cached.get_symbol_details('ethusd')
+    assert len(calls) == 4
+
+    cached.invalidate()
+    cached.get_symbols()
+    assert len(calls) == 5
+
+
+def test_cached_client_invalidate_fences_in_flight_refresh():
+    clock = Clock()
+    client, _ = make_client({'get_network': {'network': ['ethereum']}})
+    cached = CachedClient(client=client, ttls={'get_network': 10}, max_stale=100, clock=clock)
+
+    cached.get_network('eth')
+
+    started, release = threading.Event(), threading.Event()
+
+    def refresh(**kwargs):
+        started.set()
+        release.wait(5)
+        return MagicMock(content=b'{"network": ["base"]}')
+
+    client.get_network = refresh
+
+    clock.now = 20
+    cached.get_network('eth')
+    assert started.wait(5)
+
+    cached.invalidate('get_network')
+    release.set()
+    cached.close()
+
+    assert cached.cache.lookup(('get_network', False, 'eth')) == (MISS, None)
+
+
+def test_cached_client_is_thread_safe():
+    client, _ = make_client({'get_symbol_details': {}})
+    cached = CachedClient(client=client, max_size=8)
+
+    threads = [
+        threading.Thread(target=lambda i=i: [cached.get_symbol_details(str(j % 16)) for j in range(i, i + 200)])
+        for i in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(cached.cache) <= 8
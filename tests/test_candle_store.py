@@ -0,0 +1,153 @@
+import os
+import tempfile
+
+import pytest
+import pytest_asyncio
+from aiohttp import ClientSession
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from benchmarks.server import LocalSession, make_app
+from gemini_public_api.aiohttp.candle_store import sync
+from gemini_public_api.candle_store import HEADER_SIZE, MIN_CAPACITY, CandleFile, CandleStore, find_gaps
+from gemini_public_api.candles import CANDLE_DTYPE, decode_candles_structured
+from tests.fakes import serve
+
+np = pytest.importorskip('numpy')
+
+MAX_EXAMPLES: int = 50
+MINUTE: int = 60 * 1000
+
+
+def rows(minutes, close=1.0):
+    return [[minute * MINUTE, 1.0, 2.0, 0.5, close, 10.0] for minute in minutes]
+
+
+class FakeClient:
+    def __init__(self, *payloads):
+        self.payloads = iter(payloads)
+        self.requests = []
+
+    def get_candle_columns(self, symbol, time_frame, structured=False, use_sandbox=False):
+        self.requests.append((symbol, time_frame, structured))
+        return decode_candles_structured(next(self.payloads))
+
+
+def test_sync_appends_only_new_complete_candles(tmp_path):
+    now = [10 * MINUTE + 1]
+    client = FakeClient(rows(range(10, -1, -1)), rows(range(12, 7, -1), close=2.0), rows([20, 19]))
+
+    with CandleStore(tmp_path, client=client, clock=lambda: now[0]) as store:
+        first = store.sync('BTCUSD', '1m')
+
+        # The candle at minute 10 is still forming.
+        assert len(first.candles) == 10 and first.gaps == []
+        assert store.read('btcusd', '1m')['timestamp'][-1] == 9 * MINUTE
+
+        now[0] = 13 * MINUTE
+        second = store.sync('btcusd', '1m')
+
+        assert second.candles['timestamp'].tolist() == [10 * MINUTE, 11 * MINUTE, 12 * MINUTE]
+        assert second.candles['close'].tolist() == [2.0] * 3
+
+        now[0] = 30 * MINUTE
+        assert store.sync('btcusd', '1m').gaps == [(12 * MINUTE, 19 * MINUTE)]
+
+    assert client.requests == [('BTCUSD', '1m', True), ('btcusd', '1m', True), ('btcusd', '1m', True)]
+
+    with CandleStore(tmp_path, client=FakeClient(), clock=lambda: now[0]) as store:
+        candles = store.read('btcusd', '1m', start=5 * MINUTE, end=12 * MINUTE)
+
+        assert isinstance(candles.base, np.memmap) or isinstance(candles, np.memmap)
+        assert not candles.flags.writeable
+        assert candles['timestamp'].tolist() == [minute * MINUTE for minute in range(5, 12)]
+        assert store.columns('btcusd', '1m')['close'][-1] == 1.0
+        assert store.open('btcusd', '1m').gaps() == [(12 * MINUTE, 19 * MINUTE)]
+
+
+@settings(max_examples=MAX_EXAMPLES)
+@given(
+    minutes=st.lists(st.integers(min_value=0, max_value=500), unique=True, max_size=60).map(sorted),
+    start=st.none() | st.integers(min_value=-10, max_value=510),
+    end=st.none() | st.integers(min_value=-10, max_value=510)
+)
+def test_read_matches_naive_filter(minutes, start, end):
+    with tempfile.TemporaryDirectory() as root:
+        with CandleFile(os.path.join(root, 'candles'), MINUTE) as file:
+            file.append(decode_candles_structured(rows(minutes)))
+
+            start_ms = None if start is None else start * MINUTE
+            end_ms = None if end is None else end * MINUTE
+
+            expected = [
+                minute * MINUTE for minute in minutes
+                if (start is None or minute >= start) and (end is None or minute < end)
+            ]
+
+            assert file.read(start_ms, end_ms)['timestamp'].tolist() == expected
+            assert file.gaps() == find_gaps([minute * MINUTE for minute in minutes], MINUTE)
+
+
+def test_file_validation_and_torn_records(tmp_path):
+    path = tmp_path / 'btcusd_1m.candles'
+
+    with CandleFile(path, MINUTE) as file:
+        file.append(decode_candles_structured(rows([0, 1, 2])))
+
+        with pytest.raises(ValueError):
+            file.append(decode_candles_structured(rows([2, 3])))
+
+        with pytest.raises(ValueError):
+            file.append(np.array([(5, 1, 1, 1, 1, 1), (4, 1, 1, 1, 1, 1)], dtype=CANDLE_DTYPE))
+
+        assert file.append(np.empty(0, dtype=CANDLE_DTYPE)) == 0
+
+    with open(path, 'ab') as handle:
+        handle.write(b'\x01' * 7)
+
+    with CandleFile(path, MINUTE) as file:
+        assert len(file) == 3 and file.last_timestamp == 2 * MINUTE
+
+        # A crash after writing records but before counting them in the header leaves them out.
+        file.append(decode_candles_structured(rows([3])))
+        candles = file._candles
+
+    with open(path, 'r+b') as handle:
+        handle.seek(8)
+        handle.write((3).to_bytes(8, 'little'))
+
+    with CandleFile(path, MINUTE) as file:
+        assert len(file) == 3 and file.read()['timestamp'].tolist() == [0, MINUTE, 2 * MINUTE]
+        assert file.extend(decode_candles_structured(rows([2, 3, 4]))).candles['timestamp'].tolist() == [
+            3 * MINUTE, 4 * MINUTE
+        ]
+
+    # The file grew once, for the first append, and the map was kept for the appends after it.
+    assert len(candles) == MIN_CAPACITY
+    assert (os.path.getsize(path) - HEADER_SIZE) // CANDLE_DTYPE.itemsize == MIN_CAPACITY
+
+    (tmp_path / 'other').write_bytes(b'not candles at all')
+
+    with pytest.raises(ValueError):
+        CandleFile(tmp_path / 'other', MINUTE)
+
+
+@pytest_asyncio.fixture
+async def server():
+    async with serve(make_app()) as test_server:
+        yield str(test_server.make_url(''))
+
+
+@pytest.mark.asyncio
+async def test_async_sync(server, tmp_path):
+    async with ClientSession() as client:
+        with CandleStore(tmp_path) as store:
+            session = LocalSession(client, server)
+
+            first = await sync(session, store, 'btcusd', '1m')
+            second = await sync(session, store, 'btcusd', '1m')
+
+            # The newest served candle is still forming, unless the minute just turned.
+            assert len(first.candles) >= 1439 and first.gaps == []
+            assert len(second.candles) <= 1 and second.gaps == []
+            assert len(store.read('btcusd', '1m')) == len(first.candles) + len(second.candles)
@@ -0,0 +1,72 @@
+from array import array
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+import gemini_public_api.candles as candles
+from gemini_public_api.candles import CANDLE_FIELDS, decode_candles, decode_candles_structured
+
+MAX_EXAMPLES: int = 100
+
+np = pytest.importorskip('numpy')
+
+candle_rows = st.lists(
+    st.tuples(
+        st.integers(min_value=0, max_value=2 ** 50),
+        *[st.floats(min_value=0, max_value=1e9, allow_nan=False) for _ in range(5)]
+    ).map(list),
+    max_size=50,
+    unique_by=lambda row: row[0]
+)
+
+
+def expected_columns(payload):
+    rows = sorted(payload, key=lambda row: row[0])
+    return {field: [row[i] for row in rows] for i, field in enumerate(CANDLE_FIELDS)}
+
+
+@settings(max_examples=MAX_EXAMPLES)
+@given(payload=candle_rows)
+def test_decode_candles(payload):
+    columns = decode_candles(payload)
+
+    assert columns['timestamp'].dtype == np.int64
+    assert all(columns[field].flags['C_CONTIGUOUS'] for field in CANDLE_FIELDS)
+    assert {field: column.tolist() for field, column in columns.items()} == expected_columns(payload)
+
+
+@settings(max_examples=MAX_EXAMPLES)
+@given(payload=candle_rows)
+def test_decode_candles_structured(payload):
+    result = decode_candles_structured(payload)
+
+    assert result.dtype == candles.CANDLE_DTYPE
+    assert {field: result[field].tolist() for field in CANDLE_FIELDS} == expected_columns(payload)
+
+
+@settings(max_examples=MAX_EXAMPLES)
+@given(payload=candle_rows)
+def test_decode_candles_without_numpy(payload):
+    numpy = candles.np
+    candles.np = None
+
+    try:
+        columns = decode_candles(payload)
+    finally:
+        candles.np = numpy
+
+    assert columns['timestamp'].typecode == 'q'
+    assert all(isinstance(columns[field], array) for field in CANDLE_FIELDS)
+    assert {field: column.tolist() for field, column in columns.items()} == expected_columns(payload)
+
+
+def test_decode_candles_structured_requires_numpy():
+    numpy = candles.np
+    candles.np = None
+
+    try:
+        with pytest.raises(ImportError):
+            decode_candles_structured([])
+    finally:
+        candles.np = numpy
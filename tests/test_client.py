@@ -0,0 +1,201 @@
+import json
+
+import pytest
+import requests
+from hypothesis import given, settings
+from hypothesis.strategies import from_type, lists, text
+from mock import MagicMock, patch
+from requests.adapters import HTTPAdapter
+
+import gemini_public_api.api as api
+from gemini_public_api import public_endpoints
+from gemini_public_api import public_sandbox_endpoints
+from gemini_public_api.client import GeminiClient, get_default_client, set_default_client
+
+MAX_EXAMPLES: int = 100
+
+
+def test_client_mounts_pooled_adapter():
+    client = GeminiClient(pool_connections=4, pool_maxsize=16, max_retries=3)
+
+    for prefix in ('https://', 'http://'):
+        adapter = client.session.get_adapter(prefix + 'api.gemini.com')
+
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 16
+        assert adapter.max_retries.total == 3
+
+    client.close()
+
+
+def test_client_keep_alive_disabled():
+    client = GeminiClient(keep_alive=False)
+
+    assert client.session.headers['Connection'] == 'close'
+
+    client.close()
+
+
+def test_client_reuses_given_session():
+    session = requests.Session()
+    client = GeminiClient(session=session)
+
+    assert client.session is session
+
+    client.close()
+
+
+def test_client_context_manager_closes_session():
+    with patch('requests.Session.close') as mock:
+        with GeminiClient():
+            pass
+
+        mock.assert_called_once_with()
+
+
+@settings(max_examples=MAX_EXAMPLES)
+@given(symbol=from_type(str))
+def test_client_get_ticker(symbol):
+    @patch('requests.Session.get')
+    def run_test(mock):
+        GeminiClient().get_ticker(symbol=symbol)
+        mock.assert_called_once_with(url=public_endpoints.PUBLIC_TICKER.format(symbol=symbol))
+
+    run_test()
+
+
+@settings(max_examples=MAX_EXAMPLES)
+@given(symbol=from_type(str))
+def test_client_get_ticker_sandbox(symbol):
+    @patch('requests.Session.get')
+    def run_test(mock):
+        GeminiClient().get_ticker(symbol=symbol, use_sandbox=True)
+        mock.assert_called_once_with(url=public_sandbox_endpoints.PUBLIC_TICKER.format(symbol=symbol))
+
+    run_test()
+
+
+def test_default_client_is_created_once():
+    set_default_client(None)
+
+    client = get_default_client()
+
+    assert isinstance(client, GeminiClient)
+    assert get_default_client() is client
+
+
+def test_set_default_client_is_used_by_api():
+    client = GeminiClient()
+    set_default_client(client)
+
+    with patch.object(client.session, 'get') as mock:
+        api.get_symbols()
+        mock.assert_called_once_with(url=public_endpoints.SYMBOLS)
+
+    set_default_client(None)
+    client.close()
+
+
+def test_client_pool_size_matches_workers():
+    client = GeminiClient(max_workers=24)
+
+    assert client.session.get_adapter('https://api.gemini.com')._pool_maxsize == 24
+
+    client.close()
+
+
+def test_client_rejects_invalid_workers():
+    with pytest.raises(ValueError):
+        GeminiClient(max_workers=0)
+
+
+def _fake_get(url, params=None):
+    response = MagicMock()
+
+    if url.endswith('/bad'):
+        response.raise_for_status.side_effect = requests.HTTPError('500')
+
+    response.content = json.dumps({'url': url, 'params': params}).encode()
+
+    return response
+
+
+@settings(max_examples=20, deadline=None)
+@given(symbols=lists(text(alphabet='abcdefghijklmnopqrstuvwxyz', min_size=1), max_size=50))
+def test_client_fetch_many_preserves_order(symbols):
+    with patch('requests.Session.get', side_effect=_fake_get):
+        with GeminiClient(max_workers=8) as client:
+            results = client.fetch_many([('get_ticker', (symbol,)) for symbol in symbols])
+
+    assert [result['url'] for result in results] == [
+        public_endpoints.PUBLIC_TICKER.format(symbol=symbol) for symbol in symbols
+    ]
+
+
+def test_client_fetch_many_keyword_args_and_errors():
+    with patch('requests.Session.get', side_effect=_fake_get):
+        with GeminiClient() as client:
+            results = client.fetch_many([
+                ('get_current_order_book', {'symbol': 'btcusd', 'bid_limit': 5, 'ask_limit': 5}),
+                ('get_ticker', ('bad',)),
+                ('get_symbols', ())
+            ])
+
+    assert results[0] == {
+        'url':    public_endpoints.CURRENT_ORDER_BOOK.format(symbol='btcusd'),
+        'params': {'bid_limit': 5, 'ask_limit': 5}
+    }
+    assert isinstance(results[1], requests.HTTPError)
+    assert results[2]['url'] == public_endpoints.SYMBOLS
+
+
+def test_client_fetch_many_rejects_unknown_endpoint():
+    with GeminiClient() as client:
+        with pytest.raises(ValueError):
+            client.fetch_many([('close', ())])
+
+
+def test_api_fetch_many_uses_default_client():
+    set_default_client(None)
+
+    with patch('requests.Session.get', side_effect=_fake_get):
+        results = api.fetch_many([('get_price_feed', ())])
+
+    assert results == [{'url': public_endpoints.PRICE_FEED, 'params': None}]
+
+    get_default_client().close()
+    set_default_client(None)
+
+
+def test_client_iter_trades_pages_forward():
+    pages = {
+        None: None,
+        100:  [{'tid': 3, 'timestampms': 102}, {'tid': 2, 'timestampms': 101}, {'tid': 1, 'timestampms': 100}],
+        102:  [{'tid': 4, 'timestampms': 103}, {'tid': 3, 'timestampms': 102}]
+    }
+
+    def fake_get(url, params=None):
+        response = MagicMock()
+        response.content = json.dumps(pages[params['timestamp']]).encode()
+        return response
+
+    with patch('requests.Session.get', side_effect=fake_get) as mock:
+        with GeminiClient() as client:
+            trades = list(client.iter_trades('btcusd', since=100, limit_trades=3))
+
+    assert [trade['tid'] for trade in trades] == [1, 2, 3, 4]
+    assert mock.call_count == 2
+
+
+def test_client_get_candle_columns():
+    response = MagicMock()
+    response.content = b'[[2, 1.0, 2.0, 0.5, 1.5, 10.0], [1, 1.0, 1.0, 1.0, 1.0, 5.0]]'
+
+    with patch('requests.Session.get', return_value=response) as mock:
+        with GeminiClient() as client:
+            columns = client.get_candle_columns('btcusd', '1m')
+
+    mock.assert_called_once_with(url=public_endpoints.CANDLES.format(symbol='btcusd', time_frame='1m'))
+    assert list(columns['timestamp']) == [1, 2]
+    assert list(columns['volume']) == [5.0, 10.0]
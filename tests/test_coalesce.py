@@ -0,0 +1,182 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import ClientResponseError, ClientSession, web
+
+from gemini_public_api import public_endpoints
+from gemini_public_api.aiohttp import api
+from gemini_public_api.aiohttp.coalesce import CoalescingSession
+from gemini_public_api.aiohttp.response import BufferedResponse
+from tests.fakes import FakeResponse, FakeSession, serve
+
+
+class Server:
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.hits = 0
+        self.cancelled = 0
+
+    async def handle(self, request):
+        self.hits += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if request.match_info['name'] == 'missing':
+            return web.json_response({'reason': 'not found'}, status=404)
+        return web.json_response({'name': request.match_info['name'], 'query': dict(request.query)})
+
+
+@pytest_asyncio.fixture
+async def server():
+    handler = Server()
+    app = web.Application()
+    app.router.add_get('/{name}', handler.handle)
+
+    async with serve(app) as test_server:
+        yield handler, test_server
+
+
+@pytest.mark.asyncio
+async def test_coalescing_session_shares_in_flight_requests(server):
+    handler, test_server = server
+
+    async with ClientSession() as client:
+        session = CoalescingSession(client)
+
+        async def fetch(name, params=None):
+            async with session.get(str(test_server.make_url('/' + name)), params=params) as resp:
+                return await resp.json()
+
+        results = await asyncio.gather(
+            *[fetch('btcusd') for _ in range(5)],
+            *[fetch('btcusd', {'limit': 1}) for _ in range(3)],
+            fetch('ethusd')
+        )
+
+    assert handler.hits == 3
+    assert session.requests == 3
+    assert session.coalesced == 6
+    assert all(result is results[0] for result in results[:5])
+    assert results[5] == {'name': 'btcusd', 'query': {'limit': '1'}}
+
+
+@pytest.mark.asyncio
+async def test_coalescing_session_does_not_cache_completed_requests(server):
+    handler, test_server = server
+
+    async with ClientSession() as client:
+        session = CoalescingSession(client)
+        url = str(test_server.make_url('/btcusd'))
+
+        for _ in range(2):
+            response = await session.get(url)
+            assert response.status == 200
+
+    assert handler.hits == 2
+
+
+@pytest.mark.asyncio
+async def test_coalescing_session_cancelled_waiter_keeps_request(server):
+    handler, test_server = server
+
+    async with ClientSession() as client:
+        session = CoalescingSession(client)
+        url = str(test_server.make_url('/btcusd'))
+
+        first = asyncio.ensure_future(session.get(url).__aenter__())
+        second = asyncio.ensure_future(session.get(url).__aenter__())
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        response = await second
+
+    assert (await response.json())['name'] == 'btcusd'
+    assert handler.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_coalescing_session_cancels_request_without_waiters(server):
+    handler, test_server = server
+
+    async with ClientSession() as client:
+        session = CoalescingSession(client)
+        url = str(test_server.make_url('/btcusd'))
+
+        waiter = asyncio.ensure_future(session.get(url).__aenter__())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        response = await session.get(url)
+
+    assert response.status == 200
+    assert session.requests == 2
+
+
+@pytest.mark.asyncio
+async def test_coalescing_session_with_api_functions():
+    class Client(FakeSession):
+        closed = False
+
+        def response(self, url, params):
+            return FakeResponse(['btcusd'], url=url)
+
+    async def fetch():
+        async with await api.get_symbols(session) as resp:
+            assert isinstance(resp, BufferedResponse)
+            return await resp.json()
+
+    client = Client(delay=0.01)
+    session = CoalescingSession(client)
+
+    assert await asyncio.gather(fetch(), fetch()) == [['btcusd'], ['btcusd']]
+    assert client.urls == [public_endpoints.SYMBOLS]
+    assert session.closed is False
+
+
+@pytest.mark.asyncio
+async def test_coalesced_callers_stream_the_whole_body():
+    feed = [{'pair': f'PAIR{i}', 'price': str(i)} for i in range(50)]
+
+    class Client(FakeSession):
+        def response(self, url, params):
+            return FakeResponse(feed, url=url)
+
+    client = Client(delay=0.01)
+    session = CoalescingSession(client)
+
+    async def stream():
+        return [entry async for entry in api.stream_price_feed(session, chunk_size=16)]
+
+    async def read_json_and_content():
+        async with await api.get_price_feed(session) as resp:
+            return await resp.json(), await resp.content.read()
+
+    assert await asyncio.gather(stream(), stream()) == [feed, feed]
+    (first, first_body), (second, second_body) = await asyncio.gather(read_json_and_content(), read_json_and_content())
+
+    assert first == feed and first is second
+    assert first_body == second_body != b''
+    assert len(client.urls) == 2 and session.coalesced == 2
+
+
+@pytest.mark.asyncio
+async def test_buffered_response_raise_for_status(server):
+    _, test_server = server
+
+    async with ClientSession() as client:
+        response = await CoalescingSession(client).get(str(test_server.make_url('/missing')))
+
+    assert not response.ok
+    assert (await response.json()) == {'reason': 'not found'}
+    assert response.content_type == 'application/json'
+
+    with pytest.raises(ClientResponseError) as error:
+        response.raise_for_status()
+
+    assert error.value.status == 404
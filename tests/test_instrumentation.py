@@ -0,0 +1,261 @@
+import math
+import urllib.request
+
+import pytest
+import pytest_asyncio
+import requests
+from aiohttp import ClientSession
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from urllib3.connection import HTTPConnection
+
+from benchmarks.server import LocalSession, LocalTransport, ServerThread, make_app
+from gemini_public_api import public_endpoints, public_sandbox_endpoints
+from gemini_public_api.aiohttp import api
+from gemini_public_api.aiohttp.instrumentation import InstrumentedResponse, InstrumentedSession, trace_config
+from gemini_public_api.client import GeminiClient
+from gemini_public_api.instrumentation import (
+    CallbackSink, HdrHistogram, HistogramSink, Instrumentation, InstrumentedTransport, PrometheusExporter, Sink,
+    TimedHTTPAdapter, Timing, endpoint_name
+)
+from gemini_public_api.transport import RequestsTransport
+from tests.fakes import FakeTransport, serve
+
+MAX_EXAMPLES: int = 50
+
+
+class UrlTransport(FakeTransport):
+    def get(self, url, params=None, **kwargs):
+        response = super().get(url, params=params, **kwargs)
+        response.url = url
+
+        return response
+
+
+@settings(max_examples=MAX_EXAMPLES)
+@given(
+    values=st.lists(st.integers(min_value=0, max_value=10 ** 9), min_size=1, max_size=200),
+    q=st.floats(min_value=0, max_value=100),
+    significant_figures=st.integers(min_value=1, max_value=3)
+)
+def test_hdr_histogram_percentiles_within_precision(values, q, significant_figures):
+    histogram = HdrHistogram(significant_figures)
+
+    for value in values:
+        histogram.record(value)
+
+    ordered = sorted(values)
+    exact = ordered[max(1, math.ceil(q / 100 * len(values))) - 1]
+
+    assert histogram.count == len(values)
+    assert histogram.total == sum(values)
+    assert (histogram.min, histogram.max) == (ordered[0], ordered[-1])
+    assert exact <= histogram.percentile(q) <= max(exact, exact * (1 + 10 ** -significant_figures))
+
+
+def test_hdr_histogram_cumulative_counts():
+    histogram = HdrHistogram()
+
+    for value in (1, 5, 5, 300, 10 ** 6):
+        histogram.record(value)
+
+    assert histogram.cumulative_counts([0, 5, 1000, 10 ** 7]) == [0, 3, 4, 5]
+    assert HdrHistogram().cumulative_counts([1, 2]) == [0, 0]
+    assert HdrHistogram().percentile(50) == 0
+
+    histogram.reset()
+    assert (histogram.count, histogram.max, histogram.cumulative_counts([10 ** 7])) == (0, None, [0])
+
+    with pytest.raises(ValueError):
+        histogram.record(-1)
+
+    with pytest.raises(ValueError):
+        HdrHistogram(0)
+
+
+def test_endpoint_name():
+    assert endpoint_name(public_endpoints.SYMBOLS) == 'get_symbols'
+    assert endpoint_name(public_endpoints.SYMBOL_DETAILS.format(symbol='btcusd')) == 'get_symbol_details'
+    assert endpoint_name(public_sandbox_endpoints.CANDLES.format(symbol='btcusd', time_frame='1m')) == 'get_candles'
+    assert endpoint_name('http://127.0.0.1:8080/v1/book/btcusd?bid_limit=1') == 'get_current_order_book'
+    assert endpoint_name('https://api.gemini.com/v1/unknown') == 'other'
+
+
+def test_sink_base_is_abstract():
+    with pytest.raises(TypeError):
+        Sink()
+
+
+def test_histogram_sink_and_prometheus_exporter():
+    histograms = HistogramSink()
+    instrumentation = Instrumentation(histograms)
+
+    for seconds in (0.001, 0.002, 0.004):
+        instrumentation.record(Timing('get_ticker', 'u', 200, 100, {'ttfb': seconds, 'total': seconds * 2}))
+
+    instrumentation.record(Timing('get_ticker', 'u', 200, 100, {'decode': 0.00005}))
+
+    assert histograms.sizes['get_ticker'].count == 3
+    assert histograms.percentile('get_ticker', 'ttfb', 50) == pytest.approx(0.002, rel=0.01)
+    assert math.isnan(histograms.percentile('get_symbols', 'ttfb', 50))
+
+    summary = histograms.summary()['get_ticker']
+    assert sorted(summary) == ['decode', 'total', 'ttfb']
+    assert summary['ttfb']['count'] == 3
+    assert summary['ttfb']['p99'] == pytest.approx(0.004, rel=0.01)
+
+    text = PrometheusExporter(histograms, buckets=(0.001, 0.0025)).render()
+    lines = text.splitlines()
+
+    assert '# TYPE gemini_public_api_request_phase_seconds histogram' in lines
+    assert 'gemini_public_api_request_phase_seconds_bucket{endpoint="get_ticker",phase="ttfb",le="0.001"} 1' in lines
+    assert 'gemini_public_api_request_phase_seconds_bucket{endpoint="get_ticker",phase="ttfb",le="0.0025"} 2' in lines
+    assert 'gemini_public_api_request_phase_seconds_bucket{endpoint="get_ticker",phase="ttfb",le="+Inf"} 3' in lines
+    assert 'gemini_public_api_request_phase_seconds_sum{endpoint="get_ticker",phase="ttfb"} 0.007' in lines
+    assert 'gemini_public_api_response_size_bytes_count{endpoint="get_ticker"} 3' in lines
+
+    server = PrometheusExporter(histograms).serve()
+
+    try:
+        with urllib.request.urlopen(f'http://127.0.0.1:{server.server_address[1]}/metrics') as response:
+            assert response.headers['Content-Type'].startswith('text/plain; version=0.0.4')
+            assert 'phase="decode"' in response.read().decode()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    timings, sizes = histograms.snapshot()
+    histograms.reset()
+
+    assert histograms.summary() == {}
+    assert timings[('get_ticker', 'ttfb')].count == 3 and sizes['get_ticker'].total == 300
+
+
+def test_client_records_request_and_decode():
+    timings = []
+
+    with GeminiClient(transport=UrlTransport(), instrumentation=Instrumentation(CallbackSink(timings.append))) as c:
+        assert c.decode(c.get_ticker('btcusd')) == {'ok': True}
+        assert isinstance(c.transport, InstrumentedTransport)
+
+    request, decode = timings
+
+    assert request.endpoint == decode.endpoint == 'get_ticker'
+    assert list(request.phases) == ['total']
+    assert list(decode.phases) == ['decode']
+    assert request.size == decode.size == len(b'{"ok": true}')
+
+
+def test_client_is_not_instrumented_by_default():
+    transport = FakeTransport()
+
+    with GeminiClient(transport=transport) as client:
+        assert client.transport is transport
+        assert client.instrumentation is None
+
+
+def test_requests_transport_records_connection_phases():
+    timings = []
+    transport = InstrumentedTransport(RequestsTransport(), Instrumentation(CallbackSink(timings.append)))
+
+    with ServerThread(make_app()) as server:
+        for _ in range(2):
+            transport.get(server.url + '/v1/pubticker/btcusd')
+
+    transport.close()
+
+    first, second = timings
+
+    assert first.endpoint == 'get_ticker'
+    assert first.status == 200
+    assert set(first.phases) == {'connect', 'ttfb', 'transfer', 'total'}
+    assert set(second.phases) == {'ttfb', 'transfer', 'total'}
+    assert first.phases['total'] >= first.phases['connect'] + first.phases['ttfb']
+
+
+def test_streamed_requests_leave_the_body_unread():
+    timings = []
+    transport = InstrumentedTransport(RequestsTransport(), Instrumentation(CallbackSink(timings.append)))
+
+    with ServerThread(make_app()) as server:
+        with GeminiClient(transport=LocalTransport(transport, server.url)) as client:
+            levels = list(client.stream_current_order_book('btcusd', bid_limit=5, ask_limit=5, chunk_size=16))
+            size = len(client.get_current_order_book('btcusd', bid_limit=5, ask_limit=5).content)
+
+    streamed, read = timings
+
+    assert len(levels) == 10
+    assert 'transfer' not in streamed.phases and 'transfer' in read.phases
+    assert streamed.size == read.size == size
+
+
+@pytest_asyncio.fixture
+async def server():
+    async with serve(make_app()) as test_server:
+        yield str(test_server.make_url(''))
+
+
+@pytest.mark.asyncio
+async def test_instrumented_session_records_traced_phases(server):
+    histograms, timings = HistogramSink(), []
+    instrumentation = Instrumentation(histograms, CallbackSink(timings.append))
+
+    async with ClientSession(trace_configs=[trace_config()]) as client:
+        session = InstrumentedSession(LocalSession(client, server), instrumentation, trace=True)
+
+        await api.fetch_many_tickers(session, ['btcusd', 'ethusd'], concurrency=1)
+
+        async with await api.get_symbols(session) as response:
+            assert isinstance(response, InstrumentedResponse)
+            assert await response.json() == await response.json()
+
+    requests = [timing for timing in timings if 'total' in timing.phases]
+    decodes = [timing for timing in timings if 'decode' in timing.phases]
+
+    assert [timing.endpoint for timing in requests] == ['get_ticker', 'get_ticker', 'get_symbols']
+    # read_json, used by fetch_many_*, decodes through the instrumented json(), which decodes each body once.
+    assert [timing.endpoint for timing in decodes] == ['get_ticker', 'get_ticker', 'get_symbols']
+    assert {'queue', 'connect', 'ttfb', 'transfer', 'total'} >= set(requests[0].phases) >= {'connect', 'ttfb'}
+    assert 'connect' not in requests[1].phases
+    assert histograms.timings[('get_ticker', 'total')].count == 2
+
+
+@pytest.mark.asyncio
+async def test_instrumented_session_without_trace_config(server):
+    timings = []
+
+    async with ClientSession() as client:
+        assert InstrumentedSession(client, Instrumentation()).trace
+
+        session = InstrumentedSession(LocalSession(client, server), Instrumentation(CallbackSink(timings.append)))
+        assert not session.trace
+
+        await api.read_json(api.get_price_feed(session))
+
+        async with await api.get_price_feed(session) as response:
+            await response.json()
+
+    request, read_json_decode, _, json_decode = timings
+
+    assert list(request.phases) == ['ttfb', 'transfer', 'total']
+    assert list(read_json_decode.phases) == list(json_decode.phases) == ['decode']
+    assert read_json_decode.endpoint == 'get_price_feed'
+
+
+def test_connection_timing_leaves_a_callers_session_alone():
+    session = requests.Session()
+    adapters = dict(session.adapters)
+    transport = RequestsTransport(session=session)
+    mounted = dict(session.adapters)
+
+    InstrumentedTransport(transport, Instrumentation())
+    assert session.adapters == mounted and mounted != adapters
+
+    owned = RequestsTransport()
+    InstrumentedTransport(owned, Instrumentation())
+    assert all(isinstance(owned.session.adapters[prefix], TimedHTTPAdapter) for prefix in ('https://', 'http://'))
+
+
+def test_urllib3_has_the_hook_connection_timing_relies_on():
+    # TimedHTTPAdapter splits connect and tls in HTTPConnection._new_conn, see its docstring.
+    assert callable(getattr(HTTPConnection, '_new_conn', None))
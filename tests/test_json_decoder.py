@@ -0,0 +1,77 @@
+import json
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+import gemini_public_api.json_decoder as json_decoder
+from benchmarks import payloads
+from gemini_public_api.json_decoder import (
+    JSONDecoder, StdlibDecoder, available_decoders, get_default_decoder, set_default_decoder
+)
+
+documents = st.recursive(
+    st.none() | st.booleans() | st.integers(min_value=-2 ** 63, max_value=2 ** 63 - 1) | st.text(),
+    lambda children: st.lists(children) | st.dictionaries(st.text(), children),
+    max_leaves=20
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_default_decoder():
+    yield
+    set_default_decoder(None)
+
+
+@pytest.mark.parametrize('name', list(available_decoders()))
+@pytest.mark.parametrize('payload', [
+    payloads.ticker('btcusd'), payloads.candles(count=10), payloads.order_book(levels=10), payloads.trades(count=10)
+])
+def test_decoders_agree_with_stdlib(name, payload):
+    data = json.dumps(payload).encode()
+
+    assert available_decoders()[name].decode(data) == json.loads(data)
+
+
+@given(document=documents)
+def test_decoders_round_trip(document):
+    data = json.dumps(document).encode()
+
+    for decoder in available_decoders().values():
+        assert decoder.decode(data) == document
+
+
+def test_stdlib_is_always_available():
+    decoders = available_decoders()
+
+    assert 'json' in decoders
+    assert list(decoders)[-1] == 'json'
+
+
+def test_default_decoder_prefers_fastest():
+    assert get_default_decoder().name == list(available_decoders())[0]
+
+
+def test_default_decoder_falls_back_to_stdlib(monkeypatch):
+    monkeypatch.setattr(json_decoder, 'orjson', None)
+    monkeypatch.setattr(json_decoder, 'msgspec', None)
+    set_default_decoder(None)
+
+    assert isinstance(get_default_decoder(), StdlibDecoder)
+
+
+def test_set_default_decoder():
+    decoder = StdlibDecoder()
+    set_default_decoder(decoder)
+    assert get_default_decoder() is decoder
+
+    set_default_decoder('json')
+    assert get_default_decoder().name == 'json'
+
+    with pytest.raises(ValueError):
+        set_default_decoder('unknown')
+
+
+def test_base_decoder_is_abstract():
+    with pytest.raises(TypeError):
+        JSONDecoder()
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import ClientResponseError, ClientSession, TCPConnector
+
+from benchmarks.server import LocalSession, StandIn, make_app
+from gemini_public_api.aiohttp import api, managed
+from tests.fakes import serve
+
+ARGUMENTS = {
+    'get_symbol_details':     ('btcusd',),
+    'get_network':            ('rbn',),
+    'get_ticker':             ('btcusd',),
+    'get_ticker_v2':          ('btcusd',),
+    'get_candles':            ('btcusd', '1m'),
+    'get_current_order_book': ('btcusd',),
+    'get_trade_history':      ('btcusd',)
+}
+
+
+@pytest_asyncio.fixture
+async def server():
+    stand_in = StandIn()
+
+    async with serve(make_app(stand_in=stand_in)) as test_server:
+        yield str(test_server.make_url('')), stand_in
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('endpoint', api.ENDPOINTS)
+async def test_managed_endpoints_match_api(server, endpoint):
+    url, _ = server
+
+    async with ClientSession() as client:
+        session = LocalSession(client, url)
+        args = ARGUMENTS.get(endpoint, ())
+
+        async with await getattr(api, endpoint)(session, *args) as response:
+            expected = await response.json()
+
+        result = await getattr(managed, endpoint)(session, *args)
+
+    if endpoint == 'get_candles':
+        # Candles are generated up to the current minute.
+        assert len(result) == len(expected)
+    else:
+        assert result == expected
+
+
+@pytest.mark.asyncio
+async def test_connections_are_released_on_errors_and_cancellation(server):
+    url, stand_in = server
+
+    # With a single connection, any connection left checked out would block the requests after it.
+    async with ClientSession(connector=TCPConnector(limit=1)) as client:
+        session = LocalSession(client, url)
+
+        with pytest.raises(ClientResponseError) as error:
+            await managed.get_ticker(session, 'btc/usd')
+
+        assert error.value.status == 404
+
+        stand_in.latency = 0.5
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(managed.get_price_feed(session), 0.05)
+
+        stand_in.latency = 0.0
+
+        tickers = await asyncio.wait_for(
+            asyncio.gather(*(managed.get_ticker(session, symbol) for symbol in ('btcusd', 'ethusd', 'solusd'))),
+            5
+        )
+
+    assert all('volume' in ticker for ticker in tickers)
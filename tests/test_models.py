@@ -0,0 +1,141 @@
+import json
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from mock import MagicMock, patch
+
+from benchmarks import payloads
+from gemini_public_api import models, public_endpoints
+from gemini_public_api.aiohttp import api as async_api
+from gemini_public_api.client import GeminiClient
+from gemini_public_api.models import (
+    Candle, Network, OrderBookLevel, PriceFeedEntry, SymbolDetails, Ticker, TickerV2, Trade, parse
+)
+from tests.fakes import FakeSession
+
+MAX_EXAMPLES: int = 100
+
+MODELS = (Ticker, TickerV2, SymbolDetails, Network, Candle, Trade, OrderBookLevel, PriceFeedEntry)
+
+
+@pytest.mark.parametrize('model', MODELS)
+def test_models_have_no_instance_dict(model):
+    assert not hasattr(model.__new__(model), '__dict__')
+
+
+def test_ticker():
+    ticker = Ticker.from_payload({
+        'bid':    '9345.70',
+        'ask':    '9347.67',
+        'volume': {'BTC': '2210.50', 'USD': '20623996.14', 'timestamp': 1483018200000},
+        'last':   '9346.20'
+    })
+
+    assert ticker == Ticker(9345.70, 9347.67, 9346.20, 'BTC', 'USD', 2210.50, 20623996.14, 1483018200000)
+
+
+def test_ticker_v2():
+    payload = payloads.ticker_v2('btcusd')
+    ticker = TickerV2.from_payload(payload)
+
+    assert ticker.symbol == 'BTCUSD'
+    assert ticker.close == float(payload['close'])
+    assert ticker.changes == tuple(float(change) for change in payload['changes'])
+
+
+def test_symbol_details():
+    details = SymbolDetails.from_payload(payloads.symbol_details('btcusd'))
+
+    assert (details.base_currency, details.quote_currency) == ('BTC', 'USD')
+    assert details.min_order_size == 0.00001
+    assert details.wrap_enabled is False
+
+
+def test_network():
+    assert Network.from_payload({'token': 'ETH', 'network': ['ethereum']}) == Network('ETH', ('ethereum',))
+
+
+def test_candles():
+    rows = payloads.candles(count=5)
+
+    assert [candle.astuple() for candle in models.parse_candles(rows)] == [tuple(row) for row in rows]
+
+
+@settings(max_examples=MAX_EXAMPLES)
+@given(count=st.integers(min_value=0, max_value=50), seed=st.integers(min_value=0))
+def test_trades(count, seed):
+    page = payloads.trades(count=count, seed=seed)
+    trades = models.parse_trades(page)
+
+    assert [trade.tid for trade in trades] == [trade['tid'] for trade in page]
+    assert [trade.price for trade in trades] == [float(trade['price']) for trade in page]
+    assert [trade.timestamp for trade in trades] == [trade['timestamp'] for trade in page]
+
+
+def test_trade_strings_are_interned():
+    first, second = models.parse_trades(json.loads(json.dumps(payloads.trades(count=2))))
+
+    assert first.exchange is second.exchange
+
+
+def test_order_book():
+    book = models.parse_order_book(payloads.order_book(levels=3))
+
+    assert [level.price for level in book['bids']] == [30000.0, 29999.99, 29999.98]
+    assert [level.price for level in book['asks']] == [30000.01, 30000.02, 30000.03]
+    assert isinstance(book['bids'][0].timestamp, int)
+
+
+def test_price_feed():
+    entries = models.parse_price_feed([{'pair': 'BTCUSD', 'price': '9500.00', 'percentChange24h': '-0.0123'}])
+
+    assert entries == [PriceFeedEntry('BTCUSD', 9500.0, -0.0123)]
+
+
+def test_model_asdict_and_repr():
+    level = OrderBookLevel(1.5, 2.0, 3)
+
+    assert level.asdict() == {'price': 1.5, 'amount': 2.0, 'timestamp': 3}
+    assert repr(level) == 'OrderBookLevel(price=1.5, amount=2.0, timestamp=3)'
+    assert level != Candle(1, 1.0, 1.0, 1.0, 1.0, 1.0)
+
+
+def test_parse_unknown_endpoint():
+    with pytest.raises(ValueError):
+        parse('get_free_promos', {})
+
+
+def test_client_get_model():
+    response = MagicMock()
+    response.content = json.dumps(payloads.trades(count=3)).encode()
+
+    with patch('requests.Session.get', return_value=response) as mock:
+        with GeminiClient() as client:
+            trades = client.get_model('get_trade_history', 'btcusd')
+
+    mock.assert_called_once_with(url=public_endpoints.TRADE_HISTORY.format(symbol='btcusd'), params={
+        'limit_trades': 500,
+        'include_breaks': 'false'
+    })
+    assert [trade.tid for trade in trades] == [3, 2, 1]
+
+
+@pytest.mark.parametrize('endpoint', ['close', 'get_symbols', 'get_free_promos'])
+def test_client_get_model_without_model_sends_no_request(endpoint):
+    with patch('requests.Session.get') as mock:
+        with GeminiClient() as client:
+            with pytest.raises(ValueError, match='no model for endpoint'):
+                client.get_model(endpoint)
+
+    mock.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_get_model():
+    ticker = await async_api.get_model(FakeSession(), 'get_ticker_v2', 'btcusd')
+
+    assert ticker == TickerV2('btcusd', None, None, None, None)
+
+    with pytest.raises(ValueError):
+        await async_api.get_model(FakeSession(), 'get_symbols')
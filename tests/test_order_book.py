@@ -0,0 +1,177 @@
+import math
+
+import pytest
+from hypothesis import HealthCheck, given, settings
+from hypothesis import strategies as st
+
+import gemini_public_api.order_book as order_book
+from gemini_public_api.order_book import OrderBook, OrderBookDiff, OrderBookDiffer, SideDiff
+
+MAX_EXAMPLES: int = 100
+
+levels = st.dictionaries(
+    keys=st.integers(min_value=1, max_value=100_000).map(lambda cents: cents / 100),
+    values=st.integers(min_value=1, max_value=10_000).map(lambda lots: lots / 1000),
+    max_size=30
+)
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request):
+    numpy = order_book.np
+
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        order_book.np = None
+
+    yield request.param
+
+    order_book.np = numpy
+
+
+def make_payload(bids, asks):
+    return {
+        'bids': [{'price': str(price), 'amount': str(amount), 'timestamp': '0'} for price, amount in bids.items()],
+        'asks': [{'price': str(price), 'amount': str(amount), 'timestamp': '0'} for price, amount in asks.items()]
+    }
+
+
+def reference_vwap(levels_best_first, amount):
+    remaining, notional = amount, 0.0
+    for price, size in levels_best_first:
+        take = min(size, remaining)
+        notional += take * price
+        remaining -= take
+        if remaining <= 1e-12:
+            return notional / amount
+    return math.nan
+
+
+@settings(max_examples=MAX_EXAMPLES, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
+@given(bids=levels, asks=levels, amount=st.floats(min_value=0.001, max_value=100))
+def test_order_book_queries(backend, bids, asks, amount):
+    book = OrderBook.from_payload(make_payload(bids, asks))
+
+    sorted_bids = sorted(bids.items(), reverse=True)
+    sorted_asks = sorted(asks.items())
+
+    assert list(book.bid_prices) == [price for price, _ in sorted_bids]
+    assert list(book.ask_prices) == [price for price, _ in sorted_asks]
+    assert book.best_bid == (sorted_bids[0][0] if bids else None)
+    assert book.best_ask == (sorted_asks[0][0] if asks else None)
+
+    if bids and asks:
+        assert book.spread == pytest.approx(sorted_asks[0][0] - sorted_bids[0][0])
+
+    for price, size in bids.items():
+        assert book.bid_amount(price) == size
+        assert book.bid_depth(price) == pytest.approx(sum(s for p, s in bids.items() if p >= price))
+
+    for price, size in asks.items():
+        assert book.ask_amount(price) == size
+        assert book.ask_depth(price) == pytest.approx(sum(s for p, s in asks.items() if p <= price))
+
+    expected = reference_vwap(sorted_asks, amount)
+    actual = book.vwap('buy', amount)
+    assert (math.isnan(actual) and math.isnan(expected)) or actual == pytest.approx(expected)
+
+    expected = reference_vwap(sorted_bids, amount)
+    actual = book.vwap('sell', amount)
+    assert (math.isnan(actual) and math.isnan(expected)) or actual == pytest.approx(expected)
+
+
+def test_order_book_missing_levels(backend):
+    book = OrderBook.from_payload(make_payload({100.0: 1.0, 99.0: 2.0}, {101.0: 1.0, 103.0: 3.0}))
+
+    assert book.bid_amount(99.5) == 0.0
+    assert book.ask_amount(102.0) == 0.0
+    assert book.bid_depth(101.0) == 0.0
+    assert book.ask_depth(102.0) == 1.0
+    assert book.mid == 100.5
+    assert list(book.ask_depth()) == [1.0, 4.0]
+
+
+def test_order_book_slippage(backend):
+    book = OrderBook.from_payload(make_payload({100.0: 1.0, 90.0: 1.0}, {100.0: 1.0, 110.0: 1.0}))
+
+    assert book.slippage('buy', 1.0) == 0.0
+    assert book.slippage('buy', 2.0) == pytest.approx(0.05)
+    assert book.slippage('sell', 2.0) == pytest.approx(0.05)
+    assert math.isnan(book.slippage('sell', 3.0))
+
+
+def test_order_book_empty(backend):
+    book = OrderBook.from_payload({'bids': [], 'asks': []})
+
+    assert book.best_bid is None
+    assert book.best_ask is None
+    assert book.spread is None
+    assert book.mid is None
+    assert math.isnan(book.vwap('buy', 1.0))
+    assert math.isnan(book.slippage('sell', 1.0))
+
+
+def test_order_book_vectorized_vwap():
+    np = pytest.importorskip('numpy')
+    book = OrderBook.from_payload(make_payload({}, {100.0: 1.0, 110.0: 1.0}))
+
+    result = book.vwap('buy', np.array([1.0, 2.0, 3.0]))
+
+    assert result[:2].tolist() == [100.0, 105.0]
+    assert np.isnan(result[2])
+
+
+def test_order_book_rejects_invalid_input(backend):
+    with pytest.raises(ValueError):
+        OrderBook([1.0], [], [], [])
+
+    with pytest.raises(ValueError):
+        OrderBook([], [], [], []).vwap('hold', 1.0)
+
+
+@settings(max_examples=MAX_EXAMPLES, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
+@given(old_bids=levels, old_asks=levels, new_bids=levels, new_asks=levels)
+def test_order_book_diff_round_trip(backend, old_bids, old_asks, new_bids, new_asks):
+    old = OrderBook.from_payload(make_payload(old_bids, old_asks))
+    new = OrderBook.from_payload(make_payload(new_bids, new_asks))
+
+    diff = old.diff(new)
+    applied = old.apply(diff)
+
+    assert list(applied.bid_prices) == list(new.bid_prices)
+    assert list(applied.bid_amounts) == list(new.bid_amounts)
+    assert list(applied.ask_prices) == list(new.ask_prices)
+    assert list(applied.ask_amounts) == list(new.ask_amounts)
+
+    changed = {price for price in set(old_bids) | set(new_bids) if old_bids.get(price) != new_bids.get(price)}
+    assert len(diff.bids) == len(changed)
+
+
+def test_order_book_diff_categories(backend):
+    old = OrderBook.from_payload(make_payload({100.0: 1.0, 99.0: 2.0, 98.0: 1.0}, {101.0: 1.0}))
+    new = OrderBook.from_payload(make_payload({100.0: 1.0, 99.0: 3.0, 97.0: 1.0}, {101.0: 1.0}))
+
+    diff = old.diff(new)
+
+    assert diff.bids == SideDiff(added=[(97.0, 1.0)], removed=[98.0], resized=[(99.0, 3.0)])
+    assert not diff.asks
+    assert len(diff) == 3
+    assert not new.diff(new)
+
+
+def test_order_book_differ(backend):
+    differ = OrderBookDiffer()
+    first = OrderBook.from_payload(make_payload({100.0: 1.0}, {101.0: 1.0}))
+    second = OrderBook.from_payload(make_payload({100.0: 2.0}, {101.0: 1.0}))
+
+    assert differ.update('btcusd', first) == OrderBookDiff(
+        bids=SideDiff(added=[(100.0, 1.0)], removed=[], resized=[]),
+        asks=SideDiff(added=[(101.0, 1.0)], removed=[], resized=[])
+    )
+    assert differ.update('btcusd', second).bids.resized == [(100.0, 2.0)]
+    assert differ.get('btcusd') is second
+
+    differ.reset('btcusd')
+
+    assert differ.get('btcusd') is None
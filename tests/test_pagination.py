@@ -0,0 +1,77 @@
+import pytest
+from hypothesis import assume, given, settings
+from hypothesis import strategies as st
+
+from gemini_public_api.pagination import TradeCursor, trade_key
+
+MAX_EXAMPLES: int = 100
+
+
+def make_trades(gaps):
+    trades, timestamp = [], 1_000
+    for tid, gap in enumerate(gaps):
+        timestamp += gap
+        trades.append({'tid': tid, 'timestampms': timestamp, 'price': '1.0', 'amount': '1.0', 'type': 'buy'})
+    return trades
+
+
+def serve_page(trades, timestamp, limit_trades):
+    page = [trade for trade in trades if trade['timestampms'] >= timestamp][:limit_trades]
+    return list(reversed(page))
+
+
+def walk(trades, since, until, limit_trades):
+    cursor, result, requests = TradeCursor(since=since, until=until, limit_trades=limit_trades), [], 0
+    while not cursor.done:
+        requests += 1
+        result.extend(cursor.advance(serve_page(trades, cursor.timestamp, limit_trades)))
+    return result, requests
+
+
+def max_trades_per_millisecond(trades):
+    counts = {}
+    for trade in trades:
+        counts[trade['timestampms']] = counts.get(trade['timestampms'], 0) + 1
+    return max(counts.values(), default=0)
+
+
+@settings(max_examples=MAX_EXAMPLES)
+@given(
+    gaps=st.lists(st.integers(min_value=0, max_value=3), max_size=200),
+    limit_trades=st.integers(min_value=1, max_value=50),
+    since=st.integers(min_value=900, max_value=1_200),
+    span=st.one_of(st.none(), st.integers(min_value=0, max_value=400))
+)
+def test_cursor_walks_every_trade_once_in_order(gaps, limit_trades, since, span):
+    trades = make_trades(gaps)
+    assume(max_trades_per_millisecond(trades) < limit_trades)
+    until = None if span is None else since + span
+
+    result, _ = walk(trades, since, until, limit_trades)
+
+    assert result == [
+        trade for trade in trades
+        if trade['timestampms'] >= since and (until is None or trade['timestampms'] < until)
+    ]
+
+
+def test_cursor_skips_full_page_within_one_millisecond():
+    trades = make_trades([0] * 5 + [1])
+
+    result, requests = walk(trades, since=0, until=None, limit_trades=3)
+
+    assert [trade['tid'] for trade in result] == [0, 1, 2, 5]
+    assert requests == 3
+
+
+def test_cursor_with_empty_range_is_done():
+    assert TradeCursor(since=10, until=10).done
+
+
+def test_cursor_rejects_invalid_limit():
+    with pytest.raises(ValueError):
+        TradeCursor(since=0, limit_trades=0)
+
+
+def test_trade_key():
+    assert trade_key({'tid': 7, 'timestampms': 3}) == (3, 7)
@@ -0,0 +1,162 @@
+import asyncio
+import itertools
+import json
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from gemini_public_api.aiohttp.poller import Poller, PollJob
+from gemini_public_api.aiohttp.response import BufferedResponse
+from tests.fakes import FakeSession
+
+MAX_EXAMPLES: int = 50
+
+
+class PollSession(FakeSession):
+    """
+    Serves payloads from per-symbol iterators, counting the requests per symbol.
+    """
+
+    def __init__(self, payloads, delay=0.0):
+        super().__init__(delay=delay)
+        self.payloads = payloads
+        self.requests = {}
+
+    def response(self, url, params):
+        symbol = url.rsplit('/', 1)[-1]
+        self.requests[symbol] = self.requests.get(symbol, 0) + 1
+        payload = next(self.payloads[symbol])
+
+        if isinstance(payload, Exception):
+            raise payload
+
+        return BufferedResponse(url, 200, body=json.dumps(payload).encode())
+
+
+def job(interval=1.0, min_interval=0.5, max_interval=4.0, due=0.0):
+    return PollJob('get_ticker', ('btcusd',), {}, None, None, interval, min_interval, max_interval, due)
+
+
+@settings(max_examples=MAX_EXAMPLES)
+@given(
+    interval=st.floats(min_value=0.01, max_value=10),
+    durations=st.lists(st.floats(min_value=0, max_value=30), min_size=1, max_size=50)
+)
+def test_reschedule_stays_on_the_grid(interval, durations):
+    polled = job(interval=interval, min_interval=0.01, max_interval=10)
+    now = 0.0
+
+    for duration in durations:
+        now = max(now, polled.due) + duration
+        polled.reschedule(now)
+
+        assert polled.due > now
+        assert polled.due - now <= interval * (1 + 1e-9)
+
+        slots = polled.due / interval
+        assert abs(slots - round(slots)) < 1e-6
+
+    assert round(polled.due / interval) == len(durations) + polled.skipped
+
+
+def test_adapt_within_bounds():
+    polled = job()
+
+    polled.adapt(True, 0.5, 2.0)
+    polled.adapt(True, 0.5, 2.0)
+    assert polled.interval == 0.5
+
+    for _ in range(5):
+        polled.adapt(False, 0.5, 2.0)
+
+    assert polled.interval == 4.0
+
+    with pytest.raises(ValueError):
+        job(min_interval=2, max_interval=1)
+
+
+def test_update_compares_fingerprints():
+    polled = PollJob('get_ticker', (), {}, None, lambda payload: payload['last'], 1, 1, 1, 0)
+
+    assert polled.update({'last': 1, 'ts': 1})
+    assert not polled.update({'last': 1, 'ts': 2})
+    assert polled.update({'last': 2, 'ts': 3})
+    assert (polled.polls, polled.changes, polled.payload) == (3, 2, {'last': 2, 'ts': 3})
+
+
+@pytest.mark.asyncio
+async def test_poller_adapts_intervals_to_changes():
+    session = PollSession({
+        'btcusd': ({'last': i} for i in itertools.count()),
+        'ethusd': itertools.repeat({'last': 1})
+    })
+    changes = []
+
+    async def callback(polled, payload):
+        changes.append((polled.args[0], payload['last']))
+
+    async with Poller(session, min_interval=0.01, max_interval=0.08, slowdown=2.0) as poller:
+        busy = poller.add('get_ticker', 'btcusd', callback=callback)
+        quiet = poller.add('get_ticker', 'ethusd', callback=callback)
+
+        await asyncio.sleep(0.5)
+
+    assert busy.interval == 0.01
+    assert quiet.interval == 0.08
+    assert session.requests['btcusd'] > 2 * session.requests['ethusd']
+    assert changes.count(('ethusd', 1)) == 1
+    assert [last for symbol, last in changes if symbol == 'btcusd'] == list(range(busy.changes))
+    assert poller.stats()['jobs'] == 2
+
+
+@pytest.mark.asyncio
+async def test_poller_never_overlaps_a_job():
+    session = PollSession({'btcusd': itertools.repeat({})}, delay=0.05)
+
+    async with Poller(session, min_interval=0.01, max_interval=0.01) as poller:
+        polled = poller.add('get_ticker', 'btcusd')
+        await asyncio.sleep(0.3)
+
+    assert session.max_in_flight == 1
+    assert polled.skipped > polled.polls
+
+
+@pytest.mark.asyncio
+async def test_poller_counts_errors_and_keeps_polling():
+    session = PollSession({'btcusd': itertools.cycle([ValueError('boom'), {'last': 1}])})
+    errors = []
+
+    async with Poller(session, min_interval=0.01, max_interval=0.01, on_error=lambda *args: errors.append(args)) as p:
+        polled = p.add('get_ticker', 'btcusd')
+        await asyncio.sleep(0.1)
+
+        p.remove(polled)
+        requests = session.requests['btcusd']
+        await asyncio.sleep(0.05)
+
+    assert polled.errors >= 2 and polled.polls >= 2
+    assert errors[0][0] is polled and isinstance(errors[0][1], ValueError)
+    assert session.requests['btcusd'] <= requests + 1
+    assert p.jobs == []
+
+    with pytest.raises(ValueError):
+        p.add('get_model', 'btcusd')
+
+
+@pytest.mark.asyncio
+async def test_poller_keeps_polling_when_on_error_raises():
+    session = PollSession({'btcusd': itertools.repeat(ValueError('boom'))})
+    reported = []
+
+    def on_error(job, error):
+        raise RuntimeError('callback failed')
+
+    asyncio.get_running_loop().set_exception_handler(lambda loop, context: reported.append(context['exception']))
+
+    async with Poller(session, min_interval=0.01, max_interval=0.01, on_error=on_error) as poller:
+        polled = poller.add('get_ticker', 'btcusd')
+        await asyncio.sleep(0.1)
+
+    assert polled.errors >= 3 and session.requests['btcusd'] >= 3
+    assert reported and all(isinstance(error, RuntimeError) for error in reported)
@@ -0,0 +1,128 @@
+import asyncio
+import math
+import threading
+
+import pytest
+import pytest_asyncio
+from aiohttp import ClientSession
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from benchmarks.payloads import SYMBOLS
+from benchmarks.server import LocalSession, make_app
+from gemini_public_api.aiohttp.price_feed import AsyncPriceFeedIndex
+from gemini_public_api.price_feed import PriceFeed, PriceFeedIndex
+from tests.fakes import FakeClient, serve
+
+MAX_EXAMPLES: int = 50
+
+prices = st.dictionaries(
+    st.sampled_from(['BTCUSD', 'ETHUSD', 'SOLUSD', 'LTCUSD']),
+    st.floats(min_value=0.01, max_value=1e5),
+    max_size=4
+)
+
+
+def feed(entries, fetched_at=0.0):
+    return PriceFeed.from_payload(
+        [{'pair': pair, 'price': str(price), 'percentChange24h': '0.0100'} for pair, price in entries.items()],
+        fetched_at
+    )
+
+
+class FeedClient(FakeClient):
+    def __init__(self, payloads):
+        self.payloads = iter(payloads)
+        self.requests = 0
+
+    def get_price_feed(self, use_sandbox=False):
+        self.requests += 1
+        return self.respond(next(self.payloads))
+
+
+def test_price_feed_lookups():
+    snapshot = PriceFeed.from_payload([
+        {'pair': 'BTCUSD', 'price': '30000.5', 'percentChange24h': '-0.0125'},
+        {'pair': 'ETHUSD', 'price': '2000'}
+    ])
+
+    assert len(snapshot) == 2
+    assert 'btcusd' in snapshot and 'solusd' not in snapshot
+    assert snapshot.price('btcusd') == snapshot.price('BTCUSD') == 30000.5
+    assert snapshot.change_24h('btcusd') == -0.0125
+    assert snapshot.change_24h('ethusd') is None
+    assert math.isnan(snapshot.change_column[1])
+    assert snapshot.prices(['ethusd', 'BTCUSD']) == {'ethusd': 2000.0, 'BTCUSD': 30000.5}
+    assert snapshot.prices() == {'BTCUSD': 30000.5, 'ETHUSD': 2000.0}
+
+    with pytest.raises(KeyError):
+        snapshot.price('solusd')
+
+
+@settings(max_examples=MAX_EXAMPLES)
+@given(old=prices, new=prices)
+def test_changed_pairs(old, new):
+    expected = {pair for pair in old.keys() | new.keys() if old.get(pair) != new.get(pair)}
+
+    assert feed(new).changed(feed(old)) == expected
+    assert feed(new).changed(None) == set(new)
+
+
+def test_index_refreshes_after_ttl_and_notifies_changes():
+    now = [0.0]
+    client = FeedClient([
+        [{'pair': 'BTCUSD', 'price': '1'}, {'pair': 'ETHUSD', 'price': '2'}],
+        [{'pair': 'BTCUSD', 'price': '1'}, {'pair': 'ETHUSD', 'price': '3'}],
+        [{'pair': 'BTCUSD', 'price': '1'}, {'pair': 'ETHUSD', 'price': '3'}]
+    ])
+    index = PriceFeedIndex(client, ttl=5, clock=lambda: now[0])
+    notifications = []
+    index.subscribe(lambda changed, snapshot: notifications.append((changed, snapshot.price('ethusd'))))
+
+    assert index.prices(['btcusd', 'ethusd']) == {'btcusd': 1.0, 'ethusd': 2.0}
+    assert index.price('ethusd') == 2.0
+    assert client.requests == 1
+
+    now[0] = 5
+    assert index.price('ethusd') == 3.0
+    assert index.refresh() == set()
+    assert client.requests == index.refreshes == 3
+    assert notifications == [({'BTCUSD', 'ETHUSD'}, 2.0), ({'ETHUSD'}, 3.0)]
+
+
+def test_index_fetches_once_for_concurrent_callers():
+    client = FeedClient([[{'pair': 'BTCUSD', 'price': '1'}]] * 2)
+    index = PriceFeedIndex(client, ttl=60)
+    threads = [threading.Thread(target=index.price, args=('btcusd',)) for _ in range(8)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert client.requests == 1
+
+
+@pytest_asyncio.fixture
+async def server():
+    async with serve(make_app()) as test_server:
+        yield str(test_server.make_url(''))
+
+
+@pytest.mark.asyncio
+async def test_async_index_serves_every_pair_from_one_request(server):
+    async with ClientSession() as client:
+        index = AsyncPriceFeedIndex(LocalSession(client, server), ttl=60)
+        changes = []
+        index.subscribe(lambda changed, snapshot: changes.append(changed))
+
+        quotes = await asyncio.gather(*(index.price(symbol) for symbol in SYMBOLS))
+        by_symbol = await index.prices(SYMBOLS)
+
+        assert list(by_symbol.values()) == quotes
+        assert await index.change_24h('btcusd') is not None
+        assert await index.refresh() == set()
+
+    assert index.refreshes == 2
+    assert changes == [{symbol.upper() for symbol in SYMBOLS}]
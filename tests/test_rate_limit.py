@@ -0,0 +1,155 @@
+import asyncio
+import time
+from email.utils import formatdate
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from mock import MagicMock, patch
+
+from gemini_public_api import public_endpoints
+from gemini_public_api.client import GeminiClient
+from gemini_public_api.rate_limit import RetryPolicy, TokenBucket, parse_retry_after
+from tests.fakes import Clock
+
+MAX_EXAMPLES: int = 100
+
+
+def test_token_bucket_allows_burst_then_paces():
+    clock = Clock()
+    bucket = TokenBucket(rate=2, burst=3, clock=clock)
+
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert [bucket.reserve() for _ in range(3)] == [0.5, 1.0, 1.5]
+    assert bucket.throttled == 3
+    assert bucket.throttled_seconds == 3.0
+
+    clock.now = 10
+    assert bucket.reserve() == 0.0
+
+
+@settings(max_examples=MAX_EXAMPLES)
+@given(
+    rate=st.floats(min_value=0.1, max_value=100),
+    burst=st.integers(min_value=1, max_value=20),
+    requests=st.integers(min_value=1, max_value=100)
+)
+def test_token_bucket_never_exceeds_rate(rate, burst, requests):
+    bucket = TokenBucket(rate=rate, burst=burst, clock=Clock())
+
+    release_times = sorted(bucket.reserve() for _ in range(requests))
+
+    assert release_times[-1] == pytest.approx(max(0, requests - burst) / rate)
+
+
+def test_token_bucket_defer():
+    clock = Clock()
+    bucket = TokenBucket(rate=1, burst=5, clock=clock)
+
+    bucket.defer(2)
+
+    assert bucket.reserve() == pytest.approx(3)
+
+
+def test_token_bucket_rejects_invalid_arguments():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+    with pytest.raises(ValueError):
+        TokenBucket(burst=0)
+
+
+def test_token_bucket_acquire_sleeps():
+    bucket = TokenBucket(rate=100, burst=1)
+
+    start = time.monotonic()
+    for _ in range(3):
+        bucket.acquire()
+
+    assert time.monotonic() - start >= 0.015
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_acquire_async_paces_tasks():
+    bucket = TokenBucket(rate=100, burst=1)
+
+    start = asyncio.get_running_loop().time()
+    await asyncio.gather(*(bucket.acquire_async() for _ in range(5)))
+
+    assert asyncio.get_running_loop().time() - start >= 0.035
+    assert bucket.throttled == 4
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('') is None
+    assert parse_retry_after('garbage') is None
+    assert parse_retry_after('2') == 2.0
+    assert parse_retry_after(' 1.5 ') == 1.5
+    assert parse_retry_after(formatdate(1_000_010, usegmt=True), now=1_000_000) == 10.0
+    assert parse_retry_after(formatdate(1_000_000, usegmt=True), now=1_000_010) == 0.0
+
+
+@settings(max_examples=MAX_EXAMPLES)
+@given(attempt=st.integers(min_value=0, max_value=20), jitter=st.floats(min_value=0, max_value=0.999))
+def test_retry_policy_backoff_is_jittered_and_capped(attempt, jitter):
+    policy = RetryPolicy(backoff=0.5, max_backoff=10, jitter=lambda: jitter)
+
+    assert policy.delay(attempt) == min(jitter * 0.5 * 2 ** attempt, 10)
+    assert policy.delay(attempt, '3') == 3
+    assert policy.delay(attempt, '60') == 10
+
+
+def test_retry_policy_should_retry():
+    policy = RetryPolicy(max_retries=2)
+
+    assert policy.should_retry(429, 0)
+    assert policy.should_retry(503, 1)
+    assert not policy.should_retry(429, 2)
+    assert not policy.should_retry(400, 0)
+
+    with pytest.raises(ValueError):
+        RetryPolicy(max_retries=-1)
+
+
+def make_response(status, retry_after=None):
+    response = MagicMock()
+    response.status_code = status
+    response.headers = {'Retry-After': retry_after} if retry_after is not None else {}
+    return response
+
+
+def test_client_retries_throttled_requests():
+    responses = [make_response(429, '0'), make_response(503), make_response(200)]
+
+    with patch('requests.Session.get', side_effect=responses) as mock:
+        with GeminiClient(retry_policy=RetryPolicy(backoff=0.001)) as client:
+            response = client.get_symbols()
+
+    assert response is responses[2]
+    assert mock.call_count == 3
+    assert client.retried == 2
+    responses[0].close.assert_called_once_with()
+
+
+def test_client_gives_up_after_max_retries():
+    with patch('requests.Session.get', side_effect=[make_response(429, '0') for _ in range(3)]) as mock:
+        with GeminiClient(retry_policy=RetryPolicy(max_retries=2)) as client:
+            response = client.get_price_feed()
+
+    assert response.status_code == 429
+    assert mock.call_count == 3
+
+
+def test_client_retry_defers_shared_bucket():
+    bucket = TokenBucket(rate=1000, burst=10)
+    responses = [make_response(429, '0.02'), make_response(200)]
+
+    with patch('requests.Session.get', side_effect=responses) as mock:
+        with GeminiClient(rate_limiter=bucket, retry_policy=RetryPolicy()) as client:
+            start = time.monotonic()
+            client.get_ticker('btcusd')
+
+    assert time.monotonic() - start >= 0.02
+    assert bucket.throttled == 1
+    mock.assert_called_with(url=public_endpoints.PUBLIC_TICKER.format(symbol='btcusd'))
@@ -0,0 +1,202 @@
+import gzip
+
+import pytest
+import pytest_asyncio
+from aiohttp import ClientSession
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from mock import MagicMock
+
+from benchmarks.server import LocalSession, LocalTransport, ServerThread, make_app
+from gemini_public_api import endpoints, public_endpoints
+from gemini_public_api.aiohttp import api
+from gemini_public_api.aiohttp.recording import RecordingSession, ReplaySession
+from gemini_public_api.client import GeminiClient
+from gemini_public_api.recording import (
+    Exchange, RecordingTransport, RecordWriter, Replayer, ReplayTransport, read_records, request_key
+)
+from gemini_public_api.transport import RequestsTransport, Transport
+from tests.fakes import serve
+
+MAX_EXAMPLES: int = 50
+
+records = st.builds(
+    Exchange,
+    url=st.text(max_size=30),
+    params=st.dictionaries(st.text(max_size=5), st.text(max_size=5), max_size=3),
+    status=st.integers(min_value=100, max_value=599),
+    headers=st.lists(st.tuples(st.text(max_size=10), st.text(max_size=10)), max_size=3),
+    body=st.binary(max_size=200),
+    sent_at=st.floats(min_value=0, max_value=2e9),
+    received_at=st.floats(min_value=0, max_value=2e9)
+)
+
+
+def record(url, body=b'{}', sent_at=0.0, received_at=0.0, params=None, status=200):
+    return Exchange(url, params or {}, status, [('Content-Type', 'application/json')], body, sent_at, received_at)
+
+
+class CountingTransport(Transport):
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, params=None, **kwargs):
+        self.calls += 1
+
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {'Content-Type': 'application/json'}
+        response.content = f'{{"call": {self.calls}}}'.encode()
+
+        return response
+
+    def close(self):
+        pass
+
+
+def astuple(record):
+    return record.url, record.params, record.status, record.headers, record.body, record.sent_at, record.received_at
+
+
+@settings(max_examples=MAX_EXAMPLES, deadline=None)
+@given(batches=st.lists(st.lists(records, max_size=5), min_size=1, max_size=3))
+def test_records_round_trip_across_appends(tmp_path_factory, batches):
+    path = tmp_path_factory.mktemp('recording') / 'session.rec.gz'
+
+    for batch in batches:
+        with RecordWriter(path) as writer:
+            for item in batch:
+                writer.write(item)
+
+    expected = [astuple(item) for batch in batches for item in batch]
+
+    assert [astuple(item) for item in read_records(path)] == expected
+
+
+def test_truncated_recording_stops_at_last_complete_record(tmp_path):
+    path = tmp_path / 'session.rec.gz'
+
+    with RecordWriter(path) as writer:
+        for i in range(3):
+            writer.write(record('https://example.com', body=b'x' * 100))
+
+    data = gzip.decompress(path.read_bytes())
+    path.write_bytes(gzip.compress(data[:-10]))
+
+    assert len(list(read_records(path))) == 2
+
+
+def test_recording_writer_flush_makes_records_readable(tmp_path):
+    path = tmp_path / 'session.rec.gz'
+    writer = RecordWriter(path)
+    writer.write(record('https://example.com'))
+    writer.flush()
+
+    assert len(list(read_records(path))) == 1
+
+    writer.close()
+
+
+def test_request_key_ignores_param_order():
+    assert request_key('u', {'a': 1, 'b': 'x'}) == request_key('u', {'b': 'x', 'a': '1'})
+    assert request_key('u') == request_key('u', {})
+
+
+def test_record_and_replay_client(tmp_path):
+    path = tmp_path / 'session.rec.gz'
+
+    with RecordWriter(path) as writer:
+        with GeminiClient(transport=RecordingTransport(CountingTransport(), writer)) as client:
+            recorded = [client.decode(client.get_ticker('btcusd')) for _ in range(2)]
+            recorded.append(client.decode(client.get_current_order_book('btcusd', bid_limit=1)))
+
+    assert writer.records == 3
+
+    with GeminiClient(transport=ReplayTransport(path)) as client:
+        book = client.get_current_order_book('btcusd', bid_limit=1)
+        tickers = [client.get_ticker('btcusd') for _ in range(2)]
+
+        assert book.headers['content-type'] == 'application/json'
+        assert book.reason == 'OK'
+        assert [client.decode(response) for response in tickers + [book]] == recorded
+
+        with pytest.raises(LookupError):
+            client.get_ticker('btcusd')
+
+        assert client.transport.replayer.served == 3
+
+
+def test_record_and_replay_streamed_client(tmp_path):
+    path = tmp_path / 'session.rec.gz'
+
+    with ServerThread(make_app()) as server:
+        with RecordWriter(path) as writer:
+            transport = RecordingTransport(LocalTransport(RequestsTransport(), server.url), writer)
+
+            with GeminiClient(transport=transport) as client:
+                trades = list(client.stream_trade_history('btcusd', limit_trades=20, chunk_size=32))
+                unread = client._get(stream=True, **endpoints.symbols())
+                unread.close()
+
+    # The streamed body is recorded once read, the body left unread is not recorded.
+    assert writer.records == 1
+
+    with GeminiClient(transport=ReplayTransport(path)) as client:
+        assert list(client.stream_trade_history('btcusd', limit_trades=20, chunk_size=32)) == trades
+
+
+def test_replayer_paces_responses():
+    now = [10.0]
+    replayer = Replayer(
+        [record('a', sent_at=100.0, received_at=100.5), record('b', sent_at=101.0, received_at=102.0)],
+        speed=2.0,
+        clock=lambda: now[0]
+    )
+
+    assert replayer.next('a')[1] == 0.25
+
+    now[0] = 10.5
+    assert replayer.next('b')[1] == 0.5
+
+    with pytest.raises(ValueError):
+        Replayer([], speed=0)
+
+
+@pytest_asyncio.fixture
+async def server():
+    async with serve(make_app()) as test_server:
+        yield str(test_server.make_url(''))
+
+
+@pytest.mark.asyncio
+async def test_record_and_replay_session(tmp_path, server):
+    path = tmp_path / 'session.rec.gz'
+    symbols = ['btcusd', 'ethusd']
+
+    with RecordWriter(path) as writer:
+        async with ClientSession() as client:
+            session = RecordingSession(LocalSession(client, server), writer)
+            recorded = await api.fetch_many_tickers(session, symbols)
+
+            async with await api.get_trade_history(session, 'btcusd', timestamp=5) as response:
+                trades = await response.json()
+
+    assert [item.url for item in read_records(path)][-1] == public_endpoints.TRADE_HISTORY.format(symbol='btcusd')
+
+    async with ReplaySession(path) as session:
+        assert await api.fetch_many_tickers(session, symbols) == recorded
+
+        async with await api.get_trade_history(session, 'btcusd', timestamp=5) as response:
+            assert response.status == 200
+            assert await response.json() == trades
+
+        with pytest.raises(LookupError):
+            await (await api.get_ticker(session, 'btcusd'))
+
+    assert session.closed
+
+
+def test_replay_url_is_the_request_url():
+    transport = ReplayTransport([record(public_endpoints.SYMBOLS)])
+
+    assert transport.get(public_endpoints.SYMBOLS).url == public_endpoints.SYMBOLS
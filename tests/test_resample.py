@@ -0,0 +1,109 @@
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from gemini_public_api.candles import CANDLE_FIELDS, decode_candles, decode_candles_structured
+from gemini_public_api.resample import Resampler, parse_bar, resample
+
+np = pytest.importorskip('numpy')
+
+MAX_EXAMPLES: int = 100
+MINUTE: int = 60 * 1000
+
+prices = st.floats(min_value=0.01, max_value=1e5, allow_nan=False)
+
+# 1m candles, newest first like the API, at random minutes with gaps.
+candle_rows = st.lists(
+    st.tuples(st.integers(min_value=0, max_value=2000), prices, prices, prices, prices, prices),
+    max_size=80,
+    unique_by=lambda row: row[0]
+).map(lambda rows: sorted(([minute * MINUTE, *values] for minute, *values in rows), reverse=True))
+
+
+def naive(payload, bar):
+    bars = {}
+
+    for timestamp, open_, high, low, close, volume in sorted(payload):
+        start = timestamp // bar * bar
+
+        if start not in bars:
+            bars[start] = [start, open_, high, low, close, volume]
+        else:
+            row = bars[start]
+            row[2], row[3], row[4], row[5] = max(row[2], high), min(row[3], low), close, row[5] + volume
+
+    return [bars[start] for start in sorted(bars)]
+
+
+def rows(bars):
+    return [list(row) for row in zip(*(bars[field].tolist() for field in CANDLE_FIELDS))]
+
+
+def flat(table):
+    return [value for row in table for value in row]
+
+
+@settings(max_examples=MAX_EXAMPLES)
+@given(payload=candle_rows, minutes=st.sampled_from([1, 3, 10, 120, 720]))
+def test_resample_matches_naive_aggregation(payload, minutes):
+    expected = naive(payload, minutes * MINUTE)
+
+    columns = resample(decode_candles(payload), f'{minutes}m')
+    structured = resample(decode_candles_structured(payload), minutes * MINUTE)
+
+    assert isinstance(columns, dict) and columns['timestamp'].dtype == np.int64
+    assert flat(rows(columns)) == pytest.approx(flat(expected))
+    assert flat(rows(structured)) == pytest.approx(flat(expected))
+
+
+@settings(max_examples=MAX_EXAMPLES)
+@given(payload=candle_rows, minutes=st.sampled_from([3, 10, 120]), cuts=st.lists(st.integers(0, 80), max_size=5))
+def test_incremental_updates_match_batch(payload, minutes, cuts):
+    candles = decode_candles_structured(payload)
+    resampler = Resampler(f'{minutes}m', capacity=1)
+    cuts = sorted(set(cuts))
+
+    for start, end in zip([0] + cuts, cuts + [len(candles)]):
+        # Re-send a little history, as consecutive get_candles responses overlap.
+        changed = resampler.update(candles[max(0, start - 2):end])
+
+        if len(changed):
+            assert changed['timestamp'][-1] == resampler.bars['timestamp'][-1]
+
+    assert flat(rows(resampler.bars)) == pytest.approx(flat(naive(payload, minutes * MINUTE)))
+    assert len(resampler) == len(resampler.columns()['close'])
+
+
+def test_update_replaces_a_forming_candle():
+    resampler = Resampler('3m')
+
+    resampler.update(decode_candles_structured([[0, 1, 2, 0.5, 1.5, 10], [MINUTE, 1.5, 3, 1, 2, 5]]))
+    changed = resampler.update(decode_candles_structured([[MINUTE, 1.5, 4, 1, 3, 7]]))
+
+    assert rows(changed) == [[0, 1, 4, 0.5, 3, 17]]
+    assert rows(resampler.bars) == [[0, 1, 4, 0.5, 3, 17]]
+
+    changed = resampler.update(decode_candles_structured([[3 * MINUTE, 3, 3, 3, 3, 1]]))
+
+    assert rows(changed) == [[0, 1, 4, 0.5, 3, 17], [3 * MINUTE, 3, 3, 3, 3, 1]]
+    assert len(resampler.update(decode_candles_structured([]))) == 0
+
+
+def test_parse_bar_and_validation():
+    assert parse_bar('3m') == 3 * MINUTE
+    assert parse_bar('2h') == parse_bar('2hr') == 120 * MINUTE
+    assert parse_bar('1day') == parse_bar('1D') == 24 * 60 * MINUTE
+    assert parse_bar(5000) == 5000
+
+    for bar in ('3x', '', 0, '0m'):
+        with pytest.raises(ValueError):
+            parse_bar(bar)
+
+    with pytest.raises(ValueError):
+        resample(decode_candles([[0, 1, 1, 1, 1, 1]]), '3m', interval='5m')
+
+    with pytest.raises(ValueError):
+        Resampler('10m', interval='15m')
+
+    with pytest.raises(ValueError):
+        resample({field: np.array([MINUTE, 0]) for field in CANDLE_FIELDS}, '3m')
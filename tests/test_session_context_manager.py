@@ -1,7 +1,12 @@
+import asyncio
+
 import pytest
-from aiohttp import ClientSession
+import pytest_asyncio
+from aiohttp import ClientSession, ClientTimeout, web
 
-from gemini_public_api.aiohttp.session_context_manager import SessionContextManager
+import gemini_public_api.aiohttp.session_context_manager as session_context_manager
+from gemini_public_api.aiohttp.session_context_manager import SessionContextManager, install_uvloop
+from tests.fakes import serve
 
 
 @pytest.mark.asyncio
@@ -16,3 +21,53 @@ async def test_session_context_manager():
 
     # Assert that the session is closed after exiting the context
     assert session.closed
+
+
+@pytest_asyncio.fixture
+async def server():
+    connections = set()
+
+    async def handler(request):
+        connections.add(id(request.transport))
+        return web.json_response([])
+
+    app = web.Application()
+    app.router.add_get('/{tail:.*}', handler)
+
+    async with serve(app) as test_server:
+        yield str(test_server.make_url('')), connections
+
+
+@pytest.mark.asyncio
+async def test_connector_and_timeout_options():
+    manager = SessionContextManager(limit=8, limit_per_host=4, timeout=ClientTimeout(total=3), raise_for_status=True)
+
+    async with manager as session:
+        assert (session.connector.limit, session.connector.limit_per_host) == (8, 4)
+        assert session.timeout.total == 3
+        assert session._raise_for_status is True
+        assert manager.warmed == 0
+
+
+@pytest.mark.asyncio
+async def test_warm_up_opens_reusable_connections(server):
+    url, connections = server
+
+    async with SessionContextManager(warm_up=4, warm_up_url=url + '/v1/symbols') as session:
+        manager_connections = len(connections)
+
+        async def fetch():
+            async with session.get(url + '/v1/pricefeed') as response:
+                await response.read()
+
+        await asyncio.gather(*(fetch() for _ in range(4)))
+
+    assert manager_connections == 4
+    # The requests after the warm-up were all served over the warmed connections.
+    assert len(connections) == 4
+
+
+def test_install_uvloop_without_uvloop(monkeypatch):
+    monkeypatch.setattr(session_context_manager, 'uvloop', None)
+
+    assert install_uvloop() is False
@@ -0,0 +1,70 @@
+import pytest
+import pytest_asyncio
+from aiohttp import ClientSession
+
+from benchmarks.server import LocalSession, StandIn, make_app
+from benchmarks.bench_suite import CALLS, percentile
+from gemini_public_api.aiohttp import api
+from gemini_public_api.models import PARSERS, parse
+from tests.fakes import serve
+
+
+@pytest_asyncio.fixture
+async def stand_in(request):
+    stand_in = StandIn(**getattr(request, 'param', {}))
+
+    async with serve(make_app(stand_in=stand_in)) as server:
+        async with ClientSession() as session:
+            yield stand_in, LocalSession(session, str(server.make_url('')))
+
+
+@pytest.mark.parametrize('endpoint, kwargs', CALLS)
+@pytest.mark.asyncio
+async def test_stand_in_serves_every_endpoint(stand_in, endpoint, kwargs):
+    _, session = stand_in
+
+    payload = await api.read_json(getattr(api, endpoint)(session, **kwargs))
+
+    if endpoint in PARSERS:
+        parse(endpoint, payload)
+    else:
+        assert payload
+
+
+@pytest.mark.asyncio
+async def test_stand_in_honors_limits(stand_in):
+    _, session = stand_in
+
+    book = await api.read_json(api.get_current_order_book(session, 'btcusd', bid_limit=7))
+    trades = await api.read_json(api.get_trade_history(session, 'btcusd', limit_trades=9))
+
+    assert len(book['bids']) == 7
+    assert len(trades) == 9
+
+
+@pytest.mark.parametrize('stand_in', [{'throttle_rate': 0.5, 'error_rate': 0.25, 'retry_after': 2, 'seed': 1}],
+                         indirect=True)
+@pytest.mark.asyncio
+async def test_stand_in_injects_faults(stand_in):
+    stand_in, session = stand_in
+    statuses = []
+
+    for _ in range(200):
+        async with await api.get_ticker(session, 'btcusd') as response:
+            statuses.append(response.status)
+
+            if response.status == 429:
+                assert response.headers['Retry-After'] == '2'
+
+    assert statuses.count(429) == stand_in.throttled
+    assert statuses.count(500) == stand_in.errors
+    assert 60 < stand_in.throttled < 140
+    assert 20 < stand_in.errors < 80
+    assert stand_in.requests == 200
+
+
+def test_percentile():
+    assert percentile([], 50) != percentile([], 50)
+    assert percentile([1.0], 99) == 1.0
+    assert percentile(list(range(1, 101)), 50) == 50
+    assert percentile(list(range(1, 101)), 99) == 99
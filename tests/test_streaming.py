@@ -0,0 +1,143 @@
+import json
+
+import pytest
+import pytest_asyncio
+import requests
+from aiohttp import ClientResponseError, ClientSession
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from benchmarks.server import LocalSession, LocalTransport, ServerThread, make_app
+from gemini_public_api.aiohttp import api
+from gemini_public_api.client import GeminiClient
+from gemini_public_api.streaming import RecordParser, aiter_records, iter_records
+from gemini_public_api.transport import HttpxTransport, RequestsTransport
+from tests.fakes import serve
+
+MAX_EXAMPLES: int = 100
+
+# Strings that look like JSON structure, escapes and multibyte characters.
+texts = st.text(alphabet=st.sampled_from('ab1.-{}[]":,\\/ \né€\U0001f600'), max_size=12)
+values = st.one_of(
+    texts,
+    st.integers(-2 ** 63, 2 ** 63 - 1),
+    st.floats(allow_nan=False, allow_infinity=False),
+    st.booleans(),
+    st.none()
+)
+records = st.dictionaries(texts, st.one_of(values, st.lists(values, max_size=3)), max_size=5)
+order_books = st.fixed_dictionaries({'bids': st.lists(records, max_size=5), 'asks': st.lists(records, max_size=5)})
+
+
+def split(document: bytes, cuts):
+    offsets = sorted({0, len(document), *(cut % (len(document) + 1) for cut in cuts)})
+
+    return [document[start:end] for start, end in zip(offsets, offsets[1:])]
+
+
+@settings(max_examples=MAX_EXAMPLES)
+@given(trades=st.lists(records, max_size=8), cuts=st.lists(st.integers(min_value=0), max_size=20))
+def test_records_of_root_array_match_json_loads(trades, cuts):
+    document = json.dumps(trades).encode()
+
+    assert list(iter_records(split(document, cuts))) == [(None, trade) for trade in trades]
+
+
+@settings(max_examples=MAX_EXAMPLES)
+@given(book=order_books, cuts=st.lists(st.integers(min_value=0), max_size=20), ensure_ascii=st.booleans())
+def test_records_of_root_object_match_json_loads(book, cuts, ensure_ascii):
+    document = json.dumps(book, ensure_ascii=ensure_ascii).encode()
+    expected = [(side, level) for side in ('bids', 'asks') for level in book[side]]
+
+    assert list(iter_records(split(document, cuts))) == expected
+
+
+def test_byte_at_a_time():
+    document = b'{"bids": [{"price": "1\\"}]", "amount": "2"}], "asks": []}'
+
+    assert list(iter_records(document[i:i + 1] for i in range(len(document)))) == [
+        ('bids', {'price': '1"}]', 'amount': '2'})
+    ]
+
+
+def test_nested_objects_are_part_of_their_record():
+    document = b'[{"a": {"b": [{"c": 1}]}}, {"d": 2}]'
+
+    assert list(iter_records([document])) == [(None, {'a': {'b': [{'c': 1}]}}), (None, {'d': 2})]
+
+
+def test_buffer_is_released_between_records():
+    parser = RecordParser()
+
+    for _ in range(1000):
+        parser.feed(b'{"tid": 1, "price": "100.0"},' if _ else b'[{"tid": 1, "price": "100.0"},')
+
+    assert len(parser._buffer) < 64
+
+
+@pytest.mark.parametrize('document', [b'[{"a": 1}', b'{"bids": [', b'["abc', b'[{"a": "b"}]]', b'[{"a": 1]}'])
+def test_malformed_documents_raise(document):
+    with pytest.raises(ValueError):
+        list(iter_records([document]))
+
+
+@pytest.mark.asyncio
+async def test_aiter_records():
+    async def chunks():
+        yield b'[{"a": '
+        yield b'1}, {"b": 2}]'
+
+    assert [record async for record in aiter_records(chunks())] == [(None, {'a': 1}), (None, {'b': 2})]
+
+
+@pytest.fixture(scope='module')
+def server_url():
+    with ServerThread(make_app()) as server:
+        yield server.url
+
+
+@pytest.mark.parametrize('transport', [RequestsTransport, HttpxTransport])
+def test_client_streams_match_get(server_url, transport):
+    with GeminiClient(transport=LocalTransport(transport(), server_url)) as client:
+        book = client.get_current_order_book('btcusd', bid_limit=20, ask_limit=30).json()
+        trades = client.get_trade_history('btcusd', limit_trades=50).json()
+        feed = client.get_price_feed().json()
+
+        assert list(client.stream_current_order_book('btcusd', bid_limit=20, ask_limit=30, chunk_size=64)) == [
+            (side, level) for side in ('bids', 'asks') for level in book[side]
+        ]
+        assert list(client.stream_trade_history('btcusd', limit_trades=50, chunk_size=64)) == trades
+        assert list(client.stream_price_feed(chunk_size=64)) == feed
+
+
+def test_client_stream_raises_for_error_status(server_url):
+    with GeminiClient(transport=LocalTransport(RequestsTransport(), server_url)) as client:
+        with pytest.raises(requests.HTTPError):
+            list(client.stream_trade_history('btc/usd'))
+
+
+@pytest_asyncio.fixture
+async def session():
+    async with serve(make_app()) as test_server:
+        async with ClientSession() as client:
+            yield LocalSession(client, str(test_server.make_url('')))
+
+
+@pytest.mark.asyncio
+async def test_async_streams_match_read_json(session):
+    book = await api.read_json(api.get_current_order_book(session, 'btcusd', bid_limit=20, ask_limit=30))
+    trades = await api.read_json(api.get_trade_history(session, 'btcusd', limit_trades=50))
+    feed = await api.read_json(api.get_price_feed(session))
+
+    levels = [item async for item in api.stream_current_order_book(session, 'btcusd', 20, 30, chunk_size=64)]
+
+    assert levels == [(side, level) for side in ('bids', 'asks') for level in book[side]]
+    assert [trade async for trade in api.stream_trade_history(session, 'btcusd', limit_trades=50)] == trades
+    assert [entry async for entry in api.stream_price_feed(session, chunk_size=64)] == feed
+
+
+@pytest.mark.asyncio
+async def test_async_stream_raises_for_error_status(session):
+    with pytest.raises(ClientResponseError):
+        async for _ in api.stream_trade_history(session, 'btc/usd'):
+            pass
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import ClientSession, web
+
+from gemini_public_api.aiohttp.throttle import ThrottledSession
+from gemini_public_api.rate_limit import RetryPolicy, TokenBucket
+from tests.fakes import serve
+
+
+class Server:
+    def __init__(self, failures):
+        self.failures = failures
+        self.hits = 0
+
+    async def handle(self, request):
+        self.hits += 1
+        if self.hits <= self.failures:
+            return web.json_response({}, status=429, headers={'Retry-After': '0.01'})
+        return web.json_response({'hits': self.hits, 'query': dict(request.query)})
+
+
+@pytest_asyncio.fixture
+async def server(request):
+    handler = Server(getattr(request, 'param', 0))
+    app = web.Application()
+    app.router.add_get('/ticker', handler.handle)
+
+    async with serve(app) as test_server:
+        yield handler, str(test_server.make_url('/ticker'))
+
+
+@pytest.mark.parametrize('server', [2], indirect=True)
+@pytest.mark.asyncio
+async def test_throttled_session_retries_429(server):
+    handler, url = server
+
+    async with ClientSession() as client:
+        session = ThrottledSession(client, retry_policy=RetryPolicy(max_retries=3))
+
+        async with session.get(url, params={'a': 1}) as resp:
+            assert resp.status == 200
+            assert await resp.json() == {'hits': 3, 'query': {'a': '1'}}
+
+    assert session.retried == 2
+
+
+@pytest.mark.parametrize('server', [5], indirect=True)
+@pytest.mark.asyncio
+async def test_throttled_session_returns_last_response_when_retries_run_out(server):
+    handler, url = server
+
+    async with ClientSession() as client:
+        session = ThrottledSession(client, retry_policy=RetryPolicy(max_retries=1))
+
+        response = await session.get(url)
+        response.release()
+
+    assert response.status == 429
+    assert handler.hits == 2
+
+
+@pytest.mark.asyncio
+async def test_throttled_session_paces_concurrent_tasks(server):
+    handler, url = server
+    bucket = TokenBucket(rate=200, burst=2)
+
+    async with ClientSession() as client:
+        session = ThrottledSession(client, rate_limiter=bucket)
+
+        async def fetch():
+            async with session.get(url) as resp:
+                return resp.status
+
+        start = asyncio.get_running_loop().time()
+        statuses = await asyncio.gather(*(fetch() for _ in range(6)))
+
+        assert session.closed is False
+
+    assert statuses == [200] * 6
+    assert asyncio.get_running_loop().time() - start >= 0.015
+    assert bucket.throttled == 4
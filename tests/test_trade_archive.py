@@ -0,0 +1,178 @@
+import json
+import os
+import tempfile
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from gemini_public_api.aiohttp.response import BufferedResponse
+from gemini_public_api.aiohttp.trade_archive import sync
+from gemini_public_api.trade_archive import SIDES, TRADE_DTYPE, TradeArchive, TradeLog, encode_trades
+from tests.fakes import FakeClient, FakeSession
+
+np = pytest.importorskip('numpy')
+
+MAX_EXAMPLES: int = 50
+
+
+def make_trades(timestamps, start_tid=1):
+    return [
+        {
+            'timestamp':   timestamp // 1000,
+            'timestampms': timestamp,
+            'tid':         tid,
+            'price':       f'{100 + tid % 7}.25',
+            'amount':      '0.5',
+            'exchange':    'gemini',
+            'type':        SIDES[tid % 2]
+        }
+        for tid, timestamp in enumerate(timestamps, start=start_tid)
+    ]
+
+
+class History:
+    """
+    Serves trade history pages like the endpoint: the oldest `limit_trades` trades at or after `timestamp`,
+    newest first.
+    """
+
+    def __init__(self, trades):
+        self.trades = sorted(trades, key=lambda trade: (trade['timestampms'], trade['tid']))
+        self.requests = []
+
+    def page(self, timestamp, limit_trades):
+        self.requests.append(timestamp)
+        return list(reversed([trade for trade in self.trades if trade['timestampms'] >= timestamp][:limit_trades]))
+
+
+class HistoryClient(FakeClient):
+    def __init__(self, history):
+        self.history = history
+
+    def get_trade_history(self, symbol, timestamp=None, limit_trades=500, use_sandbox=False):
+        return self.respond(self.history.page(timestamp, limit_trades))
+
+
+class HistorySession(FakeSession):
+    def __init__(self, history):
+        super().__init__()
+        self.history = history
+
+    def response(self, url, params):
+        page = self.history.page(int(params['timestamp']), int(params['limit_trades']))
+        return BufferedResponse(url, 200, body=json.dumps(page).encode())
+
+
+@settings(max_examples=MAX_EXAMPLES)
+@given(
+    timestamps=st.lists(st.integers(min_value=0, max_value=300), max_size=120).map(sorted),
+    start=st.none() | st.integers(min_value=-5, max_value=305),
+    end=st.none() | st.integers(min_value=-5, max_value=305),
+    batches=st.lists(st.integers(min_value=1, max_value=40), min_size=1, max_size=5)
+)
+def test_range_reads_match_naive_filter(timestamps, start, end, batches):
+    records = encode_trades(make_trades(timestamps))
+
+    with tempfile.TemporaryDirectory() as root:
+        with TradeLog(root, segment_size=16, index_stride=4) as log:
+            position, sizes = 0, iter(batches * len(records))
+
+            while position < len(records):
+                size = next(sizes)
+                log.append(records[position:position + size])
+                position += size
+
+            expected = [
+                int(tid) for tid, timestamp in zip(records['tid'], records['timestamp'])
+                if (start is None or timestamp >= start) and (end is None or timestamp < end)
+            ]
+
+            assert len(log) == len(records)
+            assert log.read(start, end)['tid'].tolist() == expected
+            assert all(len(view) <= 16 for view in log.slices(start, end))
+
+        with TradeLog(root, segment_size=64, index_stride=8) as log:
+            # Logs keep the layout they were created with once they hold trades.
+            assert log.index_stride == 4
+            assert log.segment_size == (16 if len(records) else 64)
+            assert log.read(start, end)['tid'].tolist() == expected
+
+
+@pytest.mark.parametrize('segment_size, index_stride', [(2, 1), (2, 2), (4, 1), (4, 2)])
+def test_ranges_past_the_last_trade_of_a_full_segment(tmp_path, segment_size, index_stride):
+    records = encode_trades(make_trades([10 * i for i in range(1, segment_size + 1)]))
+
+    with TradeLog(tmp_path, segment_size=segment_size, index_stride=index_stride) as log:
+        log.append(records)
+
+        assert log.slices(start=100) == []
+        assert len(log.read(start=10 * segment_size)) == 1
+        assert log.read(end=100)['tid'].tolist() == records['tid'].tolist()
+        assert log.read(5, 15)['tid'].tolist() == [1]
+
+
+def test_sync_resumes_after_the_last_archived_trade(tmp_path):
+    # Several trades per millisecond, so that pages end in the middle of a millisecond.
+    history = History(make_trades([1000 + i // 3 for i in range(50)]))
+
+    with TradeArchive(tmp_path, client=HistoryClient(history), segment_size=8, index_stride=4) as archive:
+        with pytest.raises(ValueError):
+            archive.sync('btcusd')
+
+        history.trades, later = history.trades[:20], history.trades[20:]
+        assert archive.sync('btcusd', since=0, limit_trades=7) == 20
+
+        history.trades += later
+        # `since` only applies to an empty archive.
+        assert archive.sync('BTCUSD', since=0, limit_trades=7) == 30
+        assert history.requests[-1] >= 1000 + 49 // 3
+
+    with TradeArchive(tmp_path, client=HistoryClient(history)) as archive:
+        trades = archive.read('btcusd')
+
+        assert trades['tid'].tolist() == list(range(1, 51))
+        assert trades['price'][:2].tolist() == [101.25, 102.25]
+        assert [SIDES[side] for side in trades['side'][:2]] == ['sell', 'buy']
+        assert archive.read('btcusd', start=1005, end=1007)['tid'].tolist() == list(range(16, 22))
+        assert archive.sync('btcusd') == 0
+
+
+def test_reopen_recovers_from_torn_writes(tmp_path):
+    path = tmp_path / 'btcusd'
+
+    with TradeLog(path, segment_size=8, index_stride=2) as log:
+        log.append(encode_trades(make_trades(range(10))))
+
+        with pytest.raises(ValueError):
+            log.append(encode_trades(make_trades([5])))
+
+    with open(path / '00000001.trades', 'ab') as segment:
+        segment.write(b'\x07' * (TRADE_DTYPE.itemsize - 1))
+
+    # Drop the last index entry as if the process died before writing it.
+    os.truncate(path / 'index', os.path.getsize(path / 'index') - 8)
+
+    with TradeLog(path) as log:
+        assert len(log) == 10 and log.last_timestamp == 9
+        assert log.read(start=8)['tid'].tolist() == [9, 10]
+
+    (tmp_path / 'other').mkdir()
+    (tmp_path / 'other' / '00000000.trades').write_bytes(b'not trades at all')
+
+    with pytest.raises(ValueError):
+        TradeLog(tmp_path / 'other')
+
+    with pytest.raises(ValueError):
+        TradeLog(tmp_path / 'new', segment_size=10, index_stride=4)
+
+
+@pytest.mark.asyncio
+async def test_async_sync(tmp_path):
+    history = History(make_trades([2000 + i // 2 for i in range(25)]))
+
+    with TradeArchive(tmp_path) as archive:
+        assert await sync(HistorySession(history), archive, 'ethusd', since=0, limit_trades=6) == 25
+        assert await sync(HistorySession(history), archive, 'ethusd', limit_trades=6) == 0
+
+        assert archive.read('ethusd')['tid'].tolist() == list(range(1, 26))
@@ -0,0 +1,123 @@
+import pytest
+from aiohttp import ClientResponseError
+from mock import patch
+
+from gemini_public_api import endpoints, public_endpoints
+from gemini_public_api.aiohttp import api
+from gemini_public_api.client import GeminiClient
+from gemini_public_api.transport import HttpxTransport, RequestsTransport, Transport
+from tests.fakes import FakeTransport
+
+httpx = pytest.importorskip('httpx')
+pytest.importorskip('h2')
+
+from benchmarks.server import H2Server, LocalSession, LocalTransport, ServerThread  # noqa: E402
+from gemini_public_api.aiohttp.http2 import HTTP2Session  # noqa: E402
+
+
+def test_endpoints_trade_history():
+    assert endpoints.trade_history('btcusd', timestamp=5, use_sandbox=False) == {
+        'url':    public_endpoints.TRADE_HISTORY.format(symbol='btcusd'),
+        'params': {'timestamp': 5, 'limit_trades': 500, 'include_breaks': 'false'}
+    }
+
+
+def test_requests_transport_omits_missing_params():
+    transport = RequestsTransport()
+
+    with patch('requests.Session.get') as mock:
+        transport.get('https://example.com')
+        transport.get('https://example.com', params={'a': 1})
+
+    assert mock.call_args_list[0].kwargs == {'url': 'https://example.com'}
+    assert mock.call_args_list[1].kwargs == {'url': 'https://example.com', 'params': {'a': 1}}
+
+    transport.close()
+
+
+def test_transport_without_close_cannot_be_instantiated():
+    class GetOnly(Transport):
+        def get(self, url, params=None, **kwargs):
+            pass
+
+    with pytest.raises(TypeError):
+        GetOnly()
+
+
+def test_client_sends_through_transport():
+    transport = FakeTransport()
+
+    with GeminiClient(transport=transport) as client:
+        assert client.session is None
+        assert client.fetch_many([('get_ticker', ('btcusd',)), ('get_current_order_book', ('ethusd', 1, 2))]) == [
+            {'ok': True}, {'ok': True}
+        ]
+
+    assert sorted(transport.requests, key=str) == sorted([
+        (public_endpoints.PUBLIC_TICKER.format(symbol='btcusd'), None),
+        (public_endpoints.CURRENT_ORDER_BOOK.format(symbol='ethusd'), {'bid_limit': 1, 'ask_limit': 2})
+    ], key=str)
+    assert transport.closed
+
+
+def test_httpx_transport_multiplexes_over_one_connection():
+    server = H2Server(latency=0.01)
+
+    with ServerThread(server) as thread:
+        transport = LocalTransport(HttpxTransport(http1=False, max_connections=1), thread.url)
+
+        with GeminiClient(transport=transport, max_workers=16) as client:
+            results = client.fetch_many(('get_ticker_v2', (f'sym{i}',)) for i in range(64))
+            response = client.get_ticker('btcusd')
+
+    assert response.http_version == 'HTTP/2'
+    assert response.json()['last']
+    response.close()
+
+    assert [result['symbol'] for result in results] == [f'SYM{i}' for i in range(64)]
+    assert server.connections == 1
+
+
+@pytest.mark.asyncio
+async def test_http2_session_multiplexes_over_one_connection():
+    async with H2Server(latency=0.01) as server:
+        async with HTTP2Session(http1=False, max_connections=1) as session:
+            symbols = [f'sym{i}' for i in range(64)]
+            result = await api.fetch_many_tickers_v2(LocalSession(session, server.url), symbols, concurrency=64)
+
+        assert session.closed
+
+    assert {symbol: ticker['symbol'] for symbol, ticker in result.items()} == {
+        symbol: symbol.upper() for symbol in symbols
+    }
+    assert server.connections == 1
+
+
+@pytest.mark.asyncio
+async def test_http2_session_response():
+    async with H2Server() as server:
+        async with HTTP2Session(http1=False) as session:
+            session = LocalSession(session, server.url)
+
+            async with await api.get_current_order_book(session, 'btcusd', bid_limit=3) as response:
+                assert response.status == 200
+                assert response.content_type == 'application/json'
+                assert len((await response.json())['bids']) == 3
+                assert response.url.query == {'bid_limit': '3', 'ask_limit': '500'}
+
+            with pytest.raises(ClientResponseError):
+                await api.read_json(session.get(server.url + '/v1/unknown'))
+
+
+def test_http2_session_requires_httpx(monkeypatch):
+    import gemini_public_api.aiohttp.http2 as http2
+    import gemini_public_api.transport as transport
+
+    monkeypatch.setattr(http2, 'httpx', None)
+    monkeypatch.setattr(transport, 'httpx', None)
+
+    with pytest.raises(ImportError):
+        HTTP2Session()
+
+    with pytest.raises(ImportError):
+        HttpxTransport()